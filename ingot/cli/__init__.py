@@ -6,27 +6,59 @@ flags and commands matching the original Bash script.
 Supports tickets from all 6 platforms: Jira, Linear, GitHub, Azure DevOps, Monday, Trello.
 """
 
+from typing import TYPE_CHECKING
+
 # Re-export everything for backward compatibility.
 # Existing imports like `from ingot.cli import app` continue to work.
+# app.py is imported eagerly: it is the console-script entry point, and the
+# `app` attribute would otherwise be shadowed by the `ingot.cli.app` submodule.
 from ingot.cli.app import app, main, version_callback
-from ingot.cli.async_helpers import AsyncLoopAlreadyRunningError, run_async
-from ingot.cli.menu import _configure_settings, _run_main_menu, show_help
-from ingot.cli.platform import (
-    AMBIGUOUS_PLATFORMS,
-    _disambiguate_platform,
-    _is_ambiguous_ticket_id,
-    _platform_display_name,
-    _validate_platform,
-)
-from ingot.cli.ticket import (
-    _LINEAR_URL_TEMPLATE,
-    _fetch_ticket_async,
-    _fetch_ticket_with_onboarding,
-    _handle_fetch_error,
-    _resolve_with_platform_hint,
-    create_ticket_service_from_config,
-)
-from ingot.cli.workflow import _check_prerequisites, _run_workflow
+from ingot.utils.lazy_imports import lazy_getattr
+
+if TYPE_CHECKING:
+    from ingot.cli.async_helpers import AsyncLoopAlreadyRunningError, run_async
+    from ingot.cli.menu import _configure_settings, _run_main_menu, show_help
+    from ingot.cli.platform import (
+        AMBIGUOUS_PLATFORMS,
+        _disambiguate_platform,
+        _is_ambiguous_ticket_id,
+        _platform_display_name,
+        _validate_platform,
+    )
+    from ingot.cli.ticket import (
+        _LINEAR_URL_TEMPLATE,
+        _fetch_ticket_async,
+        _fetch_ticket_with_onboarding,
+        _handle_fetch_error,
+        _resolve_with_platform_hint,
+        create_ticket_service_from_config,
+    )
+    from ingot.cli.workflow import _check_prerequisites, _run_workflow
+
+# Lazy imports (PEP 562): submodules are only imported when one of their
+# names is first accessed, so importing this package stays cheap.
+_LAZY_IMPORTS = {
+    "AsyncLoopAlreadyRunningError": "ingot.cli.async_helpers",
+    "run_async": "ingot.cli.async_helpers",
+    "_configure_settings": "ingot.cli.menu",
+    "_run_main_menu": "ingot.cli.menu",
+    "show_help": "ingot.cli.menu",
+    "AMBIGUOUS_PLATFORMS": "ingot.cli.platform",
+    "_disambiguate_platform": "ingot.cli.platform",
+    "_is_ambiguous_ticket_id": "ingot.cli.platform",
+    "_platform_display_name": "ingot.cli.platform",
+    "_validate_platform": "ingot.cli.platform",
+    "_LINEAR_URL_TEMPLATE": "ingot.cli.ticket",
+    "_fetch_ticket_async": "ingot.cli.ticket",
+    "_fetch_ticket_with_onboarding": "ingot.cli.ticket",
+    "_handle_fetch_error": "ingot.cli.ticket",
+    "_resolve_with_platform_hint": "ingot.cli.ticket",
+    "create_ticket_service_from_config": "ingot.cli.ticket",
+    "_check_prerequisites": "ingot.cli.workflow",
+    "_run_workflow": "ingot.cli.workflow",
+}
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     # app.py
@@ -9,7 +9,6 @@ import logging
 from typing import TYPE_CHECKING
 
 from ingot.config.manager import ConfigManager
-from ingot.ui.menus import MainMenuChoice, show_main_menu
 from ingot.utils.console import print_error, print_header, print_info
 
 logger = logging.getLogger(__name__)
@@ -58,6 +57,7 @@ def show_help() -> None:
 def _run_main_menu(config: ConfigManager) -> None:
     """Run the main menu loop."""
     from ingot.cli.workflow import _run_workflow
+    from ingot.ui.menus import MainMenuChoice, show_main_menu
 
     while True:
         choice = show_main_menu()
@@ -6,7 +6,6 @@ Handles prerequisites checking and workflow execution from CLI context.
 import typer
 
 from ingot.cli.platform import _disambiguate_platform, _is_ambiguous_ticket_id
-from ingot.cli.ticket import _fetch_ticket_with_onboarding
 from ingot.config.manager import ConfigManager
 from ingot.integrations.git import is_git_repo
 from ingot.integrations.providers import Platform
@@ -67,6 +66,7 @@ def _run_workflow(
     plan_validation_strict: bool | None = None,
 ) -> None:
     """Run the AI-assisted workflow."""
+    from ingot.cli.ticket import _fetch_ticket_with_onboarding
     from ingot.workflow.runner import run_ingot_workflow
     from ingot.workflow.state import DirtyTreePolicy, RateLimitConfig
 
@@ -126,6 +126,18 @@ def _run_workflow(
         )
         raise typer.Exit(ExitCode.GENERAL_ERROR)
 
+    # Validate clarification_batch_size (config only)
+    clarification_batch_size = config.settings.clarification_batch_size
+    if clarification_batch_size < 1 or clarification_batch_size > 10:
+        print_error(f"Invalid CLARIFICATION_BATCH_SIZE={clarification_batch_size} (must be 1-10)")
+        raise typer.Exit(ExitCode.GENERAL_ERROR)
+
+    # Validate plan_candidates (config only)
+    plan_candidates = config.settings.plan_candidates
+    if plan_candidates < 1 or plan_candidates > 5:
+        print_error(f"Invalid PLAN_CANDIDATES={plan_candidates} (must be 1-5)")
+        raise typer.Exit(ExitCode.GENERAL_ERROR)
+
     # Parse dirty tree policy
     effective_dirty_tree_policy = DirtyTreePolicy.FAIL_FAST  # default
     if dirty_tree_policy:
@@ -172,6 +184,7 @@ def _run_workflow(
         planning_model=effective_planning_model,
         implementation_model=effective_impl_model,
         skip_clarification=skip_clarification or config.settings.skip_clarification,
+        clarification_batch_size=clarification_batch_size,
         squash_at_end=squash_at_end and config.settings.squash_at_end,
         use_tui=use_tui,
         verbose=verbose,
@@ -182,11 +195,22 @@ def _run_workflow(
         max_review_fix_attempts=effective_max_review_fix_attempts,
         rate_limit_config=rate_limit_config,
         enable_phase_review=enable_review,
+        enable_sharded_review=config.settings.enable_sharded_review,
         dirty_tree_policy=effective_dirty_tree_policy,
         auto_update_docs=effective_auto_update_docs,
         auto_commit=effective_auto_commit,
         enable_plan_validation=effective_plan_validation,
         plan_validation_strict=effective_plan_validation_strict,
+        plan_candidates=plan_candidates,
+        plan_candidate_models=[
+            model.strip()
+            for model in config.settings.plan_candidate_models.split(",")
+            if model.strip()
+        ],
+        prefetch_tasklist=config.settings.prefetch_tasklist,
+        research_cache_max_mb=config.settings.research_cache_max_mb,
+        enable_code_search=config.settings.enable_code_search,
+        speculative_research=config.settings.speculative_research,
     )
     if not result:
         raise typer.Exit(code=ExitCode.GENERAL_ERROR)
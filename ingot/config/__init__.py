@@ -18,24 +18,54 @@ Examples:
 Use ConfigManager.validate_fetch_config() for validation.
 """
 
-from ingot.config.fetch_config import (
-    KNOWN_PLATFORMS,
-    MAX_CACHE_DURATION_HOURS,
-    MAX_RETRIES,
-    MAX_RETRY_DELAY_SECONDS,
-    MAX_TIMEOUT_SECONDS,
-    PLATFORM_REQUIRED_CREDENTIALS,
-    AgentConfig,
-    AgentPlatform,
-    ConfigValidationError,
-    FetchPerformanceConfig,
-    FetchStrategy,
-    FetchStrategyConfig,
-    validate_credentials,
-    validate_strategy_for_platform,
-)
-from ingot.config.manager import SENSITIVE_KEY_PATTERNS, ConfigManager, EnvVarExpansionError
-from ingot.config.settings import Settings
+from typing import TYPE_CHECKING
+
+from ingot.utils.lazy_imports import lazy_getattr
+
+if TYPE_CHECKING:
+    from ingot.config.fetch_config import (
+        KNOWN_PLATFORMS,
+        MAX_CACHE_DURATION_HOURS,
+        MAX_RETRIES,
+        MAX_RETRY_DELAY_SECONDS,
+        MAX_TIMEOUT_SECONDS,
+        PLATFORM_REQUIRED_CREDENTIALS,
+        AgentConfig,
+        AgentPlatform,
+        ConfigValidationError,
+        FetchPerformanceConfig,
+        FetchStrategy,
+        FetchStrategyConfig,
+        validate_credentials,
+        validate_strategy_for_platform,
+    )
+    from ingot.config.manager import SENSITIVE_KEY_PATTERNS, ConfigManager, EnvVarExpansionError
+    from ingot.config.settings import Settings
+
+# Lazy imports (PEP 562): submodules are only imported when one of their
+# names is first accessed, so importing this package stays cheap.
+_LAZY_IMPORTS = {
+    "KNOWN_PLATFORMS": "ingot.config.fetch_config",
+    "MAX_CACHE_DURATION_HOURS": "ingot.config.fetch_config",
+    "MAX_RETRIES": "ingot.config.fetch_config",
+    "MAX_RETRY_DELAY_SECONDS": "ingot.config.fetch_config",
+    "MAX_TIMEOUT_SECONDS": "ingot.config.fetch_config",
+    "PLATFORM_REQUIRED_CREDENTIALS": "ingot.config.fetch_config",
+    "AgentConfig": "ingot.config.fetch_config",
+    "AgentPlatform": "ingot.config.fetch_config",
+    "ConfigValidationError": "ingot.config.fetch_config",
+    "FetchPerformanceConfig": "ingot.config.fetch_config",
+    "FetchStrategy": "ingot.config.fetch_config",
+    "FetchStrategyConfig": "ingot.config.fetch_config",
+    "validate_credentials": "ingot.config.fetch_config",
+    "validate_strategy_for_platform": "ingot.config.fetch_config",
+    "SENSITIVE_KEY_PATTERNS": "ingot.config.manager",
+    "ConfigManager": "ingot.config.manager",
+    "EnvVarExpansionError": "ingot.config.manager",
+    "Settings": "ingot.config.settings",
+}
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     # Core classes
@@ -76,6 +76,7 @@ class Settings:
 
     # Workflow settings
     skip_clarification: bool = False
+    clarification_batch_size: int = 1  # Questions asked per batch in Step 1.5 (1 = one at a time)
     squash_at_end: bool = True
 
     # Parallel execution settings
@@ -84,6 +85,7 @@ class Settings:
     fail_fast: bool = False
     max_self_corrections: int = 3  # Max self-correction attempts per task (0 = disable)
     max_review_fix_attempts: int = 3  # Max auto-fix attempts during review (0 = disable)
+    enable_sharded_review: bool = False  # Review large changesets in parallel shards
 
     # Subagent settings (customizable agent names)
     # Defaults use local constants to avoid circular imports
@@ -96,11 +98,19 @@ class Settings:
     subagent_doc_updater: str = _INGOT_AGENT_DOC_UPDATER
     subagent_researcher: str = _INGOT_AGENT_RESEARCHER
 
+    # Research cache settings
+    research_cache_max_mb: int = 50  # Size bound of cached researcher output (0 = disable)
+    enable_code_search: bool = True  # Local code search and symbol indexes
+    speculative_research: bool = True  # Start the researcher before the interactive setup ends
+
     # Plan validation settings
     enable_plan_validation: bool = True
     plan_validation_strict: bool = (
         True  # Block workflow on validation errors (vs. warn-and-proceed)
     )
+    plan_candidates: int = 1  # Plans generated concurrently, best validated one kept (1 = off)
+    plan_candidate_models: str = ""  # Comma-separated models assigned to candidates in turn
+    prefetch_tasklist: bool = True  # Generate the task list while the plan is reviewed
 
     # Documentation update settings
     auto_update_docs: bool = True  # Enable automatic documentation updates
@@ -135,12 +145,14 @@ class Settings:
             "AUTO_OPEN_FILES": "auto_open_files",
             "PREFERRED_EDITOR": "preferred_editor",
             "SKIP_CLARIFICATION": "skip_clarification",
+            "CLARIFICATION_BATCH_SIZE": "clarification_batch_size",
             "SQUASH_AT_END": "squash_at_end",
             "PARALLEL_EXECUTION_ENABLED": "parallel_execution_enabled",
             "MAX_PARALLEL_TASKS": "max_parallel_tasks",
             "FAIL_FAST": "fail_fast",
             "MAX_SELF_CORRECTIONS": "max_self_corrections",
             "MAX_REVIEW_FIX_ATTEMPTS": "max_review_fix_attempts",
+            "ENABLE_SHARDED_REVIEW": "enable_sharded_review",
             "SUBAGENT_PLANNER": "subagent_planner",
             "SUBAGENT_TASKLIST": "subagent_tasklist",
             "SUBAGENT_TASKLIST_REFINER": "subagent_tasklist_refiner",
@@ -149,8 +161,14 @@ class Settings:
             "SUBAGENT_FIXER": "subagent_fixer",
             "SUBAGENT_DOC_UPDATER": "subagent_doc_updater",
             "SUBAGENT_RESEARCHER": "subagent_researcher",
+            "RESEARCH_CACHE_MAX_MB": "research_cache_max_mb",
+            "ENABLE_CODE_SEARCH": "enable_code_search",
+            "SPECULATIVE_RESEARCH": "speculative_research",
             "ENABLE_PLAN_VALIDATION": "enable_plan_validation",
             "PLAN_VALIDATION_STRICT": "plan_validation_strict",
+            "PLAN_CANDIDATES": "plan_candidates",
+            "PLAN_CANDIDATE_MODELS": "plan_candidate_models",
+            "PREFETCH_TASKLIST": "prefetch_tasklist",
             "AUTO_UPDATE_DOCS": "auto_update_docs",
             "AUTO_COMMIT": "auto_commit",
             # Platform settings
@@ -6,46 +6,91 @@ This package contains:
 - auth: Authentication management for fallback credentials
 """
 
-from ingot.integrations.auggie import (
-    AuggieClient,
-    AuggieModel,
-    check_auggie_installed,
-    get_auggie_version,
-    install_auggie,
-    list_models,
-    version_gte,
-)
-from ingot.integrations.auth import (
-    AuthenticationManager,
-    PlatformCredentials,
-)
-from ingot.integrations.cache import (
-    CacheConfigurationError,
-    CachedTicket,
-    CacheKey,
-    FileBasedTicketCache,
-    InMemoryTicketCache,
-    TicketCache,
-)
-from ingot.integrations.git import (
-    DirtyStateAction,
-    add_to_gitignore,
-    branch_exists,
-    checkout_branch,
-    create_branch,
-    create_checkpoint_commit,
-    get_current_branch,
-    get_current_commit,
-    get_status_short,
-    handle_dirty_state,
-    is_dirty,
-    is_git_repo,
-    squash_commits,
-)
-from ingot.integrations.ticket_service import (
-    TicketService,
-    create_ticket_service,
-)
+from typing import TYPE_CHECKING
+
+from ingot.utils.lazy_imports import lazy_getattr
+
+if TYPE_CHECKING:
+    from ingot.integrations.auggie import (
+        AuggieClient,
+        AuggieModel,
+        check_auggie_installed,
+        get_auggie_version,
+        install_auggie,
+        list_models,
+        version_gte,
+    )
+    from ingot.integrations.auth import AuthenticationManager, PlatformCredentials
+    from ingot.integrations.cache import (
+        CacheConfigurationError,
+        CachedTicket,
+        CacheKey,
+        FileBasedTicketCache,
+        InMemoryTicketCache,
+        TicketCache,
+    )
+    from ingot.integrations.git import (
+        DirtyStateAction,
+        GitObjectReader,
+        RepoSnapshot,
+        add_to_gitignore,
+        branch_exists,
+        checkout_branch,
+        create_branch,
+        create_checkpoint_commit,
+        get_current_branch,
+        get_current_commit,
+        get_repo_snapshot,
+        get_status_short,
+        handle_dirty_state,
+        is_dirty,
+        is_git_repo,
+        repo_snapshot_scope,
+        squash_commits,
+    )
+    from ingot.integrations.ticket_service import TicketBatch, TicketService, create_ticket_service
+
+# Lazy imports (PEP 562): submodules are only imported when one of their
+# names is first accessed, so importing this package stays cheap.
+_LAZY_IMPORTS = {
+    "AuggieClient": "ingot.integrations.auggie",
+    "AuggieModel": "ingot.integrations.auggie",
+    "check_auggie_installed": "ingot.integrations.auggie",
+    "get_auggie_version": "ingot.integrations.auggie",
+    "install_auggie": "ingot.integrations.auggie",
+    "list_models": "ingot.integrations.auggie",
+    "version_gte": "ingot.integrations.auggie",
+    "AuthenticationManager": "ingot.integrations.auth",
+    "PlatformCredentials": "ingot.integrations.auth",
+    "CacheConfigurationError": "ingot.integrations.cache",
+    "CachedTicket": "ingot.integrations.cache",
+    "CacheKey": "ingot.integrations.cache",
+    "FileBasedTicketCache": "ingot.integrations.cache",
+    "InMemoryTicketCache": "ingot.integrations.cache",
+    "TicketCache": "ingot.integrations.cache",
+    "DirtyStateAction": "ingot.integrations.git",
+    "GitObjectReader": "ingot.integrations.git",
+    "RepoSnapshot": "ingot.integrations.git",
+    "get_repo_snapshot": "ingot.integrations.git",
+    "repo_snapshot_scope": "ingot.integrations.git",
+    "add_to_gitignore": "ingot.integrations.git",
+    "branch_exists": "ingot.integrations.git",
+    "checkout_branch": "ingot.integrations.git",
+    "create_branch": "ingot.integrations.git",
+    "create_checkpoint_commit": "ingot.integrations.git",
+    "get_current_branch": "ingot.integrations.git",
+    "get_current_commit": "ingot.integrations.git",
+    "get_status_short": "ingot.integrations.git",
+    "handle_dirty_state": "ingot.integrations.git",
+    "is_dirty": "ingot.integrations.git",
+    "is_git_repo": "ingot.integrations.git",
+    "squash_commits": "ingot.integrations.git",
+    "TicketBatch": "ingot.integrations.ticket_service",
+    "TicketService": "ingot.integrations.ticket_service",
+    "create_ticket_service": "ingot.integrations.ticket_service",
+}
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
 
 # Note: INGOT_AGENT_* constants are NOT re-exported here to avoid
 # circular imports. Import them directly from ingot.workflow.constants.
@@ -63,6 +108,10 @@ __all__ = [
     "FileBasedTicketCache",
     # Git
     "DirtyStateAction",
+    "RepoSnapshot",
+    "GitObjectReader",
+    "get_repo_snapshot",
+    "repo_snapshot_scope",
     "is_git_repo",
     "is_dirty",
     "get_current_branch",
@@ -84,6 +133,7 @@ __all__ = [
     "install_auggie",
     "list_models",
     # TicketService
+    "TicketBatch",
     "TicketService",
     "create_ticket_service",
 ]
@@ -978,11 +978,14 @@ def _update_agent_file(agent_path: Path, agent_name: str, quiet: bool = False) -
 
 # Patterns that INGOT requires in the target project's .gitignore
 # Note: We do NOT ignore specs/ because plan and tasklist .md files should be visible to users
-# Only runtime artifacts (.ingot/runs/ for logs/state, *.log files) are ignored
+# Only runtime artifacts (.ingot/runs/ for logs/state, .ingot/cache/ for local
+# caches, *.log files, task state journals next to the tasklist) are ignored
 # Note: .ingot/agents/ contains project-level config that should be committable
 INGOT_GITIGNORE_PATTERNS = [
     ".ingot/runs/",
+    ".ingot/cache/",
     "*.log",
+    "*.state.jsonl",
 ]
 
 # Comment marker to identify INGOT-managed section
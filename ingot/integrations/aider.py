@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import Literal
 
 from ingot.utils.logging import check_cli_installed, log_backend_metadata, log_command, log_message
+from ingot.utils.processes import process_started
 
 # Valid chat modes for Aider CLI's --chat-mode flag.
 AiderChatMode = Literal["ask", "code", "architect", "help"]
@@ -163,6 +164,7 @@ class AiderClient:
                 text=True,
                 bufsize=1,
             )
+            process_started(process)
 
             output_lines: list[str] = []
             if process.stdout is not None:
@@ -23,6 +23,7 @@ from ingot.utils.console import (
     print_warning,
 )
 from ingot.utils.logging import log_command, log_message
+from ingot.utils.processes import process_started
 
 
 @dataclass
@@ -625,6 +626,7 @@ class AuggieClient:
             text=True,
             bufsize=1,  # Line buffered
         )
+        process_started(process)
 
         output_lines = []
         if process.stdout is not None:
@@ -24,6 +24,7 @@ import yaml
 
 from ingot.config.fetch_config import AgentPlatform
 from ingot.integrations.backends.errors import BackendTimeoutError
+from ingot.utils.processes import process_started
 
 # ── Shared rate-limit detection ──────────────────────────────────────────────
 # Only match actual rate-limit status codes with word boundaries to prevent
@@ -600,6 +601,7 @@ class BaseBackend(ABC):
             bufsize=1,  # Line-buffered
             env=process_env,
         )
+        process_started(process)
 
         output_lines: list[str] = []
         stop_watchdog_event = threading.Event()
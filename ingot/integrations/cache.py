@@ -29,6 +29,7 @@ import threading
 import urllib.parse
 from abc import ABC, abstractmethod
 from collections import OrderedDict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -66,12 +67,17 @@ class CacheKey:
 
 @dataclass
 class CachedTicket:
-    """Cached ticket with expiration metadata. All timestamps use UTC."""
+    """Cached ticket with expiration metadata. All timestamps use UTC.
+
+    etag and last_modified are the HTTP validators of the response the
+    ticket was built from, used to revalidate it with a conditional request.
+    """
 
     ticket: GenericTicket
     cached_at: datetime
     expires_at: datetime
     etag: str | None = None
+    last_modified: str | None = None
 
     @property
     def is_expired(self) -> bool:
@@ -102,10 +108,19 @@ class TicketCache(ABC):
         ticket: GenericTicket,
         ttl: timedelta | None = None,
         etag: str | None = None,
+        last_modified: str | None = None,
     ) -> None:
-        """Store ticket in cache with optional custom TTL."""
+        """Store ticket in cache with optional custom TTL and HTTP validators."""
         pass
 
+    def set_many(self, tickets: Iterable[GenericTicket], ttl: timedelta | None = None) -> None:
+        """Store several tickets (without HTTP validators) with the same TTL.
+
+        Implementations override this to take their lock once for the lot.
+        """
+        for ticket in tickets:
+            self.set(ticket, ttl=ttl)
+
     @abstractmethod
     def invalidate(self, key: CacheKey) -> None:
         """Remove a specific ticket from cache."""
@@ -122,8 +137,14 @@ class TicketCache(ABC):
         pass
 
     @abstractmethod
-    def get_cached_ticket(self, key: CacheKey) -> CachedTicket | None:
-        """Retrieve full CachedTicket with metadata."""
+    def get_cached_ticket(
+        self, key: CacheKey, *, include_expired: bool = False
+    ) -> CachedTicket | None:
+        """Retrieve full CachedTicket with metadata.
+
+        With include_expired, an expired entry is returned (and kept) so
+        that its validators can be used to revalidate it.
+        """
         pass
 
     @abstractmethod
@@ -154,7 +175,9 @@ class InMemoryTicketCache(TicketCache):
         cached = self.get_cached_ticket(key)
         return cached.ticket if cached else None
 
-    def get_cached_ticket(self, key: CacheKey) -> CachedTicket | None:
+    def get_cached_ticket(
+        self, key: CacheKey, *, include_expired: bool = False
+    ) -> CachedTicket | None:
         """Retrieve full CachedTicket with metadata.
 
         Returns a deep copy to prevent callers from mutating cached data.
@@ -167,7 +190,7 @@ class InMemoryTicketCache(TicketCache):
             if cached is None:
                 return None
 
-            if cached.is_expired:
+            if cached.is_expired and not include_expired:
                 # Remove expired entry
                 del self._cache[key_str]
                 logger.debug(f"Cache expired for {key}")
@@ -183,37 +206,58 @@ class InMemoryTicketCache(TicketCache):
         ticket: GenericTicket,
         ttl: timedelta | None = None,
         etag: str | None = None,
+        last_modified: str | None = None,
     ) -> None:
         """Store ticket in cache.
 
         Stores a deep copy of the ticket to prevent external mutation
         from corrupting the cache.
         """
-        key = CacheKey.from_ticket(ticket)
+        cached = self._new_entry(ticket, ttl, etag, last_modified)
+        with self._lock:
+            self._store(cached)
+
+    def set_many(self, tickets: Iterable[GenericTicket], ttl: timedelta | None = None) -> None:
+        """Store several tickets, copying them outside the lock."""
+        entries = [self._new_entry(ticket, ttl) for ticket in tickets]
+        with self._lock:
+            for cached in entries:
+                self._store(cached)
+
+    def _new_entry(
+        self,
+        ticket: GenericTicket,
+        ttl: timedelta | None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> CachedTicket:
         effective_ttl = ttl if ttl is not None else self.default_ttl
         now = datetime.now(UTC)
 
         # Deep copy to prevent external mutation from corrupting the cache
-        cached = CachedTicket(
+        return CachedTicket(
             ticket=copy.deepcopy(ticket),
             cached_at=now,
             expires_at=now + effective_ttl,
             etag=etag,
+            last_modified=last_modified,
         )
 
-        with self._lock:
-            key_str = str(key)
+    def _store(self, cached: CachedTicket) -> None:
+        """Insert an entry, evicting the least recently used. Called with lock held."""
+        key = CacheKey.from_ticket(cached.ticket)
+        key_str = str(key)
 
-            if key_str in self._cache:
-                del self._cache[key_str]
+        if key_str in self._cache:
+            del self._cache[key_str]
 
-            while self.max_size > 0 and len(self._cache) >= self.max_size:
-                oldest_key = next(iter(self._cache))
-                del self._cache[oldest_key]
-                logger.debug(f"LRU evicted: {oldest_key}")
+        while self.max_size > 0 and len(self._cache) >= self.max_size:
+            oldest_key = next(iter(self._cache))
+            del self._cache[oldest_key]
+            logger.debug(f"LRU evicted: {oldest_key}")
 
-            self._cache[key_str] = cached
-            logger.debug(f"Cached {key} with TTL {effective_ttl}")
+        self._cache[key_str] = cached
+        logger.debug(f"Cached {key} until {cached.expires_at}")
 
     def invalidate(self, key: CacheKey) -> None:
         """Remove a specific ticket from cache."""
@@ -300,6 +344,7 @@ class FileBasedTicketCache(TicketCache):
             "cached_at": cached.cached_at.isoformat(),
             "expires_at": cached.expires_at.isoformat(),
             "etag": cached.etag,
+            "last_modified": cached.last_modified,
         }
 
     def _deserialize_ticket(self, data: dict[str, Any]) -> CachedTicket | None:
@@ -315,6 +360,7 @@ class FileBasedTicketCache(TicketCache):
                 cached_at=datetime.fromisoformat(data["cached_at"]),
                 expires_at=datetime.fromisoformat(data["expires_at"]),
                 etag=data.get("etag"),
+                last_modified=data.get("last_modified"),
             )
         except (KeyError, ValueError, TypeError) as e:
             logger.warning(f"Failed to deserialize cached ticket: {e}")
@@ -325,7 +371,9 @@ class FileBasedTicketCache(TicketCache):
         cached = self.get_cached_ticket(key)
         return cached.ticket if cached else None
 
-    def get_cached_ticket(self, key: CacheKey) -> CachedTicket | None:
+    def get_cached_ticket(
+        self, key: CacheKey, *, include_expired: bool = False
+    ) -> CachedTicket | None:
         """Retrieve full CachedTicket with metadata."""
         path = self._get_path(key)
         with self._lock:
@@ -341,7 +389,7 @@ class FileBasedTicketCache(TicketCache):
                     self._approx_size = None  # Invalidate cache size estimate
                     return None
 
-                if cached.is_expired:
+                if cached.is_expired and not include_expired:
                     path.unlink(missing_ok=True)
                     self._approx_size = None  # Invalidate cache size estimate
                     logger.debug(f"Cache expired for {key}")
@@ -410,42 +458,62 @@ class FileBasedTicketCache(TicketCache):
         ticket: GenericTicket,
         ttl: timedelta | None = None,
         etag: str | None = None,
+        last_modified: str | None = None,
     ) -> None:
         """Store ticket in cache with atomic write for crash safety.
 
         Uses a deep copy of the ticket to prevent external mutation.
         """
-        key = CacheKey.from_ticket(ticket)
+        cached = self._new_entry(ticket, ttl, etag, last_modified)
+        with self._lock:
+            self._write_entry(cached)
+            # Lazy eviction: probabilistic check to avoid O(N) on every write
+            self._maybe_evict_lru()
+
+    def set_many(self, tickets: Iterable[GenericTicket], ttl: timedelta | None = None) -> None:
+        """Store several tickets, checking for eviction once for the lot."""
+        entries = [self._new_entry(ticket, ttl) for ticket in tickets]
+        with self._lock:
+            for cached in entries:
+                self._write_entry(cached)
+            self._maybe_evict_lru()
+
+    def _new_entry(
+        self,
+        ticket: GenericTicket,
+        ttl: timedelta | None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> CachedTicket:
         effective_ttl = ttl if ttl is not None else self.default_ttl
         now = datetime.now(UTC)
-
-        cached = CachedTicket(
+        return CachedTicket(
             ticket=copy.deepcopy(ticket),
             cached_at=now,
             expires_at=now + effective_ttl,
             etag=etag,
+            last_modified=last_modified,
         )
 
+    def _write_entry(self, cached: CachedTicket) -> None:
+        """Write an entry to its file. Called with lock held; failures are logged."""
+        key = CacheKey.from_ticket(cached.ticket)
         path = self._get_path(key)
-        with self._lock:
-            try:
-                is_new_file = not path.exists()
-                data = self._serialize_ticket(cached)
-
-                self._atomic_write(path, data)
-                logger.debug(f"Cached {key} to {path}")
-
-                # Update approximate size counter
-                if is_new_file:
-                    if self._approx_size is not None:
-                        self._approx_size += 1
-
-                # Lazy eviction: probabilistic check to avoid O(N) on every write
-                self._maybe_evict_lru()
-            except (TypeError, ValueError) as e:
-                logger.warning(f"Failed to cache ticket {key} due to serialization error: {e}")
-            except OSError as e:
-                logger.warning(f"Failed to write cache file {path}: {e}")
+        try:
+            is_new_file = not path.exists()
+            data = self._serialize_ticket(cached)
+
+            self._atomic_write(path, data)
+            logger.debug(f"Cached {key} to {path}")
+
+            # Update approximate size counter
+            if is_new_file:
+                if self._approx_size is not None:
+                    self._approx_size += 1
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Failed to cache ticket {key} due to serialization error: {e}")
+        except OSError as e:
+            logger.warning(f"Failed to write cache file {path}: {e}")
 
     def invalidate(self, key: CacheKey) -> None:
         """Remove a specific ticket from cache."""
@@ -18,6 +18,7 @@ from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 
 from ingot.utils.logging import log_command, log_message
+from ingot.utils.processes import process_started
 
 CLAUDE_CLI_NAME = "claude"
 
@@ -245,6 +246,7 @@ class ClaudeClient:
                 text=True,
                 bufsize=1,  # Line buffered
             )
+            process_started(process)
 
             output_lines: list[str] = []
             if process.stdout is not None:
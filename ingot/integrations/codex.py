@@ -11,6 +11,7 @@ import subprocess
 from collections.abc import Callable
 
 from ingot.utils.logging import check_cli_installed, log_backend_metadata, log_command, log_message
+from ingot.utils.processes import process_started
 
 CODEX_CLI_NAME = "codex"
 
@@ -142,6 +143,7 @@ class CodexClient:
             text=True,
             bufsize=1,
         )
+        process_started(process)
 
         output_lines: list[str] = []
         if process.stdout is not None:
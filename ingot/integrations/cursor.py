@@ -18,6 +18,7 @@ import time
 from collections.abc import Callable
 
 from ingot.utils.logging import log_command, log_message, log_once
+from ingot.utils.processes import process_started
 
 CURSOR_CLI_NAME = "cursor"
 
@@ -387,6 +388,7 @@ class CursorClient:
                 text=True,
                 bufsize=1,  # Line buffered
             )
+            process_started(process)
 
             output_lines: list[str] = []
             if process.stdout is not None:
@@ -20,22 +20,46 @@ Exceptions:
     AgentResponseParseError: JSON output was malformed
 """
 
-from ingot.integrations.fetchers.auggie_fetcher import AuggieMediatedFetcher
-from ingot.integrations.fetchers.base import (
-    DEFAULT_TIMEOUT_SECONDS,
-    AgentMediatedFetcher,
-    TicketFetcher,
-)
-from ingot.integrations.fetchers.claude_fetcher import ClaudeMediatedFetcher
-from ingot.integrations.fetchers.cursor_fetcher import CursorMediatedFetcher
-from ingot.integrations.fetchers.direct_api_fetcher import DirectAPIFetcher
-from ingot.integrations.fetchers.exceptions import (
-    AgentFetchError,
-    AgentIntegrationError,
-    AgentResponseParseError,
-    PlatformNotSupportedError,
-    TicketFetchError,
-)
+from typing import TYPE_CHECKING
+
+from ingot.utils.lazy_imports import lazy_getattr
+
+if TYPE_CHECKING:
+    from ingot.integrations.fetchers.auggie_fetcher import AuggieMediatedFetcher
+    from ingot.integrations.fetchers.base import (
+        DEFAULT_TIMEOUT_SECONDS,
+        AgentMediatedFetcher,
+        TicketFetcher,
+    )
+    from ingot.integrations.fetchers.claude_fetcher import ClaudeMediatedFetcher
+    from ingot.integrations.fetchers.cursor_fetcher import CursorMediatedFetcher
+    from ingot.integrations.fetchers.direct_api_fetcher import DirectAPIFetcher
+    from ingot.integrations.fetchers.exceptions import (
+        AgentFetchError,
+        AgentIntegrationError,
+        AgentResponseParseError,
+        PlatformNotSupportedError,
+        TicketFetchError,
+    )
+
+# Lazy imports (PEP 562): submodules are only imported when one of their
+# names is first accessed, so importing this package stays cheap.
+_LAZY_IMPORTS = {
+    "AuggieMediatedFetcher": "ingot.integrations.fetchers.auggie_fetcher",
+    "DEFAULT_TIMEOUT_SECONDS": "ingot.integrations.fetchers.base",
+    "AgentMediatedFetcher": "ingot.integrations.fetchers.base",
+    "TicketFetcher": "ingot.integrations.fetchers.base",
+    "ClaudeMediatedFetcher": "ingot.integrations.fetchers.claude_fetcher",
+    "CursorMediatedFetcher": "ingot.integrations.fetchers.cursor_fetcher",
+    "DirectAPIFetcher": "ingot.integrations.fetchers.direct_api_fetcher",
+    "AgentFetchError": "ingot.integrations.fetchers.exceptions",
+    "AgentIntegrationError": "ingot.integrations.fetchers.exceptions",
+    "AgentResponseParseError": "ingot.integrations.fetchers.exceptions",
+    "PlatformNotSupportedError": "ingot.integrations.fetchers.exceptions",
+    "TicketFetchError": "ingot.integrations.fetchers.exceptions",
+}
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     # Base classes
@@ -28,10 +28,10 @@ import json
 import logging
 import random
 import weakref
-from collections.abc import Awaitable, Callable, Mapping
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, overload
 
 import httpx
 
@@ -46,7 +46,12 @@ from ingot.integrations.fetchers.exceptions import (
     PlatformNotFoundError,
     TicketIdFormatError,
 )
-from ingot.integrations.fetchers.handlers import PlatformHandler, create_handler
+from ingot.integrations.fetchers.handlers import (
+    CacheValidators,
+    ConditionalFetchResult,
+    PlatformHandler,
+    create_handler,
+)
 from ingot.integrations.providers.base import Platform
 
 if TYPE_CHECKING:
@@ -321,6 +326,108 @@ class DirectAPIFetcher(TicketFetcher):
         platform_enum = self._resolve_platform(platform)
         return await self.fetch_raw(ticket_id, platform_enum, timeout_seconds)
 
+    async def fetch_conditional(
+        self,
+        ticket_id: str,
+        platform: str,
+        validators: CacheValidators,
+        timeout_seconds: float | None = None,
+    ) -> ConditionalFetchResult:
+        """Fetch ticket data unless it is unchanged since validators were issued.
+
+        Sends If-None-Match/If-Modified-Since on platforms whose handler
+        supports conditional requests (GitHub, Jira); elsewhere this is an
+        ordinary fetch returning empty validators.
+
+        Args:
+            ticket_id: Normalized ticket ID
+            platform: Platform name string (e.g., 'jira', 'github')
+            validators: Validators stored with the cached ticket (may be empty)
+            timeout_seconds: Optional timeout override
+
+        Returns:
+            ConditionalFetchResult (data is None on 304 Not Modified)
+
+        Raises:
+            Same as fetch()
+        """
+        platform_enum = self._resolve_platform(platform)
+        handler, credentials = await self._prepare_fetch(platform_enum)
+        return await self._fetch_with_retry(
+            handler=handler,
+            ticket_id=ticket_id,
+            credentials=credentials,
+            timeout_seconds=(
+                timeout_seconds if timeout_seconds is not None else self._timeout_seconds
+            ),
+            validators=validators,
+        )
+
+    async def fetch_batch(
+        self,
+        ticket_ids: Sequence[str],
+        platform: str,
+        timeout_seconds: float | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch several tickets with the platform's batch endpoint.
+
+        Ticket IDs are sent in chunks of the handler's batch_size, all
+        chunks at once, each with the same retry policy as fetch().
+
+        Tickets missing from the result should be fetched one by one with
+        fetch(), which reports why they fail: the platform did not return
+        them, their chunk failed (logged as a warning), or the platform has
+        no batch endpoint (then no request is sent at all).
+
+        Args:
+            ticket_ids: Normalized ticket IDs
+            platform: Platform name string (e.g., 'jira', 'linear')
+            timeout_seconds: Optional timeout override (per request)
+
+        Returns:
+            Raw API data by ticket ID, in the shape fetch() returns
+
+        Raises:
+            AgentIntegrationError: If platform string is invalid or not supported
+        """
+        platform_enum = self._resolve_platform(platform)
+        handler, credentials = await self._prepare_fetch(platform_enum)
+        size = handler.batch_size
+        if not size or not ticket_ids:
+            return {}
+
+        effective_timeout = (
+            timeout_seconds if timeout_seconds is not None else self._timeout_seconds
+        )
+        chunks = [ticket_ids[start : start + size] for start in range(0, len(ticket_ids), size)]
+
+        async def fetch_chunk(chunk: Sequence[str]) -> dict[str, dict[str, Any]]:
+            return await self._call_with_retry(
+                handler,
+                ", ".join(chunk),
+                lambda http_client: handler.fetch_batch(
+                    chunk, credentials, effective_timeout, http_client=http_client
+                ),
+            )
+
+        results = await asyncio.gather(
+            *(fetch_chunk(chunk) for chunk in chunks), return_exceptions=True
+        )
+        tickets: dict[str, dict[str, Any]] = {}
+        for chunk, result in zip(chunks, results, strict=True):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                logger.warning(
+                    "Batch fetch of %d %s tickets failed: %s",
+                    len(chunk),
+                    handler.platform_name,
+                    result,
+                )
+                continue
+            tickets.update(result)
+        return tickets
+
     async def fetch_raw(
         self,
         ticket_id: str,
@@ -343,16 +450,7 @@ class DirectAPIFetcher(TicketFetcher):
             AgentFetchError: If API request fails (with retry exhaustion)
             AgentResponseParseError: If response parsing fails
         """
-        # Get credentials from AuthenticationManager
-        creds = self._auth.get_credentials(platform)
-        if not creds.is_configured:
-            raise AgentIntegrationError(
-                message=creds.error_message or f"No credentials configured for {platform.name}",
-                agent_name=self.name,
-            )
-
-        # Get platform-specific handler (async for concurrency-safe lazy loading)
-        handler = await self._get_platform_handler(platform)
+        handler, credentials = await self._prepare_fetch(platform)
 
         # Determine effective timeout
         effective_timeout = (
@@ -360,23 +458,100 @@ class DirectAPIFetcher(TicketFetcher):
         )
 
         # Execute with retry logic
-        # Keep credentials as Mapping[str, str] to respect immutability
         return await self._fetch_with_retry(
             handler=handler,
             ticket_id=ticket_id,
-            credentials=creds.credentials,
+            credentials=credentials,
             timeout_seconds=effective_timeout,
         )
 
+    async def _prepare_fetch(self, platform: Platform) -> tuple[PlatformHandler, Mapping[str, str]]:
+        """Get the handler and credentials for a platform.
+
+        Raises:
+            AgentIntegrationError: If no credentials are configured or no
+                handler exists for the platform
+        """
+        # Get credentials from AuthenticationManager
+        creds = self._auth.get_credentials(platform)
+        if not creds.is_configured:
+            raise AgentIntegrationError(
+                message=creds.error_message or f"No credentials configured for {platform.name}",
+                agent_name=self.name,
+            )
+
+        # Get platform-specific handler (async for concurrency-safe lazy loading)
+        handler = await self._get_platform_handler(platform)
+
+        # Keep credentials as Mapping[str, str] to respect immutability
+        return handler, creds.credentials
+
+    @overload
     async def _fetch_with_retry(
         self,
         handler: PlatformHandler,
         ticket_id: str,
         credentials: Mapping[str, str],
         timeout_seconds: float,
-    ) -> dict[str, Any]:
+        validators: None = None,
+    ) -> dict[str, Any]: ...
+
+    @overload
+    async def _fetch_with_retry(
+        self,
+        handler: PlatformHandler,
+        ticket_id: str,
+        credentials: Mapping[str, str],
+        timeout_seconds: float,
+        validators: CacheValidators,
+    ) -> ConditionalFetchResult: ...
+
+    async def _fetch_with_retry(
+        self,
+        handler: PlatformHandler,
+        ticket_id: str,
+        credentials: Mapping[str, str],
+        timeout_seconds: float,
+        validators: CacheValidators | None = None,
+    ) -> dict[str, Any] | ConditionalFetchResult:
         """Execute fetch with exponential backoff retry.
 
+        Conditional Requests:
+            With validators, the handler's fetch_conditional() is called
+            instead of fetch(), and its ConditionalFetchResult returned.
+            A 304 Not Modified is a success and is never retried.
+
+        See _call_with_retry() for the retry policy and error mapping.
+        """
+
+        async def request(
+            http_client: httpx.AsyncClient,
+        ) -> dict[str, Any] | ConditionalFetchResult:
+            if validators is not None:
+                return await handler.fetch_conditional(
+                    ticket_id,
+                    credentials,
+                    validators,
+                    timeout_seconds,
+                    http_client=http_client,
+                )
+            return await handler.fetch(
+                ticket_id,
+                credentials,
+                timeout_seconds,
+                http_client=http_client,
+            )
+
+        return await self._call_with_retry(handler, ticket_id, request)
+
+    async def _call_with_retry[T](
+        self,
+        handler: PlatformHandler,
+        ticket_id: str,
+        request: Callable[[httpx.AsyncClient], Awaitable[T]],
+    ) -> T:
+        """Execute a handler request with exponential backoff retry.
+
         Uses FetchPerformanceConfig settings for max_retries and retry_delay.
 
         Retry Policy:
@@ -401,6 +576,11 @@ class DirectAPIFetcher(TicketFetcher):
             - json.JSONDecodeError -> AgentResponseParseError
             - PlatformApiError -> AgentFetchError
             - PlatformNotFoundError -> AgentFetchError
+
+        Args:
+            handler: Handler the request is sent through
+            ticket_id: Ticket ID (or IDs) for log and error context
+            request: Sends the request with the shared HTTP client
         """
         last_error: Exception | None = None
         http_client = await self._get_http_client()
@@ -411,12 +591,7 @@ class DirectAPIFetcher(TicketFetcher):
 
         for attempt in range(self._performance.max_retries + 1):
             try:
-                return await handler.fetch(
-                    ticket_id,
-                    credentials,
-                    timeout_seconds,
-                    http_client=http_client,
-                )
+                return await request(http_client)
             except (CredentialValidationError, TicketIdFormatError) as e:
                 # Configuration/input errors - don't retry, map to integration error
                 raise AgentIntegrationError(
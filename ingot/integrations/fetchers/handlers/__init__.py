@@ -13,7 +13,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from ingot.integrations.fetchers.handlers.azure_devops import AzureDevOpsHandler
-from ingot.integrations.fetchers.handlers.base import GraphQLPlatformHandler, PlatformHandler
+from ingot.integrations.fetchers.handlers.base import (
+    CacheValidators,
+    ConditionalFetchResult,
+    GraphQLPlatformHandler,
+    PlatformHandler,
+)
 from ingot.integrations.fetchers.handlers.github import GitHubHandler
 from ingot.integrations.fetchers.handlers.jira import JiraHandler
 from ingot.integrations.fetchers.handlers.linear import LinearHandler
@@ -101,6 +106,9 @@ __all__ = [
     # Base classes
     "PlatformHandler",
     "GraphQLPlatformHandler",
+    # Conditional requests
+    "CacheValidators",
+    "ConditionalFetchResult",
     # Handler classes
     "JiraHandler",
     "LinearHandler",
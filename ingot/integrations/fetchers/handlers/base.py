@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
-from typing import Any, Literal
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, ClassVar, Literal
 
 import httpx
 
@@ -17,6 +18,74 @@ from ingot.integrations.fetchers.exceptions import (
 # HTTP status code for Not Found
 HTTP_NOT_FOUND = 404
 
+# HTTP status code for a conditional request whose cached copy is still current
+HTTP_NOT_MODIFIED = 304
+
+
+@dataclass(frozen=True)
+class CacheValidators:
+    """Validators of a cached response, sent back to make a request conditional.
+
+    Attributes:
+        etag: ETag response header (sent as If-None-Match)
+        last_modified: Last-Modified response header (sent as If-Modified-Since)
+    """
+
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def __bool__(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> CacheValidators:
+        """Read the validators of a response."""
+        return cls(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    def request_headers(self) -> dict[str, str]:
+        """Conditional request headers for these validators."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass(frozen=True)
+class ConditionalFetchResult:
+    """Result of a conditional fetch.
+
+    Attributes:
+        data: Raw API response, or None if the server answered 304 Not Modified
+        validators: Validators to store with the (re)cached ticket
+    """
+
+    data: dict[str, Any] | None
+    validators: CacheValidators
+
+    @property
+    def not_modified(self) -> bool:
+        """Whether the cached copy is still current."""
+        return self.data is None
+
+    @classmethod
+    def from_response(
+        cls, response: httpx.Response, sent: CacheValidators
+    ) -> ConditionalFetchResult:
+        """Build the result of a conditional request from its response.
+
+        A 304 may omit the validators, in which case the ones sent remain valid.
+        """
+        validators = CacheValidators.from_response(response)
+        if response.status_code == HTTP_NOT_MODIFIED:
+            return cls(data=None, validators=validators or sent)
+        data: dict[str, Any] = response.json()
+        return cls(data=data, validators=validators)
+
 
 class PlatformHandler(ABC):
     """Base class for platform-specific API handlers.
@@ -37,8 +106,21 @@ class PlatformHandler(ABC):
 
         For testing, handlers can still work without an injected client
         by falling back to creating a new client per request.
+
+    Conditional Requests:
+        Handlers for APIs that honor If-None-Match/If-Modified-Since
+        override fetch_conditional(). The default sends an ordinary
+        request, so callers can use it with every handler.
+
+    Batch Requests:
+        Handlers for APIs that can return several tickets in one request
+        set batch_size and override fetch_batch(). Callers check
+        batch_size first; the default fetch_batch() is unsupported.
     """
 
+    # Most tickets one fetch_batch() request may ask for (0: no batch endpoint)
+    batch_size: ClassVar[int] = 0
+
     @property
     @abstractmethod
     def platform_name(self) -> str:
@@ -84,6 +166,62 @@ class PlatformHandler(ABC):
         """
         pass
 
+    async def fetch_conditional(
+        self,
+        ticket_id: str,
+        credentials: Mapping[str, str],
+        validators: CacheValidators,
+        timeout_seconds: float | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> ConditionalFetchResult:
+        """Fetch ticket data unless it is unchanged since validators were issued.
+
+        Args:
+            ticket_id: The ticket identifier
+            credentials: Immutable credential mapping from AuthenticationManager
+            validators: Validators of the cached copy (may be empty)
+            timeout_seconds: Request timeout (applied per-request even with shared client)
+            http_client: Shared HTTP client from DirectAPIFetcher
+
+        Returns:
+            ConditionalFetchResult (data is None if the cached copy is current)
+
+        Raises:
+            Same as fetch()
+        """
+        data = await self.fetch(ticket_id, credentials, timeout_seconds, http_client)
+        return ConditionalFetchResult(data=data, validators=CacheValidators())
+
+    async def fetch_batch(
+        self,
+        ticket_ids: Sequence[str],
+        credentials: Mapping[str, str],
+        timeout_seconds: float | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch up to batch_size tickets in one request.
+
+        Each ticket's data has the shape fetch() returns for it, so it
+        normalizes the same way. Platforms without a batch endpoint
+        (batch_size 0) return no tickets, leaving each to a single fetch.
+
+        Args:
+            ticket_ids: Ticket identifiers (at most batch_size)
+            credentials: Immutable credential mapping from AuthenticationManager
+            timeout_seconds: Request timeout (applied per-request even with shared client)
+            http_client: Shared HTTP client from DirectAPIFetcher
+
+        Returns:
+            Raw API data by ticket ID. Tickets the platform did not return
+            (not found, no access) are missing.
+
+        Raises:
+            CredentialValidationError: If required credential keys are missing
+            PlatformApiError: If platform API returns a logical error
+            httpx.HTTPError: For HTTP-level failures
+        """
+        return {}
+
     def _validate_credentials(self, credentials: Mapping[str, str]) -> None:
         """Validate that all required credential keys are present.
 
@@ -138,6 +276,9 @@ class PlatformHandler(ABC):
         Returns:
             HTTP response object
 
+        A 304 Not Modified (answer to a conditional request) is returned
+        like a success.
+
         Raises:
             PlatformNotFoundError: If HTTP 404 is returned
             httpx.HTTPError: For other HTTP-level failures
@@ -168,7 +309,8 @@ class PlatformHandler(ABC):
             # Harmonized 404 handling: Convert HTTP 404 to semantic PlatformNotFoundError
             # This ensures consistent "Not Found" handling across REST and GraphQL handlers
             self._check_not_found(response, ticket_id)
-            response.raise_for_status()
+            if response.status_code != HTTP_NOT_MODIFIED:
+                response.raise_for_status()
             return response
         else:
             # Fallback: create a new client for this request
@@ -181,7 +323,8 @@ class PlatformHandler(ABC):
 
                 # Harmonized 404 handling for fallback client as well
                 self._check_not_found(response, ticket_id)
-                response.raise_for_status()
+                if response.status_code != HTTP_NOT_MODIFIED:
+                    response.raise_for_status()
                 return response
 
     def _check_not_found(self, response: httpx.Response, ticket_id: str | None) -> None:
@@ -320,3 +463,22 @@ class GraphQLPlatformHandler(PlatformHandler):
         self._check_graphql_errors(response_data, ticket_id)
         data = self._check_null_data(response_data, ticket_id)
         return self._extract_entity(data, ticket_id)
+
+    def _validate_batch_response(
+        self,
+        response_data: dict[str, Any],
+        ticket_ids: Sequence[str],
+    ) -> dict[str, Any]:
+        """Validate a batch GraphQL response and return its data.
+
+        Unlike a single fetch, errors alongside data are tolerated: they
+        usually report the entities that were not found, which come back
+        null while the rest of the batch is still valid.
+
+        Raises:
+            PlatformApiError: If the response has no data
+        """
+        context = ", ".join(ticket_ids)
+        if response_data.get("data") is None:
+            self._check_graphql_errors(response_data, context)
+        return self._check_null_data(response_data, context)
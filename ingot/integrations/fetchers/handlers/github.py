@@ -3,14 +3,85 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 import httpx
 
-from ingot.integrations.fetchers.exceptions import TicketIdFormatError
+from ingot.integrations.fetchers.exceptions import PlatformApiError, TicketIdFormatError
 
-from .base import PlatformHandler
+from .base import CacheValidators, ConditionalFetchResult, PlatformHandler
+
+# Fields of an issue or pull request in a batch query, enough to rebuild the
+# REST issue object that GitHubProvider.normalize() reads
+_ISSUE_FIELDS = """
+        number
+        title
+        body
+        state
+        url
+        createdAt
+        updatedAt
+        author { login }
+        assignees(first: 10) { nodes { login } }
+        labels(first: 100) { nodes { name } }
+        milestone { title }
+        repository { nameWithOwner }
+"""
+
+
+def _build_batch_query(count: int) -> str:
+    """GraphQL query for count issues/PRs, aliased i0..i{count-1}.
+
+    Variables: $oN (owner), $rN (repository name) and $nN (number).
+    """
+    variables = ", ".join(f"$o{n}: String!, $r{n}: String!, $n{n}: Int!" for n in range(count))
+    selections = "".join(
+        f"  i{n}: repository(owner: $o{n}, name: $r{n}) {{\n"
+        f"    issueOrPullRequest(number: $n{n}) {{\n"
+        f"      __typename\n"
+        f"      ... on Issue {{{_ISSUE_FIELDS}        stateReason\n      }}\n"
+        f"      ... on PullRequest {{{_ISSUE_FIELDS}        mergedAt\n      }}\n"
+        f"    }}\n"
+        f"  }}\n"
+        for n in range(count)
+    )
+    return f"\nquery GetIssues({variables}) {{\n{selections}}}\n"
+
+
+def _to_rest_issue(node: dict[str, Any]) -> dict[str, Any]:
+    """Convert a GraphQL issue/PR node to the REST issue object shape."""
+    assignees = [
+        {"login": assignee["login"]}
+        for assignee in (node.get("assignees") or {}).get("nodes") or []
+        if assignee
+    ]
+    author = node.get("author")
+    milestone = node.get("milestone")
+    issue: dict[str, Any] = {
+        "number": node.get("number"),
+        "title": node.get("title", ""),
+        "body": node.get("body"),
+        # REST has no "merged" state: merged PRs are closed
+        "state": "open" if node.get("state") == "OPEN" else "closed",
+        "state_reason": (node.get("stateReason") or "").lower() or None,
+        "html_url": node.get("url", ""),
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "user": {"login": author["login"]} if author else None,
+        "assignee": assignees[0] if assignees else None,
+        "assignees": assignees,
+        "labels": [
+            {"name": label["name"]}
+            for label in (node.get("labels") or {}).get("nodes") or []
+            if label
+        ],
+        "milestone": {"title": milestone["title"]} if milestone else None,
+        "repository": {"full_name": (node.get("repository") or {}).get("nameWithOwner", "")},
+    }
+    if node.get("__typename") == "PullRequest":
+        issue["pull_request"] = {"html_url": issue["html_url"], "merged_at": node.get("mergedAt")}
+    return issue
 
 
 class GitHubHandler(PlatformHandler):
@@ -20,9 +91,20 @@ class GitHubHandler(PlatformHandler):
         - token: GitHub personal access token
 
     Ticket ID format: "owner/repo#number" (e.g., "microsoft/vscode#12345")
+
+    Conditional requests: GitHub returns ETag and Last-Modified for issues
+    and answers a matching conditional request with 304, which does not
+    count against the rate limit.
+
+    Batch requests: the REST API has no multi-issue endpoint, so batches
+    use one GraphQL query with an aliased repository lookup per issue,
+    converted back to the REST issue shape.
     """
 
     API_URL = "https://api.github.com"
+    GRAPHQL_URL = "https://api.github.com/graphql"
+
+    batch_size = 50
 
     @property
     def platform_name(self) -> str:
@@ -76,6 +158,88 @@ class GitHubHandler(PlatformHandler):
             PlatformNotFoundError: If issue is not found (404)
             httpx.HTTPError: For other HTTP-level failures
         """
+        response = await self._get_issue(ticket_id, credentials, timeout_seconds, http_client)
+        result: dict[str, Any] = response.json()
+        return result
+
+    async def fetch_conditional(
+        self,
+        ticket_id: str,
+        credentials: Mapping[str, str],
+        validators: CacheValidators,
+        timeout_seconds: float | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> ConditionalFetchResult:
+        """Fetch issue/PR from GitHub unless it is unchanged since validators were issued."""
+        response = await self._get_issue(
+            ticket_id,
+            credentials,
+            timeout_seconds,
+            http_client,
+            extra_headers=validators.request_headers(),
+        )
+        return ConditionalFetchResult.from_response(response, validators)
+
+    async def fetch_batch(
+        self,
+        ticket_ids: Sequence[str],
+        credentials: Mapping[str, str],
+        timeout_seconds: float | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch issues/PRs from GitHub with one aliased GraphQL query.
+
+        API endpoint: POST /graphql
+
+        Issues that do not exist come back null with a NOT_FOUND error;
+        only a response without data fails the batch.
+
+        Raises:
+            TicketIdFormatError: If a ticket ID format is invalid
+            PlatformApiError: If the response has no data
+        """
+        self._validate_credentials(credentials)
+        if not ticket_ids:
+            return {}
+
+        variables: dict[str, Any] = {}
+        for n, ticket_id in enumerate(ticket_ids):
+            owner, repo, number = self._parse_ticket_id(ticket_id)
+            variables.update({f"o{n}": owner, f"r{n}": repo, f"n{n}": number})
+
+        response = await self._execute_request(
+            method="POST",
+            url=self.GRAPHQL_URL,
+            http_client=http_client,
+            timeout_seconds=timeout_seconds,
+            headers={"Authorization": f"Bearer {credentials['token']}"},
+            json_data={"query": _build_batch_query(len(ticket_ids)), "variables": variables},
+        )
+
+        response_data: dict[str, Any] = response.json()
+        data = response_data.get("data")
+        if data is None:
+            raise PlatformApiError(
+                platform_name=self.platform_name,
+                error_details=f"GraphQL errors: {response_data.get('errors')}",
+                ticket_id=", ".join(ticket_ids),
+            )
+        issues: dict[str, dict[str, Any]] = {}
+        for n, ticket_id in enumerate(ticket_ids):
+            node = (data.get(f"i{n}") or {}).get("issueOrPullRequest")
+            if node is not None:
+                issues[ticket_id] = _to_rest_issue(node)
+        return issues
+
+    async def _get_issue(
+        self,
+        ticket_id: str,
+        credentials: Mapping[str, str],
+        timeout_seconds: float | None,
+        http_client: httpx.AsyncClient | None,
+        extra_headers: Mapping[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send GET /repos/{owner}/{repo}/issues/{issue_number}."""
         # Validate required credentials are present
         self._validate_credentials(credentials)
 
@@ -86,11 +250,12 @@ class GitHubHandler(PlatformHandler):
         headers = {
             "Authorization": f"Bearer {token}",
             "Accept": "application/vnd.github.v3+json",
+            **(extra_headers or {}),
         }
 
         # Use base class helper for HTTP request execution
         # ticket_id passed for harmonized 404 handling across REST/GraphQL
-        response = await self._execute_request(
+        return await self._execute_request(
             method="GET",
             url=endpoint,
             http_client=http_client,
@@ -98,6 +263,3 @@ class GitHubHandler(PlatformHandler):
             headers=headers,
             ticket_id=ticket_id,
         )
-
-        result: dict[str, Any] = response.json()
-        return result
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import re
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 import httpx
 
-from .base import PlatformHandler
+from .base import CacheValidators, ConditionalFetchResult, PlatformHandler
+
+# Issue keys that may be interpolated into JQL (anything else could alter the query)
+_ISSUE_KEY_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$")
 
 
 class JiraHandler(PlatformHandler):
@@ -23,8 +27,17 @@ class JiraHandler(PlatformHandler):
         to ensure consistent endpoint construction regardless of whether
         the user provides "https://company.atlassian.net" or
         "https://company.atlassian.net/".
+
+    Conditional requests: validators are sent with every refresh; a Jira
+    instance that ignores them simply answers 200 with the full issue.
+
+    Batch requests: a JQL "key in (...)" search returns the issues in the
+    same shape as GET /issue. Jira rejects the whole search (400) if one
+    key does not exist, so callers fall back to single fetches then.
     """
 
+    batch_size = 50
+
     @property
     def platform_name(self) -> str:
         return "Jira"
@@ -58,6 +71,75 @@ class JiraHandler(PlatformHandler):
             PlatformNotFoundError: If issue is not found (404)
             httpx.HTTPError: For other HTTP-level failures
         """
+        response = await self._get_issue(ticket_id, credentials, timeout_seconds, http_client)
+        result: dict[str, Any] = response.json()
+        return result
+
+    async def fetch_conditional(
+        self,
+        ticket_id: str,
+        credentials: Mapping[str, str],
+        validators: CacheValidators,
+        timeout_seconds: float | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> ConditionalFetchResult:
+        """Fetch issue from Jira unless it is unchanged since validators were issued."""
+        response = await self._get_issue(
+            ticket_id,
+            credentials,
+            timeout_seconds,
+            http_client,
+            extra_headers=validators.request_headers(),
+        )
+        return ConditionalFetchResult.from_response(response, validators)
+
+    async def fetch_batch(
+        self,
+        ticket_ids: Sequence[str],
+        credentials: Mapping[str, str],
+        timeout_seconds: float | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch issues from Jira with one JQL search.
+
+        API endpoint: POST /rest/api/3/search/jql
+
+        Keys that are not plain issue keys are left out of the query (and
+        so of the result).
+        """
+        self._validate_credentials(credentials)
+
+        keys = [key for key in ticket_ids if _ISSUE_KEY_PATTERN.match(key)]
+        if not keys:
+            return {}
+
+        base_url = credentials["url"].rstrip("/")
+        payload = {
+            "jql": f"key in ({', '.join(keys)})",
+            "fields": ["*all"],
+            "maxResults": len(keys),
+        }
+        response = await self._execute_request(
+            method="POST",
+            url=f"{base_url}/rest/api/3/search/jql",
+            http_client=http_client,
+            timeout_seconds=timeout_seconds,
+            headers={"Accept": "application/json"},
+            json_data=payload,
+            auth=httpx.BasicAuth(credentials["email"], credentials["token"]),
+        )
+        issues: list[dict[str, Any]] = response.json().get("issues") or []
+        return {issue["key"]: issue for issue in issues if issue.get("key") in keys}
+
+    async def _get_issue(
+        self,
+        ticket_id: str,
+        credentials: Mapping[str, str],
+        timeout_seconds: float | None,
+        http_client: httpx.AsyncClient | None,
+        extra_headers: Mapping[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send GET /rest/api/3/issue/{issueIdOrKey}."""
         # Validate required credentials are present
         self._validate_credentials(credentials)
 
@@ -67,11 +149,11 @@ class JiraHandler(PlatformHandler):
         token = credentials["token"]
 
         endpoint = f"{base_url}/rest/api/3/issue/{ticket_id}"
-        headers = {"Accept": "application/json"}
+        headers = {"Accept": "application/json", **(extra_headers or {})}
 
         # Use base class helper for HTTP request execution
         # ticket_id passed for harmonized 404 handling across REST/GraphQL
-        response = await self._execute_request(
+        return await self._execute_request(
             method="GET",
             url=endpoint,
             http_client=http_client,
@@ -80,6 +162,3 @@ class JiraHandler(PlatformHandler):
             auth=httpx.BasicAuth(email, token),
             ticket_id=ticket_id,
         )
-
-        result: dict[str, Any] = response.json()
-        return result
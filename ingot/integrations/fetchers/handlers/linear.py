@@ -11,7 +11,7 @@ Authentication:
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 import httpx
@@ -26,9 +26,7 @@ from .base import GraphQLPlatformHandler
 #
 # API Reference: https://developers.linear.app/docs/graphql/working-with-the-graphql-api
 # Query Reference: https://studio.apollographql.com/public/Linear-API/home
-ISSUE_QUERY = """
-query GetIssue($identifier: String!) {
-  issueByIdentifier(identifier: $identifier) {
+ISSUE_FIELDS = """
     id
     identifier
     title
@@ -41,10 +39,27 @@ query GetIssue($identifier: String!) {
     priority
     team { key name }
     url
-  }
-}
 """
 
+ISSUE_QUERY = (
+    "\nquery GetIssue($identifier: String!) {\n"
+    "  issueByIdentifier(identifier: $identifier) {" + ISSUE_FIELDS + "  }\n"
+    "}\n"
+)
+
+
+def _build_batch_query(count: int) -> str:
+    """Query for count issues: one aliased issueByIdentifier per $idN variable.
+
+    Aliases are i0..i{count-1}, in the order of the variables.
+    """
+    variables = ", ".join(f"$id{n}: String!" for n in range(count))
+    selections = "".join(
+        f"  i{n}: issueByIdentifier(identifier: $id{n}) {{{ISSUE_FIELDS}  }}\n"
+        for n in range(count)
+    )
+    return f"\nquery GetIssues({variables}) {{\n{selections}}}\n"
+
 
 class LinearHandler(GraphQLPlatformHandler):
     """Handler for Linear GraphQL API.
@@ -58,10 +73,15 @@ class LinearHandler(GraphQLPlatformHandler):
         Linear accepts the API key directly in the Authorization header,
         without the "Bearer" prefix. This is per Linear's API documentation.
         See: https://developers.linear.app/docs/graphql/working-with-the-graphql-api#authentication
+
+    Batch requests: one query with an aliased issueByIdentifier per issue.
     """
 
     API_URL = "https://api.linear.app/graphql"
 
+    # Keeps batch queries well under Linear's query complexity limit
+    batch_size = 50
+
     @property
     def platform_name(self) -> str:
         return "Linear"
@@ -158,3 +178,39 @@ class LinearHandler(GraphQLPlatformHandler):
 
         # Use base class GraphQL validation and entity extraction
         return self._validate_graphql_response(response_data, ticket_id)
+
+    async def fetch_batch(
+        self,
+        ticket_ids: Sequence[str],
+        credentials: Mapping[str, str],
+        timeout_seconds: float | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch issues from Linear with one aliased GraphQL query."""
+        self._validate_credentials(credentials)
+        if not ticket_ids:
+            return {}
+
+        headers = {
+            "Authorization": credentials["api_key"],
+            "Content-Type": "application/json",
+        }
+        payload = {
+            "query": _build_batch_query(len(ticket_ids)),
+            "variables": {f"id{n}": ticket_id for n, ticket_id in enumerate(ticket_ids)},
+        }
+        response = await self._execute_request(
+            method="POST",
+            url=self.API_URL,
+            http_client=http_client,
+            timeout_seconds=timeout_seconds,
+            headers=headers,
+            json_data=payload,
+        )
+
+        data = self._validate_batch_response(response.json(), ticket_ids)
+        return {
+            ticket_id: data[f"i{n}"]
+            for n, ticket_id in enumerate(ticket_ids)
+            if data.get(f"i{n}") is not None
+        }
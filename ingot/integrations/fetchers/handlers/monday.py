@@ -13,7 +13,7 @@ Authentication:
     See: https://developer.monday.com/api-reference/reference/authentication
 
 Field Stability Notes:
-    The fields used in ITEM_QUERY are standard Monday.com item fields
+    The fields in ITEM_FIELDS are standard Monday.com item fields
     that are part of the stable API. These are unlikely to change between
     API versions:
     - id, name, state: Core item properties
@@ -24,7 +24,7 @@ Field Stability Notes:
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 import httpx
@@ -45,9 +45,7 @@ from .base import GraphQLPlatformHandler
 # - group: Parent group reference (stable relationship)
 #
 # Note: 'state' returns "active", "archived", or "deleted" per API docs
-ITEM_QUERY = """
-query GetItem($itemId: ID!) {
-  items(ids: [$itemId]) {
+ITEM_FIELDS = """
     id
     name
     state
@@ -60,10 +58,17 @@ query GetItem($itemId: ID!) {
     updated_at
     board { id name }
     group { id title }
-  }
-}
 """
 
+ITEM_QUERY = "\nquery GetItem($itemId: ID!) {\n  items(ids: [$itemId]) {" + ITEM_FIELDS + "  }\n}\n"
+
+# items() returns 25 items unless given a limit
+ITEMS_QUERY = (
+    "\nquery GetItems($itemIds: [ID!], $limit: Int) {\n"
+    "  items(ids: $itemIds, limit: $limit) {" + ITEM_FIELDS + "  }\n"
+    "}\n"
+)
+
 
 class MondayHandler(GraphQLPlatformHandler):
     """Handler for Monday.com GraphQL API.
@@ -77,10 +82,14 @@ class MondayHandler(GraphQLPlatformHandler):
         Monday accepts the API key directly in the Authorization header,
         without the "Bearer" prefix. This is per Monday's API documentation.
         See: https://developer.monday.com/api-reference/reference/authentication
+
+    Batch requests: items(ids: [...]) takes up to 100 item IDs.
     """
 
     API_URL = "https://api.monday.com/v2"
 
+    batch_size = 100
+
     @property
     def platform_name(self) -> str:
         return "Monday"
@@ -174,3 +183,36 @@ class MondayHandler(GraphQLPlatformHandler):
 
         # Use base class GraphQL validation and entity extraction
         return self._validate_graphql_response(response_data, ticket_id)
+
+    async def fetch_batch(
+        self,
+        ticket_ids: Sequence[str],
+        credentials: Mapping[str, str],
+        timeout_seconds: float | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch items from Monday.com with one items(ids: [...]) query."""
+        self._validate_credentials(credentials)
+        if not ticket_ids:
+            return {}
+
+        headers = {
+            "Authorization": credentials["api_key"],
+            "Content-Type": "application/json",
+        }
+        payload = {
+            "query": ITEMS_QUERY,
+            "variables": {"itemIds": list(ticket_ids), "limit": len(ticket_ids)},
+        }
+        response = await self._execute_request(
+            method="POST",
+            url=self.API_URL,
+            http_client=http_client,
+            timeout_seconds=timeout_seconds,
+            headers=headers,
+            json_data=payload,
+        )
+
+        data = self._validate_batch_response(response.json(), ticket_ids)
+        items: list[dict[str, Any]] = data.get("items") or []
+        return {str(item["id"]): item for item in items if str(item.get("id")) in ticket_ids}
@@ -14,6 +14,7 @@ import subprocess
 from collections.abc import Callable
 
 from ingot.utils.logging import check_cli_installed, log_backend_metadata, log_command, log_message
+from ingot.utils.processes import process_started
 
 GEMINI_CLI_NAME = "gemini"
 
@@ -159,6 +160,7 @@ class GeminiClient:
             bufsize=1,
             env=process_env,
         )
+        process_started(process)
 
         output_lines: list[str] = []
         if process.stdout is not None:
@@ -2,11 +2,30 @@
 
 This module provides git-related functionality including branch management,
 commit operations, dirty state handling, and checkpoint commit squashing.
+
+Working tree queries (dirty checks, changed and untracked file lists,
+diffstats) go through RepoSnapshot, which answers them from a single
+``git status --porcelain=v2 -z`` call plus ``git diff --numstat -z``.
+Object contents at a revision are read through GitObjectReader, a
+persistent ``git cat-file --batch`` co-process.
 """
 
+import atexit
+import difflib
+import mmap
+import os
+import shutil
 import subprocess
+import tempfile
+import threading
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
 from pathlib import Path
 
 from ingot.utils.console import print_error, print_info, print_success, print_warning
@@ -66,14 +85,14 @@ def _parse_name_status_line(line: str) -> str:
     return parts[-1] if parts else ""
 
 
-def find_repo_root() -> Path | None:
+def find_repo_root(start: Path | None = None) -> Path | None:
     """Find the git repository root by looking for .git directory.
 
-    Traverses from current working directory upward until:
+    Traverses from start (default: current working directory) upward until:
     - A .git directory is found (returns that directory)
     - The filesystem root is reached (returns None)
     """
-    current = Path.cwd()
+    current = Path.cwd() if start is None else start
     while True:
         if (current / ".git").exists():
             return current
@@ -86,6 +105,1050 @@ def find_repo_root() -> Path | None:
     return None
 
 
+# =============================================================================
+# Repository state snapshot
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class StatusEntry:
+    """One changed path from ``git status --porcelain=v2``.
+
+    Attributes:
+        path: Path relative to the repository root (new path for renames).
+        index_status: Staged status letter (X); "." if unchanged, "?" if untracked.
+        worktree_status: Unstaged status letter (Y); "." if unchanged, "?" if untracked.
+        orig_path: Original path for renames/copies, otherwise None.
+    """
+
+    path: str
+    index_status: str
+    worktree_status: str
+    orig_path: str | None = None
+
+    @property
+    def is_untracked(self) -> bool:
+        return self.index_status == "?"
+
+    @property
+    def is_staged(self) -> bool:
+        """True if the index differs from HEAD for this path."""
+        return self.index_status not in (".", "?")
+
+    @property
+    def is_unstaged(self) -> bool:
+        """True if the working tree differs from the index for this path."""
+        return self.worktree_status not in (".", "?")
+
+    @property
+    def short_status(self) -> str:
+        """Two-letter status code in ``git status --porcelain`` (v1) format."""
+        if self.is_untracked:
+            return "??"
+        return (self.index_status + self.worktree_status).replace(".", " ")
+
+
+@dataclass(frozen=True)
+class NumstatEntry:
+    """One file from ``git diff --numstat``.
+
+    Attributes:
+        path: Path relative to the repository root (new path for renames).
+        added: Inserted lines, or None for binary files.
+        deleted: Deleted lines, or None for binary files.
+        orig_path: Original path for renames/copies, otherwise None.
+    """
+
+    path: str
+    added: int | None
+    deleted: int | None
+    orig_path: str | None = None
+
+    @property
+    def is_binary(self) -> bool:
+        return self.added is None
+
+
+def parse_status_v2_z(output: str) -> tuple[str | None, str | None, list[StatusEntry]]:
+    """Parse ``git status --porcelain=v2 -z --branch`` output.
+
+    Returns:
+        Tuple of (head_sha, branch, entries). head_sha is None on an unborn
+        branch and branch is None when HEAD is detached.
+    """
+    head: str | None = None
+    branch: str | None = None
+    entries: list[StatusEntry] = []
+
+    tokens = output.split("\0")
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        i += 1
+        if not token:
+            continue
+
+        kind = token[0]
+        if kind == "#":
+            if token.startswith("# branch.oid "):
+                oid = token[len("# branch.oid ") :]
+                head = None if oid == "(initial)" else oid
+            elif token.startswith("# branch.head "):
+                name = token[len("# branch.head ") :]
+                branch = None if name == "(detached)" else name
+        elif kind == "1":
+            # 1 XY sub mH mI mW hH hI path
+            fields = token.split(" ", 8)
+            entries.append(StatusEntry(fields[8], fields[1][0], fields[1][1]))
+        elif kind == "2":
+            # 2 XY sub mH mI mW hH hI Xscore path\0origPath
+            fields = token.split(" ", 9)
+            orig_path = tokens[i] if i < len(tokens) else None
+            i += 1
+            entries.append(StatusEntry(fields[9], fields[1][0], fields[1][1], orig_path))
+        elif kind == "u":
+            # u XY sub m1 m2 m3 mW h1 h2 h3 path (unmerged: staged and unstaged)
+            fields = token.split(" ", 10)
+            entries.append(StatusEntry(fields[10], fields[1][0], fields[1][1]))
+        elif kind == "?":
+            entries.append(StatusEntry(token[2:], "?", "?"))
+        # "!" (ignored) entries are never requested
+
+    return head, branch, entries
+
+
+def parse_numstat_z(output: str) -> list[NumstatEntry]:
+    """Parse ``git diff --numstat -z`` output.
+
+    Regular entries are ``added\\tdeleted\\tpath\\0``. Renames and copies
+    have an empty path field followed by ``old\\0new\\0``. Binary files
+    report ``-`` for both counts.
+    """
+    entries: list[NumstatEntry] = []
+    tokens = output.split("\0")
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        i += 1
+        if not token:
+            continue
+
+        added, deleted, path = token.split("\t", 2)
+        orig_path = None
+        if not path:
+            orig_path = tokens[i] if i < len(tokens) else ""
+            path = tokens[i + 1] if i + 1 < len(tokens) else ""
+            i += 2
+
+        entries.append(
+            NumstatEntry(
+                path=path,
+                added=None if added == "-" else int(added),
+                deleted=None if deleted == "-" else int(deleted),
+                orig_path=orig_path,
+            )
+        )
+    return entries
+
+
+def diff_numstat(*args: str) -> list[NumstatEntry]:
+    """Run ``git diff --numstat -z`` with extra arguments (revisions, --cached).
+
+    Raises:
+        subprocess.CalledProcessError: If git command fails
+    """
+    cmd = ["git", "diff", "--no-color", "--no-ext-diff", "--numstat", "-z", *args]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    log_command(" ".join(cmd), result.returncode)
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(
+            result.returncode, cmd, output=result.stdout, stderr=result.stderr
+        )
+    return parse_numstat_z(result.stdout)
+
+
+def format_diffstat(entries: list[NumstatEntry]) -> str:
+    """Render numstat entries in the layout of ``git diff --stat``.
+
+    The summary line uses git's wording so parse_stat_total_lines() and
+    parse_stat_file_count() work on the result. Returns "" for no entries.
+    """
+    if not entries:
+        return ""
+
+    width = max(len(entry.path) for entry in entries)
+    lines = []
+    insertions = deletions = 0
+    for entry in entries:
+        if entry.is_binary:
+            lines.append(f" {entry.path.ljust(width)} | Bin")
+            continue
+        added = entry.added or 0
+        deleted = entry.deleted or 0
+        insertions += added
+        deletions += deleted
+        lines.append(
+            f" {entry.path.ljust(width)} | {added + deleted} {'+' * min(added, 40)}"
+            f"{'-' * min(deleted, 40)}".rstrip()
+        )
+
+    count = len(entries)
+    summary = f" {count} file{'s' if count != 1 else ''} changed"
+    if insertions:
+        summary += f", {insertions} insertion{'s' if insertions != 1 else ''}(+)"
+    if deletions:
+        summary += f", {deletions} deletion{'s' if deletions != 1 else ''}(-)"
+    lines.append(summary)
+    return "\n".join(lines)
+
+
+class RepoSnapshot:
+    """Working tree state from a single ``git status --porcelain=v2 -z`` call.
+
+    Replaces the separate ``git diff --name-only`` (staged and unstaged) and
+    ``git ls-files --others`` calls. Staged and unstaged line counts are
+    fetched lazily with ``git diff --numstat -z`` and cached on the snapshot.
+
+    Use get_repo_snapshot() rather than capture() so that queries inside a
+    repo_snapshot_scope() share one snapshot.
+    """
+
+    def __init__(
+        self,
+        head: str | None,
+        branch: str | None,
+        entries: list[StatusEntry],
+        state_key: tuple[object, ...] | None = None,
+    ) -> None:
+        self.head = head
+        self.branch = branch
+        self.entries = entries
+        self.state_key = state_key
+        self._numstat: dict[str, list[NumstatEntry]] = {}
+
+    @classmethod
+    def capture(cls) -> "RepoSnapshot":
+        """Capture the current repository state.
+
+        Raises:
+            subprocess.CalledProcessError: If git command fails
+        """
+        state_key = _repo_state_key()
+        # --no-optional-locks stops status from refreshing (rewriting) the
+        # index, which would otherwise invalidate the key we just computed
+        cmd = [
+            "git",
+            "--no-optional-locks",
+            "status",
+            "--porcelain=v2",
+            "-z",
+            "--branch",
+            "--untracked-files=all",
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        log_command(" ".join(cmd), result.returncode)
+        if result.returncode != 0:
+            raise subprocess.CalledProcessError(
+                result.returncode, cmd, output=result.stdout, stderr=result.stderr
+            )
+        head, branch, entries = parse_status_v2_z(result.stdout)
+        return cls(head, branch, entries, state_key)
+
+    @property
+    def staged_files(self) -> list[str]:
+        """Paths with staged changes (index vs HEAD)."""
+        return [e.path for e in self.entries if e.is_staged]
+
+    @property
+    def unstaged_files(self) -> list[str]:
+        """Paths with unstaged changes (working tree vs index)."""
+        return [e.path for e in self.entries if e.is_unstaged]
+
+    @property
+    def untracked_files(self) -> list[str]:
+        """Untracked paths, excluding ignored files."""
+        return [e.path for e in self.entries if e.is_untracked]
+
+    @property
+    def is_dirty(self) -> bool:
+        """True if there are staged or unstaged changes to tracked files."""
+        return any(e.is_staged or e.is_unstaged for e in self.entries)
+
+    @property
+    def has_untracked(self) -> bool:
+        return any(e.is_untracked for e in self.entries)
+
+    @property
+    def has_changes(self) -> bool:
+        """True if there are staged, unstaged or untracked changes."""
+        return bool(self.entries)
+
+    def staged_numstat(self) -> list[NumstatEntry]:
+        """Line counts of staged changes (``git diff --cached --numstat``)."""
+        if not any(e.is_staged for e in self.entries):
+            return []
+        return self._cached_numstat("staged", "--cached")
+
+    def unstaged_numstat(self) -> list[NumstatEntry]:
+        """Line counts of unstaged changes (``git diff --numstat``)."""
+        if not any(e.is_unstaged for e in self.entries):
+            return []
+        return self._cached_numstat("unstaged")
+
+    def _cached_numstat(self, key: str, *args: str) -> list[NumstatEntry]:
+        if key not in self._numstat:
+            self._numstat[key] = diff_numstat(*args)
+        return self._numstat[key]
+
+
+def _resolve_git_dir(repo_root: Path) -> Path | None:
+    """Return the git directory for a repo root (handles worktree .git files)."""
+    dot_git = repo_root / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    try:
+        content = dot_git.read_text().strip()
+    except OSError:
+        return None
+    if not content.startswith("gitdir:"):
+        return None
+    git_dir = Path(content[len("gitdir:") :].strip())
+    return git_dir if git_dir.is_absolute() else (repo_root / git_dir).resolve()
+
+
+def _stat_key(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _repo_state_key(start: Path | None = None) -> tuple[object, ...] | None:
+    """Cheap fingerprint of HEAD and the index, read without spawning git.
+
+    Returns None if the repository layout cannot be read, which disables
+    memoization.
+    """
+    repo_root = find_repo_root(start)
+    if repo_root is None:
+        return None
+    git_dir = _resolve_git_dir(repo_root)
+    if git_dir is None:
+        return None
+
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return None
+
+    # Branch refs live in the common dir for linked worktrees
+    common_dir = git_dir
+    try:
+        common_dir = (git_dir / (git_dir / "commondir").read_text().strip()).resolve()
+    except OSError:
+        pass
+
+    ref_key = None
+    if head.startswith("ref:"):
+        ref = head[len("ref:") :].strip()
+        ref_key = (_stat_key(common_dir / ref), _stat_key(common_dir / "packed-refs"))
+
+    return (str(repo_root), head, ref_key, _stat_key(git_dir / "index"))
+
+
+# Per-context snapshot cache, only active inside repo_snapshot_scope()
+_snapshot_scope: ContextVar[dict[str, RepoSnapshot] | None] = ContextVar(
+    "ingot_repo_snapshot_scope", default=None
+)
+
+
+@contextmanager
+def repo_snapshot_scope() -> Iterator[None]:
+    """Share one RepoSnapshot between git queries while HEAD and the index are unchanged.
+
+    Edits to tracked or untracked files in the working tree change neither
+    HEAD nor the index, so only wrap sequences of queries during which no
+    agent or user is modifying files (e.g. pre-flight checks of a step).
+    A scope nested inside another one shares the outer scope's snapshot.
+    """
+    if _snapshot_scope.get() is not None:
+        yield
+        return
+    token = _snapshot_scope.set({})
+    try:
+        yield
+    finally:
+        _snapshot_scope.reset(token)
+
+
+def get_repo_snapshot() -> RepoSnapshot:
+    """Get the repository snapshot, reusing the scoped one if still valid.
+
+    Outside repo_snapshot_scope() this always captures a fresh snapshot.
+
+    Raises:
+        subprocess.CalledProcessError: If git command fails
+    """
+    cache = _snapshot_scope.get()
+    if cache is None:
+        return RepoSnapshot.capture()
+
+    cached = cache.get("snapshot")
+    if cached is not None and cached.state_key is not None:
+        if cached.state_key == _repo_state_key():
+            return cached
+
+    snapshot = RepoSnapshot.capture()
+    cache["snapshot"] = snapshot
+    return snapshot
+
+
+# =============================================================================
+# Object access via a persistent cat-file co-process
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class GitObjectInfo:
+    """Object metadata reported by ``git cat-file --batch-check``."""
+
+    oid: str
+    type: str
+    size: int
+
+
+class GitObjectReader:
+    """Long-lived ``git cat-file --batch`` co-process for blob and tree access.
+
+    Each lookup is a request line on the co-process's stdin and a reply on
+    its stdout, so reading many objects costs a pipe round-trip each
+    instead of a fork+exec of ``git show``. Metadata-only lookups use a
+    separate ``--batch-check`` process so they never wait behind large
+    blob reads.
+
+    Thread-safe: each co-process is guarded by its own lock, held for one
+    request/response. Processes are started lazily and restarted once if
+    they die. Use get_object_reader() to share one reader per repository.
+
+    Object specs are anything ``git rev-parse`` accepts, e.g. ``HEAD``,
+    ``HEAD:path/to/file`` or a full object name.
+    """
+
+    def __init__(self, repo_root: Path | None = None) -> None:
+        self.repo_root = repo_root
+        self._processes: dict[str, subprocess.Popen[bytes] | None] = {
+            "--batch": None,
+            "--batch-check": None,
+        }
+        self._locks = {mode: threading.Lock() for mode in self._processes}
+        self._closed = False
+
+    def info(self, spec: str) -> GitObjectInfo | None:
+        """Return type and size of an object, or None if it does not exist."""
+        result = self._request("--batch-check", spec)
+        return result[0] if result else None
+
+    def exists(self, spec: str) -> bool:
+        """True if the object spec resolves to an object."""
+        return self.info(spec) is not None
+
+    def read(self, spec: str) -> tuple[GitObjectInfo, bytes] | None:
+        """Return object metadata and raw content, or None if it does not exist."""
+        return self._request("--batch", spec)
+
+    def read_blob(self, revision: str, path: str) -> bytes | None:
+        """Return the content of a file at a revision, or None if absent."""
+        result = self.read(f"{revision}:{path}")
+        if result is None or result[0].type != "blob":
+            return None
+        return result[1]
+
+    def read_text(self, revision: str, path: str) -> str | None:
+        """Return a file at a revision decoded as UTF-8 (invalid bytes replaced)."""
+        content = self.read_blob(revision, path)
+        return None if content is None else content.decode("utf-8", errors="replace")
+
+    def close(self) -> None:
+        """Terminate the co-processes. Further lookups raise RuntimeError."""
+        self._closed = True
+        for mode, lock in self._locks.items():
+            with lock:
+                self._stop(mode)
+
+    def __enter__(self) -> "GitObjectReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _request(self, mode: str, spec: str) -> tuple[GitObjectInfo, bytes] | None:
+        if "\n" in spec:
+            raise ValueError(f"Object spec must not contain newlines: {spec!r}")
+
+        with self._locks[mode]:
+            if self._closed:
+                raise RuntimeError("GitObjectReader is closed")
+            # One retry covers a co-process that exited since the last request
+            for attempt in range(2):
+                proc = self._ensure_started(mode)
+                try:
+                    return self._exchange(proc, spec, with_content=mode == "--batch")
+                except (BrokenPipeError, ConnectionError, EOFError):
+                    self._stop(mode)
+                    if attempt:
+                        raise
+        return None  # pragma: no cover - loop always returns or raises
+
+    @staticmethod
+    def _exchange(
+        proc: subprocess.Popen[bytes], spec: str, *, with_content: bool
+    ) -> tuple[GitObjectInfo, bytes] | None:
+        assert proc.stdin is not None and proc.stdout is not None
+        proc.stdin.write(spec.encode("utf-8") + b"\n")
+        proc.stdin.flush()
+
+        header = proc.stdout.readline()
+        if not header:
+            raise EOFError("git cat-file exited unexpectedly")
+
+        # Unknown specs are echoed back as "<spec> missing" (or "ambiguous")
+        parts = header.decode("utf-8", errors="replace").rstrip("\n").split(" ")
+        if len(parts) != 3 or not parts[2].isdigit():
+            return None
+        info = GitObjectInfo(oid=parts[0], type=parts[1], size=int(parts[2]))
+
+        if not with_content:
+            return info, b""
+
+        content = proc.stdout.read(info.size)
+        # Content is followed by a single LF
+        if len(content) != info.size or proc.stdout.read(1) != b"\n":
+            raise EOFError("Truncated object from git cat-file")
+        return info, content
+
+    def _ensure_started(self, mode: str) -> subprocess.Popen[bytes]:
+        proc = self._processes[mode]
+        if proc is None or proc.poll() is not None:
+            cmd = ["git", "cat-file", mode]
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=self.repo_root,
+            )
+            log_command(" ".join(cmd))
+            self._processes[mode] = proc
+        return proc
+
+    def _stop(self, mode: str) -> None:
+        proc = self._processes[mode]
+        self._processes[mode] = None
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+            proc.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+        finally:
+            if proc.stdout:
+                proc.stdout.close()
+
+
+# One shared reader per repository root, closed at interpreter exit
+_object_readers: dict[Path, GitObjectReader] = {}
+_object_readers_lock = threading.Lock()
+
+
+def get_object_reader() -> GitObjectReader:
+    """Get the shared GitObjectReader for the current repository."""
+    repo_root = (find_repo_root() or Path.cwd()).resolve()
+    with _object_readers_lock:
+        reader = _object_readers.get(repo_root)
+        if reader is None:
+            if not _object_readers:
+                atexit.register(close_object_readers)
+            reader = GitObjectReader(repo_root)
+            _object_readers[repo_root] = reader
+        return reader
+
+
+def close_object_readers() -> None:
+    """Close all shared object readers (their co-processes exit)."""
+    with _object_readers_lock:
+        readers = list(_object_readers.values())
+        _object_readers.clear()
+    for reader in readers:
+        reader.close()
+
+
+def read_file_at_revision(revision: str, path: str) -> str | None:
+    """Read a file at a revision through the shared object reader.
+
+    Returns None if the revision or path does not exist.
+    """
+    return get_object_reader().read_text(revision, path)
+
+
+# =============================================================================
+# Working tree trees
+# =============================================================================
+
+
+def write_worktree_tree() -> str | None:
+    """Record the current working tree as a git tree object and return its hash.
+
+    Tracked and untracked (non-ignored) files are staged into a throwaway
+    copy of the index and written with ``git write-tree``, so the real
+    index, HEAD and stash are untouched. Two calls return the same hash
+    exactly when the working tree content is the same, which makes the
+    hash a cheap change detector between agent runs.
+
+    Returns:
+        The tree hash, or None if not in a git repository or git fails.
+    """
+    try:
+        index_path = subprocess.run(
+            ["git", "rev-parse", "--git-path", "index"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+    fd, temp_index = tempfile.mkstemp(prefix="ingot-index-")
+    os.close(fd)
+    try:
+        # Seeding with the real index lets git reuse its stat cache
+        try:
+            shutil.copyfile(index_path, temp_index)
+        except OSError:
+            os.unlink(temp_index)
+        env = {**os.environ, "GIT_INDEX_FILE": temp_index}
+        for cmd in (["git", "add", "-A"], ["git", "write-tree"]):
+            result = subprocess.run(cmd, capture_output=True, text=True, env=env)
+            log_command(" ".join(cmd), result.returncode)
+            if result.returncode != 0:
+                return None
+        return result.stdout.strip() or None
+    finally:
+        try:
+            os.unlink(temp_index)
+        except OSError:
+            pass
+
+
+def diff_tree_blobs(old: str, new: str) -> dict[str, str]:
+    """Map each path that differs between two tree-ish objects to its new blob hash.
+
+    Deleted paths map to the all-zero hash. Renames are reported as a
+    deletion plus an addition.
+
+    Raises:
+        subprocess.CalledProcessError: If git command fails
+    """
+    cmd = ["git", "diff", "--raw", "-z", "--no-renames", "--no-abbrev", old, new]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    log_command(" ".join(cmd), result.returncode)
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(
+            result.returncode, cmd, output=result.stdout, stderr=result.stderr
+        )
+
+    blobs: dict[str, str] = {}
+    tokens = result.stdout.split("\0")
+    # Each entry is ":<old mode> <new mode> <old sha> <new sha> <status>\0<path>\0"
+    for meta, path in zip(tokens[0::2], tokens[1::2], strict=False):
+        if meta.startswith(":"):
+            blobs[path] = meta.split()[3]
+    return blobs
+
+
+def grep_words(words: Iterable[str], repo_root: Path | None = None) -> set[str]:
+    """Return the words that occur as whole words in tracked text files.
+
+    Uses a single ``git grep`` over the working tree for all words.
+
+    Raises:
+        subprocess.CalledProcessError: If git command fails
+    """
+    words = sorted(set(words))
+    if not words:
+        return set()
+    cmd = ["git", "grep", "--no-color", "-h", "-o", "-w", "-I", "-F"]
+    for word in words:
+        cmd += ["-e", word]
+    result = subprocess.run(cmd, cwd=repo_root, capture_output=True, text=True)
+    log_command(f"git grep -w ({len(words)} words)", result.returncode)
+    if result.returncode == 1:
+        return set()  # No matches
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(
+            result.returncode, cmd, output=result.stdout, stderr=result.stderr
+        )
+    return set(result.stdout.split()) & set(words)
+
+
+# =============================================================================
+# Repository file index
+# =============================================================================
+
+# ls-files -t tags for entries that are not present in the working tree
+# (R: deleted from the working tree, S: skip-worktree in a sparse checkout)
+_ABSENT_LS_FILES_TAGS = frozenset("RS")
+
+
+class RepoFileIndex:
+    """Set of repository file paths with a directory trie.
+
+    Built from a single ``git ls-files`` call listing tracked files (minus
+    working tree deletions) and untracked, non-ignored files, so existence
+    checks are set lookups instead of a resolve() and stat() per path.
+
+    Git never lists paths below a symbolic link, so every directory in the
+    trie is a real directory. Symlinked entries are recorded separately
+    for callers that must not follow links through the index.
+
+    Use get_repo_index() rather than build() so that callers share one
+    index until HEAD or the index changes. Files created or deleted in the
+    working tree without touching the index are not reflected; callers
+    should treat a miss as "check the filesystem".
+    """
+
+    def __init__(
+        self,
+        files: Iterable[str],
+        symlinks: Iterable[str] = (),
+        state_key: tuple[object, ...] | None = None,
+    ) -> None:
+        self.files = frozenset(files)
+        self.symlinks = frozenset(symlinks)
+        self.state_key = state_key
+        # Directory path ("" for the root) -> names of its direct children
+        self._children: dict[str, set[str]] = {"": set()}
+        self._by_name: dict[str, list[str]] = {}
+        for path in self.files:
+            parent, _, name = path.rpartition("/")
+            self._by_name.setdefault(name, []).append(path)
+            while True:
+                siblings = self._children.setdefault(parent, set())
+                if name in siblings:
+                    break
+                siblings.add(name)
+                if not parent:
+                    break
+                parent, _, name = parent.rpartition("/")
+        self._names: list[str] | None = None
+
+    @classmethod
+    def build(cls, repo_root: Path) -> "RepoFileIndex":
+        """Index the files under repo_root.
+
+        Raises:
+            subprocess.CalledProcessError: If git command fails
+        """
+        state_key = _repo_state_key(repo_root)
+        cmd = [
+            "git",
+            "ls-files",
+            "-z",
+            "-t",
+            "-s",
+            "--cached",
+            "--others",
+            "--deleted",
+            "--exclude-standard",
+        ]
+        result = subprocess.run(cmd, cwd=repo_root, capture_output=True)
+        log_command(" ".join(cmd), result.returncode)
+        if result.returncode != 0:
+            raise subprocess.CalledProcessError(
+                result.returncode, cmd, output=result.stdout, stderr=result.stderr
+            )
+
+        present: set[str] = set()
+        absent: set[str] = set()
+        symlinks: set[str] = set()
+        untracked: list[str] = []
+        for record in os.fsdecode(result.stdout).split("\0"):
+            if not record:
+                continue
+            tag, _, rest = record.partition(" ")
+            if tag == "?":
+                untracked.append(rest)
+                continue
+            # Tracked: "<mode> <object> <stage>\t<path>"
+            meta, _, path = rest.partition("\t")
+            if tag in _ABSENT_LS_FILES_TAGS:
+                absent.add(path)
+                continue
+            present.add(path)
+            if meta.startswith("120000 "):
+                symlinks.add(path)
+
+        # Untracked entries carry no mode, so look for links on disk
+        for path in untracked:
+            present.add(path)
+            if (repo_root / path).is_symlink():
+                symlinks.add(path)
+
+        return cls(present - absent, symlinks - absent, state_key)
+
+    def is_file(self, path: str) -> bool:
+        return path in self.files
+
+    def is_dir(self, path: str) -> bool:
+        return path.rstrip("/") in self._children
+
+    def exists(self, path: str) -> bool:
+        """True if path (relative, normalized) is an indexed file or directory."""
+        return path in self.files or path.rstrip("/") in self._children
+
+    def files_named(self, name: str) -> list[str]:
+        """Sorted indexed file paths whose final component is name."""
+        return sorted(self._by_name.get(name, ()))
+
+    def list_dir(self, path: str = "") -> list[str]:
+        """Sorted names of the entries directly below directory path."""
+        return sorted(self._children.get(path.rstrip("/"), ()))
+
+    def suggest(self, path: str, limit: int = 3) -> list[str]:
+        """Return up to limit indexed paths that path most likely meant.
+
+        Candidates are files with the same or a similar name anywhere in
+        the repository, plus the entries of path's deepest existing parent
+        directory. They are ranked by similarity to the full path.
+        """
+        path = path.strip("/")
+        parent, _, name = path.rpartition("/")
+        if not name:
+            return []
+
+        candidates: set[str] = set(self._by_name.get(name, ()))
+        if self._names is None:
+            self._names = sorted(self._by_name)
+        for similar in difflib.get_close_matches(name, self._names, n=limit, cutoff=0.75):
+            candidates.update(self._by_name[similar])
+
+        while parent and parent not in self._children:
+            parent = parent.rpartition("/")[0]
+        prefix = f"{parent}/" if parent else ""
+        candidates.update(prefix + child for child in self._children[parent])
+
+        candidates.discard(path)
+        scored = [
+            (difflib.SequenceMatcher(None, path, candidate).ratio(), candidate)
+            for candidate in candidates
+        ]
+        same_name = set(self._by_name.get(name, ()))
+        return [
+            candidate
+            for score, candidate in sorted(scored, key=lambda item: (-item[0], item[1]))
+            if score >= 0.6 or candidate in same_name
+        ][:limit]
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+
+# One shared index per repository root, rebuilt when HEAD or the index moves
+_repo_indexes: dict[Path, RepoFileIndex] = {}
+_repo_indexes_lock = threading.Lock()
+
+
+def get_repo_index(repo_root: Path | None = None) -> RepoFileIndex | None:
+    """Get the shared RepoFileIndex for repo_root (default: current repository).
+
+    Returns None if repo_root is not inside a git repository or git fails,
+    in which case callers fall back to filesystem checks.
+    """
+    if repo_root is None:
+        repo_root = find_repo_root()
+        if repo_root is None:
+            return None
+    repo_root = repo_root.resolve()
+    state_key = _repo_state_key(repo_root)
+    if state_key is None:
+        return None
+
+    with _repo_indexes_lock:
+        cached = _repo_indexes.get(repo_root)
+        if cached is not None and cached.state_key == state_key:
+            return cached
+        try:
+            index = RepoFileIndex.build(repo_root)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        _repo_indexes[repo_root] = index
+        return index
+
+
+def clear_repo_indexes() -> None:
+    """Drop all shared repository indexes."""
+    with _repo_indexes_lock:
+        _repo_indexes.clear()
+
+
+# =============================================================================
+# Untracked file diffs
+# =============================================================================
+
+# Untracked directories holding more files than this are summarized as one
+# entry (vendored code, generated fixtures) instead of one entry per file
+UNTRACKED_DIR_COLLAPSE_THRESHOLD = 200
+
+# Worker threads used to read untracked files
+UNTRACKED_DIFF_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class UntrackedDirSummary:
+    """A collapsed untracked directory (path ends with "/")."""
+
+    path: str
+    file_count: int
+
+    def to_diff(self) -> str:
+        return (
+            f"diff --git a/{self.path} b/{self.path}\n"
+            f"new directory\n"
+            f"[UNTRACKED DIRECTORY: {self.path} ({self.file_count} files) - content omitted]\n"
+        )
+
+    def to_stat(self) -> str:
+        return f" {self.path} | [NEW DIRECTORY: {self.file_count} files]"
+
+
+def collapse_untracked_dirs(
+    paths: list[str],
+    threshold: int = UNTRACKED_DIR_COLLAPSE_THRESHOLD,
+) -> list[str | UntrackedDirSummary]:
+    """Replace files under crowded untracked directories with one summary each.
+
+    The shallowest directory holding more than threshold untracked files is
+    collapsed. Order follows the first file of each collapsed directory.
+    """
+    counts: dict[str, int] = {}
+    for path in paths:
+        parts = path.split("/")[:-1]
+        for depth in range(1, len(parts) + 1):
+            prefix = "/".join(parts[:depth]) + "/"
+            counts[prefix] = counts.get(prefix, 0) + 1
+
+    crowded = {prefix for prefix, count in counts.items() if count > threshold}
+    if not crowded:
+        return list(paths)
+
+    entries: list[str | UntrackedDirSummary] = []
+    emitted: set[str] = set()
+    for path in paths:
+        parts = path.split("/")[:-1]
+        collapsed = next(
+            (
+                prefix
+                for prefix in ("/".join(parts[:depth]) + "/" for depth in range(1, len(parts) + 1))
+                if prefix in crowded
+            ),
+            None,
+        )
+        if collapsed is None:
+            entries.append(path)
+        elif collapsed not in emitted:
+            emitted.add(collapsed)
+            entries.append(UntrackedDirSummary(collapsed, counts[collapsed]))
+    return entries
+
+
+def render_untracked_files(
+    paths: list[str],
+    render: Callable[[str], str],
+    *,
+    max_workers: int = UNTRACKED_DIFF_WORKERS,
+    collapse_threshold: int = UNTRACKED_DIR_COLLAPSE_THRESHOLD,
+) -> Generator[str, None, None]:
+    """Yield one diff chunk per untracked file (or collapsed directory), in order.
+
+    Files are rendered on a thread pool with bounded read-ahead, so closing
+    the iterator early (diff budget exhausted) stops scheduling reads.
+    """
+
+    def render_entry(entry: str | UntrackedDirSummary) -> str:
+        if isinstance(entry, UntrackedDirSummary):
+            return entry.to_diff()
+        return render(entry)
+
+    entries = collapse_untracked_dirs(paths, collapse_threshold)
+    if max_workers <= 1 or len(entries) <= 1:
+        yield from map(render_entry, entries)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ingot-untracked")
+    remaining = iter(entries)
+    pending: deque[Future[str]] = deque(
+        executor.submit(render_entry, entry) for entry in islice(remaining, max_workers * 2)
+    )
+    try:
+        while pending:
+            future = pending.popleft()
+            next_entry = next(remaining, None)
+            if next_entry is not None:
+                pending.append(executor.submit(render_entry, next_entry))
+            yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def read_text_if_not_binary(
+    path: str, max_file_size: int, sample_size: int = 8192
+) -> tuple[int, str | None]:
+    """Open a file once and return (size, text).
+
+    text is None if the file is larger than max_file_size or binary (NUL
+    byte in the first sample_size bytes). The binary sniff runs on a
+    memory map, so binary files are never copied into memory.
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > max_file_size:
+            return size, None
+        if size == 0:
+            return size, ""
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b"\x00", 0, sample_size) != -1:
+                    return size, None
+                data = mm[:]
+        except ValueError:
+            # Not mappable (e.g. special files): fall back to a plain read
+            data = f.read()
+            if b"\x00" in data[:sample_size]:
+                return size, None
+    return size, data.decode("utf-8", errors="replace")
+
+
+def format_new_file_diff(path: str, content: str) -> str:
+    """Render file content as a unified diff adding a new file."""
+    lines = content.splitlines(keepends=True)
+    if lines and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+    header = (
+        f"diff --git a/{path} b/{path}\n"
+        "new file mode 100644\n"
+        "--- /dev/null\n"
+        f"+++ b/{path}\n"
+        f"@@ -0,0 +1,{len(lines)} @@\n"
+    )
+    return header + "".join("+" + line for line in lines)
+
+
 def is_git_repo() -> bool:
     """Check if current directory is a git repository."""
     try:
@@ -103,17 +1166,7 @@ def is_git_repo() -> bool:
 def is_dirty() -> bool:
     """Check if working directory has uncommitted changes (staged or unstaged)."""
     try:
-        # Check unstaged changes
-        result1 = subprocess.run(
-            ["git", "diff", "--quiet"],
-            capture_output=True,
-        )
-        # Check staged changes
-        result2 = subprocess.run(
-            ["git", "diff", "--cached", "--quiet"],
-            capture_output=True,
-        )
-        return result1.returncode != 0 or result2.returncode != 0
+        return get_repo_snapshot().is_dirty
     except subprocess.CalledProcessError:
         return False
 
@@ -121,13 +1174,7 @@ def is_dirty() -> bool:
 def has_untracked_files() -> bool:
     """Check if there are any untracked files (excluding ignored)."""
     try:
-        result = subprocess.run(
-            ["git", "ls-files", "--others", "--exclude-standard"],
-            capture_output=True,
-            text=True,
-        )
-        log_command("git ls-files --others --exclude-standard", result.returncode)
-        return result.returncode == 0 and bool(result.stdout.strip())
+        return get_repo_snapshot().has_untracked
     except Exception:
         return False
 
@@ -136,8 +1183,10 @@ def has_any_changes() -> bool:
     """Check if working directory has any changes (staged, unstaged, or untracked).
 
     This is a comprehensive check that combines is_dirty() and has_untracked_files().
+    Both checks share a single repository snapshot.
     """
-    return is_dirty() or has_untracked_files()
+    with repo_snapshot_scope():
+        return is_dirty() or has_untracked_files()
 
 
 def get_current_branch() -> str:
@@ -172,6 +1221,22 @@ def get_current_commit() -> str:
     return result.stdout.strip()
 
 
+def get_head_tree() -> str | None:
+    """Get the hash of the tree object at HEAD.
+
+    Returns:
+        The tree hash, or None if not in a git repository or HEAD is unborn.
+    """
+    result = subprocess.run(
+        ["git", "rev-parse", "--verify", "--quiet", "HEAD^{tree}"],
+        capture_output=True,
+        text=True,
+    )
+    log_command("git rev-parse HEAD^{tree}", result.returncode)
+    tree = result.stdout.strip()
+    return tree if result.returncode == 0 and tree else None
+
+
 def get_status_short() -> str:
     """Get short git status output."""
     result = subprocess.run(
@@ -371,210 +1436,92 @@ def get_diff_from_baseline(base_commit: str | None) -> DiffResult:
 
     If base_commit is empty/None but repo is dirty, falls back to
     collecting staged + unstaged + untracked changes (no commit-to-commit diff).
+
+    File lists, untracked files and diffstats come from the repository
+    snapshot and ``--numstat``; patch text is only requested for the
+    sections that actually have changes.
     """
     # Handle missing base_commit - fall back to staged + unstaged + untracked
     no_base_commit = not base_commit or not base_commit.strip()
 
     diff_sections: list[str] = []
     changed_files: list[str] = []
-    untracked_files: list[str] = []
-    diffstat = ""
+    diffstat_parts: list[str] = []
 
     try:
-        # Base git diff flags for clean output
-        base_flags = ["--no-color", "--no-ext-diff"]
-
-        # 1. Get committed changes: git diff <base>..HEAD (only if we have a base commit)
-        if not no_base_commit:
-            committed_result = subprocess.run(
-                ["git", "diff", *base_flags, f"{base_commit}..HEAD"],
-                capture_output=True,
-                text=True,
-            )
-            log_command(f"git diff {base_commit}..HEAD", committed_result.returncode)
-
-            if committed_result.returncode != 0:
-                stderr = (
-                    committed_result.stderr.strip() if committed_result.stderr else "unknown error"
-                )
-                print_warning(f"Failed to compute committed diff: {stderr}")
-                return DiffResult(
-                    has_error=True,
-                    error_message=f"git diff {base_commit}..HEAD failed: {stderr}",
-                )
-
-            if committed_result.stdout.strip():
-                diff_sections.append("=== Committed Changes ===\n" + committed_result.stdout)
-
-        # 2. Get staged changes: git diff --cached
-        staged_result = subprocess.run(
-            ["git", "diff", *base_flags, "--cached"],
-            capture_output=True,
-            text=True,
-        )
-        log_command("git diff --cached", staged_result.returncode)
-
-        if staged_result.returncode != 0:
-            stderr = staged_result.stderr.strip() if staged_result.stderr else "unknown error"
-            print_warning(f"Failed to compute staged diff: {stderr}")
-            return DiffResult(
-                has_error=True,
-                error_message=f"git diff --cached failed: {stderr}",
-            )
-
-        if staged_result.stdout.strip():
-            diff_sections.append("=== Staged Changes ===\n" + staged_result.stdout)
-
-        # 3. Get unstaged changes: git diff
-        unstaged_result = subprocess.run(
-            ["git", "diff", *base_flags],
-            capture_output=True,
-            text=True,
-        )
-        log_command("git diff", unstaged_result.returncode)
-
-        if unstaged_result.returncode != 0:
-            stderr = unstaged_result.stderr.strip() if unstaged_result.stderr else "unknown error"
-            print_warning(f"Failed to compute unstaged diff: {stderr}")
+        # 1. One status call for staged, unstaged and untracked paths
+        try:
+            snapshot = get_repo_snapshot()
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.strip() if e.stderr else "unknown error"
+            print_warning(f"Failed to read repository status: {stderr}")
             return DiffResult(
                 has_error=True,
-                error_message=f"git diff failed: {stderr}",
-            )
-
-        if unstaged_result.stdout.strip():
-            diff_sections.append("=== Unstaged Changes ===\n" + unstaged_result.stdout)
-
-        # 4. Get changed files list
-        # Always collect staged + unstaged files to capture working tree changes
-        # even when base_commit exists (base..HEAD may be empty if no commits yet)
-        staged_files_result = subprocess.run(
-            ["git", "diff", "--name-only", "--cached"],
-            capture_output=True,
-            text=True,
-        )
-        log_command("git diff --name-only --cached", staged_files_result.returncode)
-
-        unstaged_files_result = subprocess.run(
-            ["git", "diff", "--name-only"],
-            capture_output=True,
-            text=True,
-        )
-        log_command("git diff --name-only", unstaged_files_result.returncode)
-
-        if staged_files_result.returncode == 0:
-            changed_files.extend(
-                [f for f in staged_files_result.stdout.strip().split("\n") if f.strip()]
+                error_message=f"git status failed: {stderr}",
             )
-        else:
-            stderr = (
-                staged_files_result.stderr.strip()
-                if staged_files_result.stderr
-                else "unknown error"
-            )
-            print_warning(f"Failed to list staged files: {stderr}")
 
-        if unstaged_files_result.returncode == 0:
-            changed_files.extend(
-                [f for f in unstaged_files_result.stdout.strip().split("\n") if f.strip()]
-            )
-        else:
-            stderr = (
-                unstaged_files_result.stderr.strip()
-                if unstaged_files_result.stderr
-                else "unknown error"
-            )
-            print_warning(f"Failed to list unstaged files: {stderr}")
-
-        # Also get committed changes if we have a base commit
+        # 2. Committed changes: git diff <base>..HEAD (only if we have a base commit)
         if not no_base_commit:
-            name_status_result = subprocess.run(
-                ["git", "diff", "--name-status", f"{base_commit}..HEAD"],
-                capture_output=True,
-                text=True,
-            )
-            log_command(
-                f"git diff --name-status {base_commit}..HEAD", name_status_result.returncode
-            )
-
-            if name_status_result.returncode != 0:
-                stderr = (
-                    name_status_result.stderr.strip()
-                    if name_status_result.stderr
-                    else "unknown error"
+            committed_range = f"{base_commit}..HEAD"
+            committed_diff, error = _run_diff_patch(committed_range)
+            if error is not None:
+                print_warning(f"Failed to compute committed diff: {error}")
+                return DiffResult(
+                    has_error=True,
+                    error_message=f"git diff {committed_range} failed: {error}",
                 )
+            if committed_diff.strip():
+                diff_sections.append("=== Committed Changes ===\n" + committed_diff)
+
+            try:
+                committed_numstat = diff_numstat(committed_range)
+            except subprocess.CalledProcessError as e:
+                stderr = e.stderr.strip() if e.stderr else "unknown error"
                 print_warning(f"Failed to get changed files list: {stderr}")
                 # Non-fatal: continue with what we have
-            elif name_status_result.stdout.strip():
-                changed_files.extend(
-                    _parse_name_status_line(line)
-                    for line in name_status_result.stdout.strip().split("\n")
-                    if line.strip()
+            else:
+                changed_files.extend(entry.path for entry in committed_numstat)
+                committed_stat = format_diffstat(committed_numstat)
+                if committed_stat:
+                    diffstat_parts.append("Committed:\n" + committed_stat)
+
+        # 3. Staged and unstaged changes, skipping git entirely when clean
+        for label, files, numstat, extra_args in (
+            ("Staged", snapshot.staged_files, snapshot.staged_numstat, ("--cached",)),
+            ("Unstaged", snapshot.unstaged_files, snapshot.unstaged_numstat, ()),
+        ):
+            if not files:
+                continue
+
+            patch, error = _run_diff_patch(*extra_args)
+            if error is not None:
+                command = " ".join(["git diff", *extra_args])
+                print_warning(f"Failed to compute {label.lower()} diff: {error}")
+                return DiffResult(
+                    has_error=True,
+                    error_message=f"{command} failed: {error}",
                 )
-
-        changed_files = list(set(changed_files))  # Deduplicate
-
-        # 5. Get diffstat summary
-        # Always include staged + unstaged diffstat
-        diffstat_parts = []
-
-        # Staged diffstat
-        staged_stat_result = subprocess.run(
-            ["git", "diff", "--stat", "--cached"],
-            capture_output=True,
-            text=True,
-        )
-        log_command("git diff --stat --cached", staged_stat_result.returncode)
-
-        if staged_stat_result.returncode == 0 and staged_stat_result.stdout.strip():
-            diffstat_parts.append("Staged:\n" + staged_stat_result.stdout.strip())
-
-        # Unstaged diffstat
-        unstaged_stat_result = subprocess.run(
-            ["git", "diff", "--stat"],
-            capture_output=True,
-            text=True,
-        )
-        log_command("git diff --stat", unstaged_stat_result.returncode)
-
-        if unstaged_stat_result.returncode == 0 and unstaged_stat_result.stdout.strip():
-            diffstat_parts.append("Unstaged:\n" + unstaged_stat_result.stdout.strip())
-
-        # Committed diffstat (if we have a base commit)
-        if not no_base_commit:
-            committed_stat_result = subprocess.run(
-                ["git", "diff", "--stat", f"{base_commit}..HEAD"],
-                capture_output=True,
-                text=True,
+            if patch.strip():
+                diff_sections.append(f"=== {label} Changes ===\n" + patch)
+
+            changed_files.extend(files)
+            try:
+                stat = format_diffstat(numstat())
+            except subprocess.CalledProcessError:
+                stat = ""
+            if stat:
+                diffstat_parts.append(f"{label}:\n" + stat)
+
+        # Deduplicate, keeping a stable order
+        changed_files = list(dict.fromkeys(changed_files))
+
+        # 4. Untracked files (content only for small documentation files)
+        untracked_files = snapshot.untracked_files
+        if untracked_files:
+            untracked_diff_parts = list(
+                render_untracked_files(untracked_files, _generate_untracked_file_diff)
             )
-            log_command(f"git diff --stat {base_commit}..HEAD", committed_stat_result.returncode)
-
-            if committed_stat_result.returncode == 0 and committed_stat_result.stdout.strip():
-                diffstat_parts.insert(0, "Committed:\n" + committed_stat_result.stdout.strip())
-
-        diffstat = "\n\n".join(diffstat_parts)
-
-        # 6. Get untracked files: git ls-files --others --exclude-standard
-        untracked_result = subprocess.run(
-            ["git", "ls-files", "--others", "--exclude-standard"],
-            capture_output=True,
-            text=True,
-        )
-        log_command("git ls-files --others --exclude-standard", untracked_result.returncode)
-
-        if untracked_result.returncode != 0:
-            stderr = untracked_result.stderr.strip() if untracked_result.stderr else "unknown error"
-            print_warning(f"Failed to list untracked files: {stderr}")
-            # Non-fatal: continue with empty untracked_files
-        elif untracked_result.stdout.strip():
-            untracked_files = [f for f in untracked_result.stdout.strip().split("\n") if f.strip()]
-
-            # Generate diff-like content for small text untracked files
-            untracked_diff_parts = []
-            for filepath in untracked_files:
-                untracked_diff_parts.append(_generate_untracked_file_diff(filepath))
-
-            if untracked_diff_parts:
-                diff_sections.append("=== Untracked Files ===\n" + "\n".join(untracked_diff_parts))
+            diff_sections.append("=== Untracked Files ===\n" + "\n".join(untracked_diff_parts))
 
         diff_output = "\n\n".join(diff_sections).strip()
 
@@ -582,7 +1529,7 @@ def get_diff_from_baseline(base_commit: str | None) -> DiffResult:
             diff=diff_output,
             has_error=False,
             changed_files=changed_files,
-            diffstat=diffstat,
+            diffstat="\n\n".join(diffstat_parts),
             untracked_files=untracked_files,
         )
 
@@ -594,6 +1541,16 @@ def get_diff_from_baseline(base_commit: str | None) -> DiffResult:
         )
 
 
+def _run_diff_patch(*args: str) -> tuple[str, str | None]:
+    """Run ``git diff --no-color --no-ext-diff`` and return (output, error)."""
+    cmd = ["git", "diff", "--no-color", "--no-ext-diff", *args]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    log_command(" ".join(cmd), result.returncode)
+    if result.returncode != 0:
+        return "", result.stderr.strip() if result.stderr else "unknown error"
+    return result.stdout, None
+
+
 def _is_doc_file_for_diff(filepath: str) -> bool:
     """Check if a file is a documentation file (for diff content inclusion).
 
@@ -632,8 +1589,6 @@ def _generate_untracked_file_diff(filepath: str, max_file_size: int = 50_000) ->
     leaking secrets or sensitive information. Non-doc files get
     a filename-only entry.
     """
-    import os
-
     try:
         if not os.path.isfile(filepath):
             return f"diff --git a/{filepath} b/{filepath}\nnew file (not readable)\n"
@@ -647,7 +1602,8 @@ def _generate_untracked_file_diff(filepath: str, max_file_size: int = 50_000) ->
                 f"[NEW FILE: {filepath} ({file_size} bytes) - content omitted (non-doc)]\n"
             )
 
-        file_size = os.path.getsize(filepath)
+        # Doc files: one open for size, binary sniff and content
+        file_size, content = read_text_if_not_binary(filepath, max_file_size)
 
         if file_size > max_file_size:
             return (
@@ -656,38 +1612,14 @@ def _generate_untracked_file_diff(filepath: str, max_file_size: int = 50_000) ->
                 f"[LARGE FILE: {filepath} ({file_size} bytes) - content omitted]\n"
             )
 
-        # Check if binary by looking for null bytes
-        try:
-            with open(filepath, "rb") as f:
-                sample = f.read(8192)
-            if b"\x00" in sample:
-                return (
-                    f"diff --git a/{filepath} b/{filepath}\n"
-                    f"new file mode 100644\n"
-                    f"[BINARY FILE: {filepath}]\n"
-                )
-        except OSError:
-            pass
-
-        # Read and format text file (doc files only)
-        with open(filepath, encoding="utf-8", errors="replace") as f:
-            content = f.read()
-
-        lines = content.splitlines(keepends=True)
-        if lines and not lines[-1].endswith("\n"):
-            lines[-1] += "\n"
-
-        diff_lines = [
-            f"diff --git a/{filepath} b/{filepath}\n",
-            "new file mode 100644\n",
-            "--- /dev/null\n",
-            f"+++ b/{filepath}\n",
-            f"@@ -0,0 +1,{len(lines)} @@\n",
-        ]
-        for line in lines:
-            diff_lines.append(f"+{line}")
+        if content is None:
+            return (
+                f"diff --git a/{filepath} b/{filepath}\n"
+                f"new file mode 100644\n"
+                f"[BINARY FILE: {filepath}]\n"
+            )
 
-        return "".join(diff_lines)
+        return format_new_file_diff(filepath, content)
 
     except OSError as e:
         return (
@@ -718,27 +1650,48 @@ def get_changed_files_list(base_commit: str) -> tuple[list[str], str]:
 
 def get_untracked_files_list() -> list[str]:
     """Get list of untracked files (excluding ignored)."""
-    result = subprocess.run(
-        ["git", "ls-files", "--others", "--exclude-standard"],
-        capture_output=True,
-        text=True,
-    )
-
-    if result.returncode != 0:
+    try:
+        return get_repo_snapshot().untracked_files
+    except subprocess.CalledProcessError:
         return []
 
-    return [f for f in result.stdout.strip().split("\n") if f.strip()]
-
 
 __all__ = [
     "DiffResult",
     "DirtyStateAction",
+    "StatusEntry",
+    "NumstatEntry",
+    "RepoSnapshot",
+    "get_repo_snapshot",
+    "repo_snapshot_scope",
+    "parse_status_v2_z",
+    "parse_numstat_z",
+    "diff_numstat",
+    "format_diffstat",
+    "write_worktree_tree",
+    "diff_tree_blobs",
+    "grep_words",
+    "RepoFileIndex",
+    "get_repo_index",
+    "clear_repo_indexes",
+    "GitObjectInfo",
+    "GitObjectReader",
+    "get_object_reader",
+    "close_object_readers",
+    "read_file_at_revision",
+    "UNTRACKED_DIR_COLLAPSE_THRESHOLD",
+    "UntrackedDirSummary",
+    "collapse_untracked_dirs",
+    "render_untracked_files",
+    "read_text_if_not_binary",
+    "format_new_file_diff",
     "is_git_repo",
     "is_dirty",
     "has_untracked_files",
     "has_any_changes",
     "get_current_branch",
     "get_current_commit",
+    "get_head_tree",
     "get_status_short",
     "branch_exists",
     "create_branch",
@@ -8,16 +8,21 @@ This module provides the central orchestration service that coordinates:
 Example usage:
     service = await create_ticket_service()
     ticket = await service.get_ticket("PROJ-123")
+    batch = await service.get_tickets(["PROJ-123", "PROJ-124"])
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 from ingot.config.fetch_config import AgentPlatform
-from ingot.integrations.cache import CacheKey, InMemoryTicketCache, TicketCache
+from ingot.integrations.cache import CachedTicket, CacheKey, InMemoryTicketCache, TicketCache
 from ingot.integrations.fetchers import (
     AgentFetchError,
     AgentIntegrationError,
@@ -26,8 +31,10 @@ from ingot.integrations.fetchers import (
     DirectAPIFetcher,
 )
 from ingot.integrations.fetchers.exceptions import PlatformNotSupportedError
+from ingot.integrations.fetchers.handlers import CacheValidators
 from ingot.integrations.providers import Platform, ProviderRegistry
-from ingot.integrations.providers.base import GenericTicket
+from ingot.integrations.providers.base import GenericTicket, IssueTrackerProvider
+from ingot.integrations.providers.exceptions import IssueTrackerError
 
 if TYPE_CHECKING:
     from ingot.config import ConfigManager
@@ -65,6 +72,25 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_CACHE_TTL = timedelta(hours=1)
 
+# Single-ticket fetches get_tickets() keeps in flight at once (all platforms)
+DEFAULT_FETCH_CONCURRENCY = 8
+
+
+@dataclass
+class TicketBatch:
+    """Result of TicketService.get_tickets().
+
+    Attributes:
+        tickets: Fetched tickets by input string, in input order
+        errors: Why each input that could not be parsed or fetched failed
+        latency: Seconds spent fetching each platform's tickets (platforms
+            served entirely from the cache are absent)
+    """
+
+    tickets: dict[str, GenericTicket] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+    latency: dict[Platform, float] = field(default_factory=dict)
+
 
 class TicketService:
     """Orchestrates ticket fetching with caching and fallback.
@@ -77,6 +103,18 @@ class TicketService:
     5. Normalization via provider.normalize()
     6. Cache storage after successful fetch
 
+    Revalidation:
+        When tickets are fetched through DirectAPIFetcher, the ETag and
+        Last-Modified of each response are cached with the ticket. An
+        expired (or skip_cache) ticket is refreshed with a conditional
+        request; a 304 Not Modified only extends its TTL, with no download
+        or renormalization.
+
+    Batches:
+        get_tickets() fetches many tickets in one call, using the batch
+        endpoints of DirectAPIFetcher where the platform has one and
+        bounded concurrent single fetches for everything else.
+
     Resource Management:
         If using DirectAPIFetcher as fallback, the caller is responsible
         for proper cleanup. Use the async context manager pattern or
@@ -114,8 +152,9 @@ class TicketService:
         1. Detects the platform from the input
         2. Parses the input to extract ticket ID
         3. Checks cache (unless skip_cache=True)
-        4. Fetches via primary fetcher with fallback
-        5. Normalizes to GenericTicket
+        4. Fetches via primary fetcher with fallback, conditionally if the
+           cached ticket has validators
+        5. Normalizes to GenericTicket (unless the server answered 304)
         6. Caches the result
 
         Raises:
@@ -135,28 +174,263 @@ class TicketService:
         logger.debug(f"Parsed {input_str} -> platform={platform.name}, id={ticket_id}")
 
         # Step 3: Check cache (if enabled and not skipped)
-        if self._cache and not skip_cache:
-            cache_key = CacheKey(platform, ticket_id)
+        cached, entry = self._check_cache(provider, ticket_id, skip_cache=skip_cache, ttl=ttl)
+        if cached is not None:
+            return cached
+
+        # Steps 4-6: Fetch, normalize and cache
+        return await self._refresh(provider, ticket_id, entry, ttl)
+
+    async def get_tickets(
+        self,
+        inputs: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+        skip_cache: bool = False,
+        ttl: timedelta | None = None,
+    ) -> TicketBatch:
+        """Fetch and normalize several tickets, from any mix of platforms.
+
+        Cache hits are served first. The remaining tickets of a platform
+        are fetched with one request per chunk where DirectAPIFetcher
+        serves the platform and it has a batch endpoint (Jira JQL search,
+        Linear and GitHub GraphQL aliases, Monday items(ids: [...])). What
+        is left, and expired tickets whose cached validators allow a
+        conditional request, is fetched one by one, at most concurrency at
+        a time.
+        Platforms are fetched concurrently, and the tickets fetched are
+        cached together.
+
+        Unlike get_ticket(), failures do not raise: each input that could
+        not be parsed or fetched is reported in the result's errors. Inputs
+        naming the same ticket are fetched once.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+        """
+        if self._closed:
+            raise RuntimeError("TicketService has been closed")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        batch = TicketBatch()
+        keys: dict[str, CacheKey] = {}
+        found: dict[CacheKey, GenericTicket] = {}
+        failed: dict[CacheKey, Exception] = {}
+        pending: dict[Platform, dict[str, tuple[IssueTrackerProvider, CachedTicket | None]]] = {}
+
+        for input_str in dict.fromkeys(inputs):
+            try:
+                provider = ProviderRegistry.get_provider_for_input(input_str)
+                ticket_id = provider.parse_input(input_str)
+            except (IssueTrackerError, ValueError) as e:
+                batch.errors[input_str] = e
+                continue
+            key = CacheKey(provider.platform, ticket_id)
+            keys[input_str] = key
+            if key in found or ticket_id in pending.get(provider.platform, {}):
+                continue
+            cached, entry = self._check_cache(provider, ticket_id, skip_cache=skip_cache, ttl=ttl)
+            if cached is not None:
+                found[key] = cached
+            else:
+                pending.setdefault(provider.platform, {})[ticket_id] = (provider, entry)
+
+        semaphore = asyncio.Semaphore(concurrency)
+        results = await asyncio.gather(
+            *(
+                self._fetch_platform(platform, tickets, semaphore)
+                for platform, tickets in pending.items()
+            )
+        )
+
+        effective_ttl = ttl or self._default_ttl
+        unvalidated: list[GenericTicket] = []
+        for platform, (fetched, errors, seconds) in zip(pending, results, strict=True):
+            batch.latency[platform] = seconds
+            for ticket_id, (ticket, validators) in fetched.items():
+                found[CacheKey(platform, ticket_id)] = ticket
+                if self._cache and validators:
+                    self._cache.set(
+                        ticket,
+                        ttl=effective_ttl,
+                        etag=validators.etag,
+                        last_modified=validators.last_modified,
+                    )
+                else:
+                    unvalidated.append(ticket)
+            for ticket_id, error in errors.items():
+                failed[CacheKey(platform, ticket_id)] = error
+        if self._cache and unvalidated:
+            self._cache.set_many(unvalidated, ttl=effective_ttl)
+            logger.debug(f"Cached {len(unvalidated)} tickets with TTL {effective_ttl}")
+
+        for input_str, key in keys.items():
+            if key in found:
+                batch.tickets[input_str] = found[key]
+            else:
+                batch.errors[input_str] = failed[key]
+        return batch
+
+    async def _fetch_platform(
+        self,
+        platform: Platform,
+        tickets: dict[str, tuple[IssueTrackerProvider, CachedTicket | None]],
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[dict[str, tuple[GenericTicket, CacheValidators]], dict[str, Exception], float]:
+        """Fetch and normalize one platform's share of get_tickets().
+
+        Returns:
+            The tickets fetched (with their validators) and the errors, by
+            ticket ID, and the seconds it took.
+        """
+        start = time.perf_counter()
+        raw: dict[str, dict[str, Any]] = {}
+        direct_fetcher = self._direct_fetcher(platform)
+        # Cached tickets with validators are revalidated one by one instead:
+        # batch responses carry no validators, and a 304 costs little
+        batchable = [
+            ticket_id
+            for ticket_id, (_, entry) in tickets.items()
+            if entry is None or not (entry.etag or entry.last_modified)
+        ]
+        if direct_fetcher is not None and len(batchable) > 1:
+            try:
+                raw = await direct_fetcher.fetch_batch(batchable, platform.name.lower())
+            except (AgentIntegrationError, AgentFetchError, AgentResponseParseError) as e:
+                logger.warning(f"Batch fetch failed on {platform.name}: {e}; fetching one by one")
+
+        fetched: dict[str, tuple[GenericTicket, CacheValidators]] = {}
+        errors: dict[str, Exception] = {}
+        for ticket_id, data in raw.items():
+            provider, _ = tickets[ticket_id]
+            try:
+                fetched[ticket_id] = (provider.normalize(data, ticket_id), CacheValidators())
+            except Exception as e:
+                # Same as a failed single fetch: reported for this ticket only
+                errors[ticket_id] = e
+
+        async def fetch_one(ticket_id: str) -> tuple[GenericTicket, CacheValidators]:
+            provider, entry = tickets[ticket_id]
+            async with semaphore:
+                return await self._fetch_ticket(provider, ticket_id, entry)
+
+        remaining = [ticket_id for ticket_id in tickets if ticket_id not in raw]
+        results = await asyncio.gather(
+            *(fetch_one(ticket_id) for ticket_id in remaining), return_exceptions=True
+        )
+        for ticket_id, result in zip(remaining, results, strict=True):
+            if isinstance(result, Exception):
+                errors[ticket_id] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                fetched[ticket_id] = result
+
+        seconds = time.perf_counter() - start
+        logger.info(
+            f"Fetched {len(fetched)}/{len(tickets)} {platform.name} tickets in {seconds:.2f}s "
+            f"({len(raw)} batched, {len(remaining)} single)"
+        )
+        return fetched, errors, seconds
+
+    def _check_cache(
+        self,
+        provider: IssueTrackerProvider,
+        ticket_id: str,
+        *,
+        skip_cache: bool,
+        ttl: timedelta | None,
+    ) -> tuple[GenericTicket | None, CachedTicket | None]:
+        """Look a ticket up in the cache.
+
+        Returns:
+            The ticket if it is cached and fresh, else None; and the cached
+            entry a refresh should revalidate, if any.
+        """
+        platform = provider.platform
+        cache_key = CacheKey(platform, ticket_id)
+        entry: CachedTicket | None = None
+        if self._cache and self._direct_fetcher(platform) is not None:
+            # Expired entries are kept: their validators make the refresh conditional
+            entry = self._cache.get_cached_ticket(cache_key, include_expired=True)
+            if entry is not None and not skip_cache and not entry.is_expired:
+                logger.debug(f"Cache hit for {cache_key}")
+                return entry.ticket, entry
+        elif self._cache and not skip_cache:
             cached = self._cache.get(cache_key)
             if cached is not None:
                 logger.debug(f"Cache hit for {cache_key}")
-                return cached
+                return cached, None
             logger.debug(f"Cache miss for {cache_key}")
+        return None, entry
 
-        # Step 4: Fetch raw data with primary/fallback pattern
-        raw_data = await self._fetch_with_fallback(ticket_id, platform)
-
-        # Step 5: Normalize using provider
-        ticket = provider.normalize(raw_data, ticket_id)
+    async def _refresh(
+        self,
+        provider: IssueTrackerProvider,
+        ticket_id: str,
+        entry: CachedTicket | None,
+        ttl: timedelta | None,
+    ) -> GenericTicket:
+        """Fetch, normalize and cache a ticket, revalidating entry if possible."""
+        ticket, validators = await self._fetch_ticket(provider, ticket_id, entry)
 
-        # Step 6: Cache the result
         if self._cache:
             effective_ttl = ttl or self._default_ttl
-            self._cache.set(ticket, ttl=effective_ttl)
+            self._cache.set(
+                ticket,
+                ttl=effective_ttl,
+                etag=validators.etag,
+                last_modified=validators.last_modified,
+            )
             logger.debug(f"Cached ticket {ticket.id} with TTL {effective_ttl}")
 
         return ticket
 
+    async def _fetch_ticket(
+        self,
+        provider: IssueTrackerProvider,
+        ticket_id: str,
+        entry: CachedTicket | None,
+    ) -> tuple[GenericTicket, CacheValidators]:
+        """Fetch and normalize a ticket, revalidating entry if possible.
+
+        Returns:
+            The ticket (entry's if it was not modified) and the validators
+            to cache it with.
+        """
+        platform = provider.platform
+        direct_fetcher = self._direct_fetcher(platform)
+        if direct_fetcher is None:
+            raw_data = await self._fetch_with_fallback(ticket_id, platform)
+            return provider.normalize(raw_data, ticket_id), CacheValidators()
+
+        sent = CacheValidators(entry.etag, entry.last_modified) if entry else CacheValidators()
+        result = await direct_fetcher.fetch_conditional(ticket_id, platform.name.lower(), sent)
+        if result.data is None and entry is not None:
+            logger.debug(f"{platform.name} {ticket_id} not modified; extending its TTL")
+            return entry.ticket, result.validators
+        if result.data is None:
+            # 304 without a cached copy: nothing was sent to match, so refetch in full
+            raw_data = await self._fetch_with_fallback(ticket_id, platform)
+            return provider.normalize(raw_data, ticket_id), result.validators
+        return provider.normalize(result.data, ticket_id), result.validators
+
+    def _direct_fetcher(self, platform: Platform) -> DirectAPIFetcher | None:
+        """The fetcher that will serve platform, if it is a DirectAPIFetcher.
+
+        Only DirectAPIFetcher can send conditional and batch requests
+        (agent-mediated fetchers cannot), whether it is the primary fetcher
+        or the fallback for platforms the primary lacks.
+        """
+        if isinstance(self._primary, DirectAPIFetcher):
+            return self._primary if self._primary.supports_platform(platform) else None
+        if isinstance(self._fallback, DirectAPIFetcher) and self._fallback.supports_platform(
+            platform
+        ):
+            return None if self._primary.supports_platform(platform) else self._fallback
+        return None
+
     async def _fetch_with_fallback(
         self,
         ticket_id: str,
@@ -6,26 +6,54 @@ This package contains:
 - log_buffer: Memory-efficient log buffer with file backing
 """
 
-from ingot.ui.inline_runner import InlineRunner
-from ingot.ui.log_buffer import TaskLogBuffer
-from ingot.ui.menus import (
-    MainMenuChoice,
-    ReviewChoice,
-    show_git_dirty_menu,
-    show_main_menu,
-    show_model_selection,
-    show_plan_review_menu,
-    show_task_checkboxes,
-    show_task_review_menu,
-)
-from ingot.ui.prompts import (
-    custom_style,
-    prompt_checkbox,
-    prompt_confirm,
-    prompt_enter,
-    prompt_input,
-    prompt_select,
-)
+from typing import TYPE_CHECKING
+
+from ingot.utils.lazy_imports import lazy_getattr
+
+if TYPE_CHECKING:
+    from ingot.ui.inline_runner import InlineRunner
+    from ingot.ui.log_buffer import TaskLogBuffer
+    from ingot.ui.menus import (
+        MainMenuChoice,
+        ReviewChoice,
+        show_git_dirty_menu,
+        show_main_menu,
+        show_model_selection,
+        show_plan_review_menu,
+        show_task_checkboxes,
+        show_task_review_menu,
+    )
+    from ingot.ui.prompts import (
+        custom_style,
+        prompt_checkbox,
+        prompt_confirm,
+        prompt_enter,
+        prompt_input,
+        prompt_select,
+    )
+
+# Lazy imports (PEP 562): submodules are only imported when one of their
+# names is first accessed, so importing this package stays cheap.
+_LAZY_IMPORTS = {
+    "InlineRunner": "ingot.ui.inline_runner",
+    "TaskLogBuffer": "ingot.ui.log_buffer",
+    "MainMenuChoice": "ingot.ui.menus",
+    "ReviewChoice": "ingot.ui.menus",
+    "show_git_dirty_menu": "ingot.ui.menus",
+    "show_main_menu": "ingot.ui.menus",
+    "show_model_selection": "ingot.ui.menus",
+    "show_plan_review_menu": "ingot.ui.menus",
+    "show_task_checkboxes": "ingot.ui.menus",
+    "show_task_review_menu": "ingot.ui.menus",
+    "custom_style": "ingot.ui.prompts",
+    "prompt_checkbox": "ingot.ui.prompts",
+    "prompt_confirm": "ingot.ui.prompts",
+    "prompt_enter": "ingot.ui.prompts",
+    "prompt_input": "ingot.ui.prompts",
+    "prompt_select": "ingot.ui.prompts",
+}
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     # Inline Runner
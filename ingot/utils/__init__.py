@@ -6,9 +6,15 @@ This package contains:
 - errors: Custom exceptions and exit codes
 - error_analysis: Structured error parsing for better retry prompts
 - logging: Logging configuration
+- processes: Tracking of backend subprocesses started by a thread
 - retry: Rate limit handling with exponential backoff
+- token_budget: Token estimates and per-prompt token budgets
 """
 
+from typing import TYPE_CHECKING
+
+# Console helpers stay eager: nearly every code path prints, and the `console`
+# attribute would otherwise be shadowed by the `ingot.utils.console` submodule.
 from ingot.utils.console import (
     console,
     print_error,
@@ -19,28 +25,65 @@ from ingot.utils.console import (
     print_warning,
     show_banner,
 )
-from ingot.utils.env_utils import (
-    SENSITIVE_KEY_PATTERNS,
-    EnvVarExpansionError,
-    expand_env_vars,
-    expand_env_vars_strict,
-    is_sensitive_key,
-)
-from ingot.utils.error_analysis import ErrorAnalysis, analyze_error_output
-from ingot.utils.errors import (
-    AuggieNotInstalledError,
-    ExitCode,
-    GitOperationError,
-    IngotError,
-    PlatformNotConfiguredError,
-    UserCancelledError,
-)
-from ingot.utils.logging import log_command, log_message, setup_logging
-from ingot.utils.retry import (
-    RateLimitExceededError,
-    calculate_backoff_delay,
-    with_rate_limit_retry,
-)
+from ingot.utils.lazy_imports import lazy_getattr
+
+if TYPE_CHECKING:
+    from ingot.utils.env_utils import (
+        SENSITIVE_KEY_PATTERNS,
+        EnvVarExpansionError,
+        expand_env_vars,
+        expand_env_vars_strict,
+        is_sensitive_key,
+    )
+    from ingot.utils.error_analysis import ErrorAnalysis, analyze_error_output
+    from ingot.utils.errors import (
+        AuggieNotInstalledError,
+        ExitCode,
+        GitOperationError,
+        IngotError,
+        PlatformNotConfiguredError,
+        UserCancelledError,
+    )
+    from ingot.utils.logging import log_command, log_message, setup_logging
+    from ingot.utils.processes import process_started, watch_processes
+    from ingot.utils.retry import (
+        RateLimitExceededError,
+        calculate_backoff_delay,
+        with_rate_limit_retry,
+    )
+    from ingot.utils.token_budget import TokenBudget, TokenEstimator, get_token_estimator
+
+# Lazy imports (PEP 562): submodules are only imported when one of their
+# names is first accessed, so importing this package stays cheap.
+_LAZY_IMPORTS = {
+    "SENSITIVE_KEY_PATTERNS": "ingot.utils.env_utils",
+    "EnvVarExpansionError": "ingot.utils.env_utils",
+    "expand_env_vars": "ingot.utils.env_utils",
+    "expand_env_vars_strict": "ingot.utils.env_utils",
+    "is_sensitive_key": "ingot.utils.env_utils",
+    "ErrorAnalysis": "ingot.utils.error_analysis",
+    "analyze_error_output": "ingot.utils.error_analysis",
+    "AuggieNotInstalledError": "ingot.utils.errors",
+    "ExitCode": "ingot.utils.errors",
+    "GitOperationError": "ingot.utils.errors",
+    "IngotError": "ingot.utils.errors",
+    "PlatformNotConfiguredError": "ingot.utils.errors",
+    "UserCancelledError": "ingot.utils.errors",
+    "log_command": "ingot.utils.logging",
+    "log_message": "ingot.utils.logging",
+    "setup_logging": "ingot.utils.logging",
+    "process_started": "ingot.utils.processes",
+    "watch_processes": "ingot.utils.processes",
+    "RateLimitExceededError": "ingot.utils.retry",
+    "calculate_backoff_delay": "ingot.utils.retry",
+    "with_rate_limit_retry": "ingot.utils.retry",
+    "TokenBudget": "ingot.utils.token_budget",
+    "TokenEstimator": "ingot.utils.token_budget",
+    "get_token_estimator": "ingot.utils.token_budget",
+}
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
+
 
 __all__ = [
     # Console
@@ -72,8 +115,15 @@ __all__ = [
     "setup_logging",
     "log_message",
     "log_command",
+    # Processes
+    "process_started",
+    "watch_processes",
     # Retry
     "RateLimitExceededError",
     "calculate_backoff_delay",
     "with_rate_limit_retry",
+    # Token Budget
+    "TokenBudget",
+    "TokenEstimator",
+    "get_token_estimator",
 ]
@@ -9,10 +9,19 @@ import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from ingot.utils.token_budget import TokenEstimator
+
 if TYPE_CHECKING:
     from ingot.workflow.tasks import Task
 
 
+# Token budgets for the raw error excerpt of unparsed output
+_ERROR_MESSAGE_TOKENS = 150
+_SYNTAX_ERROR_MESSAGE_TOKENS = 100
+
+_ESTIMATOR = TokenEstimator()
+
+
 @dataclass
 class ErrorAnalysis:
     """Structured error analysis."""
@@ -87,7 +96,7 @@ def analyze_error_output(output: str, task: "Task") -> ErrorAnalysis:
         error_type="unknown",
         file_path=None,
         line_number=None,
-        error_message=_extract_last_n_chars(output, 500),
+        error_message=_extract_tail(output, _ERROR_MESSAGE_TOKENS),
         stack_trace=[],
         root_cause="Unable to determine root cause from error output",
         suggested_fix="Review the error output carefully and try again",
@@ -258,7 +267,7 @@ def _parse_syntax_error(output: str) -> ErrorAnalysis:
         error_type="syntax",
         file_path=None,
         line_number=None,
-        error_message=_extract_last_n_chars(output, 300),
+        error_message=_extract_tail(output, _SYNTAX_ERROR_MESSAGE_TOKENS),
         stack_trace=[],
         root_cause="Syntax error in code",
         suggested_fix="Review the syntax error message and fix the code",
@@ -271,18 +280,19 @@ def _generic_error(output: str) -> ErrorAnalysis:
         error_type="unknown",
         file_path=None,
         line_number=None,
-        error_message=_extract_last_n_chars(output, 500),
+        error_message=_extract_tail(output, _ERROR_MESSAGE_TOKENS),
         stack_trace=[],
         root_cause="Unable to determine root cause",
         suggested_fix="Review the error output and try again",
     )
 
 
-def _extract_last_n_chars(text: str, n: int) -> str:
-    """Extract last N characters, adding ellipsis if truncated."""
-    if len(text) <= n:
+def _extract_tail(text: str, max_tokens: int) -> str:
+    """Extract the last lines of text that fit in max_tokens, adding ellipsis if truncated."""
+    tail = _ESTIMATOR.truncate(text, max_tokens, keep="tail")
+    if tail == text:
         return text
-    return "...\n" + text[-n:]
+    return "...\n" + tail
 
 
 __all__ = [
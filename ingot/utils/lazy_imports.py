@@ -0,0 +1,31 @@
+"""Lazy package exports (PEP 562).
+
+Package ``__init__`` modules map each re-exported name to the submodule that
+defines it and install the function returned by :func:`lazy_getattr` as their
+module-level ``__getattr__``. A submodule is only imported the first time one
+of its names is accessed, so importing the package itself stays cheap.
+"""
+
+import importlib
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_getattr(package: str, exports: Mapping[str, str]) -> Callable[[str], Any]:
+    """Build a module ``__getattr__`` that imports exported names on first access.
+
+    Args:
+        package: Name of the package, used in the AttributeError message.
+        exports: Maps each exported name to the module that defines it.
+
+    Returns:
+        Function to assign to the package's ``__getattr__``.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        return getattr(importlib.import_module(module), name)
+
+    return __getattr__
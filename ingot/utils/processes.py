@@ -0,0 +1,39 @@
+"""Tracking of backend subprocesses started by the current thread.
+
+Background runs share their backend with the foreground workflow, so
+cancelling one cannot stop "the backend"; it has to stop the process
+its own call started. Backend clients report each streaming process they
+spawn with process_started(), and watch_processes() hands those reports
+to a callback while a block runs in the calling thread.
+"""
+
+import subprocess
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+_watchers = threading.local()
+
+
+@contextmanager
+def watch_processes(on_start: Callable[[subprocess.Popen[str]], None]) -> Iterator[None]:
+    """Call on_start with every process this thread reports inside the block."""
+    previous = getattr(_watchers, "on_start", None)
+    _watchers.on_start = on_start
+    try:
+        yield
+    finally:
+        _watchers.on_start = previous
+
+
+def process_started(process: subprocess.Popen[str]) -> None:
+    """Report a subprocess started by this thread to the active watcher, if any."""
+    on_start = getattr(_watchers, "on_start", None)
+    if on_start is not None:
+        on_start(process)
+
+
+__all__ = [
+    "process_started",
+    "watch_processes",
+]
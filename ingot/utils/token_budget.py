@@ -0,0 +1,274 @@
+"""Token budgets for prompt assembly.
+
+Prompt builders used to cap their inputs in characters, which is a poor
+proxy for tokens: dense code costs roughly a third more tokens per
+character than prose, so the same cap either overflows the context window
+or leaves much of it unused.
+
+TokenEstimator estimates token counts locally (no tokenizer download, no
+API call) from the length of the text and how code-like it is, using
+characters-per-token ratios calibrated per backend. TokenBudget splits one
+call's budget between the components of a prompt (instructions, plan,
+research, diff, errors); builders ask it how much room a component has
+and let it cut the text to fit.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from ingot.config.fetch_config import AgentPlatform
+
+
+@dataclass(frozen=True)
+class TokenCalibration:
+    """Tokenizer characteristics of a backend's default model family.
+
+    Attributes:
+        prose_chars_per_token: Average characters per token in English prose.
+        code_chars_per_token: Average characters per token in source code.
+        context_tokens: Context window of the model.
+    """
+
+    prose_chars_per_token: float
+    code_chars_per_token: float
+    context_tokens: int
+
+
+# Ratios are rounded down so that estimates err on the high side
+DEFAULT_CALIBRATION = TokenCalibration(3.5, 2.9, 128_000)
+
+_CALIBRATIONS: dict[str, TokenCalibration] = {
+    "auggie": TokenCalibration(3.5, 2.9, 200_000),
+    "claude": TokenCalibration(3.5, 2.9, 200_000),
+    "cursor": TokenCalibration(3.8, 3.1, 200_000),
+    "aider": TokenCalibration(3.8, 3.1, 128_000),
+    "gemini": TokenCalibration(4.0, 3.3, 1_000_000),
+    "codex": TokenCalibration(4.2, 3.4, 400_000),
+}
+
+# Share of the context window a prompt may fill; the agent needs the rest
+# for its own file reads, tool output and answer
+PROMPT_CONTEXT_FRACTION = 0.5
+
+# Characters that make text tokenize like code
+_SYMBOL_CHARS = "{}()[]<>;:=+-*/\\|&!?.,'\"`#@$%^~_"
+_DROP_SYMBOLS = str.maketrans("", "", _SYMBOL_CHARS)
+
+# Fraction of symbol characters at which text counts as fully code-like
+_CODE_SYMBOL_DENSITY = 0.15
+
+
+def get_calibration(platform: AgentPlatform | str | None) -> TokenCalibration:
+    """Get the token calibration of a backend (default for unknown backends)."""
+    key = platform if platform is None or isinstance(platform, str) else platform.value
+    return _CALIBRATIONS.get(key, DEFAULT_CALIBRATION) if key else DEFAULT_CALIBRATION
+
+
+class TokenEstimator:
+    """Fast local token count estimates for one backend.
+
+    The characters-per-token ratio is interpolated between the prose and
+    code ratios of the calibration by the density of symbol characters,
+    so one pass over the text (str.translate) is all it costs.
+    """
+
+    def __init__(self, calibration: TokenCalibration = DEFAULT_CALIBRATION) -> None:
+        self.calibration = calibration
+
+    def chars_per_token(self, text: str) -> float:
+        """Estimated characters per token of text."""
+        prose = self.calibration.prose_chars_per_token
+        code = self.calibration.code_chars_per_token
+        if not text:
+            return prose
+        symbols = len(text) - len(text.translate(_DROP_SYMBOLS))
+        weight = min(symbols / len(text) / _CODE_SYMBOL_DENSITY, 1.0)
+        return prose + (code - prose) * weight
+
+    def estimate(self, text: str) -> int:
+        """Estimated number of tokens in text."""
+        if not text:
+            return 0
+        return math.ceil(len(text) / self.chars_per_token(text))
+
+    def chars_for(self, tokens: int, *, code: bool = False) -> int:
+        """Characters of prose (or code) that fit in tokens."""
+        ratio = (
+            self.calibration.code_chars_per_token
+            if code
+            else self.calibration.prose_chars_per_token
+        )
+        return int(tokens * ratio)
+
+    def truncate(self, text: str, max_tokens: int, *, keep: Literal["head", "tail"]) -> str:
+        """Cut text at a line boundary so that it fits in max_tokens.
+
+        keep="head" keeps the beginning, keep="tail" the end. A single
+        line longer than the budget is cut mid-line.
+        """
+        estimate = self.estimate(text)
+        if estimate <= max_tokens:
+            return text
+        if max_tokens <= 0:
+            return ""
+        length = int(len(text) * max_tokens / estimate)
+        while True:
+            if keep == "head":
+                cut = text[:length]
+                newline = cut.rfind("\n")
+                if newline > 0:
+                    cut = cut[:newline]
+            else:
+                cut = text[len(text) - length :]
+                newline = cut.find("\n")
+                if 0 <= newline < len(cut) - 1:
+                    cut = cut[newline + 1 :]
+            if self.estimate(cut) <= max_tokens or not cut:
+                return cut
+            length = int(length * 0.9)
+
+
+def get_token_estimator(platform: AgentPlatform | str | None = None) -> TokenEstimator:
+    """Get a token estimator calibrated for a backend."""
+    return TokenEstimator(get_calibration(platform))
+
+
+@dataclass(frozen=True)
+class ComponentAllocation:
+    """How much of a prompt budget a component is given.
+
+    Attributes:
+        share: Fraction of the budget held for the component until it is used.
+        max_tokens: Ceiling regardless of the budget size, for components
+            that stop being useful past a certain length.
+    """
+
+    share: float
+    max_tokens: int | None = None
+
+
+DEFAULT_ALLOCATIONS: Mapping[str, ComponentAllocation] = {
+    "instructions": ComponentAllocation(0.10),
+    # Excerpt of an existing plan sent back for fixes
+    "plan": ComponentAllocation(0.15, max_tokens=2_200),
+    "research": ComponentAllocation(0.10, max_tokens=3_500),
+    "diff": ComponentAllocation(0.55),
+    # Tail of a failed run's output
+    "errors": ComponentAllocation(0.10, max_tokens=900),
+}
+
+
+class TokenBudget:
+    """Token budget of one prompt, divided between its components.
+
+    Each component holds its allocation until it is used. A component
+    asking for space may take everything not used so far and not held by
+    components still to come (up to its own ceiling), so room left by a
+    short plan goes to the diff, and so on.
+    """
+
+    def __init__(
+        self,
+        total_tokens: int | None = None,
+        estimator: TokenEstimator | None = None,
+        allocations: Mapping[str, ComponentAllocation] = DEFAULT_ALLOCATIONS,
+    ) -> None:
+        self.estimator = estimator or TokenEstimator()
+        if total_tokens is None:
+            total_tokens = int(self.estimator.calibration.context_tokens * PROMPT_CONTEXT_FRACTION)
+        self.total_tokens = total_tokens
+        self._allocations = allocations
+        self._used: dict[str, int] = {}
+
+    @classmethod
+    def for_platform(cls, platform: AgentPlatform | str | None) -> TokenBudget:
+        """Budget of one call to a backend, sized from its context window."""
+        return cls(estimator=get_token_estimator(platform))
+
+    @property
+    def used_tokens(self) -> int:
+        return sum(self._used.values())
+
+    def allocation(self, component: str) -> int:
+        """Tokens held for component before anything is used."""
+        spec = self._allocations.get(component)
+        if spec is None:
+            return 0
+        tokens = int(self.total_tokens * spec.share)
+        return tokens if spec.max_tokens is None else min(tokens, spec.max_tokens)
+
+    def allowance(self, component: str) -> int:
+        """Tokens component may use now."""
+        held = sum(
+            self.allocation(name)
+            for name in self._allocations
+            if name != component and name not in self._used
+        )
+        free = max(self.total_tokens - self.used_tokens - held, 0)
+        spec = self._allocations.get(component)
+        if spec is not None and spec.max_tokens is not None:
+            free = min(free, max(spec.max_tokens - self._used.get(component, 0), 0))
+        return free
+
+    def char_allowance(self, component: str, *, code: bool = False) -> int:
+        """allowance() in characters of prose (or code), for character-based readers."""
+        return self.estimator.chars_for(self.allowance(component), code=code)
+
+    def reserve(self, component: str, text: str) -> int:
+        """Record text that is sent whole; returns its estimated tokens."""
+        tokens = self.estimator.estimate(text)
+        self._used[component] = self._used.get(component, 0) + tokens
+        return tokens
+
+    def fit(
+        self,
+        component: str,
+        text: str,
+        *,
+        keep: Literal["head", "tail", "ends"] = "head",
+        marker: str = "",
+    ) -> str:
+        """Return text cut to component's allowance, and record it as used.
+
+        keep selects what survives: the beginning, the end, or both ends
+        (two thirds head, one third tail). marker is inserted where text
+        was cut, and only then.
+        """
+        allowance = self.allowance(component)
+        if self.estimator.estimate(text) <= allowance:
+            self.reserve(component, text)
+            return text
+
+        room = max(allowance - self.estimator.estimate(marker), 0)
+        truncate = self.estimator.truncate
+        if keep == "head":
+            result = truncate(text, room, keep="head") + marker
+        elif keep == "tail":
+            result = marker + truncate(text, room, keep="tail")
+        else:
+            head_room = room * 2 // 3
+            result = (
+                truncate(text, head_room, keep="head")
+                + marker
+                + truncate(text, room - head_room, keep="tail")
+            )
+        self.reserve(component, result)
+        return result
+
+
+__all__ = [
+    "DEFAULT_ALLOCATIONS",
+    "DEFAULT_CALIBRATION",
+    "PROMPT_CONTEXT_FRACTION",
+    "ComponentAllocation",
+    "TokenBudget",
+    "TokenCalibration",
+    "TokenEstimator",
+    "get_calibration",
+    "get_token_estimator",
+]
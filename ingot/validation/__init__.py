@@ -1,17 +1,43 @@
 """Plan and artifact validation for INGOT workflow."""
 
-from ingot.validation.base import (
-    ValidationContext,
-    ValidationFinding,
-    ValidationReport,
-    ValidationSeverity,
-    Validator,
-    ValidatorRegistry,
-)
-from ingot.validation.plan_fixer import PlanFixer
+from typing import TYPE_CHECKING
+
+from ingot.utils.lazy_imports import lazy_getattr
+
+if TYPE_CHECKING:
+    from ingot.validation.base import (
+        SectionFindingCache,
+        ValidationContext,
+        ValidationFinding,
+        ValidationReport,
+        ValidationSeverity,
+        Validator,
+        ValidatorRegistry,
+    )
+    from ingot.validation.plan_document import PlanDocument
+    from ingot.validation.plan_fixer import PlanFixer
+
+# Lazy imports (PEP 562): submodules are only imported when one of their
+# names is first accessed, so importing this package stays cheap.
+_LAZY_IMPORTS = {
+    "SectionFindingCache": "ingot.validation.base",
+    "ValidationContext": "ingot.validation.base",
+    "ValidationFinding": "ingot.validation.base",
+    "ValidationReport": "ingot.validation.base",
+    "ValidationSeverity": "ingot.validation.base",
+    "Validator": "ingot.validation.base",
+    "ValidatorRegistry": "ingot.validation.base",
+    "PlanDocument": "ingot.validation.plan_document",
+    "PlanFixer": "ingot.validation.plan_fixer",
+}
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
+
 
 __all__ = [
+    "PlanDocument",
     "PlanFixer",
+    "SectionFindingCache",
     "ValidationContext",
     "ValidationFinding",
     "ValidationReport",
@@ -4,13 +4,22 @@ Provides the Validator ABC, finding/report data classes, and the
 ValidatorRegistry that runs all registered validators against content.
 """
 
+import dataclasses
+import hashlib
+import threading
 import traceback
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ingot.utils.logging import log_message
+from ingot.validation.plan_document import PlanDocument
+
+if TYPE_CHECKING:
+    from ingot.workflow.symbol_index import SymbolIndex
 
 
 class ValidationSeverity(Enum):
@@ -38,6 +47,10 @@ class ValidationContext:
 
     repo_root: Path | None = None  # For filesystem checks (must be injected, not auto-discovered)
     ticket_id: str = ""  # Reserved for future validator use
+    # Parsed content, built once by ValidatorRegistry.validate_all()
+    document: PlanDocument | None = None
+    # Definitions in the repository; symbol checks are skipped when None
+    symbol_index: "SymbolIndex | None" = None
 
 
 @dataclass
@@ -80,11 +93,57 @@ class Validator(ABC):
         """Human-readable validator name (e.g., 'File Exists Check')."""
         ...
 
+    # Section-scoped validators judge each plan section on its own text, so
+    # the registry may run them per section and cache findings by section
+    # hash (see SectionFindingCache). Document-scoped ones always see it all.
+    section_scoped: bool = False
+
     @abstractmethod
     def validate(self, content: str, context: ValidationContext) -> list[ValidationFinding]:
         """Run validation on content. Return list of findings (empty = pass)."""
         ...
 
+    def merge_section_findings(self, findings: list[ValidationFinding]) -> list[ValidationFinding]:
+        """Combine per-section findings (in document order) into the final list."""
+        return findings
+
+
+class SectionFindingCache:
+    """Findings of section-scoped validators, keyed by section content hash.
+
+    Share one cache across the validation passes of a single plan (for
+    example the AI fix attempts of Step 1) so that only sections whose
+    text changed are validated again. Line numbers are stored relative to
+    the section. Validators that consult the filesystem assume it does not
+    change while the cache is in use.
+    """
+
+    def __init__(self) -> None:
+        self._findings: dict[tuple[str, str], list[ValidationFinding]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def section_hash(text: str) -> str:
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    def get(self, validator_name: str, digest: str) -> list[ValidationFinding] | None:
+        with self._lock:
+            findings = self._findings.get((validator_name, digest))
+            if findings is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return findings
+
+    def put(self, validator_name: str, digest: str, findings: list[ValidationFinding]) -> None:
+        with self._lock:
+            self._findings[(validator_name, digest)] = findings
+
+    def __len__(self) -> int:
+        return len(self._findings)
+
 
 class ValidatorRegistry:
     """Registry of validators. Run all registered validators against content."""
@@ -95,29 +154,93 @@ class ValidatorRegistry:
     def register(self, validator: Validator) -> None:
         self._validators.append(validator)
 
-    def validate_all(self, content: str, context: ValidationContext) -> ValidationReport:
+    def validate_all(
+        self,
+        content: str,
+        context: ValidationContext,
+        *,
+        max_workers: int = 1,
+        section_cache: SectionFindingCache | None = None,
+    ) -> ValidationReport:
+        """Run every validator against content.
+
+        The content is parsed once into a PlanDocument that validators read
+        through context.document. With max_workers > 1 validators run
+        concurrently; findings are still reported in registration order.
+        With a section_cache, section-scoped validators only re-check
+        sections whose text is not in the cache.
+        """
+        if context.document is None or context.document.content != content:
+            context = dataclasses.replace(context, document=PlanDocument.parse_all(content))
+
+        def run(validator: Validator) -> list[ValidationFinding]:
+            if section_cache is not None and validator.section_scoped:
+                return self._run_by_section(validator, context, section_cache)
+            return self._run_one(validator, content, context)
+
+        if max_workers > 1 and len(self._validators) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(self._validators)),
+                thread_name_prefix="ingot-validate",
+            ) as pool:
+                results = list(pool.map(run, self._validators))
+        else:
+            results = [run(v) for v in self._validators]
+
         report = ValidationReport()
-        for validator in self._validators:
-            try:
-                findings = validator.validate(content, context)
-                report.findings.extend(findings)
-            except Exception as exc:
-                log_message(f"Validator '{validator.name}' crashed:\n{traceback.format_exc()}")
-                report.findings.append(
-                    ValidationFinding(
-                        validator_name=validator.name,
-                        severity=ValidationSeverity.ERROR,
-                        message=f"Validator crashed: {exc}",
-                    )
-                )
+        for findings in results:
+            report.findings.extend(findings)
         return report
 
+    @staticmethod
+    def _run_one(
+        validator: Validator, content: str, context: ValidationContext
+    ) -> list[ValidationFinding]:
+        try:
+            return validator.validate(content, context)
+        except Exception as exc:
+            log_message(f"Validator '{validator.name}' crashed:\n{traceback.format_exc()}")
+            return [
+                ValidationFinding(
+                    validator_name=validator.name,
+                    severity=ValidationSeverity.ERROR,
+                    message=f"Validator crashed: {exc}",
+                )
+            ]
+
+    @classmethod
+    def _run_by_section(
+        cls, validator: Validator, context: ValidationContext, cache: SectionFindingCache
+    ) -> list[ValidationFinding]:
+        document = context.document
+        assert document is not None
+        findings: list[ValidationFinding] = []
+        for section in document.sections:
+            digest = cache.section_hash(section.text)
+            section_findings = cache.get(validator.name, digest)
+            if section_findings is None:
+                section_context = dataclasses.replace(context, document=PlanDocument(section.text))
+                section_findings = cls._run_one(validator, section.text, section_context)
+                if any(f.message.startswith("Validator crashed:") for f in section_findings):
+                    return section_findings
+                cache.put(validator.name, digest, section_findings)
+
+            line_offset = document.line_number_at(section.start) - 1
+            findings.extend(
+                dataclasses.replace(f, line_number=f.line_number + line_offset)
+                if f.line_number is not None
+                else f
+                for f in section_findings
+            )
+        return validator.merge_section_findings(findings)
+
     @property
     def validators(self) -> list[Validator]:
         return list(self._validators)
 
 
 __all__ = [
+    "SectionFindingCache",
     "ValidationContext",
     "ValidationFinding",
     "ValidationReport",
@@ -0,0 +1,117 @@
+"""Cached per-file line-offset indexes for cheap file:line checks.
+
+Validators that verify ``path:start-end`` citations only need to know how
+many lines a file has. FileLineIndex records the offset of every
+newline, found with mmap and ``find`` rather than by decoding the file,
+and get_file_line_index() memoizes indexes by path until the file's
+mtime or size changes.
+"""
+
+import mmap
+import os
+import stat
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+
+# Indexes kept in memory; least recently used ones are evicted first
+MAX_CACHED_LINE_INDEXES = 1024
+
+
+class FileLineIndex:
+    """Newline offsets of one file.
+
+    Attributes:
+        path: Resolved file path.
+        mtime_ns: Modification time the index was built from.
+        size: File size in bytes the index was built from.
+    """
+
+    def __init__(self, path: Path, mtime_ns: int, size: int, newlines: array) -> None:
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self._newlines = newlines
+
+    @classmethod
+    def build(cls, path: Path) -> "FileLineIndex":
+        """Index path.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        newlines = array("q")
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            if st.st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    find = mm.find
+                    position = find(b"\n")
+                    while position != -1:
+                        newlines.append(position)
+                        position = find(b"\n", position + 1)
+        return cls(path, st.st_mtime_ns, st.st_size, newlines)
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines, counting a final line without a trailing newline."""
+        count = len(self._newlines)
+        if self.size and (not count or self._newlines[-1] != self.size - 1):
+            count += 1
+        return count
+
+    def has_lines(self, start: int, end: int | None = None) -> bool:
+        """True if 1-based lines start..end all exist."""
+        end = start if end is None else end
+        return 1 <= start <= end <= self.line_count
+
+
+_line_indexes: OrderedDict[Path, FileLineIndex] = OrderedDict()
+_line_indexes_lock = threading.Lock()
+
+
+def get_file_line_index(path: Path) -> FileLineIndex | None:
+    """Return the line index of path, rebuilt if the file changed.
+
+    Returns None if path is not a readable regular file.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+
+    key = path.resolve()
+    with _line_indexes_lock:
+        cached = _line_indexes.get(key)
+        if cached is not None and (cached.mtime_ns, cached.size) == (st.st_mtime_ns, st.st_size):
+            _line_indexes.move_to_end(key)
+            return cached
+
+    try:
+        index = FileLineIndex.build(key)
+    except OSError:
+        return None
+
+    with _line_indexes_lock:
+        _line_indexes[key] = index
+        _line_indexes.move_to_end(key)
+        while len(_line_indexes) > MAX_CACHED_LINE_INDEXES:
+            _line_indexes.popitem(last=False)
+    return index
+
+
+def clear_line_index_cache() -> None:
+    """Drop all cached line indexes."""
+    with _line_indexes_lock:
+        _line_indexes.clear()
+
+
+__all__ = [
+    "MAX_CACHED_LINE_INDEXES",
+    "FileLineIndex",
+    "clear_line_index_cache",
+    "get_file_line_index",
+]
@@ -0,0 +1,274 @@
+"""Parsed markdown model of a plan, shared by all plan validators.
+
+PlanDocument scans the plan once and exposes the structures validators
+need: a line index, fenced code blocks, the heading outline with section
+text, inline code spans and HTML comments. ValidatorRegistry builds it
+and passes it through ValidationContext.document, so each validator
+queries it instead of re-parsing the plan.
+
+Each structure is computed on first access and then cached. The registry
+builds documents with parse_all(), so validators running concurrently
+only read them.
+"""
+
+import bisect
+import re
+from dataclasses import dataclass, field
+from functools import cached_property
+
+# Regex-delimited fenced code block (opening ``` line to the next ``` line)
+_FENCED_CODE_BLOCK_RE = re.compile(
+    r"^```[^\n]*\n.*?^```\s*$",
+    re.MULTILINE | re.DOTALL,
+)
+
+_HEADING_RE = re.compile(r"^(#{1,3})\s+(.+)$", re.MULTILINE)
+
+_INLINE_CODE_RE = re.compile(r"`([^`\n]+)`")
+
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+
+
+@dataclass(frozen=True)
+class TextSpan:
+    """A matched region of the plan.
+
+    Attributes:
+        start: Offset of the first character.
+        end: Offset just past the last character.
+        text: The matched text (inner text for inline code spans).
+    """
+
+    start: int
+    end: int
+    text: str
+
+
+@dataclass
+class Heading:
+    """A ``#`` to ``###`` heading and the section it opens.
+
+    Attributes:
+        level: Number of leading ``#`` characters (1-3).
+        title: Heading text without the ``#`` prefix.
+        start: Offset of the heading line.
+        end: Offset of the next heading of any level, or end of the plan.
+        children: Headings nested directly below this one.
+    """
+
+    level: int
+    title: str
+    start: int
+    end: int
+    children: list["Heading"] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class FencePair:
+    """A code fence found by the line-based fence state machine.
+
+    Attributes:
+        open_line: 0-based index of the opening ``` line.
+        close_line: 0-based index of the closing ``` line.
+    """
+
+    open_line: int
+    close_line: int
+
+
+class PlanDocument:
+    """Single-pass parsed view of plan markdown."""
+
+    def __init__(self, content: str) -> None:
+        self.content = content
+        self._outline: list[Heading] = []  # Filled in by headings
+
+    @classmethod
+    def parse_all(cls, content: str) -> "PlanDocument":
+        """Build a document with every structure computed up front."""
+        document = cls(content)
+        for name in (
+            "lines",
+            "line_index",
+            "code_blocks",
+            "_code_block_starts",
+            "stripped_content",
+            "fences",
+            "headings",
+            "sections",
+            "inline_code_spans",
+            "html_comments",
+            "_sections",
+        ):
+            getattr(document, name)
+        return document
+
+    # -- Lines ---------------------------------------------------------------
+
+    @cached_property
+    def lines(self) -> list[str]:
+        """Lines as returned by ``str.splitlines()``."""
+        return self.content.splitlines()
+
+    @cached_property
+    def line_index(self) -> list[int]:
+        """Sorted offsets of every ``\\n`` in the content."""
+        offsets: list[int] = []
+        find = self.content.find
+        position = find("\n")
+        while position != -1:
+            offsets.append(position)
+            position = find("\n", position + 1)
+        return offsets
+
+    def line_number_at(self, offset: int) -> int:
+        """Return the 1-based line number of a character offset."""
+        return bisect.bisect_right(self.line_index, offset) + 1
+
+    # -- Fenced code blocks --------------------------------------------------
+
+    @cached_property
+    def code_blocks(self) -> list[TextSpan]:
+        """Fenced code blocks, in order, including their fence lines."""
+        return [
+            TextSpan(m.start(), m.end(), m.group(0))
+            for m in _FENCED_CODE_BLOCK_RE.finditer(self.content)
+        ]
+
+    @cached_property
+    def _code_block_starts(self) -> list[int]:
+        return [block.start for block in self.code_blocks]
+
+    def in_code_block(self, offset: int) -> bool:
+        """True if offset falls inside a fenced code block."""
+        idx = bisect.bisect_right(self._code_block_starts, offset) - 1
+        return idx >= 0 and offset < self.code_blocks[idx].end
+
+    @cached_property
+    def stripped_content(self) -> str:
+        """The content with fenced code blocks removed."""
+        return strip_code_blocks(self.content)
+
+    @cached_property
+    def _fence_scan(self) -> tuple[list[FencePair], int | None]:
+        pairs: list[FencePair] = []
+        open_line: int | None = None
+        for i, line in enumerate(self.lines):
+            if line.strip().startswith("```"):
+                if open_line is None:
+                    open_line = i
+                else:
+                    pairs.append(FencePair(open_line, i))
+                    open_line = None
+        return pairs, open_line
+
+    @property
+    def fences(self) -> list[FencePair]:
+        """Fence pairs from a line scan (any line starting with ```, indented or not)."""
+        return self._fence_scan[0]
+
+    @property
+    def unclosed_fence_line(self) -> int | None:
+        """0-based line of an opening fence that is never closed, if any."""
+        return self._fence_scan[1]
+
+    # -- Headings ------------------------------------------------------------
+
+    @cached_property
+    def headings(self) -> list[Heading]:
+        """All ``#`` to ``###`` headings in document order, children linked."""
+        matches = list(_HEADING_RE.finditer(self.content))
+        headings: list[Heading] = []
+        roots: list[Heading] = []
+        stack: list[Heading] = []
+        for idx, m in enumerate(matches):
+            end = matches[idx + 1].start() if idx + 1 < len(matches) else len(self.content)
+            heading = Heading(len(m.group(1)), m.group(2).strip(), m.start(), end)
+            while stack and stack[-1].level >= heading.level:
+                stack.pop()
+            (stack[-1].children if stack else roots).append(heading)
+            stack.append(heading)
+            headings.append(heading)
+        self._outline = roots
+        return headings
+
+    @property
+    def outline(self) -> list[Heading]:
+        """Top-level headings, with deeper headings nested as children."""
+        self.headings  # noqa: B018 - builds the outline
+        return self._outline
+
+    @cached_property
+    def sections(self) -> list[TextSpan]:
+        """The content split before every heading outside fenced code blocks.
+
+        A plan not starting with a heading gets a leading preamble span.
+        Spans are contiguous and together cover the whole content,
+        and no fenced code block is split across two spans.
+        """
+        starts = [0]
+        for heading in self.headings:
+            if heading.start and not self.in_code_block(heading.start):
+                starts.append(heading.start)
+        ends = [*starts[1:], len(self.content)]
+        return [
+            TextSpan(start, end, self.content[start:end])
+            for start, end in zip(starts, ends, strict=True)
+        ]
+
+    def section_text(self, section_names: list[str]) -> str:
+        """Concatenated text of the sections whose heading contains any name.
+
+        Matching is case-insensitive and partial, and each section runs to
+        the next heading of any level.
+        """
+        key = tuple(section_names)
+        cached = self._sections.get(key)
+        if cached is not None:
+            return cached
+        lowered = [name.lower() for name in section_names]
+        parts = [
+            self.content[heading.start : heading.end]
+            for heading in self.headings
+            if any(name in heading.title.lower() for name in lowered)
+        ]
+        text = "\n".join(parts)
+        self._sections[key] = text
+        return text
+
+    @cached_property
+    def _sections(self) -> dict[tuple[str, ...], str]:
+        return {}
+
+    # -- Inline markup -------------------------------------------------------
+
+    @cached_property
+    def inline_code_spans(self) -> list[TextSpan]:
+        """Backtick-quoted spans outside fenced code blocks (text without backticks)."""
+        return [
+            TextSpan(m.start(), m.end(), m.group(1))
+            for m in _INLINE_CODE_RE.finditer(self.content)
+            if not self.in_code_block(m.start())
+        ]
+
+    @cached_property
+    def html_comments(self) -> list[TextSpan]:
+        """``<!-- ... -->`` comments, which carry the plan's markers."""
+        return [
+            TextSpan(m.start(), m.end(), m.group(0))
+            for m in _HTML_COMMENT_RE.finditer(self.content)
+        ]
+
+
+def strip_code_blocks(content: str) -> str:
+    """Remove fenced code blocks from content."""
+    return _FENCED_CODE_BLOCK_RE.sub("", content)
+
+
+__all__ = [
+    "FencePair",
+    "Heading",
+    "PlanDocument",
+    "TextSpan",
+    "strip_code_blocks",
+]
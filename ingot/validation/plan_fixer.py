@@ -1,27 +1,92 @@
 """Deterministic post-processor that auto-corrects plan validation errors.
 
-PlanFixer resolves FileExistsValidator errors by injecting the correct
-markers (<!-- UNVERIFIED -->) into the plan text, eliminating false-positive
-errors that would otherwise trigger retries or user prompts.
+PlanFixer resolves FileExistsValidator errors without an AI round-trip:
+mistyped paths that match exactly one repository file (by suffix, unique
+basename or a small edit distance) are rewritten in place, and the rest
+get the correct markers (<!-- UNVERIFIED -->) injected into the plan text,
+eliminating false-positive errors that would otherwise trigger retries or
+user prompts.
 """
 
 import re
+from dataclasses import dataclass
 
+from ingot.integrations.git import RepoFileIndex
 from ingot.validation.base import ValidationReport, ValidationSeverity
+from ingot.validation.plan_validators import (
+    NEW_FILE_MARKER_RE,
+    NEW_FILE_POST_PATH_RE,
+    NEW_FILE_PRE_PATH_RE,
+    UNVERIFIED_RE,
+)
 
 # Match the error message format from FileExistsValidator
 _FILE_NOT_FOUND_RE = re.compile(r"^File not found: `(.+)`$")
 
+# Backtick-quoted span, as FileExistsValidator extracts paths from them
+_QUOTED_RE = re.compile(r"`([^`\n]+)`")
+
+# Characters FileExistsValidator strips from quoted paths
+_STRIP_CHARS = ".,;:()\"' "
+
+# Optional :line or :start-end suffix after a quoted path
+_LINE_SUFFIX_RE = re.compile(r":\d+(?:-\d+)?$")
+
+
+@dataclass
+class PlanFixStats:
+    """Counts of fixes applied by a PlanFixer over its lifetime."""
+
+    paths_corrected: int = 0  # Rewritten to the unique matching repo file
+    paths_flagged: int = 0  # Marked UNVERIFIED (no unambiguous match)
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance between a and b, or limit + 1 once it exceeds limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b))
+            )
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def _typo_limit(name: str) -> int:
+    """Edits tolerated in one path component; short names allow only one."""
+    return 1 if len(name) <= 6 else 2
+
+
+def _quoted_path(span: str) -> str:
+    """Path inside a backtick span, normalized the way FileExistsValidator does."""
+    path = span.strip(_STRIP_CHARS)
+    return _LINE_SUFFIX_RE.sub("", path)
+
 
 class PlanFixer:
     """Deterministic post-processor that auto-corrects plan validation errors.
 
     Only fixes ``FileExistsValidator`` errors — these are the common
     false positives when the AI planner omits ``<!-- NEW_FILE -->`` or
-    ``<!-- UNVERIFIED -->`` markers. Other validators (e.g.
-    ``RequiredSectionsValidator``) produce real issues that require AI retry.
+    ``<!-- UNVERIFIED -->`` markers, or slightly mistypes a path. Other
+    validators (e.g. ``RequiredSectionsValidator``) produce real issues
+    that require AI retry.
+
+    With a ``repo_index``, a not-found path is rewritten everywhere it is
+    quoted when exactly one repository file matches it. Paths quoted as a
+    file to create are never rewritten.
     """
 
+    def __init__(self, repo_index: RepoFileIndex | None = None) -> None:
+        self._repo_index = repo_index
+        self.stats = PlanFixStats()
+
     def fix(self, content: str, report: ValidationReport) -> tuple[str, list[str]]:
         """Apply deterministic fixes to plan content.
 
@@ -58,15 +123,110 @@ class PlanFixer:
             if "<!-- UNVERIFIED" in line or "<!-- NEW_FILE" in line:
                 continue
 
+            path = path_match.group(1)
+            corrected = self.resolve_path(path, lines)
+            if corrected is not None:
+                rewritten = self._rewrite_path(lines, path, corrected)
+                if rewritten == lines:
+                    continue  # Already corrected by an earlier pass
+                lines = rewritten
+                self.stats.paths_corrected += 1
+                fixes.append(f"Corrected `{path}` to `{corrected}` (line {finding.line_number})")
+                continue
+
             # Inject UNVERIFIED marker at end of line
             lines[idx] = f"{line} <!-- UNVERIFIED: auto-flagged, file not in repo -->"
-            fixes.append(
-                f"Marked `{path_match.group(1)}` as UNVERIFIED (line {finding.line_number})"
-            )
+            self.stats.paths_flagged += 1
+            fixes.append(f"Marked `{path}` as UNVERIFIED (line {finding.line_number})")
 
         if not fixes:
             return content, fixes
         return "\n".join(lines), fixes
 
+    def resolve_path(self, path: str, lines: list[str] | None = None) -> str | None:
+        """Return the single repository file that path most likely names.
+
+        Tries, in order, and stops at the first rule with exactly one match:
+        a file ending with path (missing leading directories), a file that
+        path ends with (extra leading directories), a file with the same
+        unique basename, and a file reached by correcting small typos in
+        each path component. Returns None when there is no index, when
+        path is quoted as a new file in lines, or when no rule is
+        unambiguous.
+        """
+        index = self._repo_index
+        if index is None or (lines is not None and self._is_new_file(path, lines)):
+            return None
+
+        path = path.removeprefix("./").strip("/")
+        if not path or index.exists(path):
+            return None
+        name = path.rpartition("/")[2]
+
+        with_name = index.files_named(name)
+        suffix_matches = [f for f in with_name if f.endswith(f"/{path}")]
+        if len(suffix_matches) == 1:
+            return suffix_matches[0]
+
+        parts = path.split("/")
+        prefix_matches = [
+            "/".join(parts[i:]) for i in range(1, len(parts)) if index.is_file("/".join(parts[i:]))
+        ]
+        if len(prefix_matches) == 1:
+            return prefix_matches[0]
+
+        if len(with_name) == 1:
+            return with_name[0]
+
+        return self._correct_typos(index, parts)
+
+    @staticmethod
+    def _correct_typos(index: RepoFileIndex, parts: list[str]) -> str | None:
+        """Replace each missing path component by its unique closest sibling."""
+        current = ""
+        for part in parts:
+            children = index.list_dir(current)
+            if part not in children:
+                limit = _typo_limit(part)
+                scored = [(_edit_distance(part, child, limit), child) for child in children]
+                close = sorted((d, child) for d, child in scored if d <= limit)
+                if not close or (len(close) > 1 and close[0][0] == close[1][0]):
+                    return None
+                part = close[0][1]
+            current = f"{current}/{part}" if current else part
+        return current if index.is_file(current) else None
+
+    @staticmethod
+    def _is_new_file(path: str, lines: list[str]) -> bool:
+        """True if path is quoted as a file to create anywhere in the plan."""
+        for line in lines:
+            if NEW_FILE_MARKER_RE.search(line) and f"`{path}" in line:
+                return True
+            for pattern in (NEW_FILE_PRE_PATH_RE, NEW_FILE_POST_PATH_RE):
+                for m in pattern.finditer(line):
+                    if _quoted_path(m.group(1).strip("`")) == path:
+                        return True
+        return False
+
+    @staticmethod
+    def _rewrite_path(lines: list[str], old: str, new: str) -> list[str]:
+        """Replace old with new in every backtick span quoting it.
+
+        Lines carrying UNVERIFIED or NEW_FILE markers are left alone.
+        """
+
+        def replace(m: re.Match[str]) -> str:
+            span = m.group(1)
+            if _quoted_path(span) != old:
+                return m.group(0)
+            return "`" + span.replace(old, new, 1) + "`"
+
+        return [
+            line
+            if UNVERIFIED_RE.search(line) or NEW_FILE_MARKER_RE.search(line)
+            else _QUOTED_RE.sub(replace, line)
+            for line in lines
+        ]
+
 
-__all__ = ["PlanFixer"]
+__all__ = ["PlanFixStats", "PlanFixer"]
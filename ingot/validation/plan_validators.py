@@ -5,9 +5,14 @@ a generated plan. The factory function at the bottom creates the
 default registry with all standard validators.
 """
 
-import bisect
+import builtins
+import difflib
+import posixpath
 import re
+import subprocess
+from pathlib import Path
 
+from ingot.integrations.git import get_repo_index, grep_words
 from ingot.validation.base import (
     ValidationContext,
     ValidationFinding,
@@ -15,96 +20,31 @@ from ingot.validation.base import (
     Validator,
     ValidatorRegistry,
 )
+from ingot.validation.line_index import get_file_line_index
+from ingot.validation.plan_document import PlanDocument, strip_code_blocks
 
 # =============================================================================
 # Shared Utility Functions
 # =============================================================================
 
-_FENCED_CODE_BLOCK_RE = re.compile(
-    r"^```[^\n]*\n.*?^```\s*$",
-    re.MULTILINE | re.DOTALL,
-)
-
-_HEADING_RE = re.compile(r"^(#{1,3})\s+(.+)$", re.MULTILINE)
-
 # Module-level marker patterns shared between validators and PlanFixer.
 UNVERIFIED_RE = re.compile(r"<!--\s*UNVERIFIED:.*?-->", re.DOTALL)
 NEW_FILE_MARKER_RE = re.compile(r"<!--\s*NEW_FILE(?::.*?)?\s*-->", re.IGNORECASE)
+# Backtick-quoted paths directly after a creation keyword, or followed by
+# "(NEW FILE)". Group 1 is the quoted span including backticks.
+NEW_FILE_PRE_PATH_RE = re.compile(
+    r"(?:^|\b)(?:Create|Creating|New\s+file)\b\s*[:*]*\s*(`[^`\n]+`)",
+    re.IGNORECASE | re.MULTILINE,
+)
+NEW_FILE_POST_PATH_RE = re.compile(r"(`[^`\n]+`)\s*\(NEW\s+FILE\)", re.IGNORECASE)
 
 
-def _strip_fenced_code_blocks(content: str) -> str:
-    """Remove fenced code blocks from content.
-
-    Used to prevent headings or names inside ``` blocks from matching
-    as real sections or coverage references.
-    """
-    return _FENCED_CODE_BLOCK_RE.sub("", content)
-
-
-def _build_code_block_ranges(content: str) -> tuple[list[int], list[int]]:
-    """Return sorted (starts, ends) offset lists for fenced code blocks.
-
-    Each pair ``(starts[i], ends[i])`` delimits one fenced code block.
-    """
-    starts: list[int] = []
-    ends: list[int] = []
-    for m in _FENCED_CODE_BLOCK_RE.finditer(content):
-        starts.append(m.start())
-        ends.append(m.end())
-    return starts, ends
-
-
-def _is_inside_code_block(starts: list[int], ends: list[int], offset: int) -> bool:
-    """Check whether *offset* falls inside any fenced code block range.
-
-    Uses ``bisect.bisect_right`` for O(log N) lookup.
-    """
-    idx = bisect.bisect_right(starts, offset) - 1
-    if idx < 0:
-        return False
-    return offset < ends[idx]
-
-
-def _build_line_index(content: str) -> list[int]:
-    """Build a sorted list of newline character offsets for O(log N) lookups.
-
-    Returns a list of positions where '\\n' occurs in *content*.
-    """
-    return [i for i, ch in enumerate(content) if ch == "\n"]
-
-
-def _line_number_at(line_index: list[int], offset: int) -> int:
-    """Return the 1-based line number for a character *offset*.
-
-    Uses ``bisect.bisect_right`` for O(log N) lookup against the
-    pre-built *line_index*.
-    """
-    return bisect.bisect_right(line_index, offset) + 1
-
-
-def _extract_plan_sections(content: str, section_names: list[str]) -> str:
-    """Extract text from specific plan sections.
-
-    Scans for ``#{1,3}`` headings (not ``####``+) and checks whether the
-    heading text matches any target *section_names* (case-insensitive
-    partial match).  Returns the concatenated text from matched sections.
-    """
-    matches = list(_HEADING_RE.finditer(content))
-
-    if not matches:
-        return ""
-
-    parts: list[str] = []
-    for idx, m in enumerate(matches):
-        heading_text = m.group(2).strip()
-        # Check case-insensitive partial match against any target section
-        if not any(name.lower() in heading_text.lower() for name in section_names):
-            continue
-        start = m.start()
-        end = matches[idx + 1].start() if idx + 1 < len(matches) else len(content)
-        parts.append(content[start:end])
-
-    return "\n".join(parts)
+def _document(content: str, context: ValidationContext) -> PlanDocument:
+    """Return the registry-built document for content, parsing it if absent."""
+    document = context.document
+    if document is None or (document.content is not content and document.content != content):
+        return PlanDocument(content)
+    return document
 
 
 class RequiredSectionsValidator(Validator):
@@ -126,7 +66,7 @@ class RequiredSectionsValidator(Validator):
     def validate(self, content: str, context: ValidationContext) -> list[ValidationFinding]:
         findings: list[ValidationFinding] = []
         # Strip fenced code blocks so headings inside ``` don't count
-        stripped = _strip_fenced_code_blocks(content)
+        stripped = _document(content, context).stripped_content
         for section in self.REQUIRED:
             # Case-insensitive, allows partial match
             # e.g. "Potential Risks or Considerations" matches "Potential Risks"
@@ -149,6 +89,9 @@ class RequiredSectionsValidator(Validator):
 class FileExistsValidator(Validator):
     """Check that file paths referenced in the plan exist on the filesystem."""
 
+    # Paths and their markers are line-local, so sections can be checked alone
+    section_scoped = True
+
     # Match backtick-quoted strings containing at least one / and a file extension
     _PATH_RE = re.compile(r"`([^`\n]*?(?:/[^`\n]*?\.\w{1,8})[^`\n]*?)`")
 
@@ -244,15 +187,9 @@ class FileExistsValidator(Validator):
     # optional markdown formatting between) to avoid false positives from
     # incidental usage of "Create" in prose on lines referencing existing files.
     # e.g. "Create `src/new.py`" matches, but "Create a new endpoint in `src/existing.py`" does not.
-    _NEW_FILE_PRE_PATH_RE = re.compile(
-        r"(?:^|\b)(?:Create|Creating|New\s+file)\b\s*[:*]*\s*(`[^`\n]+`)",
-        re.IGNORECASE | re.MULTILINE,
-    )
+    _NEW_FILE_PRE_PATH_RE = NEW_FILE_PRE_PATH_RE
     # Detect backtick-quoted paths followed by "(NEW FILE)" marker.
-    _NEW_FILE_POST_PATH_RE = re.compile(
-        r"(`[^`\n]+`)\s*\(NEW\s+FILE\)",
-        re.IGNORECASE,
-    )
+    _NEW_FILE_POST_PATH_RE = NEW_FILE_POST_PATH_RE
     # Explicit marker for new files (references module-level pattern).
     # Applied line-wide since these markers are explicit and unambiguous.
     _NEW_FILE_MARKER_RE = NEW_FILE_MARKER_RE
@@ -261,15 +198,19 @@ class FileExistsValidator(Validator):
     def name(self) -> str:
         return "File Exists"
 
-    def _extract_paths(self, content: str) -> list[tuple[str, int]]:
+    def _extract_paths(
+        self, content: str, document: PlanDocument | None = None
+    ) -> list[tuple[str, int]]:
         """Extract (normalized_path, line_number) pairs from plan content."""
-        line_index = _build_line_index(content)
-        cb_starts, cb_ends = _build_code_block_ranges(content)
+        if document is None:
+            document = PlanDocument(content)
+        line_number_at = document.line_number_at
 
         # Find line numbers that contain UNVERIFIED markers
         unverified_lines: set[int] = set()
-        for m in self._UNVERIFIED_RE.finditer(content):
-            unverified_lines.add(_line_number_at(line_index, m.start()))
+        for comment in document.html_comments:
+            for m in self._UNVERIFIED_RE.finditer(comment.text):
+                unverified_lines.add(line_number_at(comment.start + m.start()))
 
         # Find character offsets of backtick-quoted paths adjacent to creation
         # keywords.  Only the specific path next to the keyword is skipped,
@@ -282,9 +223,10 @@ class FileExistsValidator(Validator):
 
         # <!-- NEW_FILE --> markers are explicit enough to apply line-wide.
         new_file_lines: set[int] = set()
-        for i, line in enumerate(content.splitlines(), 1):
-            if self._NEW_FILE_MARKER_RE.search(line):
-                new_file_lines.add(i)
+        for comment in document.html_comments:
+            marker = self._NEW_FILE_MARKER_RE.search(comment.text)
+            if marker:
+                new_file_lines.add(line_number_at(comment.start + marker.start()))
 
         # Collect all matches from all regexes, deduplicating by offset
         seen_offsets: set[int] = set()
@@ -292,30 +234,30 @@ class FileExistsValidator(Validator):
 
         for match in self._PATH_RE.finditer(content):
             if match.start() not in seen_offsets:
-                if _is_inside_code_block(cb_starts, cb_ends, match.start()):
+                if document.in_code_block(match.start()):
                     continue
                 seen_offsets.add(match.start())
-                line_num = _line_number_at(line_index, match.start())
+                line_num = line_number_at(match.start())
                 raw_matches.append((match.group(1), match.start(), line_num))
 
         for match in self._ROOT_FILE_RE.finditer(content):
             if match.start() not in seen_offsets:
-                if _is_inside_code_block(cb_starts, cb_ends, match.start()):
+                if document.in_code_block(match.start()):
                     continue
                 raw = match.group(1)
                 # Only accept if extension is common
                 ext = raw.rsplit(".", 1)[-1].lower() if "." in raw else ""
                 if ext in self._COMMON_FILE_EXTENSIONS:
                     seen_offsets.add(match.start())
-                    line_num = _line_number_at(line_index, match.start())
+                    line_num = line_number_at(match.start())
                     raw_matches.append((raw, match.start(), line_num))
 
         for match in self._EXTENSIONLESS_RE.finditer(content):
             if match.start() not in seen_offsets:
-                if _is_inside_code_block(cb_starts, cb_ends, match.start()):
+                if document.in_code_block(match.start()):
                     continue
                 seen_offsets.add(match.start())
-                line_num = _line_number_at(line_index, match.start())
+                line_num = line_number_at(match.start())
                 raw_matches.append((match.group(1), match.start(), line_num))
 
         results: list[tuple[str, int]] = []
@@ -351,19 +293,36 @@ class FileExistsValidator(Validator):
 
         return results
 
+    def merge_section_findings(self, findings: list[ValidationFinding]) -> list[ValidationFinding]:
+        # Report each missing path once, at its first occurrence
+        seen: set[str] = set()
+        merged: list[ValidationFinding] = []
+        for finding in findings:
+            if finding.message not in seen:
+                seen.add(finding.message)
+                merged.append(finding)
+        return merged
+
     def validate(self, content: str, context: ValidationContext) -> list[ValidationFinding]:
         if context.repo_root is None:
             return []
 
         findings: list[ValidationFinding] = []
-        paths = self._extract_paths(content)
+        paths = self._extract_paths(content, _document(content, context))
         seen: set[str] = set()
+        repo_index = get_repo_index(context.repo_root)
 
         for path_str, line_number in paths:
             if path_str in seen:
                 continue
             seen.add(path_str)
 
+            # Paths listed by git exist; anything else (ignored files, files
+            # created since the index was built) is checked on disk.
+            relative = posixpath.normpath(path_str)
+            if repo_index is not None and repo_index.exists(relative):
+                continue
+
             full_path = context.repo_root / path_str
             try:
                 resolved = full_path.resolve()
@@ -372,6 +331,11 @@ class FileExistsValidator(Validator):
             except (ValueError, OSError):
                 continue
             if not resolved.exists():
+                hint = ""
+                if repo_index is not None:
+                    matches = repo_index.suggest(relative, limit=1)
+                    if matches:
+                        hint = f"Did you mean `{matches[0]}`? "
                 findings.append(
                     ValidationFinding(
                         validator_name=self.name,
@@ -379,6 +343,7 @@ class FileExistsValidator(Validator):
                         message=f"File not found: `{path_str}`",
                         line_number=line_number,
                         suggestion=(
+                            f"{hint}"
                             "Verify the file path exists in the repository. "
                             "For new files to create, use 'Create `path`' or "
                             "<!-- NEW_FILE --> on the same line. "
@@ -398,6 +363,8 @@ class PatternSourceValidator(Validator):
         re.IGNORECASE,
     )
     _NO_PATTERN_MARKER_RE = re.compile(r"<!--\s*NO_EXISTING_PATTERN:", re.IGNORECASE)
+    # Splits a citation into path, first line and optional last line
+    _CITATION_RE = re.compile(r"(\S+):(\d+)(?:-(\d+))?$")
 
     _WINDOW_LINES = 5  # Lines before/after code block to search for citation
 
@@ -407,24 +374,12 @@ class PatternSourceValidator(Validator):
 
     def validate(self, content: str, context: ValidationContext) -> list[ValidationFinding]:
         findings: list[ValidationFinding] = []
-        lines = content.splitlines()
-
-        # Stateful fence parsing: track open/close pairs via state machine
-        code_blocks: list[tuple[int, int]] = []  # (open_line, close_line)
-        in_code_block = False
-        open_line = 0
-
-        for i, line in enumerate(lines):
-            if line.strip().startswith("```"):
-                if not in_code_block:
-                    in_code_block = True
-                    open_line = i
-                else:
-                    in_code_block = False
-                    code_blocks.append((open_line, i))
+        document = _document(content, context)
+        lines = document.lines
 
         # Warn about unbalanced fence
-        if in_code_block:
+        open_line = document.unclosed_fence_line
+        if open_line is not None:
             findings.append(
                 ValidationFinding(
                     validator_name=self.name,
@@ -439,7 +394,8 @@ class PatternSourceValidator(Validator):
             )
 
         # Check each code block for pattern source citation
-        for block_open, block_close in code_blocks:
+        for fence in document.fences:
+            block_open, block_close = fence.open_line, fence.close_line
             # Skip trivially short blocks (< 3 lines of content)
             content_lines = block_close - block_open - 1
             if content_lines < 3:
@@ -470,6 +426,61 @@ class PatternSourceValidator(Validator):
                     )
                 )
 
+        if context.repo_root is not None:
+            findings.extend(self._verify_citations(document, context.repo_root))
+
+        return findings
+
+    def _verify_citations(self, document: PlanDocument, repo_root: Path) -> list[ValidationFinding]:
+        """Check that each cited file exists and has the cited lines."""
+        findings: list[ValidationFinding] = []
+        seen: set[str] = set()
+        root = repo_root.resolve()
+
+        for match in self._PATTERN_SOURCE_RE.finditer(document.content):
+            citation = match.group(1).strip().split()[-1].strip("`")
+            parsed = self._CITATION_RE.match(citation)
+            if parsed is None or citation in seen:
+                continue
+            seen.add(citation)
+            path_str, first, last = parsed.group(1), int(parsed.group(2)), parsed.group(3)
+            start, end = first, int(last) if last else first
+            line_number = document.line_number_at(match.start())
+
+            full_path = root / path_str
+            try:
+                if not full_path.resolve().is_relative_to(root):
+                    continue
+            except (ValueError, OSError):
+                continue
+
+            if start < 1 or end < start:
+                problem = f"has an invalid line range {start}-{end}"
+            else:
+                line_index = get_file_line_index(full_path)
+                if line_index is None:
+                    problem = "cites a file that does not exist"
+                elif not line_index.has_lines(start, end):
+                    problem = (
+                        f"cites lines {start}-{end} but `{path_str}` has "
+                        f"{line_index.line_count} line(s)"
+                    )
+                else:
+                    continue
+
+            findings.append(
+                ValidationFinding(
+                    validator_name=self.name,
+                    severity=ValidationSeverity.WARNING,
+                    message=f"Pattern source `{citation}` {problem}.",
+                    line_number=line_number,
+                    suggestion=(
+                        "Cite an existing file and a line range inside it, or use "
+                        "'<!-- NO_EXISTING_PATTERN: description -->'."
+                    ),
+                )
+            )
+
         return findings
 
 
@@ -503,68 +514,28 @@ class UnresolvedMarkersValidator(Validator):
 
     def validate(self, content: str, context: ValidationContext) -> list[ValidationFinding]:
         findings: list[ValidationFinding] = []
-        line_index = _build_line_index(content)
-
-        for match in self._UNVERIFIED_RE.finditer(content):
-            line_number = _line_number_at(line_index, match.start())
-            reason = match.group(1).strip()
-            findings.append(
-                ValidationFinding(
-                    validator_name=self.name,
-                    severity=ValidationSeverity.INFO,
-                    message=f"UNVERIFIED marker: {reason}",
-                    line_number=line_number,
-                )
-            )
-
-        for match in self._NO_PATTERN_RE.finditer(content):
-            line_number = _line_number_at(line_index, match.start())
-            desc = match.group(1).strip()
-            findings.append(
-                ValidationFinding(
-                    validator_name=self.name,
-                    severity=ValidationSeverity.INFO,
-                    message=f"NO_EXISTING_PATTERN marker: {desc}",
-                    line_number=line_number,
-                )
-            )
-
-        for match in self._NEW_FILE_RE.finditer(content):
-            line_number = _line_number_at(line_index, match.start())
-            desc = (match.group(1) or "").strip()
-            msg = f"NEW_FILE marker: {desc}" if desc else "NEW_FILE marker"
-            findings.append(
-                ValidationFinding(
-                    validator_name=self.name,
-                    severity=ValidationSeverity.INFO,
-                    message=msg,
-                    line_number=line_number,
-                )
-            )
-
-        for match in self._NO_TEST_NEEDED_RE.finditer(content):
-            line_number = _line_number_at(line_index, match.start())
-            desc = match.group(1).strip()
-            findings.append(
-                ValidationFinding(
-                    validator_name=self.name,
-                    severity=ValidationSeverity.INFO,
-                    message=f"NO_TEST_NEEDED marker: {desc}",
-                    line_number=line_number,
-                )
-            )
-
-        for match in self._TRIVIAL_STEP_RE.finditer(content):
-            line_number = _line_number_at(line_index, match.start())
-            desc = match.group(1).strip()
-            findings.append(
-                ValidationFinding(
-                    validator_name=self.name,
-                    severity=ValidationSeverity.INFO,
-                    message=f"TRIVIAL_STEP marker: {desc}",
-                    line_number=line_number,
-                )
-            )
+        document = _document(content, context)
+        # (pattern, message label); reported grouped by marker kind, in this order
+        markers = (
+            (self._UNVERIFIED_RE, "UNVERIFIED"),
+            (self._NO_PATTERN_RE, "NO_EXISTING_PATTERN"),
+            (self._NEW_FILE_RE, "NEW_FILE"),
+            (self._NO_TEST_NEEDED_RE, "NO_TEST_NEEDED"),
+            (self._TRIVIAL_STEP_RE, "TRIVIAL_STEP"),
+        )
+
+        for pattern, label in markers:
+            for comment in document.html_comments:
+                for match in pattern.finditer(comment.text):
+                    desc = (match.group(1) or "").strip()
+                    findings.append(
+                        ValidationFinding(
+                            validator_name=self.name,
+                            severity=ValidationSeverity.INFO,
+                            message=f"{label} marker: {desc}" if desc else f"{label} marker",
+                            line_number=document.line_number_at(comment.start + match.start()),
+                        )
+                    )
 
         return findings
 
@@ -640,13 +611,14 @@ class DiscoveryCoverageValidator(Validator):
         findings: list[ValidationFinding] = []
 
         # Extract text from target sections only
-        restricted_text = _extract_plan_sections(content, self._TARGET_SECTIONS)
+        document = _document(content, context)
+        restricted_text = document.section_text(self._TARGET_SECTIONS)
         if restricted_text:
             # Strip code blocks from restricted text
-            search_text = _strip_fenced_code_blocks(restricted_text)
+            search_text = strip_code_blocks(restricted_text)
         else:
             # Fallback: if no target sections found (malformed plan), search full content
-            search_text = _strip_fenced_code_blocks(content)
+            search_text = document.stripped_content
 
         # Extract names from Interface & Class Hierarchy
         interface_names = self._extract_names_from_section("Interface & Class Hierarchy")
@@ -706,14 +678,15 @@ class TestCoverageValidator(Validator):
     def validate(self, content: str, context: ValidationContext) -> list[ValidationFinding]:
         findings: list[ValidationFinding] = []
 
-        impl_text = _extract_plan_sections(content, ["Implementation Steps"])
-        test_text = _extract_plan_sections(content, ["Testing Strategy"])
+        document = _document(content, context)
+        impl_text = document.section_text(["Implementation Steps"])
+        test_text = document.section_text(["Testing Strategy"])
 
         if not impl_text or not test_text:
             return findings
 
         # Extract file paths from Implementation Steps (strip code blocks first)
-        impl_stripped = _strip_fenced_code_blocks(impl_text)
+        impl_stripped = strip_code_blocks(impl_text)
 
         # Remove Pattern source citations so their paths aren't treated as impl files
         impl_cleaned = self._PATTERN_SOURCE_PREFIX_RE.sub("", impl_stripped)
@@ -798,7 +771,7 @@ class ImplementationDetailValidator(Validator):
     def validate(self, content: str, context: ValidationContext) -> list[ValidationFinding]:
         findings: list[ValidationFinding] = []
 
-        impl_text = _extract_plan_sections(content, ["Implementation Steps"])
+        impl_text = _document(content, context).section_text(["Implementation Steps"])
         if not impl_text:
             return findings
 
@@ -854,7 +827,7 @@ class RiskCategoriesValidator(Validator):
     def validate(self, content: str, context: ValidationContext) -> list[ValidationFinding]:
         findings: list[ValidationFinding] = []
 
-        risks_text = _extract_plan_sections(content, ["Potential Risks"])
+        risks_text = _document(content, context).section_text(["Potential Risks"])
         if not risks_text:
             return findings
 
@@ -894,6 +867,139 @@ class RiskCategoriesValidator(Validator):
         return findings
 
 
+class SymbolReferenceValidator(Validator):
+    """Check that code symbols referenced in the plan are defined in the repository.
+
+    Looks at inline code spans naming a call (`render()`, `Invoice.render()`)
+    or a CamelCase type (`InvoiceRenderer`) and looks them up in the
+    symbol index. Names the plan itself introduces (on lines that add or
+    create something, or defined in its code blocks) are not references.
+    Names missing from the index but used anywhere in the repository
+    (library classes, imported helpers) are accepted too, so a finding
+    means the name appears nowhere in the code.
+    """
+
+    # `name()`, `obj.name(args)`, `Class.name` (group 1: dotted name)
+    _CALL_RE = re.compile(r"([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)\s*(\(.*\))?")
+    # CamelCase with at least two humps, e.g. InvoiceRenderer (not Config or ID)
+    _CAMEL_RE = re.compile(r"[A-Z][a-z0-9]+(?:[A-Z][a-z0-9]*)+")
+    # Lines on which the plan introduces names rather than referencing them
+    _INTRODUCES_RE = re.compile(
+        r"\b(?:add|adds|adding|create|creates|creating|new|introduce|introduces|implement|"
+        r"implements|define|defines|extract|rename|renames|generate)\b",
+        re.IGNORECASE,
+    )
+    # Definitions inside the plan's own code snippets
+    _DEFINITION_RE = re.compile(
+        r"\b(?:def|class|function|interface|type|struct|enum|record)\s+([A-Za-z_]\w*)"
+        r"|\bfunc\s+(?:\([^)]*\)\s*)?([A-Za-z_]\w*)"
+    )
+    # Qualifiers that refer to the enclosing class
+    _SELF_NAMES = frozenset({"self", "cls", "this", "super"})
+    _BUILTINS = frozenset(dir(builtins))
+
+    @property
+    def name(self) -> str:
+        return "Symbol Reference"
+
+    def _references(self, document: PlanDocument) -> list[tuple[str, str, int]]:
+        """Extract (span text, name to look up, line number) references."""
+        marked_lines: set[int] = set()
+        for comment in document.html_comments:
+            if UNVERIFIED_RE.search(comment.text) or NEW_FILE_MARKER_RE.search(comment.text):
+                marked_lines.add(document.line_number_at(comment.start))
+
+        references: list[tuple[str, str, int]] = []
+        for span in document.inline_code_spans:
+            m = self._CALL_RE.fullmatch(span.text.strip())
+            if m is None:
+                continue
+            dotted, call = m.groups()
+            parts = dotted.split(".")
+            if call is None and not (len(parts) <= 2 and self._CAMEL_RE.fullmatch(parts[0])):
+                continue  # Plain words, module paths, constants
+            line_number = document.line_number_at(span.start)
+            if line_number in marked_lines:
+                continue
+            if len(parts) == 1 or parts[-2] in self._SELF_NAMES:
+                name = parts[-1]
+            elif parts[-2][:1].isupper():
+                name = f"{parts[-2]}.{parts[-1]}"
+            else:
+                continue  # module.func() or variable.method(): type unknown
+            if parts[-1] in self._BUILTINS or parts[-1].startswith("__"):
+                continue
+            references.append((span.text.strip(), name, line_number))
+        return references
+
+    def _introduced_names(self, document: PlanDocument) -> set[str]:
+        """Names the plan defines in code blocks or on lines that introduce them."""
+        names: set[str] = set()
+        for block in document.code_blocks:
+            for m in self._DEFINITION_RE.finditer(block.text):
+                names.add(m.group(1) or m.group(2))
+        for span in document.inline_code_spans:
+            line = document.lines[document.line_number_at(span.start) - 1]
+            if self._INTRODUCES_RE.search(line):
+                names.update(re.findall(r"[A-Za-z_]\w*", span.text))
+        return names
+
+    def validate(self, content: str, context: ValidationContext) -> list[ValidationFinding]:
+        index = context.symbol_index
+        if index is None or context.repo_root is None:
+            return []
+        document = _document(content, context)
+        references = self._references(document)
+        if not references:
+            return []
+        introduced = self._introduced_names(document)
+
+        unresolved: dict[str, tuple[str, str, int]] = {}
+        for text, name, line_number in references:
+            simple = name.rpartition(".")[2]
+            # Members of a class the plan introduces are new as well
+            if simple in introduced or name.partition(".")[0] in introduced:
+                continue
+            if name in unresolved or index.has_symbol(name):
+                continue
+            # Class.method may be inherited; accept any definition of the method
+            if "." in name and index.has_symbol(simple):
+                continue
+            unresolved[name] = (text, simple, line_number)
+        if not unresolved:
+            return []
+
+        try:
+            used = grep_words({simple for _, simple, _ in unresolved.values()}, context.repo_root)
+        except (subprocess.CalledProcessError, OSError):
+            return []  # Cannot tell library names from invented ones
+
+        findings: list[ValidationFinding] = []
+        for text, simple, line_number in unresolved.values():
+            if simple in used:
+                continue
+            hint = ""
+            candidates = difflib.get_close_matches(simple, index.names(), n=1, cutoff=0.8)
+            if candidates:
+                (symbol, *_) = index.lookup(candidates[0])
+                hint = f"Did you mean `{symbol.qualname}` ({symbol.location})? "
+            findings.append(
+                ValidationFinding(
+                    validator_name=self.name,
+                    severity=ValidationSeverity.WARNING,
+                    message=f"Symbol not found in repository: `{text}`",
+                    line_number=line_number,
+                    suggestion=(
+                        f"{hint}"
+                        "Reference an existing definition, or say on the same line that "
+                        "the step adds or creates it. "
+                        "For unverified names, use <!-- UNVERIFIED: reason -->."
+                    ),
+                )
+            )
+        return findings
+
+
 def create_plan_validator_registry(
     researcher_output: str = "",
 ) -> ValidatorRegistry:
@@ -911,11 +1017,14 @@ def create_plan_validator_registry(
     registry.register(TestCoverageValidator())
     registry.register(ImplementationDetailValidator())
     registry.register(RiskCategoriesValidator())
+    registry.register(SymbolReferenceValidator())
     return registry
 
 
 __all__ = [
     "NEW_FILE_MARKER_RE",
+    "NEW_FILE_PRE_PATH_RE",
+    "NEW_FILE_POST_PATH_RE",
     "UNVERIFIED_RE",
     "RequiredSectionsValidator",
     "FileExistsValidator",
@@ -925,5 +1034,6 @@ __all__ = [
     "TestCoverageValidator",
     "ImplementationDetailValidator",
     "RiskCategoriesValidator",
+    "SymbolReferenceValidator",
     "create_plan_validator_registry",
 ]
@@ -3,6 +3,7 @@
 This package contains:
 - state: WorkflowState dataclass
 - tasks: Task parsing and management
+- tasklist_store: Append-only task state journal (source of truth for Step 3)
 - task_memory: Cross-task learning system
 - events: Task execution events and run records for TUI
 - step1_plan: Step 1 - Create implementation plan
@@ -11,57 +12,117 @@ This package contains:
 - runner: Workflow orchestration
 """
 
-from ingot.workflow.constants import (
-    DEFAULT_EXECUTION_TIMEOUT,
-    FIRST_RUN_TIMEOUT,
-    INGOT_AGENT_DOC_UPDATER,
-    INGOT_AGENT_FIXER,
-    INGOT_AGENT_IMPLEMENTER,
-    INGOT_AGENT_PLANNER,
-    INGOT_AGENT_REVIEWER,
-    INGOT_AGENT_TASKLIST,
-    INGOT_AGENT_TASKLIST_REFINER,
-    ONBOARDING_SMOKE_TEST_TIMEOUT,
-)
-from ingot.workflow.events import (
-    TaskEvent,
-    TaskEventCallback,
-    TaskEventType,
-    TaskRunRecord,
-    TaskRunStatus,
-    create_run_finished_event,
-    create_run_started_event,
-    create_task_finished_event,
-    create_task_output_event,
-    create_task_started_event,
-    format_log_filename,
-    format_run_directory,
-    format_timestamp,
-    slugify_task_name,
-)
-from ingot.workflow.runner import WorkflowResult, run_ingot_workflow, workflow_cleanup
-from ingot.workflow.state import WorkflowState
-from ingot.workflow.step1_5_clarification import step_1_5_clarification
-from ingot.workflow.step1_plan import step_1_create_plan
-from ingot.workflow.step2_tasklist import step_2_create_tasklist
-from ingot.workflow.step3_execute import step_3_execute
-from ingot.workflow.step4_update_docs import step_4_update_docs
-from ingot.workflow.step5_commit import step_5_commit
-from ingot.workflow.task_memory import (
-    TaskMemory,
-    build_pattern_context,
-    find_related_task_memories,
-)
-from ingot.workflow.tasks import (
-    Task,
-    TaskCategory,
-    TaskStatus,
-    format_task_list,
-    get_completed_tasks,
-    get_pending_tasks,
-    mark_task_complete,
-    parse_task_list,
-)
+from typing import TYPE_CHECKING
+
+from ingot.utils.lazy_imports import lazy_getattr
+
+if TYPE_CHECKING:
+    from ingot.workflow.constants import (
+        DEFAULT_EXECUTION_TIMEOUT,
+        FIRST_RUN_TIMEOUT,
+        INGOT_AGENT_DOC_UPDATER,
+        INGOT_AGENT_FIXER,
+        INGOT_AGENT_IMPLEMENTER,
+        INGOT_AGENT_PLANNER,
+        INGOT_AGENT_REVIEWER,
+        INGOT_AGENT_TASKLIST,
+        INGOT_AGENT_TASKLIST_REFINER,
+        ONBOARDING_SMOKE_TEST_TIMEOUT,
+    )
+    from ingot.workflow.events import (
+        TaskEvent,
+        TaskEventCallback,
+        TaskEventType,
+        TaskRunRecord,
+        TaskRunStatus,
+        create_run_finished_event,
+        create_run_started_event,
+        create_task_finished_event,
+        create_task_output_event,
+        create_task_started_event,
+        format_log_filename,
+        format_run_directory,
+        format_timestamp,
+        slugify_task_name,
+    )
+    from ingot.workflow.runner import WorkflowResult, run_ingot_workflow, workflow_cleanup
+    from ingot.workflow.state import WorkflowState
+    from ingot.workflow.step1_5_clarification import step_1_5_clarification
+    from ingot.workflow.step1_plan import step_1_create_plan
+    from ingot.workflow.step2_tasklist import step_2_create_tasklist
+    from ingot.workflow.step3_execute import step_3_execute
+    from ingot.workflow.step4_update_docs import step_4_update_docs
+    from ingot.workflow.step5_commit import step_5_commit
+    from ingot.workflow.task_memory import (
+        TaskMemory,
+        build_pattern_context,
+        find_related_task_memories,
+    )
+    from ingot.workflow.tasklist_store import TaskListStore, TaskStateRecord
+    from ingot.workflow.tasks import (
+        Task,
+        TaskCategory,
+        TaskStatus,
+        format_task_list,
+        get_completed_tasks,
+        get_pending_tasks,
+        mark_task_complete,
+        parse_task_list,
+    )
+
+# Lazy imports (PEP 562): submodules are only imported when one of their
+# names is first accessed, so importing this package stays cheap.
+_LAZY_IMPORTS = {
+    "DEFAULT_EXECUTION_TIMEOUT": "ingot.workflow.constants",
+    "FIRST_RUN_TIMEOUT": "ingot.workflow.constants",
+    "INGOT_AGENT_DOC_UPDATER": "ingot.workflow.constants",
+    "INGOT_AGENT_FIXER": "ingot.workflow.constants",
+    "INGOT_AGENT_IMPLEMENTER": "ingot.workflow.constants",
+    "INGOT_AGENT_PLANNER": "ingot.workflow.constants",
+    "INGOT_AGENT_REVIEWER": "ingot.workflow.constants",
+    "INGOT_AGENT_TASKLIST": "ingot.workflow.constants",
+    "INGOT_AGENT_TASKLIST_REFINER": "ingot.workflow.constants",
+    "ONBOARDING_SMOKE_TEST_TIMEOUT": "ingot.workflow.constants",
+    "TaskEvent": "ingot.workflow.events",
+    "TaskEventCallback": "ingot.workflow.events",
+    "TaskEventType": "ingot.workflow.events",
+    "TaskRunRecord": "ingot.workflow.events",
+    "TaskRunStatus": "ingot.workflow.events",
+    "create_run_finished_event": "ingot.workflow.events",
+    "create_run_started_event": "ingot.workflow.events",
+    "create_task_finished_event": "ingot.workflow.events",
+    "create_task_output_event": "ingot.workflow.events",
+    "create_task_started_event": "ingot.workflow.events",
+    "format_log_filename": "ingot.workflow.events",
+    "format_run_directory": "ingot.workflow.events",
+    "format_timestamp": "ingot.workflow.events",
+    "slugify_task_name": "ingot.workflow.events",
+    "WorkflowResult": "ingot.workflow.runner",
+    "run_ingot_workflow": "ingot.workflow.runner",
+    "workflow_cleanup": "ingot.workflow.runner",
+    "WorkflowState": "ingot.workflow.state",
+    "step_1_5_clarification": "ingot.workflow.step1_5_clarification",
+    "step_1_create_plan": "ingot.workflow.step1_plan",
+    "step_2_create_tasklist": "ingot.workflow.step2_tasklist",
+    "step_3_execute": "ingot.workflow.step3_execute",
+    "step_4_update_docs": "ingot.workflow.step4_update_docs",
+    "step_5_commit": "ingot.workflow.step5_commit",
+    "TaskMemory": "ingot.workflow.task_memory",
+    "build_pattern_context": "ingot.workflow.task_memory",
+    "find_related_task_memories": "ingot.workflow.task_memory",
+    "Task": "ingot.workflow.tasks",
+    "TaskCategory": "ingot.workflow.tasks",
+    "TaskStatus": "ingot.workflow.tasks",
+    "format_task_list": "ingot.workflow.tasks",
+    "get_completed_tasks": "ingot.workflow.tasks",
+    "get_pending_tasks": "ingot.workflow.tasks",
+    "mark_task_complete": "ingot.workflow.tasks",
+    "parse_task_list": "ingot.workflow.tasks",
+    "TaskListStore": "ingot.workflow.tasklist_store",
+    "TaskStateRecord": "ingot.workflow.tasklist_store",
+}
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     # Subagent Constants
@@ -87,6 +148,9 @@ __all__ = [
     "get_completed_tasks",
     "mark_task_complete",
     "format_task_list",
+    # Task State Journal
+    "TaskListStore",
+    "TaskStateRecord",
     # Task Memory
     "TaskMemory",
     "find_related_task_memories",
@@ -0,0 +1,99 @@
+"""Cancellable backend runs in a background thread.
+
+Some steps start a backend call before its result is needed, while the
+user is still answering prompts or reviewing output, and join it later:
+the researcher ahead of Step 1, the task list during plan review and the
+next batch of clarification questions. BackgroundRun holds the thread and
+cancellation handling they share.
+"""
+
+import subprocess
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import ClassVar
+
+from ingot.utils.logging import log_message
+from ingot.utils.processes import watch_processes
+
+
+class RunCancelled(Exception):
+    """Raised from an output callback to stop a cancelled backend run."""
+
+
+class BackgroundRun(ABC):
+    """Work running in a daemon thread that the workflow can cancel or wait for.
+
+    Subclasses implement _work() and pass _handle_output_line as the
+    output callback of their backend calls. Cancelling terminates the
+    backend process the run is waiting on, even if it is quiet or stuck,
+    and the callback raises RunCancelled at any further line of output.
+    While a listener is set, output lines are forwarded to it, e.g. to
+    show progress once the user waits on the run.
+    """
+
+    # Thread name and the label used in log messages
+    thread_name: ClassVar[str] = "ingot-background"
+    label: ClassVar[str] = "Background run"
+
+    def __init__(self) -> None:
+        self._listener: Callable[[str], None] | None = None
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+        # Latest backend process started by the run, terminated on cancel
+        self._process: subprocess.Popen[str] | None = None
+        self._process_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+
+    def _start(self) -> None:
+        self._thread.start()
+
+    @abstractmethod
+    def _work(self) -> None:
+        """Do the run's work in the background thread."""
+        ...
+
+    def _finished(self) -> None:  # noqa: B027
+        """Hook called in the thread once the run is done, even if it failed."""
+
+    def _run(self) -> None:
+        try:
+            with watch_processes(self._process_started):
+                self._work()
+        except RunCancelled:
+            log_message(f"{self.label} cancelled")
+        except Exception as e:
+            log_message(f"{self.label} failed: {e}")
+        finally:
+            self._done.set()
+            self._finished()
+
+    def _process_started(self, process: subprocess.Popen[str]) -> None:
+        with self._process_lock:
+            self._process = process
+            cancelled = self.cancelled
+        if cancelled:
+            process.terminate()
+
+    def _handle_output_line(self, line: str) -> None:
+        if self._cancelled.is_set():
+            raise RunCancelled
+        listener = self._listener
+        if listener is not None:
+            listener(line)
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Stop the run and its backend process; its result will not be used."""
+        with self._process_lock:
+            self._cancelled.set()
+            process = self._process
+        if process is not None and process.poll() is None:
+            process.terminate()
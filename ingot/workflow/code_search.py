@@ -0,0 +1,355 @@
+"""Local lexical code search used to pre-seed the researcher agent.
+
+The researcher spends most of its time grepping for where things live.
+CodeSearchIndex is a BM25 index over the identifier tokens of every text
+file at HEAD, so Step 1 can rank files against the ticket's keywords
+before the agent starts and hand it the best matches with snippets.
+
+The index is persisted as JSON under ``.ingot/cache/search/`` together
+with the tree it describes. Each run compares that tree with the tree at
+HEAD and re-tokenizes only the files whose blobs changed, so keeping it
+current costs one ``git diff`` plus the changed files.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+import subprocess
+import tempfile
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+from ingot.integrations.git import (
+    GitObjectReader,
+    diff_tree_blobs,
+    get_head_tree,
+    get_object_reader,
+)
+from ingot.utils.logging import log_command, log_message
+from ingot.workflow.research_cache import get_cache_base_dir
+
+# Bump when the token or file format changes; older indexes are rebuilt
+INDEX_VERSION = 1
+
+# Files larger than this are not indexed (generated code, data files)
+MAX_INDEXED_FILE_BYTES = 256 * 1024
+
+# BM25 parameters
+_K1 = 1.2
+_B = 0.75
+
+_ZERO_OID = "0" * 40
+_IDENTIFIER_RE = re.compile(r"[A-Za-z][A-Za-z0-9_]*")
+_CAMEL_PART_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+
+# Words too common in tickets or code to rank files by
+_STOPWORDS = frozenset(
+    """
+    about after all also and any are but can could does each for from get has have
+    how into its may more most must need new not now only other our out over same
+    set should some such than that the their them then there these they this those
+    use used uses using via want was were what when where which while who will with
+    would you your true false self return def class import none null
+    """.split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase search terms.
+
+    Each identifier yields itself and its snake_case / camelCase parts, so
+    ``RepoFileIndex`` matches queries for "repo", "file" or "index".
+    """
+    terms: list[str] = []
+    for identifier in _IDENTIFIER_RE.findall(text):
+        lowered = identifier.lower()
+        if len(lowered) >= 3 and lowered not in _STOPWORDS:
+            terms.append(lowered)
+        parts = [p for chunk in identifier.split("_") for p in _CAMEL_PART_RE.findall(chunk)]
+        if len(parts) > 1:
+            for part in parts:
+                part = part.lower()
+                if len(part) >= 3 and part not in _STOPWORDS and part != lowered:
+                    terms.append(part)
+    return terms
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """A file ranked for a query.
+
+    Attributes:
+        path: Path relative to the repository root.
+        score: BM25 score (higher is better).
+        terms: Query terms found in the file, best first.
+        snippets: (line number, line text) of the lines matching most terms.
+    """
+
+    path: str
+    score: float
+    terms: tuple[str, ...]
+    snippets: tuple[tuple[int, str], ...] = ()
+
+
+class CodeSearchIndex:
+    """BM25 index of the text files in one git tree."""
+
+    def __init__(self, tree: str | None = None) -> None:
+        self.tree = tree
+        self._blobs: dict[str, str] = {}  # path -> blob hash
+        self._terms: dict[str, dict[str, int]] = {}  # path -> term counts
+        self._postings: dict[str, dict[str, int]] | None = None  # term -> path -> count
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    # -- Building ------------------------------------------------------------
+
+    def update(self, tree: str, reader: GitObjectReader) -> int:
+        """Bring the index to tree, re-reading only changed files.
+
+        Returns the number of files added, changed or removed.
+        """
+        if tree == self.tree:
+            return 0
+        changed: dict[str, str] | None = None
+        if self.tree is not None:
+            try:
+                changed = diff_tree_blobs(self.tree, tree)
+            except subprocess.CalledProcessError:
+                changed = None  # Indexed tree is gone; rebuild
+        if changed is None:
+            self._blobs.clear()
+            self._terms.clear()
+            changed = _list_tree_blobs(tree)
+
+        for path, blob in changed.items():
+            self._terms.pop(path, None)
+            self._blobs.pop(path, None)
+            if blob == _ZERO_OID:
+                continue
+            content = _read_text_blob(reader, blob)
+            if content is None:
+                continue
+            self._blobs[path] = blob
+            self._terms[path] = dict(Counter(tokenize(f"{path}\n{content}")))
+
+        self.tree = tree
+        self._postings = None
+        return len(changed)
+
+    # -- Persistence ---------------------------------------------------------
+
+    @classmethod
+    def load(cls, path: Path) -> CodeSearchIndex:
+        """Load an index from path; an empty index if missing or outdated."""
+        try:
+            data = json.loads(path.read_text())
+        except FileNotFoundError:
+            return cls()
+        except (OSError, json.JSONDecodeError) as e:
+            log_message(f"Discarding unreadable code search index {path}: {e}")
+            return cls()
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return cls()
+
+        index = cls(tree=data.get("tree"))
+        for file_path, entry in data.get("files", {}).items():
+            index._blobs[file_path] = entry["blob"]
+            index._terms[file_path] = entry["terms"]
+        return index
+
+    def save(self, path: Path) -> None:
+        """Write the index to path atomically."""
+        data = {
+            "version": INDEX_VERSION,
+            "tree": self.tree,
+            "files": {
+                file_path: {"blob": self._blobs[file_path], "terms": terms}
+                for file_path, terms in self._terms.items()
+            },
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", prefix=".index_", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    # -- Querying ------------------------------------------------------------
+
+    def document_frequency(self, term: str) -> int:
+        """Number of indexed files containing term."""
+        return len(self._get_postings().get(term, ()))
+
+    def search(self, query_terms: list[str], limit: int = 8) -> list[SearchHit]:
+        """Rank files against query_terms with BM25; best first."""
+        postings = self._get_postings()
+        total_docs = len(self._terms)
+        if not total_docs:
+            return []
+        lengths = {path: sum(terms.values()) for path, terms in self._terms.items()}
+        avg_length = sum(lengths.values()) / total_docs or 1.0
+
+        scores: defaultdict[str, float] = defaultdict(float)
+        matched: dict[str, list[tuple[float, str]]] = {}
+        for term in dict.fromkeys(query_terms):
+            docs = postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (total_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            for path, count in docs.items():
+                norm = _K1 * (1 - _B + _B * lengths[path] / avg_length)
+                score = idf * count * (_K1 + 1) / (count + norm)
+                scores[path] += score
+                matched.setdefault(path, []).append((score, term))
+
+        return [
+            SearchHit(
+                path=path,
+                score=score,
+                terms=tuple(term for _, term in sorted(matched[path], reverse=True)),
+            )
+            for path, score in sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        ]
+
+    def with_snippets(
+        self, hits: list[SearchHit], reader: GitObjectReader, per_file: int = 2
+    ) -> list[SearchHit]:
+        """Attach the lines matching the most query terms to each hit."""
+        result = []
+        for hit in hits:
+            content = _read_text_blob(reader, self._blobs[hit.path])
+            snippets: list[tuple[int, int, str]] = []
+            for number, line in enumerate((content or "").splitlines(), 1):
+                line_terms = set(tokenize(line))
+                found = sum(1 for term in hit.terms if term in line_terms)
+                if found:
+                    snippets.append((-found, number, line.strip()[:160]))
+            best = sorted(snippets)[:per_file]
+            result.append(
+                SearchHit(
+                    hit.path,
+                    hit.score,
+                    hit.terms,
+                    tuple((number, text) for _, number, text in sorted(best, key=lambda s: s[1])),
+                )
+            )
+        return result
+
+    def _get_postings(self) -> dict[str, dict[str, int]]:
+        if self._postings is None:
+            postings: dict[str, dict[str, int]] = {}
+            for path, terms in self._terms.items():
+                for term, count in terms.items():
+                    postings.setdefault(term, {})[path] = count
+            self._postings = postings
+        return self._postings
+
+
+def _list_tree_blobs(tree: str) -> dict[str, str]:
+    """Map every regular file in tree to its blob hash.
+
+    Raises:
+        subprocess.CalledProcessError: If git command fails
+    """
+    cmd = ["git", "ls-tree", "-r", "-z", "--full-tree", tree]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    log_command(" ".join(cmd), result.returncode)
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(
+            result.returncode, cmd, output=result.stdout, stderr=result.stderr
+        )
+    blobs: dict[str, str] = {}
+    # Each entry is "<mode> <type> <object>\t<path>"
+    for entry in result.stdout.split("\0"):
+        meta, _, path = entry.partition("\t")
+        fields = meta.split()
+        if len(fields) == 3 and fields[1] == "blob" and fields[0] in ("100644", "100755"):
+            blobs[path] = fields[2]
+    return blobs
+
+
+def _read_text_blob(reader: GitObjectReader, blob: str) -> str | None:
+    """Return a blob decoded as text, or None if missing, binary or too large."""
+    info = reader.info(blob)
+    if info is None or info.type != "blob" or info.size > MAX_INDEXED_FILE_BYTES:
+        return None
+    result = reader.read(blob)
+    if result is None or b"\0" in result[1][:8192]:
+        return None
+    return result[1].decode("utf-8", errors="replace")
+
+
+def get_index_path() -> Path:
+    """Get the path of the persisted code search index."""
+    return get_cache_base_dir() / "search" / "index.json"
+
+
+def load_code_search_index() -> CodeSearchIndex | None:
+    """Load the persisted index and bring it up to date with HEAD.
+
+    Returns None outside a git repository or if the index cannot be built.
+    """
+    tree = get_head_tree()
+    if tree is None:
+        return None
+    path = get_index_path()
+    index = CodeSearchIndex.load(path)
+    try:
+        changed = index.update(tree, get_object_reader())
+    except (subprocess.CalledProcessError, OSError, RuntimeError) as e:
+        log_message(f"Failed to update code search index: {e}")
+        return None
+    if changed:
+        log_message(f"Code search index updated: {changed} file(s) changed, {len(index)} indexed")
+        try:
+            index.save(path)
+        except OSError as e:
+            log_message(f"Failed to save code search index: {e}")
+    return index
+
+
+def query_terms_for(text: str, index: CodeSearchIndex, max_terms: int = 24) -> list[str]:
+    """Search terms from ticket text that can discriminate between files.
+
+    Terms in no file, or in more than half of them, are dropped.
+    """
+    limit = max(len(index) // 2, 1)
+    terms = []
+    for term in dict.fromkeys(tokenize(text)):
+        if 0 < index.document_frequency(term) <= limit:
+            terms.append(term)
+            if len(terms) == max_terms:
+                break
+    return terms
+
+
+def format_search_hits(hits: list[SearchHit]) -> str:
+    """Render hits as a markdown list with indented snippets."""
+    lines = []
+    for hit in hits:
+        lines.append(f"- `{hit.path}` (matches: {', '.join(hit.terms[:5])})")
+        for number, text in hit.snippets:
+            lines.append(f"    {number}: {text}")
+    return "\n".join(lines)
+
+
+__all__ = [
+    "INDEX_VERSION",
+    "MAX_INDEXED_FILE_BYTES",
+    "CodeSearchIndex",
+    "SearchHit",
+    "format_search_hits",
+    "get_index_path",
+    "load_code_search_index",
+    "query_terms_for",
+    "tokenize",
+]
@@ -10,13 +10,30 @@ Key features:
 - Dirty working tree detection: Detect uncommitted changes before workflow
   modifications begin.
 - Binary file handling: Gracefully handle binary files in diffs.
+- Streaming diffs: git diff output is consumed line by line, filtered on
+  the fly and abandoned as soon as the output budget is reached.
 """
 
+import functools
 import re
 import subprocess
+import tempfile
+from collections.abc import Iterable, Iterator
 from enum import Enum
 from pathlib import Path
 
+from ingot.integrations.git import (
+    RepoSnapshot,
+    UntrackedDirSummary,
+    collapse_untracked_dirs,
+    diff_numstat,
+    format_diffstat,
+    format_new_file_diff,
+    get_repo_snapshot,
+    read_text_if_not_binary,
+    render_untracked_files,
+    repo_snapshot_scope,
+)
 from ingot.utils.console import print_warning
 
 
@@ -39,6 +56,7 @@ WORKFLOW_ARTIFACT_PATHS = frozenset(
     {
         ".ingot/runs/",  # Run logs and workflow state (gitignored)
         ".ingot/agents/",  # Auto-generated agent definitions (committable, but not auto-staged)
+        ".ingot/cache/",  # Local artifact caches (gitignored)
         "specs/",  # Generated specs and task lists
         ".DS_Store",  # macOS system file
         ".gitignore",  # Modified by ensure_gitignore_configured() to add INGOT patterns
@@ -194,7 +212,7 @@ def check_dirty_working_tree(
     - Staged changes (index vs HEAD, excluding workflow artifacts)
     - Untracked files (excluding workflow artifacts)
 
-    Workflow artifacts (specs/, .ingot/runs/, .ingot/agents/, .DS_Store)
+    Workflow artifacts (specs/, .ingot/runs/, .ingot/agents/, .ingot/cache/, .DS_Store)
     are excluded from this check since they are created by Steps 1-2
     and should not block Step 3 execution.
 
@@ -208,36 +226,15 @@ def check_dirty_working_tree(
     Raises:
         DirtyWorkingTreeError: If working tree is dirty and policy is FAIL_FAST.
     """
-    # Check for unstaged changes (working tree vs index)
-    # Use --name-only to get file list for filtering
-    result_unstaged = subprocess.run(
-        ["git", "diff", "--name-only"],
-        capture_output=True,
-        text=True,
-    )
-    unstaged_files = [
-        f for f in result_unstaged.stdout.strip().split("\n") if f and not is_workflow_artifact(f)
-    ]
-
-    # Check for staged changes (index vs HEAD)
-    result_staged = subprocess.run(
-        ["git", "diff", "--cached", "--name-only"],
-        capture_output=True,
-        text=True,
-    )
-    staged_files = [
-        f for f in result_staged.stdout.strip().split("\n") if f and not is_workflow_artifact(f)
-    ]
+    # Unstaged, staged and untracked paths all come from one status call
+    try:
+        snapshot = get_repo_snapshot()
+    except subprocess.CalledProcessError:
+        snapshot = RepoSnapshot(head=None, branch=None, entries=[])
 
-    # Check for untracked files (excluding workflow artifacts)
-    result_untracked = subprocess.run(
-        ["git", "ls-files", "--others", "--exclude-standard"],
-        capture_output=True,
-        text=True,
-    )
-    untracked_files = [
-        f for f in result_untracked.stdout.strip().split("\n") if f and not is_workflow_artifact(f)
-    ]
+    unstaged_files = [f for f in snapshot.unstaged_files if not is_workflow_artifact(f)]
+    staged_files = [f for f in snapshot.staged_files if not is_workflow_artifact(f)]
+    untracked_files = [f for f in snapshot.untracked_files if not is_workflow_artifact(f)]
 
     is_dirty = bool(unstaged_files or staged_files or untracked_files)
 
@@ -384,18 +381,11 @@ def get_untracked_files() -> list[str]:
     Returns:
         List of untracked file paths relative to repo root.
     """
-    result = subprocess.run(
-        ["git", "ls-files", "--others", "--exclude-standard"],
-        capture_output=True,
-        text=True,
-    )
-
-    if result.returncode != 0:
+    try:
+        return get_repo_snapshot().untracked_files
+    except subprocess.CalledProcessError:
         return []
 
-    files = result.stdout.strip().split("\n") if result.stdout.strip() else []
-    return [f for f in files if f]  # Filter empty strings
-
 
 def get_untracked_files_diff(
     *,
@@ -406,6 +396,9 @@ def get_untracked_files_diff(
 
     Creates a unified diff format for new untracked files, making them
     visible in review diffs. Binary files are marked with a placeholder.
+    Files are read in parallel, and directories with more than
+    UNTRACKED_DIR_COLLAPSE_THRESHOLD untracked files are summarized as a
+    single entry.
 
     Args:
         stat_only: If True, return only stat-like summary.
@@ -420,28 +413,33 @@ def get_untracked_files_diff(
         return ""
 
     if stat_only:
-        # Generate stat-like output for untracked files
-        lines = []
-        for path in untracked:
-            lines.append(f" {path} | [NEW FILE]")
-        if lines:
-            lines.append(f" {len(untracked)} untracked file(s)")
-        return "\n" + "\n".join(lines) + "\n"
+        return _format_untracked_stat(untracked)
 
-    # Generate full diff-like output for each untracked file
-    diff_parts = []
+    return "\n".join(
+        render_untracked_files(
+            untracked, functools.partial(_generate_untracked_file_diff, max_file_size=max_file_size)
+        )
+    )
 
-    for path in untracked:
-        file_diff = _generate_untracked_file_diff(path, max_file_size)
-        if file_diff:
-            diff_parts.append(file_diff)
 
-    return "\n".join(diff_parts)
+def _format_untracked_stat(untracked: list[str]) -> str:
+    """Generate stat-like output for untracked files ("" if none)."""
+    if not untracked:
+        return ""
+    lines = [
+        entry.to_stat() if isinstance(entry, UntrackedDirSummary) else f" {entry} | [NEW FILE]"
+        for entry in collapse_untracked_dirs(untracked)
+    ]
+    lines.append(f" {len(untracked)} untracked file(s)")
+    return "\n" + "\n".join(lines) + "\n"
 
 
 def _generate_untracked_file_diff(path: str, max_file_size: int) -> str:
     """Generate diff output for a single untracked file.
 
+    The file is opened once: its size comes from fstat, the binary sniff
+    runs on a memory map and text content is decoded from the same map.
+
     Args:
         path: Path to the untracked file.
         max_file_size: Maximum file size to include content.
@@ -449,46 +447,8 @@ def _generate_untracked_file_diff(path: str, max_file_size: int) -> str:
     Returns:
         Diff-like output for the file.
     """
-    import os
-
     try:
-        # Check file size
-        file_size = os.path.getsize(path)
-
-        if file_size > max_file_size:
-            return (
-                f"diff --git a/{path} b/{path}\n"
-                f"new file mode 100644\n"
-                f"[LARGE FILE: {path} ({file_size} bytes) - content omitted]\n"
-            )
-
-        # Check if binary
-        if _is_binary_file(path):
-            return (
-                f"diff --git a/{path} b/{path}\nnew file mode 100644\n[BINARY FILE ADDED: {path}]\n"
-            )
-
-        # Read file content
-        with open(path, encoding="utf-8", errors="replace") as f:
-            content = f.read()
-
-        # Generate unified diff format
-        lines = content.splitlines(keepends=True)
-        if lines and not lines[-1].endswith("\n"):
-            lines[-1] += "\n"
-
-        diff_lines = [
-            f"diff --git a/{path} b/{path}\n",
-            "new file mode 100644\n",
-            "--- /dev/null\n",
-            f"+++ b/{path}\n",
-            f"@@ -0,0 +1,{len(lines)} @@\n",
-        ]
-        for line in lines:
-            diff_lines.append(f"+{line}")
-
-        return "".join(diff_lines)
-
+        file_size, content = read_text_if_not_binary(path, max_file_size)
     except OSError as e:
         return (
             f"diff --git a/{path} b/{path}\n"
@@ -496,26 +456,17 @@ def _generate_untracked_file_diff(path: str, max_file_size: int) -> str:
             f"[ERROR READING FILE: {path} - {e}]\n"
         )
 
+    if file_size > max_file_size:
+        return (
+            f"diff --git a/{path} b/{path}\n"
+            f"new file mode 100644\n"
+            f"[LARGE FILE: {path} ({file_size} bytes) - content omitted]\n"
+        )
 
-def _is_binary_file(path: str, sample_size: int = 8192) -> bool:
-    """Check if a file appears to be binary.
-
-    Uses a heuristic: if the first sample_size bytes contain null bytes,
-    the file is likely binary.
-
-    Args:
-        path: Path to the file.
-        sample_size: Number of bytes to sample.
+    if content is None:
+        return f"diff --git a/{path} b/{path}\nnew file mode 100644\n[BINARY FILE ADDED: {path}]\n"
 
-    Returns:
-        True if file appears to be binary.
-    """
-    try:
-        with open(path, "rb") as f:
-            sample = f.read(sample_size)
-        return b"\x00" in sample
-    except OSError:
-        return False
+    return format_new_file_diff(path, content)
 
 
 def filter_binary_files_from_diff(diff_output: str) -> str:
@@ -533,17 +484,176 @@ def filter_binary_files_from_diff(diff_output: str) -> str:
     Returns:
         Filtered diff with binary content markers.
     """
-    # Pattern matches "Binary files a/... and b/... differ"
-    binary_pattern = re.compile(
-        r"Binary files a/(.+?) and b/(.+?) differ",
-        re.MULTILINE,
-    )
+    return _BINARY_DIFF_PATTERN.sub(_replace_binary_diff, diff_output)
+
+
+# Pattern matches "Binary files a/... and b/... differ"
+_BINARY_DIFF_PATTERN = re.compile(
+    r"Binary files a/(.+?) and b/(.+?) differ",
+    re.MULTILINE,
+)
+
+
+def _replace_binary_diff(match: re.Match) -> str:
+    path = match.group(2)  # Use the "b/" (new) path
+    return f"[BINARY FILE CHANGED: {path}]"
+
+
+# =============================================================================
+# Streaming diff pipeline
+# =============================================================================
+
+# Default output budget for a full diff, as a multiple of the changed-line
+# limit (context lines and headers roughly double or triple the output)
+DIFF_OUTPUT_LINE_FACTOR = 3
 
-    def replace_binary(match: re.Match) -> str:
-        path = match.group(2)  # Use the "b/" (new) path
-        return f"[BINARY FILE CHANGED: {path}]"
+# Default character budget for a full diff (~100k tokens at ~4 chars/token)
+DEFAULT_DIFF_OUTPUT_CHARS = 400_000
 
-    return binary_pattern.sub(replace_binary, diff_output)
+# Per-file cap on diff lines; larger file sections are replaced by a marker
+DEFAULT_MAX_FILE_DIFF_LINES = 1_000
+
+_DIFF_HEADER_PATTERN = re.compile(r"^diff --git a/.* b/(.*)$")
+
+
+def stream_git_diff(*args: str) -> Iterator[str]:
+    """Yield ``git diff --no-color --no-ext-diff <args>`` output line by line.
+
+    Lines keep their trailing newline. Output is read as git produces it;
+    closing the generator early (e.g. when a budget is reached) terminates
+    git instead of waiting for the rest of the diff. Stderr goes to a
+    temporary file, so git never blocks on a full stderr pipe.
+
+    Raises:
+        subprocess.CalledProcessError: If git exits with an error after
+            the output was fully consumed.
+    """
+    cmd = ["git", "diff", "--no-color", "--no-ext-diff", *args]
+    with tempfile.TemporaryFile(mode="w+", errors="replace") as stderr_file:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            text=True,
+            errors="replace",
+        )
+        finished = False
+        try:
+            assert proc.stdout is not None
+            yield from proc.stdout
+            finished = True
+        finally:
+            if not finished:
+                proc.kill()
+            returncode = proc.wait()
+            if proc.stdout:
+                proc.stdout.close()
+        stderr_file.seek(0)
+        stderr = stderr_file.read()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr)
+
+
+def filter_diff_lines(
+    lines: Iterable[str],
+    *,
+    max_file_lines: int | None = DEFAULT_MAX_FILE_DIFF_LINES,
+) -> Iterator[str]:
+    """Filter a diff stream on the fly.
+
+    - "Binary files ... differ" lines become "[BINARY FILE CHANGED: path]".
+    - A single file's section longer than max_file_lines is cut off with
+      one marker line; the rest of that file is skipped without buffering.
+    """
+    path = ""
+    file_lines = 0
+    skipping = False
+
+    try:
+        for line in lines:
+            header = _DIFF_HEADER_PATTERN.match(line.rstrip("\n"))
+            if header:
+                path = header.group(1)
+                file_lines = 0
+                skipping = False
+            elif skipping:
+                continue
+
+            file_lines += 1
+            if max_file_lines is not None and file_lines > max_file_lines:
+                skipping = True
+                yield f"[LARGE FILE DIFF: {path} - remaining lines omitted]\n"
+                continue
+
+            if line.startswith("Binary files "):
+                line = _BINARY_DIFF_PATTERN.sub(_replace_binary_diff, line)
+            yield line
+    finally:
+        # Propagate early close to the source stream
+        _close_iterable(lines)
+
+
+def collect_diff_within_budget(
+    lines: Iterable[str],
+    *,
+    max_lines: int | None = None,
+    max_chars: int | None = None,
+) -> tuple[str, bool]:
+    """Join diff lines until a line or character budget is reached.
+
+    Stops pulling from the stream at the budget, so upstream generators
+    (and the git process behind stream_git_diff) are closed early.
+
+    Returns:
+        Tuple of (diff_text, was_truncated).
+    """
+    parts: list[str] = []
+    line_count = 0
+    char_count = 0
+    truncated = False
+
+    try:
+        for line in lines:
+            if (max_lines is not None and line_count >= max_lines) or (
+                max_chars is not None and char_count + len(line) > max_chars
+            ):
+                truncated = True
+                break
+            parts.append(line)
+            line_count += 1
+            char_count += len(line)
+    finally:
+        _close_iterable(lines)
+
+    return "".join(parts), truncated
+
+
+def _close_iterable(lines: Iterable[str]) -> None:
+    """Close a generator (no-op for plain iterables)."""
+    close = getattr(lines, "close", None)
+    if close is not None:
+        close()
+
+
+def iter_untracked_files_diff(
+    untracked: Iterable[str],
+    *,
+    max_file_size: int = 100_000,
+) -> Iterator[str]:
+    """Yield diff-like lines for untracked files.
+
+    Files are read ahead on a small thread pool. Closing this generator
+    (e.g. when the diff budget is exhausted) stops scheduling further reads.
+    """
+    file_diffs = render_untracked_files(
+        list(untracked),
+        functools.partial(_generate_untracked_file_diff, max_file_size=max_file_size),
+    )
+    try:
+        for file_diff in file_diffs:
+            yield from file_diff.splitlines(keepends=True)
+    finally:
+        file_diffs.close()
 
 
 def parse_stat_total_lines(stat_output: str) -> int:
@@ -672,6 +782,8 @@ def get_smart_diff_from_baseline(
     max_files: int = 20,
     include_working_tree: bool = True,
     include_untracked: bool = True,
+    max_output_lines: int | None = None,
+    max_output_chars: int | None = DEFAULT_DIFF_OUTPUT_CHARS,
 ) -> tuple[str, bool, bool]:
     """Get baseline-anchored diff output, using --stat only for large changes.
 
@@ -686,40 +798,66 @@ def get_smart_diff_from_baseline(
             If False, only show committed changes since baseline.
         include_untracked: If True, include untracked files in diff output.
             Only applies when include_working_tree is True.
+        max_output_lines: Line budget for the full diff text. Reading stops
+            once it is reached (default: max_lines * DIFF_OUTPUT_LINE_FACTOR).
+        max_output_chars: Character budget for the full diff text, or None
+            for no character limit.
 
     Returns:
         Tuple of (diff_output, is_truncated, git_error) where:
         - diff_output is the diff text (filtered for binary files)
-        - is_truncated is True if only stat output was returned due to large changeset
+        - is_truncated is True if only stat output was returned due to large
+          changeset, or the full diff was cut off at the output budget
         - git_error is True if git command failed (diff may be unreliable)
     """
-    # Choose diff function based on whether we include working tree
-    if include_working_tree:
-        stat_output, stat_error = get_working_tree_diff_from_baseline(
-            baseline_ref, stat_only=True, include_untracked=include_untracked
+    # All queries below share one repository snapshot
+    with repo_snapshot_scope():
+        return _smart_diff_from_baseline(
+            baseline_ref,
+            max_lines=max_lines,
+            max_files=max_files,
+            include_working_tree=include_working_tree,
+            include_untracked=include_untracked,
+            max_output_lines=max_output_lines,
+            max_output_chars=max_output_chars,
         )
-    else:
-        stat_output, stat_error = get_diff_from_baseline(baseline_ref, stat_only=True)
 
-    # Check for git errors
-    if stat_error:
+
+def _smart_diff_from_baseline(
+    baseline_ref: str,
+    *,
+    max_lines: int,
+    max_files: int,
+    include_working_tree: bool,
+    include_untracked: bool,
+    max_output_lines: int | None,
+    max_output_chars: int | None,
+) -> tuple[str, bool, bool]:
+    """Implementation of get_smart_diff_from_baseline() inside a snapshot scope."""
+    # Size the change with --numstat (exact per-file counts, one git call)
+    range_args = (baseline_ref,) if include_working_tree else (baseline_ref, "HEAD")
+    try:
+        numstat = diff_numstat(*range_args)
+    except subprocess.CalledProcessError as e:
+        stderr = e.stderr.strip() if e.stderr else "unknown error"
+        print_warning(f"Git diff from baseline failed: {stderr}")
         return "", False, True
 
-    if not stat_output.strip():
+    untracked = get_untracked_files() if include_working_tree and include_untracked else []
+
+    if not numstat and not untracked:
         # No changes - return empty (not an error, just empty diff)
         return "", False, False
 
-    # Parse stat to get counts (note: untracked files add to file count)
-    lines_changed = parse_stat_total_lines(stat_output)
-    files_changed = parse_stat_file_count(stat_output)
-
-    # Add untracked file count if applicable
-    if include_working_tree and include_untracked:
-        untracked_count = len(get_untracked_files())
-        files_changed += untracked_count
+    lines_changed = sum((e.added or 0) + (e.deleted or 0) for e in numstat)
+    # Untracked files add to the file count
+    files_changed = len(numstat) + len(untracked)
 
     # Check if diff is too large
     if lines_changed > max_lines or files_changed > max_files:
+        stat_output = format_diffstat(numstat)
+        if untracked:
+            stat_output += _format_untracked_stat(untracked)
         # Return stat-only with instructions
         truncated_output = f"""## Git Diff Summary (Large Changeset)
 
@@ -730,23 +868,36 @@ To review specific files in detail, use: `git diff {baseline_ref} -- <file_path>
 Focus on files most critical to the implementation plan."""
         return truncated_output, True, False
 
-    # Small enough for full diff
-    if include_working_tree:
-        full_output, full_error = get_working_tree_diff_from_baseline(
-            baseline_ref, include_untracked=include_untracked
-        )
-    else:
-        full_output, full_error = get_diff_from_baseline(baseline_ref)
+    # Small enough for a full diff: stream it, filtering binary and oversize
+    # file sections on the fly and stopping at the output budget
+    if max_output_lines is None:
+        max_output_lines = max_lines * DIFF_OUTPUT_LINE_FACTOR
 
-    # Check for git errors on full diff
-    if full_error:
+    def sources() -> Iterator[str]:
+        # yield from forwards close(), so git is terminated at the budget
+        yield from stream_git_diff(*range_args)
+        yield from iter_untracked_files_diff(untracked)
+
+    try:
+        full_output, budget_hit = collect_diff_within_budget(
+            filter_diff_lines(sources()),
+            max_lines=max_output_lines,
+            max_chars=max_output_chars,
+        )
+    except subprocess.CalledProcessError as e:
+        stderr = e.stderr.strip() if e.stderr else "unknown error"
+        print_warning(f"Git diff from baseline failed: {stderr}")
         # Fall back to stat output with error flag
-        return stat_output, True, True
+        return format_diffstat(numstat) + _format_untracked_stat(untracked), True, True
 
-    # Filter binary file content to avoid token issues
-    filtered_output = filter_binary_files_from_diff(full_output)
+    if budget_hit:
+        full_output += (
+            "\n... [diff truncated at output budget]\n"
+            f"Use `git diff {baseline_ref} -- <file_path>` to inspect the remaining files.\n"
+        )
+        return full_output, True, False
 
-    return filtered_output, False, False
+    return full_output, False, False
 
 
 __all__ = [
@@ -762,6 +913,11 @@ __all__ = [
     "get_diff_from_baseline",
     "get_working_tree_diff_from_baseline",
     "filter_binary_files_from_diff",
+    # Streaming diff pipeline
+    "stream_git_diff",
+    "filter_diff_lines",
+    "collect_diff_within_budget",
+    "iter_untracked_files_diff",
     "get_smart_diff_from_baseline",
     # Untracked file functions
     "get_untracked_files",
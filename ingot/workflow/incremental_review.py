@@ -0,0 +1,286 @@
+"""Incremental re-review for the review-fix loop.
+
+After the first verification of the review-fix loop, re-reviewing the
+whole baseline diff on every attempt spends most of the reviewer's
+tokens on files the fixer never touched. This module tracks the working
+tree as a git tree hash (before and after each fix) and keeps a cache of
+per-file verdicts keyed by (path, blob hash):
+
+- a file whose current content already passed review is never sent again;
+- later verify passes send only the remaining files' diffs plus the
+  previous review's findings.
+
+The cache is seeded from the review that preceded the first fix: from a
+full review when its diff was complete, or from the verdicts of the
+shards that reviewed their files in full when the review was sharded.
+
+Verdicts are attributed to files conservatively: a file is only cached as
+passed if the reviewer returned PASS, or returned NEEDS_ATTENTION with
+issues that name other files.
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+
+from ingot.integrations.git import diff_tree_blobs, write_worktree_tree
+from ingot.workflow.git_utils import (
+    DEFAULT_DIFF_OUTPUT_CHARS,
+    collect_diff_within_budget,
+    filter_diff_lines,
+    stream_git_diff,
+)
+from ingot.workflow.review import (
+    ISSUES_PATTERN,
+    ReviewStatus,
+    build_review_prompt,
+    parse_review_status,
+)
+
+if TYPE_CHECKING:
+    from ingot.workflow.review_shards import ShardVerdict
+    from ingot.workflow.state import WorkflowState
+
+# Line budget for the delta diff sent to an incremental verify pass
+DEFAULT_DELTA_MAX_LINES = 6_000
+
+
+@dataclass(frozen=True)
+class TreeState:
+    """Working tree content relative to the baseline.
+
+    Attributes:
+        tree: Hash of the working tree as a git tree object.
+        blobs: Blob hash of every path changed since the baseline.
+    """
+
+    tree: str
+    blobs: dict[str, str]
+
+
+@dataclass
+class FileVerdictCache:
+    """Per-file review verdicts keyed by content (path, blob hash)."""
+
+    _passed: set[tuple[str, str]] = field(default_factory=set)
+
+    def has_passed(self, path: str, blob: str) -> bool:
+        return (path, blob) in self._passed
+
+    def mark_passed(self, path: str, blob: str) -> None:
+        self._passed.add((path, blob))
+
+    def __len__(self) -> int:
+        return len(self._passed)
+
+
+def flagged_paths(review_output: str, paths: list[str]) -> set[str]:
+    """Return the paths that the review's issues refer to.
+
+    Matches full paths, and bare file names when they are unambiguous
+    among paths. Only the **Issues** section is searched when present.
+    """
+    match = ISSUES_PATTERN.search(review_output)
+    text = match.group(1) if match else review_output
+
+    name_counts: dict[str, int] = {}
+    for path in paths:
+        name = PurePosixPath(path).name
+        name_counts[name] = name_counts.get(name, 0) + 1
+
+    flagged: set[str] = set()
+    for path in paths:
+        name = PurePosixPath(path).name
+        if path in text or (
+            name_counts[name] == 1 and re.search(rf"(?<![\w./-]){re.escape(name)}\b", text)
+        ):
+            flagged.add(path)
+    return flagged
+
+
+class IncrementalReviewTracker:
+    """Tracks working tree changes and per-file verdicts across fix attempts.
+
+    Usage in the review-fix loop:
+        tracker = IncrementalReviewTracker.start(baseline_ref)
+        tracker.seed(initial_review, complete=..., shard_verdicts=...)
+        ... run_auto_fix ...
+        tree_state = tracker.capture()
+        pending = tracker.pending_files(tree_state)
+        ... review pending files ...
+        tracker.record(tree_state, reviewed_paths, output)
+    """
+
+    def __init__(self, baseline_ref: str, tree_state: TreeState) -> None:
+        self.baseline_ref = baseline_ref
+        self.cache = FileVerdictCache()
+        self._previous = tree_state
+        self._seeded = False
+
+    @classmethod
+    def start(cls, baseline_ref: str) -> IncrementalReviewTracker | None:
+        """Capture the tree before the first fix; None if git state is unavailable."""
+        tracker = cls(baseline_ref, TreeState("", {}))
+        tree_state = tracker.capture()
+        if tree_state is None:
+            return None
+        tracker._previous = tree_state
+        return tracker
+
+    @property
+    def is_seeded(self) -> bool:
+        """True once a complete review populated the verdict cache."""
+        return self._seeded
+
+    def capture(self) -> TreeState | None:
+        """Capture the current working tree relative to the baseline."""
+        tree = write_worktree_tree()
+        if tree is None:
+            return None
+        try:
+            blobs = diff_tree_blobs(self.baseline_ref, tree)
+        except subprocess.CalledProcessError:
+            return None
+        return TreeState(tree, blobs)
+
+    def changed_by_fix(self, tree_state: TreeState) -> list[str]:
+        """Paths whose content changed since the previous capture, sorted."""
+        previous = self._previous.blobs
+        if tree_state.tree == self._previous.tree:
+            return []
+        paths = set(previous) | set(tree_state.blobs)
+        return sorted(p for p in paths if previous.get(p) != tree_state.blobs.get(p))
+
+    def pending_files(self, tree_state: TreeState) -> list[str]:
+        """Changed paths whose current content has not passed review, sorted."""
+        return sorted(
+            path for path, blob in tree_state.blobs.items() if not self.cache.has_passed(path, blob)
+        )
+
+    def record(
+        self,
+        tree_state: TreeState,
+        reviewed_paths: list[str],
+        review_output: str,
+    ) -> None:
+        """Cache verdicts for reviewed_paths from a review of tree_state."""
+        status = parse_review_status(review_output)
+        if status == ReviewStatus.PASS:
+            passed = set(reviewed_paths)
+        elif status == ReviewStatus.NEEDS_ATTENTION:
+            flagged = flagged_paths(review_output, reviewed_paths)
+            # Without attribution every reviewed file stays under suspicion
+            passed = set(reviewed_paths) - flagged if flagged else set()
+        else:
+            passed = set()
+
+        for path in passed:
+            blob = tree_state.blobs.get(path)
+            if blob is not None:
+                self.cache.mark_passed(path, blob)
+        self._previous = tree_state
+        self._seeded = True
+
+    def record_shards(self, tree_state: TreeState, verdicts: list[ShardVerdict]) -> None:
+        """Cache verdicts per shard from a sharded review of tree_state.
+
+        Each shard's own output decides for its files; shards that failed
+        or had a file cut to fit the budget are skipped.
+        """
+        complete = [v for v in verdicts if v.success and not v.shard.truncated]
+        for verdict in complete:
+            self.record(tree_state, verdict.shard.paths, verdict.output)
+        if not complete:
+            self.advance(tree_state)
+
+    def seed(
+        self,
+        review_output: str,
+        *,
+        complete: bool,
+        shard_verdicts: list[ShardVerdict] | None = None,
+    ) -> None:
+        """Seed the cache from the review of the tree captured by start().
+
+        Args:
+            review_output: Output of the review that preceded the first fix.
+            complete: True if that review saw the full diff.
+            shard_verdicts: Per-shard verdicts if the review was sharded.
+        """
+        if shard_verdicts:
+            self.record_shards(self._previous, shard_verdicts)
+        elif complete:
+            self.record(self._previous, list(self._previous.blobs), review_output)
+
+    def advance(self, tree_state: TreeState) -> None:
+        """Remember tree_state as the latest capture without recording verdicts."""
+        self._previous = tree_state
+
+    def delta_diff(
+        self,
+        tree_state: TreeState,
+        paths: list[str],
+        *,
+        max_lines: int = DEFAULT_DELTA_MAX_LINES,
+    ) -> tuple[str, bool]:
+        """Diff of paths from the baseline to tree_state, within a line budget.
+
+        Raises:
+            subprocess.CalledProcessError: If git diff fails.
+        """
+        lines = filter_diff_lines(stream_git_diff(self.baseline_ref, tree_state.tree, "--", *paths))
+        return collect_diff_within_budget(
+            lines, max_lines=max_lines, max_chars=DEFAULT_DIFF_OUTPUT_CHARS
+        )
+
+
+def build_incremental_review_prompt(
+    state: WorkflowState,
+    phase: str,
+    diff_output: str,
+    is_truncated: bool,
+    *,
+    pending: list[str],
+    changed_by_fix: list[str],
+    unchanged_passed: int,
+    previous_review: str,
+) -> str:
+    """Build the reviewer prompt for an incremental verify pass."""
+    prompt = build_review_prompt(state, phase, diff_output, is_truncated)
+    pending_list = "\n".join(f"- {path}" for path in pending)
+    fixed_list = "\n".join(f"- {path}" for path in changed_by_fix) or "- (none)"
+    return (
+        prompt
+        + f"""
+## Incremental Re-review
+This is a follow-up review after an automated fix. The diff above covers
+only these files (relative to the baseline):
+{pending_list}
+
+Files modified by the latest fix:
+{fixed_list}
+
+{unchanged_passed} other changed file(s) already passed review and are
+unchanged since; do not re-review them.
+
+### Previous Review Findings
+{previous_review.strip()}
+
+Check whether the previous findings are resolved and whether the fix
+introduced new problems. Report only issues that remain in the files above.
+"""
+    )
+
+
+__all__ = [
+    "DEFAULT_DELTA_MAX_LINES",
+    "FileVerdictCache",
+    "IncrementalReviewTracker",
+    "TreeState",
+    "build_incremental_review_prompt",
+    "flagged_paths",
+]
@@ -26,16 +26,15 @@ from ingot.utils.console import (
     print_warning,
 )
 from ingot.workflow.events import (
+    TaskRunStatus,
     create_task_finished_event,
     create_task_output_event,
     create_task_started_event,
     format_log_filename,
 )
 from ingot.workflow.state import WorkflowState
-from ingot.workflow.tasks import (
-    Task,
-    mark_task_complete,
-)
+from ingot.workflow.tasklist_store import record_task_result
+from ingot.workflow.tasks import Task
 
 # Type alias for task status
 TaskStatus = Literal["success", "failed", "skipped"]
@@ -47,10 +46,6 @@ ExecuteWithRetryFn = Callable[
 ]
 
 
-# Shared lock for serializing tasklist file writes across parallel workers
-_tasklist_write_lock = threading.Lock()
-
-
 def _execute_parallel_fallback(
     state: WorkflowState,
     tasks: list[Task],
@@ -144,12 +139,18 @@ def _execute_parallel_fallback(
                 skipped_tasks.append(task.name)
                 print_info(f"[PARALLEL] Skipped: {task.name}")
             elif success:
-                with _tasklist_write_lock:
-                    mark_task_complete(tasklist_path, task.name)
+                # O(1) journal append; the markdown is rendered once after the phase
+                record_task_result(tasklist_path, task.name, TaskRunStatus.SUCCESS)
                 state.mark_task_complete(task.name)
                 print_success(f"[PARALLEL] Completed: {task.name}")
                 # Memory capture disabled for parallel tasks (contamination risk)
             else:
+                record_task_result(
+                    tasklist_path,
+                    task.name,
+                    TaskRunStatus.FAILED,
+                    error="Task returned failure",
+                )
                 failed_tasks.append(task.name)
                 print_warning(f"[PARALLEL] Failed: {task.name}")
                 # Trigger fail-fast if enabled
@@ -297,13 +298,21 @@ def _execute_parallel_with_tui(
 
                     # Update state based on status
                     if status == "success":
-                        with _tasklist_write_lock:
-                            mark_task_complete(tasklist_path, task.name)
+                        record_task_result(
+                            tasklist_path, task.name, TaskRunStatus.SUCCESS, duration=duration
+                        )
                         state.mark_task_complete(task.name)
                         # Memory capture disabled for parallel tasks (contamination risk)
                     elif status == "skipped":
                         pass  # skipped tasks don't need tracking
                     else:  # failed
+                        record_task_result(
+                            tasklist_path,
+                            task.name,
+                            TaskRunStatus.FAILED,
+                            duration=duration,
+                            error=error,
+                        )
                         _failed.append(task.name)
                         # Trigger fail-fast if enabled
                         if state.fail_fast:
@@ -10,6 +10,7 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from ingot.utils.token_budget import TokenBudget
 from ingot.workflow.tasks import PathSecurityError, normalize_path
 
 if TYPE_CHECKING:
@@ -193,9 +194,6 @@ If you cannot reliably map changed source files to specific tests AND cannot run
 If NO production files were changed AND NO test files were changed, report "No code changes detected that require testing" and STOP."""
 
 
-_MAX_ERROR_OUTPUT_LENGTH = 3000
-
-
 def build_self_correction_prompt(
     task: Task,
     plan_path: Path,
@@ -208,6 +206,7 @@ def build_self_correction_prompt(
     repo_root: Path | None = None,
     ticket_title: str = "",
     ticket_description: str = "",
+    budget: TokenBudget | None = None,
 ) -> str:
     """Build a prompt for self-correction after a failed task attempt.
 
@@ -222,6 +221,8 @@ def build_self_correction_prompt(
         max_attempts: Maximum correction attempts allowed
         is_parallel: Whether this task runs in parallel with others
         user_constraints: Optional constraints & preferences provided by the user
+        budget: Token budget of the backend the prompt is sent to; limits how
+            much of the error output is included (default: TokenBudget()).
 
     Returns:
         Correction prompt string
@@ -229,13 +230,10 @@ def build_self_correction_prompt(
     parallel_mode = "YES" if is_parallel else "NO"
 
     # Truncate long error output — keep the tail where stack traces / errors live
-    truncated_output = error_output
-    if len(truncated_output) > _MAX_ERROR_OUTPUT_LENGTH:
-        tail = truncated_output[-_MAX_ERROR_OUTPUT_LENGTH:]
-        cut = tail.find("\n")
-        if cut <= 0:
-            cut = 0
-        truncated_output = "... [earlier output truncated]\n\n" + tail[cut:].lstrip("\n")
+    budget = budget or TokenBudget()
+    truncated_output = budget.fit(
+        "errors", error_output, keep="tail", marker="... [earlier output truncated]\n\n"
+    )
 
     prompt = f"""Self-correction attempt {attempt}/{max_attempts} for task: {task.name}
 
@@ -0,0 +1,264 @@
+"""Content-addressed cache of researcher (Step 1 discovery) output.
+
+The researcher agent explores the whole codebase, which is the slowest
+part of Step 1, yet its output only depends on the code, the ticket and
+the agent definition. Entries are therefore keyed by:
+
+- the tree hash at HEAD;
+- a hash of the ticket content (title, description, user constraints);
+- a hash of the researcher agent definition and the backend model.
+
+An exact hit skips the researcher. When only the tree differs and the
+difference touches few files, the previous output is returned together
+with the changed paths so the caller can ask for a cheaper refresh
+instead of a full rediscovery.
+
+Entries are JSON files under ``.ingot/cache/research/``; the directory is
+bounded in bytes and evicts least recently used entries (by mtime, which
+hits refresh) first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ingot.integrations.agents import get_agent_body, get_agents_dir
+from ingot.integrations.git import diff_tree_blobs, get_head_tree, get_repo_snapshot
+from ingot.utils.logging import log_message
+from ingot.workflow.git_utils import is_workflow_artifact
+
+if TYPE_CHECKING:
+    from ingot.workflow.state import WorkflowState
+
+# Default size bound of the research cache directory
+DEFAULT_RESEARCH_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# Largest tree change (in files) still answered with a refresh prompt
+REFRESH_MAX_CHANGED_FILES = 20
+
+# Older entries of the same ticket considered as a refresh base
+_REFRESH_CANDIDATES = 3
+
+
+def get_cache_base_dir() -> Path:
+    """Get the base directory for local artifact caches."""
+    env_dir = os.environ.get("INGOT_CACHE_DIR")
+    if env_dir:
+        return Path(env_dir)
+    return Path(".ingot/cache")
+
+
+def _digest(*parts: str) -> str:
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+@dataclass(frozen=True)
+class ResearchKey:
+    """Cache key of one researcher run.
+
+    Attributes:
+        tree: Tree hash at HEAD the research describes.
+        ticket_hash: Hash of the ticket content sent to the researcher.
+        agent_hash: Hash of the researcher agent definition and model.
+    """
+
+    tree: str
+    ticket_hash: str
+    agent_hash: str
+
+    @classmethod
+    def for_state(cls, state: WorkflowState, researcher_name: str) -> ResearchKey | None:
+        """Build the key for a researcher run, or None if it cannot be cached.
+
+        Research is only cacheable from a git repository whose working
+        tree matches HEAD (workflow artifacts aside), since uncommitted
+        changes are not part of the tree hash.
+        """
+        tree = get_head_tree()
+        if tree is None:
+            return None
+        try:
+            snapshot = get_repo_snapshot()
+        except subprocess.CalledProcessError:
+            return None
+        if any(not is_workflow_artifact(entry.path) for entry in snapshot.entries):
+            log_message("Working tree has uncommitted changes; not caching research")
+            return None
+
+        ticket = state.ticket
+        ticket_hash = _digest(
+            ticket.id,
+            ticket.title or ticket.branch_summary or "",
+            ticket.description or "",
+            state.user_constraints,
+            str(state.spec_verified),
+        )
+        try:
+            definition = (get_agents_dir() / f"{researcher_name}.md").read_text()
+        except OSError:
+            definition = get_agent_body(researcher_name) or researcher_name
+        agent_hash = _digest(definition, state.backend_name or "", state.backend_model or "")
+        return cls(tree=tree, ticket_hash=ticket_hash, agent_hash=agent_hash)
+
+    @property
+    def scope(self) -> str:
+        """File name prefix shared by all trees of one ticket and agent."""
+        return f"{self.ticket_hash[:16]}-{self.agent_hash[:16]}"
+
+    @property
+    def filename(self) -> str:
+        return f"{self.scope}-{self.tree}.json"
+
+
+@dataclass(frozen=True)
+class ResearchCacheHit:
+    """Cached researcher output found for a key.
+
+    Attributes:
+        output: The cached researcher markdown.
+        tree: Tree hash the output was produced from.
+        changed_paths: Paths that differ between that tree and the
+            requested one; empty for an exact hit.
+    """
+
+    output: str
+    tree: str
+    changed_paths: tuple[str, ...] = ()
+
+    @property
+    def is_exact(self) -> bool:
+        return not self.changed_paths
+
+
+class ResearchCache:
+    """Size-bounded LRU cache of researcher output on disk."""
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_bytes: int = DEFAULT_RESEARCH_CACHE_MAX_BYTES,
+        refresh_max_changed_files: int = REFRESH_MAX_CHANGED_FILES,
+    ) -> None:
+        self.cache_dir = cache_dir or get_cache_base_dir() / "research"
+        self.max_bytes = max_bytes
+        self.refresh_max_changed_files = refresh_max_changed_files
+
+    def lookup(self, key: ResearchKey) -> ResearchCacheHit | None:
+        """Return the exact entry for key, or a recent one within refresh distance."""
+        exact = self._load(self.cache_dir / key.filename)
+        if exact is not None:
+            return ResearchCacheHit(output=exact["output"], tree=key.tree)
+
+        if self.refresh_max_changed_files <= 0:
+            return None
+        try:
+            candidates = sorted(
+                self.cache_dir.glob(f"{key.scope}-*.json"),
+                key=lambda p: p.stat().st_mtime,
+                reverse=True,
+            )
+        except OSError:
+            return None
+        for path in candidates[:_REFRESH_CANDIDATES]:
+            entry = self._load(path, touch=False)
+            if entry is None:
+                continue
+            try:
+                changed = diff_tree_blobs(entry["tree"], key.tree)
+            except subprocess.CalledProcessError:
+                continue  # Old tree no longer in the object database
+            if len(changed) <= self.refresh_max_changed_files:
+                self._load(path)  # Mark as recently used
+                return ResearchCacheHit(
+                    output=entry["output"],
+                    tree=entry["tree"],
+                    changed_paths=tuple(sorted(changed)),
+                )
+        return None
+
+    def store(self, key: ResearchKey, output: str) -> None:
+        """Save output for key, then evict old entries over the size bound."""
+        data = {
+            "tree": key.tree,
+            "ticket_hash": key.ticket_hash,
+            "agent_hash": key.agent_hash,
+            "created_at": datetime.now(UTC).isoformat(),
+            "output": output,
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix=".tmp", prefix=".research_", dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.cache_dir / key.filename)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            log_message(f"Failed to cache researcher output: {e}")
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits max_bytes."""
+        entries: list[tuple[float, int, Path]] = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(".json"):
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((st.st_mtime, st.st_size, Path(entry.path)))
+        except OSError:
+            return
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            log_message(f"Evicted cached research {path.name}")
+
+    def _load(self, path: Path, *, touch: bool = True) -> dict[str, str] | None:
+        try:
+            data = json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError):
+            path.unlink(missing_ok=True)
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get("output"), str):
+            path.unlink(missing_ok=True)
+            return None
+        if touch:
+            try:
+                path.touch()  # Mark as recently used
+            except OSError:
+                pass
+        return data
+
+
+__all__ = [
+    "DEFAULT_RESEARCH_CACHE_MAX_BYTES",
+    "REFRESH_MAX_CHANGED_FILES",
+    "ResearchCache",
+    "ResearchCacheHit",
+    "ResearchKey",
+    "get_cache_base_dir",
+]
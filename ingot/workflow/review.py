@@ -11,6 +11,8 @@ introduced by the current workflow, not pre-existing dirty changes.
 from __future__ import annotations
 
 import re
+import subprocess
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -24,12 +26,17 @@ from ingot.utils.console import (
     print_success,
     print_warning,
 )
+from ingot.utils.token_budget import TokenBudget
 from ingot.workflow.constants import noop_output_callback
 from ingot.workflow.git_utils import get_smart_diff, get_smart_diff_from_baseline
 
 if TYPE_CHECKING:
+    from ingot.workflow.review_shards import ShardVerdict
     from ingot.workflow.state import WorkflowState
 
+# Structured **Issues**: section of a reviewer's output, up to the next bold header
+ISSUES_PATTERN = re.compile(r"\*\*Issues\*\*\s*:\s*(.*?)(?=\n\n\*\*[A-Z]|\Z)", re.DOTALL)
+
 
 class ReviewStatus(Enum):
     """Status codes returned by the review parser."""
@@ -186,7 +193,7 @@ File: {plan_path}
     if is_truncated:
         prompt += """
 ## Large Changeset Instructions
-This is a large changeset. The diff above shows only the file summary.
+This is a large changeset. The diff above shows only the file summary or a partial diff.
 Use `git diff -- <file_path>` to inspect specific files that need detailed review.
 Focus on files most critical to the implementation plan.
 """
@@ -249,15 +256,59 @@ def _get_diff_for_review(state: WorkflowState) -> tuple[str, bool, bool]:
     """
     if state.diff_baseline_ref:
         # Use baseline-anchored diff (recommended)
+        budget = TokenBudget.for_platform(state.backend_platform)
         return get_smart_diff_from_baseline(
             state.diff_baseline_ref,
             include_working_tree=True,  # Include uncommitted changes
+            # Stop reading the diff at the reviewer's token allowance
+            max_output_chars=budget.char_allowance("diff", code=True),
         )
     else:
         # Fallback to legacy behavior (no baseline)
         return get_smart_diff()
 
 
+def _run_reviewer(
+    state: WorkflowState,
+    phase: str,
+    diff_output: str,
+    is_truncated: bool,
+    backend: AIBackend,
+    *,
+    verdicts_callback: Callable[[list[ShardVerdict]], None] | None = None,
+) -> tuple[bool, str]:
+    """Run the reviewer agent on the current changes.
+
+    When sharded review is enabled and the changeset is too large for a
+    single full-diff review, the baseline diff is reviewed in concurrent
+    shards and the verdicts merged (see review_shards). Otherwise a single
+    reviewer sees diff_output. Exceptions from the backend propagate.
+
+    Args:
+        verdicts_callback: Called with the per-shard verdicts when the
+            review was sharded.
+
+    Returns:
+        Tuple of (success, output) as returned by run_with_callback().
+    """
+    if is_truncated and state.enable_sharded_review and state.diff_baseline_ref:
+        from ingot.workflow.review_shards import run_sharded_review
+
+        result = run_sharded_review(
+            state, phase, backend=backend, verdicts_callback=verdicts_callback
+        )
+        if result is not None:
+            return result
+
+    prompt = build_review_prompt(state, phase, diff_output, is_truncated)
+    return backend.run_with_callback(
+        prompt,
+        subagent=state.subagent_names["reviewer"],
+        output_callback=noop_output_callback,
+        dont_save_session=True,
+    )
+
+
 def _display_review_issues(output: str) -> None:
     """Extract and display review issues from reviewer output.
 
@@ -357,18 +408,29 @@ def _run_review_fix_loop(
     log_dir: Path,
     phase: str,
     backend: AIBackend,
+    *,
+    initial_review_complete: bool = False,
+    initial_shard_verdicts: list[ShardVerdict] | None = None,
 ) -> ReviewFixResult:
     """Run the review-fix loop up to max_review_fix_attempts times.
 
     Each iteration: (1) run auto-fix with the latest review feedback,
     (2) re-review the result. Stops early on PASS or if no diff remains.
 
+    With a diff baseline, the working tree is tracked as a git tree hash
+    across fixes. Once a review has covered files in full (the initial
+    review, or the shards of a sharded review), verify passes only send
+    files whose current content has not passed review yet, together with
+    the previous findings (see incremental_review).
+
     Args:
         state: Current workflow state (reads max_review_fix_attempts)
         review_output: Initial review feedback to fix
         log_dir: Directory for log files
         phase: Phase identifier for the review (e.g., "final")
         backend: AI backend instance for agent interactions
+        initial_review_complete: True if the initial review saw the full diff
+        initial_shard_verdicts: Per-shard verdicts if the initial review was sharded
 
     Returns:
         ReviewFixResult with pass/fail status and attempt counts.
@@ -387,6 +449,21 @@ def _run_review_fix_loop(
             max_attempts=max_attempts,
         )
 
+    tracker = None
+    if state.diff_baseline_ref:
+        from ingot.workflow.incremental_review import (
+            IncrementalReviewTracker,
+            build_incremental_review_prompt,
+        )
+
+        tracker = IncrementalReviewTracker.start(state.diff_baseline_ref)
+        if tracker is not None:
+            tracker.seed(
+                review_output,
+                complete=initial_review_complete,
+                shard_verdicts=initial_shard_verdicts,
+            )
+
     for attempt in range(1, max_attempts + 1):
         # --- FIX phase ---
         print_step(f"[AUTO-FIX {attempt}/{max_attempts}] Attempting fix for {phase} review...")
@@ -399,7 +476,53 @@ def _run_review_fix_loop(
         # Always verify, even after autofix failure — partial fixes may satisfy the reviewer
         print_step(f"[VERIFY {attempt}/{max_attempts}] Re-reviewing after fix...")
 
-        diff_output, is_truncated, git_error = _get_diff_for_review(state)
+        tree_state = tracker.capture() if tracker is not None else None
+        # Paths covered by this verification, when it is complete enough to cache
+        reviewed_paths: list[str] | None = None
+        # Prompt for an incremental pass; None means a full review
+        incremental_prompt: str | None = None
+        shard_verdicts: list[ShardVerdict] = []
+
+        if tracker is not None and tree_state is not None and tracker.is_seeded:
+            # Incremental pass: only files whose current content has not passed
+            pending = tracker.pending_files(tree_state)
+            if not tree_state.blobs:
+                diff_output, is_truncated, git_error = "", False, False
+            elif not pending:
+                print_success(
+                    f"[VERIFY {attempt}/{max_attempts}] All changed files already passed review"
+                )
+                return ReviewFixResult(
+                    passed=True,
+                    exit_reason=ExitReason.PASSED,
+                    review_output="",
+                    fix_attempts=attempt,
+                    max_attempts=max_attempts,
+                )
+            else:
+                try:
+                    diff_output, is_truncated = tracker.delta_diff(tree_state, pending)
+                    git_error = False
+                except subprocess.CalledProcessError:
+                    diff_output, is_truncated, git_error = "", False, True
+                print_info(
+                    f"Re-reviewing {len(pending)} of {len(tree_state.blobs)} changed file(s)"
+                )
+                reviewed_paths = pending
+                incremental_prompt = build_incremental_review_prompt(
+                    state,
+                    phase,
+                    diff_output,
+                    is_truncated,
+                    pending=pending,
+                    changed_by_fix=tracker.changed_by_fix(tree_state),
+                    unchanged_passed=len(tree_state.blobs) - len(pending),
+                    previous_review=current_feedback,
+                )
+        else:
+            diff_output, is_truncated, git_error = _get_diff_for_review(state)
+            if tree_state is not None and not is_truncated:
+                reviewed_paths = list(tree_state.blobs)
 
         if git_error:
             print_warning("Could not retrieve git diff for verification")
@@ -421,15 +544,23 @@ def _run_review_fix_loop(
                 max_attempts=max_attempts,
             )
 
-        prompt = build_review_prompt(state, phase, diff_output, is_truncated)
-
         try:
-            success, output = backend.run_with_callback(
-                prompt,
-                subagent=state.subagent_names["reviewer"],
-                output_callback=noop_output_callback,
-                dont_save_session=True,
-            )
+            if incremental_prompt is not None:
+                success, output = backend.run_with_callback(
+                    incremental_prompt,
+                    subagent=state.subagent_names["reviewer"],
+                    output_callback=noop_output_callback,
+                    dont_save_session=True,
+                )
+            else:
+                success, output = _run_reviewer(
+                    state,
+                    phase,
+                    diff_output,
+                    is_truncated,
+                    backend,
+                    verdicts_callback=shard_verdicts.extend,
+                )
         except Exception as e:
             print_warning(f"Verification review failed: {e}")
             return ReviewFixResult(
@@ -450,6 +581,14 @@ def _run_review_fix_loop(
                 max_attempts=max_attempts,
             )
 
+        if tree_state is not None and tracker is not None:
+            if reviewed_paths is not None and not is_truncated:
+                tracker.record(tree_state, reviewed_paths, output)
+            elif shard_verdicts:
+                tracker.record_shards(tree_state, shard_verdicts)
+            else:
+                tracker.advance(tree_state)
+
         status = parse_review_status(output)
 
         if status == ReviewStatus.PASS:
@@ -529,16 +668,16 @@ def run_phase_review(
         print_info("No changes to review")
         return (ReviewOutcome.CONTINUE, "")
 
-    # Build prompt
-    prompt = build_review_prompt(state, phase, diff_output, is_truncated)
-
-    # Run review
+    # Run review (sharded across parallel reviewers for large changesets if enabled)
+    shard_verdicts: list[ShardVerdict] = []
     try:
-        success, output = backend.run_with_callback(
-            prompt,
-            subagent=state.subagent_names["reviewer"],
-            output_callback=noop_output_callback,
-            dont_save_session=True,
+        success, output = _run_reviewer(
+            state,
+            phase,
+            diff_output,
+            is_truncated,
+            backend,
+            verdicts_callback=shard_verdicts.extend,
         )
     except Exception as e:
         print_warning(f"Review execution failed: {e}")
@@ -574,7 +713,15 @@ def run_phase_review(
     # Offer auto-fix loop when max_review_fix_attempts > 0
     if state.max_review_fix_attempts > 0:
         if prompt_confirm("Would you like to attempt auto-fix?", default=False):
-            loop_result = _run_review_fix_loop(state, output, log_dir, phase, backend)
+            loop_result = _run_review_fix_loop(
+                state,
+                output,
+                log_dir,
+                phase,
+                backend,
+                initial_review_complete=not is_truncated,
+                initial_shard_verdicts=shard_verdicts,
+            )
             match loop_result.exit_reason:
                 case ExitReason.PASSED:
                     return (ReviewOutcome.CONTINUE, "")
@@ -605,6 +752,7 @@ def run_phase_review(
 
 
 __all__ = [
+    "ISSUES_PATTERN",
     "ExitReason",
     "ReviewFixResult",
     "ReviewOutcome",
@@ -0,0 +1,416 @@
+"""Sharded (map-reduce) code review for large changesets.
+
+A single review prompt only carries the full diff while the change stays
+under the smart-diff limits; past that the reviewer sees a stat summary
+and has to dig through files on its own. Sharded review instead splits
+the baseline diff per file into budget-sized shards (keeping files of the
+same directory together), reviews the shards concurrently with one fresh
+backend per worker, and reduces the per-shard verdicts into a single
+output that follows the usual PASS / NEEDS_ATTENTION / NEEDS_REPLAN
+contract, so callers can parse it with parse_review_status().
+
+The reduce step is deterministic: the most severe shard status wins
+(NEEDS_REPLAN > NEEDS_ATTENTION > PASS) and issues and replan reasons are
+collected under one structured section each, labelled with their shard.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from ingot.integrations.backends.base import AIBackend
+from ingot.integrations.backends.factory import BackendFactory
+from ingot.utils.console import print_info, print_warning
+from ingot.workflow.constants import noop_output_callback
+from ingot.workflow.git_utils import get_smart_diff_from_baseline
+from ingot.workflow.review import (
+    ISSUES_PATTERN,
+    ReviewStatus,
+    build_review_prompt,
+    parse_review_status,
+)
+
+if TYPE_CHECKING:
+    from ingot.workflow.state import WorkflowState
+
+# Per-shard budget, matching the single-review smart diff limits
+DEFAULT_SHARD_MAX_LINES = 2000
+DEFAULT_SHARD_MAX_FILES = 20
+
+# Upper bound on shards per review; also bounds the total diff read
+MAX_REVIEW_SHARDS = 8
+
+_DIFF_HEADER_PATTERN = re.compile(r"^diff --git a/.* b/(.*)$")
+_REPLAN_REASON_PATTERN = re.compile(
+    r"\*\*Replan Reason\*\*\s*:\s*(.*?)(?=\n\n\*\*[A-Z]|\Z)", re.DOTALL
+)
+_NUMBERED_ITEM_PATTERN = re.compile(r"^\s*\d+[.)]\s+(.*)$")
+_STATUS_LINE_PATTERN = re.compile(r"^\*?\*?Status\*?\*?\s*:", re.IGNORECASE)
+
+# Most severe first
+_STATUS_SEVERITY = [ReviewStatus.NEEDS_REPLAN, ReviewStatus.NEEDS_ATTENTION, ReviewStatus.PASS]
+
+
+@dataclass(frozen=True)
+class FileDiff:
+    """The diff section of a single file."""
+
+    path: str
+    text: str
+
+    @property
+    def line_count(self) -> int:
+        return self.text.count("\n")
+
+
+@dataclass
+class ReviewShard:
+    """A budget-sized group of file diffs reviewed by one reviewer agent.
+
+    Attributes:
+        index: 1-based shard number.
+        files: File diffs in this shard, in path order.
+        truncated: True if a file was cut to fit the shard budget.
+    """
+
+    index: int
+    files: list[FileDiff] = field(default_factory=list)
+    truncated: bool = False
+
+    @property
+    def paths(self) -> list[str]:
+        return [f.path for f in self.files]
+
+    @property
+    def line_count(self) -> int:
+        return sum(f.line_count for f in self.files)
+
+    @property
+    def diff(self) -> str:
+        return "".join(f.text for f in self.files)
+
+
+@dataclass
+class ShardVerdict:
+    """Result of reviewing one shard."""
+
+    shard: ReviewShard
+    success: bool
+    output: str
+
+    @property
+    def status(self) -> ReviewStatus:
+        return parse_review_status(self.output)
+
+
+def split_diff_by_file(diff_output: str) -> list[FileDiff]:
+    """Split unified diff output into per-file sections.
+
+    Text before the first "diff --git" header (and trailing markers such
+    as the output-budget note) is attached to the adjacent section.
+    """
+    files: list[FileDiff] = []
+    current_path: str | None = None
+    current: list[str] = []
+    preamble: list[str] = []
+
+    for line in diff_output.splitlines(keepends=True):
+        match = _DIFF_HEADER_PATTERN.match(line.rstrip("\n"))
+        if match:
+            if current_path is not None:
+                files.append(FileDiff(current_path, "".join(current)))
+            current_path = match.group(1)
+            current = [*preamble, line]
+            preamble = []
+        elif current_path is None:
+            preamble.append(line)
+        else:
+            current.append(line)
+
+    if current_path is not None:
+        if current and not current[-1].endswith("\n"):
+            current[-1] += "\n"
+        files.append(FileDiff(current_path, "".join(current)))
+    return files
+
+
+def _truncate_file_diff(file_diff: FileDiff, max_lines: int) -> FileDiff:
+    """Cut a single oversized file diff down to max_lines."""
+    lines = file_diff.text.splitlines(keepends=True)
+    kept = "".join(lines[:max_lines])
+    marker = f"[LARGE FILE DIFF: {file_diff.path} - remaining lines omitted]\n"
+    return FileDiff(file_diff.path, kept + marker)
+
+
+def partition_diff(
+    files: list[FileDiff],
+    *,
+    max_lines: int = DEFAULT_SHARD_MAX_LINES,
+    max_files: int = DEFAULT_SHARD_MAX_FILES,
+) -> list[ReviewShard]:
+    """Pack file diffs into shards of at most max_lines / max_files.
+
+    Files are packed in path order, so files of the same directory end up
+    in the same shard unless the directory alone exceeds the budget. A
+    file larger than max_lines gets a shard of its own and is truncated.
+    """
+    shards: list[ReviewShard] = []
+    current = ReviewShard(index=1)
+
+    for file_diff in sorted(files, key=lambda f: f.path):
+        truncated = False
+        if file_diff.line_count > max_lines:
+            file_diff = _truncate_file_diff(file_diff, max_lines)
+            truncated = True
+
+        if current.files and (
+            current.line_count + file_diff.line_count > max_lines or len(current.files) >= max_files
+        ):
+            shards.append(current)
+            current = ReviewShard(index=len(shards) + 1)
+
+        current.files.append(file_diff)
+        current.truncated = current.truncated or truncated
+
+    if current.files:
+        shards.append(current)
+    return shards
+
+
+def build_shard_review_prompt(
+    state: WorkflowState,
+    phase: str,
+    shard: ReviewShard,
+    shard_count: int,
+) -> str:
+    """Build the reviewer prompt for one shard."""
+    prompt = build_review_prompt(state, phase, shard.diff, shard.truncated)
+    file_list = "\n".join(f"- {path}" for path in shard.paths)
+    return (
+        prompt
+        + f"""
+## Review Scope
+This review is split across {shard_count} reviewers. You are reviewing part \
+{shard.index} of {shard_count}, which covers only these files:
+{file_list}
+
+Other reviewers cover the remaining files. Use codebase-retrieval or
+`git diff -- <file_path>` to check how these changes interact with the rest
+of the codebase, but only report issues in the files above.
+"""
+    )
+
+
+def _shard_label(shard: ReviewShard, shard_count: int) -> str:
+    return f"Shard {shard.index}/{shard_count}"
+
+
+def _extract_issues(output: str) -> list[str]:
+    """Extract issue items from a reviewer's output.
+
+    Falls back to the last non-status lines when the reviewer did not
+    produce a structured **Issues**: section.
+    """
+    match = ISSUES_PATTERN.search(output)
+    if not match:
+        lines = [
+            ln.strip()
+            for ln in output.splitlines()
+            if ln.strip() and not _STATUS_LINE_PATTERN.match(ln.strip())
+        ]
+        return lines[-10:]
+
+    issues: list[str] = []
+    for line in match.group(1).strip().splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        item = _NUMBERED_ITEM_PATTERN.match(stripped)
+        if item:
+            issues.append(item.group(1))
+        elif issues:
+            issues[-1] += f" {stripped}"
+        else:
+            issues.append(stripped)
+    return issues
+
+
+def _extract_replan_reason(output: str) -> str:
+    match = _REPLAN_REASON_PATTERN.search(output)
+    if match:
+        return " ".join(line.strip() for line in match.group(1).strip().splitlines())
+    return "Reviewer recommended re-planning (no reason given)"
+
+
+def merge_shard_verdicts(verdicts: list[ShardVerdict], *, diff_truncated: bool = False) -> str:
+    """Reduce per-shard review outputs into one review output.
+
+    The merged output ends with a canonical **Status** line carrying the
+    most severe shard status. Failed shard executions count as
+    NEEDS_ATTENTION so a partial review never reads as PASS.
+
+    Args:
+        verdicts: One verdict per shard, in shard order.
+        diff_truncated: True if the diff was cut at the sharded review
+            budget, so some files were not reviewed.
+
+    Returns:
+        Review output in the format produced by a single reviewer.
+    """
+    shard_count = len(verdicts)
+    summary: list[str] = []
+    issues: list[str] = []
+    replan_reasons: list[str] = []
+    statuses: set[ReviewStatus] = set()
+
+    for verdict in verdicts:
+        label = _shard_label(verdict.shard, shard_count)
+        paths = ", ".join(verdict.shard.paths)
+        if not verdict.success:
+            statuses.add(ReviewStatus.NEEDS_ATTENTION)
+            summary.append(f"- {label} [REVIEW FAILED]: {paths}")
+            issues.append(f"[{label}] Review did not complete for: {paths}")
+            continue
+
+        status = verdict.status
+        statuses.add(status)
+        summary.append(f"- {label} [{status.value}]: {paths}")
+        if status == ReviewStatus.NEEDS_REPLAN:
+            replan_reasons.append(f"[{label}] {_extract_replan_reason(verdict.output)}")
+        elif status == ReviewStatus.NEEDS_ATTENTION:
+            issues.extend(f"[{label}] {issue}" for issue in _extract_issues(verdict.output))
+
+    if diff_truncated:
+        statuses.add(ReviewStatus.NEEDS_ATTENTION)
+        issues.append(
+            "[TRUNCATED] The changeset exceeded the sharded review budget; "
+            "files past the last shard were not reviewed"
+        )
+
+    final_status = next((s for s in _STATUS_SEVERITY if s in statuses), ReviewStatus.PASS)
+
+    parts = [f"## Sharded Review ({shard_count} shards)\n\n" + "\n".join(summary)]
+    if issues:
+        parts.append(
+            "**Issues**:\n" + "\n".join(f"{i}. {issue}" for i, issue in enumerate(issues, 1))
+        )
+    if replan_reasons:
+        parts.append("**Replan Reason**: " + "\n".join(replan_reasons))
+    parts.append(f"**Status**: {final_status.value}")
+    return "\n\n".join(parts) + "\n"
+
+
+def _review_shard(
+    state: WorkflowState,
+    phase: str,
+    shard: ReviewShard,
+    shard_count: int,
+    backend: AIBackend,
+) -> ShardVerdict:
+    """Review a single shard with a fresh backend (runs in a worker thread)."""
+    prompt = build_shard_review_prompt(state, phase, shard, shard_count)
+    worker_backend = BackendFactory.create(backend.platform, model=backend.model)
+    try:
+        success, output = worker_backend.run_with_callback(
+            prompt,
+            subagent=state.subagent_names["reviewer"],
+            output_callback=noop_output_callback,
+            dont_save_session=True,
+        )
+    except Exception as e:
+        print_warning(f"[{_shard_label(shard, shard_count)}] Review failed: {e}")
+        return ShardVerdict(shard, False, str(e))
+    finally:
+        worker_backend.close()
+    return ShardVerdict(shard, success, output)
+
+
+def run_sharded_review(
+    state: WorkflowState,
+    phase: str,
+    *,
+    backend: AIBackend,
+    max_lines: int = DEFAULT_SHARD_MAX_LINES,
+    max_files: int = DEFAULT_SHARD_MAX_FILES,
+    max_shards: int = MAX_REVIEW_SHARDS,
+    verdicts_callback: Callable[[list[ShardVerdict]], None] | None = None,
+) -> tuple[bool, str] | None:
+    """Review the baseline diff as concurrently reviewed shards.
+
+    Reads up to max_shards * max_lines lines of the full baseline diff,
+    partitions it, and runs one reviewer per shard on up to
+    state.max_parallel_tasks workers. Each worker gets a fresh backend
+    from BackendFactory, like parallel task execution.
+
+    Args:
+        state: Current workflow state (requires diff_baseline_ref).
+        phase: Phase identifier for the review (e.g., "final").
+        backend: Backend whose platform and model the workers use.
+        max_lines: Line budget per shard.
+        max_files: File budget per shard.
+        max_shards: Maximum number of shards.
+        verdicts_callback: Called with the per-shard verdicts before they
+            are merged, e.g. to cache per-file results.
+
+    Returns:
+        (success, merged_output) in the same shape as
+        AIBackend.run_with_callback(), where success is False if any shard
+        failed to execute; or None if the full diff could not be read and
+        the caller should fall back to a single review.
+    """
+    diff_output, diff_truncated, git_error = get_smart_diff_from_baseline(
+        state.diff_baseline_ref,
+        include_working_tree=True,
+        # Never fall back to --stat; the output budget bounds the read instead
+        max_lines=sys.maxsize,
+        max_files=sys.maxsize,
+        max_output_lines=max_lines * max_shards,
+        max_output_chars=None,
+    )
+    files = split_diff_by_file(diff_output) if not git_error else []
+    if not files:
+        return None
+
+    shards = partition_diff(files, max_lines=max_lines, max_files=max_files)
+    if len(shards) > max_shards:
+        diff_truncated = True
+        shards = shards[:max_shards]
+
+    max_workers = max(1, min(state.max_parallel_tasks, len(shards)))
+    print_info(
+        f"Reviewing {len(files)} files in {len(shards)} shards "
+        f"with {max_workers} parallel reviewers"
+    )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        verdicts = list(
+            executor.map(
+                lambda shard: _review_shard(state, phase, shard, len(shards), backend),
+                shards,
+            )
+        )
+
+    if verdicts_callback is not None:
+        verdicts_callback(verdicts)
+    merged = merge_shard_verdicts(verdicts, diff_truncated=diff_truncated)
+    return all(v.success for v in verdicts), merged
+
+
+__all__ = [
+    "DEFAULT_SHARD_MAX_FILES",
+    "DEFAULT_SHARD_MAX_LINES",
+    "MAX_REVIEW_SHARDS",
+    "FileDiff",
+    "ReviewShard",
+    "ShardVerdict",
+    "build_shard_review_prompt",
+    "merge_shard_verdicts",
+    "partition_diff",
+    "run_sharded_review",
+    "split_diff_by_file",
+]
@@ -36,7 +36,11 @@ from ingot.workflow.git_utils import DirtyTreePolicy, restore_to_baseline
 from ingot.workflow.review import ReviewOutcome
 from ingot.workflow.state import RateLimitConfig, WorkflowState
 from ingot.workflow.step1_5_clarification import step_1_5_clarification
-from ingot.workflow.step1_plan import replan_with_feedback, step_1_create_plan
+from ingot.workflow.step1_plan import (
+    SpeculativeResearch,
+    replan_with_feedback,
+    step_1_create_plan,
+)
 from ingot.workflow.step2_tasklist import step_2_create_tasklist
 from ingot.workflow.step3_execute import Step3Result, step_3_execute
 from ingot.workflow.step4_update_docs import Step4Result, step_4_update_docs
@@ -62,6 +66,7 @@ def run_ingot_workflow(
     planning_model: str = "",
     implementation_model: str = "",
     skip_clarification: bool = False,
+    clarification_batch_size: int = 1,
     squash_at_end: bool = True,
     use_tui: bool | None = None,
     verbose: bool = False,
@@ -72,11 +77,18 @@ def run_ingot_workflow(
     max_review_fix_attempts: int = 3,
     rate_limit_config: RateLimitConfig | None = None,
     enable_phase_review: bool = False,
+    enable_sharded_review: bool = False,
     dirty_tree_policy: DirtyTreePolicy = DirtyTreePolicy.FAIL_FAST,
     auto_update_docs: bool = True,
     auto_commit: bool = True,
     enable_plan_validation: bool = True,
     plan_validation_strict: bool = True,
+    plan_candidates: int = 1,
+    plan_candidate_models: list[str] | None = None,
+    prefetch_tasklist: bool = True,
+    research_cache_max_mb: int = 50,
+    enable_code_search: bool = True,
+    speculative_research: bool = True,
 ) -> WorkflowResult:
     """Run the complete spec-driven development workflow.
 
@@ -106,6 +118,7 @@ def run_ingot_workflow(
         planning_model=planning_model or config.settings.default_model,
         implementation_model=implementation_model or config.settings.default_model,
         skip_clarification=skip_clarification,
+        clarification_batch_size=clarification_batch_size,
         squash_at_end=squash_at_end,
         parallel_execution_enabled=parallel_execution_enabled,
         max_parallel_tasks=max_parallel_tasks,
@@ -114,9 +127,16 @@ def run_ingot_workflow(
         max_review_fix_attempts=max_review_fix_attempts,
         rate_limit_config=rate_limit_config or RateLimitConfig(),
         enable_phase_review=enable_phase_review,
+        enable_sharded_review=enable_sharded_review,
         dirty_tree_policy=dirty_tree_policy,
         enable_plan_validation=enable_plan_validation,
         validation_strict=plan_validation_strict,
+        plan_candidates=plan_candidates,
+        plan_candidate_models=plan_candidate_models or [],
+        prefetch_tasklist=prefetch_tasklist,
+        research_cache_max_mb=research_cache_max_mb,
+        enable_code_search=enable_code_search,
+        speculative_research=speculative_research,
         backend_platform=backend.platform,
         backend_model=backend.model or "",
         backend_name=backend.name,
@@ -128,6 +148,7 @@ def run_ingot_workflow(
             "reviewer": config.settings.subagent_reviewer,
             "fixer": config.settings.subagent_fixer,
             "doc_updater": config.settings.subagent_doc_updater,
+            "researcher": config.settings.subagent_researcher,
         },
     )
 
@@ -149,6 +170,11 @@ def run_ingot_workflow(
             print_error("Failed to install INGOT subagent files")
             return WorkflowResult(success=False, error="Failed to install subagent files")
 
+        # The researcher only needs the ticket: start it now so that it works
+        # while the user answers the prompts below, and Step 1 joins it
+        if state.speculative_research and state.current_step <= 1:
+            state.pending_research = SpeculativeResearch.start(state, backend)
+
         # Display ticket information (already fetched via TicketService before workflow)
         print_success(f"Ticket: {display_name}")
         if state.ticket.description:
@@ -179,6 +205,7 @@ def run_ingot_workflow(
                 print_success("Constraints and preferences saved")
 
                 # Fail-Fast Semantic Check: Detect conflicts between ticket and user constraints
+                # (runs alongside any researcher started above)
                 print_step("Checking for conflicts between ticket and your constraints...")
                 conflict_detected, conflict_summary = detect_context_conflict(
                     state.ticket, state.user_constraints, backend
@@ -430,6 +457,11 @@ def workflow_cleanup(
         _offer_cleanup(state, original_branch)
         raise
     finally:
+        for pending in (state.pending_research, state.pending_tasklist):
+            if pending is not None:
+                pending.cancel()
+        state.pending_research = None
+        state.pending_tasklist = None
         if backend is not None:
             backend.close()
 
@@ -27,6 +27,8 @@ from ingot.workflow.constants import (
 from ingot.workflow.git_utils import DirtyTreePolicy
 
 if TYPE_CHECKING:
+    from ingot.workflow.step1_plan import SpeculativeResearch
+    from ingot.workflow.step2_tasklist import TasklistPrefetch
     from ingot.workflow.task_memory import TaskMemory
 
 
@@ -82,6 +84,8 @@ class WorkflowState:
 
     # Workflow options
     skip_clarification: bool = False
+    # Clarification questions generated per call in Step 1.5 (1 = one at a time)
+    clarification_batch_size: int = 1
     squash_at_end: bool = True
     fail_fast: bool = False  # Stop execution on first task failure
     max_self_corrections: int = 3  # Max self-correction attempts per task (0 = disable)
@@ -121,14 +125,36 @@ class WorkflowState:
 
     # Review configuration
     enable_phase_review: bool = False  # Enable phase reviews after task execution
+    # Review large changesets as concurrent per-file shards instead of a stat summary
+    enable_sharded_review: bool = False
+
+    # Size bound of the researcher output cache in MB (0 = disabled)
+    research_cache_max_mb: int = 50
+    # Use the local code search and symbol indexes to seed prompts and check plans
+    enable_code_search: bool = True
+    # Start the researcher while the user is still answering setup prompts
+    speculative_research: bool = True
+    # Researcher run started by the runner before Step 1 (joined by Step 1)
+    pending_research: "SpeculativeResearch | None" = field(default=None, repr=False, compare=False)
 
     # Plan validation
     enable_plan_validation: bool = True
     validation_strict: bool = True  # Block workflow on validation errors (vs. warn-and-proceed)
+    # Generate the task list in the background while the user reviews the plan
+    # (off unless the runner enables it, so Step 1 alone never starts Step 2 work)
+    prefetch_tasklist: bool = False
+    # Task list generation started during plan review (joined by Step 2)
+    pending_tasklist: "TasklistPrefetch | None" = field(default=None, repr=False, compare=False)
+    # Plans generated concurrently on first generation, best validated one kept (1 = off)
+    plan_candidates: int = 1
+    # Models assigned to the candidates in turn (empty = backend default)
+    plan_candidate_models: list[str] = field(default_factory=list)
 
     # Re-planning state
     replan_count: int = 0  # Number of execution replans (Step 3 post-review)
     plan_revision_count: int = 0  # Number of plan revisions (Step 1 regenerations)
+    # Validation rounds fully resolved by PlanFixer (AI fix attempts not needed)
+    plan_ai_fixes_avoided: int = 0
     max_replans: int = 2  # Maximum replan attempts (prevents infinite loops)
 
     # Snapshot of untracked files before step 3 execution, used by
@@ -174,6 +200,12 @@ class WorkflowState:
             raise ValueError(f"max_self_corrections must be 0-10, got {self.max_self_corrections}")
         if self.max_replans < 0 or self.max_replans > 5:
             raise ValueError(f"max_replans must be 0-5, got {self.max_replans}")
+        if self.clarification_batch_size < 1 or self.clarification_batch_size > 10:
+            raise ValueError(
+                f"clarification_batch_size must be 1-10, got {self.clarification_batch_size}"
+            )
+        if self.plan_candidates < 1 or self.plan_candidates > 5:
+            raise ValueError(f"plan_candidates must be 1-5, got {self.plan_candidates}")
         if self.session_reset_interval < 1 or self.session_reset_interval > 100:
             raise ValueError(
                 f"session_reset_interval must be 1-100, got {self.session_reset_interval}"
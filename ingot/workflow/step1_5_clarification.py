@@ -1,10 +1,17 @@
 """Step 1.5: Interactive Clarification Phase.
 
-This module implements an interactive Q&A loop where the AI asks one
-clarification question at a time about the plan, the user answers,
-and then the plan is rewritten to incorporate all collected clarifications.
+This module implements an interactive Q&A loop where the AI asks
+clarification questions about the plan, the user answers, and then the
+plan is rewritten to incorporate all collected clarifications.
+
+Questions are asked one at a time, or, with a clarification batch size
+above one, as a ranked batch generated in one call. While the user
+answers a full batch, the next batch is generated in the background.
 """
 
+import copy
+import re
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -20,6 +27,7 @@ from ingot.utils.console import (
 )
 from ingot.utils.errors import UserCancelledError
 from ingot.utils.logging import log_message
+from ingot.workflow.background_run import BackgroundRun
 from ingot.workflow.constants import noop_output_callback
 from ingot.workflow.state import WorkflowState
 from ingot.workflow.step1_plan import _display_plan_summary
@@ -32,6 +40,10 @@ MAX_CLARIFICATION_ROUNDS = 10
 NO_MORE_QUESTIONS = "NO_MORE_QUESTIONS"
 _MAX_CONFLICT_SUMMARY_LENGTH = 500
 _MIN_PLAN_LENGTH_RATIO = 0.5  # Safety check: rewritten plan must be >= 50% of original
+_EXIT_COMMANDS = {"done", "exit", "skip", "quit"}
+
+# Numbered or bulleted line starting a question in a batch ("1. ...", "2) ...", "- ...")
+_QUESTION_ITEM_RE = re.compile(r"^(?:\d+[.)]|[-*])\s+")
 
 
 # =============================================================================
@@ -86,18 +98,27 @@ def step_1_5_clarification(state: WorkflowState, backend: AIBackend) -> bool:
         print_info("Skipping clarification phase.")
         return True
 
+    batched = state.clarification_batch_size > 1
+
     # Print instructions
     print_step("Starting interactive clarification phase...")
     console.print()
     print_info("INSTRUCTIONS:")
-    print_info("  - The AI will ask one question at a time")
-    print_info("  - Answer each question when prompted")
+    if batched:
+        print_info("  - The AI will ask a batch of questions, most important first")
+        print_info("  - Answer each question when prompted (leave empty to skip it)")
+    else:
+        print_info("  - The AI will ask one question at a time")
+        print_info("  - Answer each question when prompted")
     print_info("  - Type 'done', 'skip', 'exit', or 'quit' to stop early")
     print_info("  - Press Ctrl+C to cancel at any time")
     console.print()
 
     # Run interactive Q&A loop
-    qa_pairs = _run_interactive_qa_loop(state, backend, plan_path)
+    if batched:
+        qa_pairs = _run_batched_qa_loop(state, backend, plan_path)
+    else:
+        qa_pairs = _run_interactive_qa_loop(state, backend, plan_path)
 
     if not qa_pairs:
         print_info("No clarifications collected.")
@@ -179,7 +200,7 @@ def _run_interactive_qa_loop(
             break
 
         # Check for exit commands
-        if answer.strip().lower() in {"done", "exit", "skip", "quit"}:
+        if answer.strip().lower() in _EXIT_COMMANDS:
             print_info("Stopping clarification loop.")
             break
 
@@ -199,6 +220,214 @@ def _run_interactive_qa_loop(
     return qa_pairs
 
 
+# =============================================================================
+# Batched Q&A Loop
+# =============================================================================
+
+
+class _NextQuestionBatch(BackgroundRun):
+    """Next batch of questions, generated while the user answers the current one.
+
+    The prompt lists the questions still being answered, so the new batch
+    neither repeats them nor depends on their answers; that is what makes
+    it safe to generate before the answers are in.
+    """
+
+    thread_name = "ingot-clarification"
+    label = "Step 1.5: Background question batch"
+
+    def __init__(
+        self,
+        state: WorkflowState,
+        backend: AIBackend,
+        plan_path: Path,
+        previous_qa: list[ClarificationQA],
+        pending: list[str],
+        batch_size: int,
+    ) -> None:
+        super().__init__()
+        self._state = copy.copy(state)
+        self._backend = backend
+        self._plan_path = plan_path
+        self._previous_qa = list(previous_qa)
+        self._pending = list(pending)
+        self._batch_size = batch_size
+        self._result: list[str] | None = None
+
+    @classmethod
+    def start(
+        cls,
+        state: WorkflowState,
+        backend: AIBackend,
+        plan_path: Path,
+        previous_qa: list[ClarificationQA],
+        pending: list[str],
+        batch_size: int,
+    ) -> "_NextQuestionBatch | None":
+        """Start generating the next batch, or return None if the backend cannot run it now.
+
+        Backends that do not support concurrent invocations are not
+        started, since the plan rewrite may call them while this runs.
+        """
+        if not backend.supports_parallel:
+            return None
+        batch = cls(state, backend, plan_path, previous_qa, pending, batch_size)
+        batch._start()
+        log_message("Step 1.5: Generating next question batch in the background")
+        return batch
+
+    def _work(self) -> None:
+        self._result = _request_question_batch(
+            self._state,
+            self._backend,
+            self._plan_path,
+            self._previous_qa,
+            self._batch_size,
+            pending=self._pending,
+            output_callback=self._handle_output_line,
+        )
+
+    def join(self) -> list[str] | None:
+        """Wait for the batch; None if generating it failed."""
+        if not self.done:
+            print_step("Waiting for the next questions...")
+            self._done.wait()
+        return None if self.cancelled else self._result
+
+
+def _run_batched_qa_loop(
+    state: WorkflowState,
+    backend: AIBackend,
+    plan_path: Path,
+) -> list[ClarificationQA]:
+    """Run the Q&A loop in batches of ranked questions generated in one call each.
+
+    A batch that comes back full suggests open issues remain, so the next
+    batch is generated in the background while the user answers it; a
+    short batch ends the loop. At most MAX_CLARIFICATION_ROUNDS questions
+    are asked in total.
+
+    Returns list of ClarificationQA pairs collected.
+    """
+    qa_pairs: list[ClarificationQA] = []
+    asked: list[str] = []
+    batch_size = min(state.clarification_batch_size, MAX_CLARIFICATION_ROUNDS)
+
+    log_message("Step 1.5: Requesting question batch 1")
+    questions = _request_question_batch(state, backend, plan_path, qa_pairs, batch_size)
+
+    while True:
+        if questions is None:
+            print_warning("AI backend failed to generate questions. Stopping Q&A loop.")
+            break
+        questions = [q for q in questions if q not in asked]
+        if not questions:
+            print_info("AI has no more clarification questions.")
+            break
+
+        # A short batch means the AI asked everything it had
+        more_expected = len(questions) >= batch_size
+        remaining = MAX_CLARIFICATION_ROUNDS - len(asked) - len(questions)
+        batch_size = min(state.clarification_batch_size, remaining)
+        next_batch: _NextQuestionBatch | None = None
+        if more_expected and batch_size > 0:
+            next_batch = _NextQuestionBatch.start(
+                state, backend, plan_path, qa_pairs, asked + questions, batch_size
+            )
+
+        stopped = _answer_question_batch(questions, len(asked), qa_pairs)
+        asked.extend(questions)
+
+        if (
+            stopped
+            or not more_expected
+            or batch_size <= 0
+            or not prompt_confirm("Continue with more questions?", default=True)
+        ):
+            if next_batch is not None:
+                next_batch.cancel()
+            break
+
+        if next_batch is not None:
+            questions = next_batch.join()
+        else:
+            log_message(f"Step 1.5: Requesting question batch after {len(asked)} question(s)")
+            questions = _request_question_batch(
+                state, backend, plan_path, qa_pairs, batch_size, pending=asked
+            )
+
+    return qa_pairs
+
+
+def _answer_question_batch(
+    questions: list[str],
+    offset: int,
+    qa_pairs: list[ClarificationQA],
+) -> bool:
+    """Show a batch of questions and collect answers into qa_pairs.
+
+    Returns True if the user stopped the clarification phase.
+    """
+    console.print()
+    for i, question in enumerate(questions, offset + 1):
+        console.print(f"[bold cyan]Question {i}:[/bold cyan] {question}")
+
+    for i, question in enumerate(questions, offset + 1):
+        console.print()
+        try:
+            answer = prompt_input(f"Your answer to question {i}:")
+        except UserCancelledError:
+            print_info("\nClarification cancelled by user.")
+            return True
+
+        if answer.strip().lower() in _EXIT_COMMANDS:
+            print_info("Stopping clarification loop.")
+            return True
+
+        if not answer.strip():
+            print_info("Empty answer, skipping this question.")
+            continue
+
+        qa_pairs.append(ClarificationQA(question=question, answer=answer.strip()))
+        log_message(f"Step 1.5: Collected Q&A pair {len(qa_pairs)}")
+
+    return False
+
+
+def _request_question_batch(
+    state: WorkflowState,
+    backend: AIBackend,
+    plan_path: Path,
+    previous_qa: list[ClarificationQA],
+    batch_size: int,
+    *,
+    pending: list[str] | None = None,
+    output_callback: Callable[[str], None] = noop_output_callback,
+) -> list[str] | None:
+    """Ask the backend for a ranked batch of questions.
+
+    Returns the questions (empty if the AI has none), or None if the
+    backend call failed.
+    """
+    prompt = _build_question_batch_prompt(
+        plan_path=plan_path,
+        state=state,
+        previous_qa=previous_qa,
+        pending=pending or [],
+        batch_size=batch_size,
+    )
+    success, output = backend.run_with_callback(
+        prompt,
+        subagent=state.subagent_names["planner"],
+        output_callback=output_callback,
+        dont_save_session=True,
+    )
+    if not success:
+        log_message("Step 1.5: Backend failed to generate a question batch")
+        return None
+    return _extract_questions(output)[:batch_size]
+
+
 # =============================================================================
 # Plan Rewrite
 # =============================================================================
@@ -272,32 +501,9 @@ def _build_single_question_prompt(
     round_num: int,
 ) -> str:
     """Build prompt for generating a single clarification question."""
-    # Build conflict context (only for the first round)
-    conflict_context = ""
-    if round_num == 1 and state.conflict_detected and state.conflict_summary:
-        sanitized_summary = state.conflict_summary[:_MAX_CONFLICT_SUMMARY_LENGTH]
-        if len(state.conflict_summary) > _MAX_CONFLICT_SUMMARY_LENGTH:
-            sanitized_summary += "..."
-        conflict_context = f"""
-IMPORTANT: A conflict was detected between the ticket description and the user's constraints & preferences:
-"{sanitized_summary}"
-
-Your FIRST question should address this specific conflict to help resolve the ambiguity.
-
-"""
-
-    # Build previous Q&A context
-    qa_context = ""
-    if previous_qa:
-        qa_lines = []
-        for i, qa in enumerate(previous_qa, 1):
-            qa_lines.append(f"Q{i}: {qa.question}")
-            qa_lines.append(f"A{i}: {qa.answer}")
-            qa_lines.append("")
-        qa_context = f"""
-Previously asked questions and answers:
-{"\n".join(qa_lines)}
-"""
+    # Conflict context only for the first round
+    conflict_context = _build_conflict_context(state) if round_num == 1 else ""
+    qa_context = _build_previous_qa_context(previous_qa)
 
     return f"""You are reviewing an implementation plan and asking clarification questions ONE AT A TIME.
 
@@ -319,6 +525,80 @@ IMPORTANT RULES:
 - Output ONLY the question text (no numbering, no prefix, no explanation)"""
 
 
+def _build_question_batch_prompt(
+    plan_path: Path,
+    state: WorkflowState,
+    previous_qa: list[ClarificationQA],
+    pending: list[str],
+    batch_size: int,
+) -> str:
+    """Build prompt for generating a ranked batch of clarification questions."""
+    # Conflict context only for the first batch
+    conflict_context = "" if previous_qa or pending else _build_conflict_context(state)
+    qa_context = _build_previous_qa_context(previous_qa)
+
+    pending_context = ""
+    if pending:
+        pending_lines = "\n".join(f"- {question}" for question in pending)
+        pending_context = f"""
+These questions have already been asked (answers pending or skipped). Do NOT repeat them,
+and do NOT ask anything whose relevance depends on their answers:
+{pending_lines}
+"""
+
+    return f"""You are reviewing an implementation plan and asking a batch of clarification questions.
+
+Implementation plan file: {plan_path}
+Read the plan file before asking your questions.
+
+{conflict_context}{qa_context}{pending_context}
+Ask up to {batch_size} clarification questions about ambiguous or unclear aspects of the plan:
+- Requirements that could be interpreted multiple ways
+- Missing technical details needed for implementation
+- Unclear dependencies or integration points
+- Edge cases or error scenarios not covered
+- Performance, security, or scalability considerations
+
+IMPORTANT RULES:
+- Rank the questions by how much their answers would change the plan, most important first
+- Each question must be answerable on its own, without the answers to the others
+- Do NOT repeat any previously asked question
+- Ask fewer questions rather than padding the list with minor ones
+- If the plan is already clear and comprehensive, or you have no more questions, respond with EXACTLY: {NO_MORE_QUESTIONS}
+- Output ONLY a numbered list, one question per item (e.g. "1. ..."), with no other text"""
+
+
+def _build_conflict_context(state: WorkflowState) -> str:
+    """Describe the detected ticket/constraints conflict for the first question."""
+    if not (state.conflict_detected and state.conflict_summary):
+        return ""
+    sanitized_summary = state.conflict_summary[:_MAX_CONFLICT_SUMMARY_LENGTH]
+    if len(state.conflict_summary) > _MAX_CONFLICT_SUMMARY_LENGTH:
+        sanitized_summary += "..."
+    return f"""
+IMPORTANT: A conflict was detected between the ticket description and the user's constraints & preferences:
+"{sanitized_summary}"
+
+Your FIRST question should address this specific conflict to help resolve the ambiguity.
+
+"""
+
+
+def _build_previous_qa_context(previous_qa: list[ClarificationQA]) -> str:
+    """List the questions answered so far."""
+    if not previous_qa:
+        return ""
+    qa_lines = []
+    for i, qa in enumerate(previous_qa, 1):
+        qa_lines.append(f"Q{i}: {qa.question}")
+        qa_lines.append(f"A{i}: {qa.answer}")
+        qa_lines.append("")
+    return f"""
+Previously asked questions and answers:
+{"\n".join(qa_lines)}
+"""
+
+
 def _build_rewrite_prompt(
     plan_path: Path,
     qa_pairs: list[ClarificationQA],
@@ -377,6 +657,34 @@ def _extract_question(output: str | None) -> str | None:
     return " ".join(lines)
 
 
+def _extract_questions(output: str | None) -> list[str]:
+    """Extract a ranked batch of questions from AI output.
+
+    Numbered or bulleted lines start questions and other lines continue
+    the current one; text before the first item is dropped. Output with
+    no list at all is read as a single question. Returns [] if the AI
+    signaled no more questions.
+    """
+    if not output or NO_MORE_QUESTIONS in output:
+        return []
+
+    questions: list[list[str]] = []
+    for raw_line in output.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+        item = _QUESTION_ITEM_RE.match(line)
+        if item:
+            questions.append([line[item.end() :]])
+        elif questions:
+            questions[-1].append(line)
+
+    if not questions:
+        question = _extract_question(output)
+        return [question] if question else []
+    return [" ".join(parts) for parts in questions if " ".join(parts).strip()]
+
+
 def _append_clarifications_log(plan_path: Path, qa_pairs: list[ClarificationQA]) -> None:
     """Append a Clarifications Log section to the plan file."""
     content = plan_path.read_text()
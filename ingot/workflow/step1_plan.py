@@ -4,15 +4,25 @@ This module implements the first step of the workflow - creating
 an implementation plan based on the Jira ticket.
 """
 
+import copy
 import os
 import re
 import shlex
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 from ingot.integrations.backends.base import AIBackend
-from ingot.integrations.git import find_repo_root
+from ingot.integrations.backends.factory import BackendFactory
+from ingot.integrations.git import (
+    find_repo_root,
+    get_head_tree,
+    get_object_reader,
+    get_repo_index,
+)
 from ingot.ui.menus import ReviewChoice, show_plan_review_menu
 from ingot.ui.prompts import prompt_enter, prompt_input
 from ingot.utils.console import (
@@ -25,9 +35,21 @@ from ingot.utils.console import (
     print_warning,
 )
 from ingot.utils.logging import log_message
-from ingot.validation.base import ValidationContext, ValidationReport, ValidationSeverity
+from ingot.utils.token_budget import TokenBudget, TokenEstimator
+from ingot.validation.base import (
+    SectionFindingCache,
+    ValidationContext,
+    ValidationReport,
+    ValidationSeverity,
+)
 from ingot.validation.plan_fixer import PlanFixer
 from ingot.validation.plan_validators import FileExistsValidator, create_plan_validator_registry
+from ingot.workflow.background_run import BackgroundRun, RunCancelled
+from ingot.workflow.code_search import (
+    format_search_hits,
+    load_code_search_index,
+    query_terms_for,
+)
 from ingot.workflow.constants import (
     MAX_GENERATION_RETRIES,
     MAX_REVIEW_ITERATIONS,
@@ -35,7 +57,14 @@ from ingot.workflow.constants import (
     noop_output_callback,
 )
 from ingot.workflow.events import format_run_directory
+from ingot.workflow.research_cache import ResearchCache, ResearchCacheHit, ResearchKey
 from ingot.workflow.state import WorkflowState
+from ingot.workflow.step2_tasklist import TasklistPrefetch
+from ingot.workflow.symbol_index import (
+    SymbolIndex,
+    format_symbol_definitions,
+    get_symbol_index,
+)
 
 # Robust ANSI/terminal escape sequence patterns (ECMA-48 compliant).
 # Matches:
@@ -60,12 +89,9 @@ _THINKING_BLOCK_RE = re.compile(
     re.DOTALL | re.IGNORECASE,
 )
 
-# Maximum character limits for replan prompt sections to keep prompt size reasonable.
-_REPLAN_PLAN_EXCERPT_LIMIT = 4000
-_REPLAN_FEEDBACK_EXCERPT_LIMIT = 3000
-
-# Character limit for the existing-plan excerpt in AI-fix prompts.
-_FIX_PLAN_EXCERPT_LIMIT = 8000
+# Plan validators run concurrently; the file check overlaps its git and
+# filesystem I/O with the text-only validators.
+_PLAN_VALIDATION_WORKERS = 4
 
 # Source-label constants used in prompts to tag data provenance.
 _SOURCE_VERIFIED = "[SOURCE: VERIFIED PLATFORM DATA]"
@@ -75,8 +101,13 @@ _UNVERIFIED_NOTE = (
     'Do NOT reference "the ticket" as a source of requirements.'
 )
 
-# Researcher context truncation settings
-_RESEARCHER_CONTEXT_BUDGET = 12000  # chars (~3000 tokens)
+# Files from the local code search index listed in the researcher prompt
+_CODE_SEARCH_SEED_FILES = 8
+
+# Symbols from the local symbol index cited in the planner prompt
+_SYMBOL_DEFINITIONS_LIMIT = 30
+# Inline code naming a symbol in researcher output: `name`, `Class.method()`
+_SYMBOL_SPAN_RE = re.compile(r"`([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)(?:\([^`\n]*\))?`")
 
 # Section priority order for truncation (highest priority first)
 _SECTION_PRIORITY = RESEARCHER_SECTION_HEADINGS
@@ -117,6 +148,7 @@ def _generate_plan_with_tui(
     plan_path: Path,
     backend: AIBackend,
     researcher_context: str = "",
+    symbol_index: SymbolIndex | None = None,
 ) -> tuple[bool, str]:
     """Generate plan with TUI progress display using subagent.
 
@@ -125,6 +157,7 @@ def _generate_plan_with_tui(
         plan_path: Path where the plan should be saved.
         backend: AI backend for agent calls.
         researcher_context: Optional researcher output to inject into the prompt.
+        symbol_index: Symbol index of this Step 1 run, used to cite definitions.
 
     Returns:
         Tuple of (success, captured_output).
@@ -153,6 +186,7 @@ def _generate_plan_with_tui(
         plan_path,
         plan_mode=use_plan_mode,
         researcher_context=researcher_context,
+        symbol_index=symbol_index,
     )
 
     def _work() -> tuple[bool, str]:
@@ -175,12 +209,165 @@ def _generate_plan_with_tui(
     return success, output
 
 
+@dataclass
+class _PlanCandidate:
+    """One of several plans generated concurrently, with its validation report."""
+
+    number: int
+    model: str
+    content: str = ""
+    report: ValidationReport | None = None
+
+    @property
+    def score(self) -> tuple[float, float, int]:
+        """Sort key: fewest errors, then fewest warnings, then earliest candidate."""
+        if self.report is None:
+            return (float("inf"), float("inf"), self.number)
+        return (self.report.error_count, self.report.warning_count, self.number)
+
+    @property
+    def label(self) -> str:
+        return f"candidate {self.number} ({self.model or 'default model'})"
+
+
+def _use_plan_candidates(state: WorkflowState, backend: AIBackend) -> bool:
+    """Whether the first plan is generated as several concurrent candidates."""
+    if state.plan_candidates <= 1 or not state.enable_plan_validation:
+        return False
+    if not backend.supports_parallel:
+        log_message(f"{backend.name} does not support parallel runs; generating a single plan")
+        return False
+    return True
+
+
+def _generate_plan_candidates(
+    state: WorkflowState,
+    plan_path: Path,
+    backend: AIBackend,
+    researcher_context: str = "",
+    section_cache: SectionFindingCache | None = None,
+    symbol_index: SymbolIndex | None = None,
+) -> bool:
+    """Generate state.plan_candidates plans concurrently and keep the best one.
+
+    Each candidate runs on a fresh backend (with the next model from
+    state.plan_candidate_models, if any), writes to its own file and is
+    validated as soon as it finishes. The candidate with the fewest
+    validation errors, then warnings, is saved to plan_path. All
+    candidates share symbol_index, the index of this Step 1 run.
+
+    Returns:
+        True if a plan was saved, False if every candidate failed or the
+        user cancelled.
+    """
+    # Lazy imports: see _generate_plan_with_tui
+    from ingot.ui.inline_runner import InlineRunner
+    from ingot.ui.log_buffer import TaskLogBuffer
+
+    count = state.plan_candidates
+    models = state.plan_candidate_models
+    use_plan_mode = backend.supports_plan_mode
+    log_dir = _create_plan_log_dir(state.ticket.safe_filename_stem)
+    run_name = format_run_directory()
+    stop = threading.Event()
+
+    ui = InlineRunner(
+        status_message=f"Generating {count} implementation plan candidates...",
+        ticket_id=state.ticket.id,
+    )
+
+    def _generate(number: int) -> _PlanCandidate:
+        candidate = _PlanCandidate(number, models[(number - 1) % len(models)] if models else "")
+        candidate_path = plan_path.with_name(f"{plan_path.stem}.candidate-{number}.md")
+        candidate_path.unlink(missing_ok=True)
+        prompt = _build_minimal_prompt(
+            state,
+            candidate_path,
+            plan_mode=use_plan_mode,
+            researcher_context=researcher_context,
+            symbol_index=symbol_index,
+        )
+        worker_backend = BackendFactory.create(
+            backend.platform, model=candidate.model or backend.model
+        )
+        try:
+            with TaskLogBuffer(log_dir / f"{run_name}-candidate-{number}.log") as log_buffer:
+
+                def _output_callback(line: str) -> None:
+                    if stop.is_set():
+                        raise RunCancelled
+                    log_buffer.write(line)
+                    ui.handle_output_line(line)
+
+                success, output = worker_backend.run_with_callback(
+                    prompt,
+                    subagent=state.subagent_names["planner"],
+                    output_callback=_output_callback,
+                    model=candidate.model or None,
+                    dont_save_session=True,
+                    plan_mode=use_plan_mode,
+                )
+        except RunCancelled:
+            return candidate
+        except Exception as e:
+            log_message(f"Plan {candidate.label} failed: {e}")
+            return candidate
+        finally:
+            worker_backend.close()
+
+        if candidate_path.exists():
+            candidate.content = candidate_path.read_text()
+            candidate_path.unlink()
+        elif success and output.strip():
+            candidate.content = _extract_plan_markdown(output)
+        if not success or not candidate.content.strip():
+            log_message(f"Plan {candidate.label} produced no plan")
+            candidate.content = ""
+            return candidate
+        candidate.report = _validate_plan(
+            candidate.content,
+            state,
+            researcher_output=researcher_context,
+            section_cache=section_cache,
+            symbol_index=symbol_index,
+        )
+        log_message(
+            f"Plan {candidate.label}: {candidate.report.error_count} error(s), "
+            f"{candidate.report.warning_count} warning(s)"
+        )
+        return candidate
+
+    def _work() -> list[_PlanCandidate]:
+        with ThreadPoolExecutor(max_workers=count, thread_name_prefix="ingot-plan") as executor:
+            return list(executor.map(_generate, range(1, count + 1)))
+
+    candidates = ui.run_with_work(_work)
+    if ui.check_quit_requested():
+        stop.set()
+        print_warning("Plan generation cancelled by user.")
+        return False
+
+    best = min(candidates, key=lambda candidate: candidate.score)
+    if best.report is None:
+        ui.print_summary(False)
+        return False
+    ui.print_summary(True)
+
+    plan_path.write_text(best.content)
+    print_info(
+        f"Selected plan {best.label}: {best.report.error_count} error(s), "
+        f"{best.report.warning_count} warning(s)"
+    )
+    return True
+
+
 def _build_minimal_prompt(
     state: WorkflowState,
     plan_path: Path,
     *,
     plan_mode: bool = False,
     researcher_context: str = "",
+    symbol_index: SymbolIndex | None = None,
 ) -> str:
     """Build minimal prompt for plan generation.
 
@@ -192,8 +379,11 @@ def _build_minimal_prompt(
         plan_mode: If True, instruct the AI to output the plan to stdout
             instead of writing a file (for read-only backends).
         researcher_context: Optional researcher output to inject into the prompt.
+        symbol_index: Optional symbol index; definitions of the symbols the
+            research names are cited from it.
     """
     source_label = _SOURCE_VERIFIED if state.spec_verified else _SOURCE_UNVERIFIED
+    budget = TokenBudget.for_platform(state.backend_platform)
 
     prompt = f"""Create implementation plan for: {state.ticket.id}
 
@@ -213,7 +403,11 @@ Description: {state.ticket.description or "Not available"}"""
 
     # Inject researcher context if provided
     if researcher_context:
-        trimmed = _truncate_researcher_context(researcher_context)
+        budget.reserve("instructions", prompt)
+        trimmed = _truncate_researcher_context(
+            researcher_context, budget.allowance("research"), budget.estimator
+        )
+        budget.reserve("research", trimmed)
         prompt += f"""
 
 [SOURCE: CODEBASE DISCOVERY (from automated research)]
@@ -222,6 +416,14 @@ primary source of truth for file paths, code patterns, and call sites. Do NOT
 re-search for information already provided here.
 
 {trimmed}"""
+        definitions = _build_symbol_definitions(symbol_index, trimmed)
+        if definitions:
+            prompt += f"""
+
+[SOURCE: SYMBOL INDEX (exact definitions from a local index of the repository)]
+Cite these locations for the symbols named above instead of searching for them.
+
+{definitions}"""
     else:
         prompt += """
 
@@ -266,19 +468,13 @@ def _build_fix_prompt(
         validation_feedback: Formatted validation errors/warnings.
         plan_mode: If True, instruct AI to output to stdout instead of writing a file.
     """
-    if len(existing_plan) <= _FIX_PLAN_EXCERPT_LIMIT:
-        plan_excerpt = existing_plan
-    else:
-        # Keep both the beginning and end of the plan so the AI sees
-        # the overall structure *and* trailing sections (which are
-        # often the ones flagged as missing by validators).
-        head_budget = _FIX_PLAN_EXCERPT_LIMIT * 2 // 3
-        tail_budget = _FIX_PLAN_EXCERPT_LIMIT - head_budget
-        plan_excerpt = (
-            existing_plan[:head_budget]
-            + "\n\n... [middle truncated] ...\n\n"
-            + existing_plan[-tail_budget:]
-        )
+    budget = TokenBudget.for_platform(state.backend_platform)
+    # Keep both the beginning and end of the plan so the AI sees
+    # the overall structure *and* trailing sections (which are
+    # often the ones flagged as missing by validators).
+    plan_excerpt = budget.fit(
+        "plan", existing_plan, keep="ends", marker="\n\n... [middle truncated] ...\n\n"
+    )
 
     ticket_source_label = _SOURCE_VERIFIED if state.spec_verified else _SOURCE_UNVERIFIED
 
@@ -375,23 +571,35 @@ def _fix_plan_with_ai(
 # =============================================================================
 
 
-def _run_researcher(
-    state: WorkflowState,
-    backend: AIBackend,
-) -> tuple[bool, str]:
-    """Run the researcher agent to discover codebase context.
+@dataclass
+class _ResearchRequest:
+    """A researcher run ready to start, or its cached result.
 
-    Returns (success, researcher_output_markdown).
+    Attributes:
+        prompt: Prompt for the researcher agent.
+        status_message: Progress message shown while it runs.
+        cache: Research cache to store the output in, if caching is on.
+        key: Cache key of this run.
+        cached_output: Output cached for this exact tree, if any.
     """
-    # Lazy import: startup-perf optimization, NOT circular-dep workaround —
-    # InlineRunner only imports from ingot.ui.log_buffer and ingot.utils.console
-    from ingot.ui.inline_runner import InlineRunner
 
-    researcher_name = state.subagent_names.get("researcher")
-    if not researcher_name:
-        log_message("No researcher agent configured, skipping discovery phase")
-        return False, ""
+    prompt: str
+    status_message: str
+    cache: ResearchCache | None = None
+    key: ResearchKey | None = None
+    cached_output: str | None = None
+
+    def store(self, output: str) -> None:
+        """Cache researcher output produced for this request."""
+        if output.strip() and self.cache is not None and self.key is not None:
+            self.cache.store(self.key, output)
 
+
+def _prepare_research(state: WorkflowState, researcher_name: str) -> _ResearchRequest:
+    """Build the researcher prompt, reusing or refreshing cached research.
+
+    Prints nothing, so that it can run in a background thread.
+    """
     source_label = _SOURCE_VERIFIED if state.spec_verified else _SOURCE_UNVERIFIED
 
     prompt = f"""Research the codebase for: {state.ticket.id}
@@ -406,14 +614,61 @@ Description: {state.ticket.description or "Not available"}"""
 [SOURCE: USER-PROVIDED CONSTRAINTS & PREFERENCES]
 {state.user_constraints}"""
 
+    cache, cache_key = _open_research_cache(state, researcher_name)
+    hit = cache.lookup(cache_key) if cache is not None and cache_key is not None else None
+    status_message = "Researching codebase..."
+    if hit is not None and hit.is_exact:
+        log_message(f"Research cache hit for tree {hit.tree[:12]}")
+        return _ResearchRequest(prompt, status_message, cache, cache_key, hit.output)
+    if hit is not None:
+        log_message(
+            f"Research cache refresh: {len(hit.changed_paths)} file(s) changed since "
+            f"tree {hit.tree[:12]}"
+        )
+        prompt = _build_research_refresh_prompt(prompt, hit)
+        status_message = "Refreshing cached codebase research..."
+    elif state.enable_code_search:
+        seed = _build_code_search_seed(state)
+        if seed:
+            prompt += f"""
+
+[SOURCE: LOCAL CODE SEARCH (lexical matches for ticket keywords; verify before citing)]
+Start your exploration from these files:
+{seed}"""
+
+    return _ResearchRequest(prompt, status_message, cache, cache_key)
+
+
+def _run_researcher(
+    state: WorkflowState,
+    backend: AIBackend,
+) -> tuple[bool, str]:
+    """Run the researcher agent to discover codebase context.
+
+    Returns (success, researcher_output_markdown).
+    """
+    # Lazy import: startup-perf optimization, NOT circular-dep workaround —
+    # InlineRunner only imports from ingot.ui.log_buffer and ingot.utils.console
+    from ingot.ui.inline_runner import InlineRunner
+
+    researcher_name = state.subagent_names.get("researcher")
+    if not researcher_name:
+        log_message("No researcher agent configured, skipping discovery phase")
+        return False, ""
+
+    request = _prepare_research(state, researcher_name)
+    if request.cached_output is not None:
+        print_info("Reusing cached codebase research (repository unchanged)")
+        return True, request.cached_output
+
     ui = InlineRunner(
-        status_message="Researching codebase...",
+        status_message=request.status_message,
         ticket_id=state.ticket.id,
     )
 
     def _work() -> tuple[bool, str]:
         return backend.run_with_callback(
-            prompt,
+            request.prompt,
             subagent=researcher_name,
             output_callback=ui.handle_output_line,
             dont_save_session=True,
@@ -429,28 +684,239 @@ Description: {state.ticket.description or "Not available"}"""
         return False, ""
 
     ui.print_summary(success)
+    if success:
+        request.store(output)
     return success, output
 
 
-def _truncate_researcher_context(context: str, budget: int = _RESEARCHER_CONTEXT_BUDGET) -> str:
-    """Truncate researcher context to fit within character budget.
+class SpeculativeResearch(BackgroundRun):
+    """Researcher run started before Step 1, while the user answers setup prompts.
+
+    The researcher only needs the ticket, so the runner starts it in a
+    background thread as soon as the ticket is loaded, and Step 1 joins
+    it instead of starting its own run. The constraints prompt, conflict
+    detection and branch setup all happen while it works. Constraints the
+    user enters meanwhile are not in the researcher prompt; the planner
+    prompt carries them.
+    """
+
+    thread_name = "ingot-research"
+    label = "Speculative researcher run"
+
+    def __init__(self, state: WorkflowState, backend: AIBackend, researcher_name: str) -> None:
+        super().__init__()
+        # The researcher sees the state as it was at start, not half-entered constraints
+        self._state = copy.copy(state)
+        self._backend = backend
+        self._researcher_name = researcher_name
+        self._tree = get_head_tree()
+        self._request: _ResearchRequest | None = None
+        self._result: tuple[bool, str] = (False, "")
+
+    @classmethod
+    def start(cls, state: WorkflowState, backend: AIBackend) -> "SpeculativeResearch | None":
+        """Start the researcher in the background, or return None if it cannot run early.
+
+        Backends that do not support concurrent invocations are left to
+        run the researcher in Step 1, since conflict detection may call
+        them meanwhile.
+        """
+        researcher_name = state.subagent_names.get("researcher")
+        if not researcher_name or not backend.supports_parallel:
+            return None
+        research = cls(state, backend, researcher_name)
+        research._start()
+        log_message("Started researcher ahead of Step 1")
+        return research
+
+    def _work(self) -> None:
+        self._request = _prepare_research(self._state, self._researcher_name)
+        if self._request.cached_output is not None:
+            self._result = (True, self._request.cached_output)
+            return
+        self._result = self._backend.run_with_callback(
+            self._request.prompt,
+            subagent=self._researcher_name,
+            output_callback=self._handle_output_line,
+            dont_save_session=True,
+        )
+
+    def join(self) -> tuple[bool, str] | None:
+        """Wait for the research, showing progress if it is still running.
+
+        Returns (success, researcher_output_markdown) like _run_researcher,
+        or None if the result does not apply (HEAD moved to another tree
+        meanwhile) and the researcher must run again.
+        """
+        # Lazy import: see _run_researcher
+        from ingot.ui.inline_runner import InlineRunner
+
+        ui: InlineRunner | None = None
+        if not self._done.is_set():
+            ui = InlineRunner(
+                status_message=(
+                    self._request.status_message if self._request else "Researching codebase..."
+                ),
+                ticket_id=self._state.ticket.id,
+            )
+            self._listener = ui.handle_output_line
+            try:
+                ui.run_with_work(self._done.wait)
+            finally:
+                self._listener = None
+            if ui.check_quit_requested():
+                self.cancel()
+                return False, ""
+
+        if self.cancelled:
+            return None
+        if get_head_tree() != self._tree:
+            log_message("HEAD tree changed since the researcher started; discarding its output")
+            return None
+
+        request = self._request
+        success, output = self._result
+        if request is not None and request.cached_output is not None:
+            print_info("Reusing cached codebase research (repository unchanged)")
+            return True, output
+        if ui is not None:
+            ui.print_summary(success)
+        else:
+            print_info("Codebase research finished while you were answering prompts")
+        if success and request is not None:
+            request.store(output)
+        return success, output
+
+
+def _build_code_search_seed(state: WorkflowState) -> str:
+    """Rank repository files against the ticket with the local search index.
+
+    Returns a markdown list of the best matching files and snippets, or ""
+    if the index is unavailable or nothing matches.
+    """
+    index = load_code_search_index()
+    if index is None:
+        return ""
+    ticket = state.ticket
+    terms = query_terms_for(
+        f"{ticket.title or ticket.branch_summary or ''}\n{ticket.description or ''}", index
+    )
+    hits = index.search(terms, limit=_CODE_SEARCH_SEED_FILES)
+    if not hits:
+        return ""
+    try:
+        hits = index.with_snippets(hits, get_object_reader())
+    except (OSError, EOFError, RuntimeError) as e:
+        log_message(f"Code search snippets unavailable: {e}")
+    log_message(f"Seeding researcher with {len(hits)} code search hit(s) for {terms}")
+    return format_search_hits(hits)
+
+
+class _SymbolIndexBuild:
+    """Symbol index brought up to date in a background thread.
+
+    Step 1 starts it before the researcher and joins it before the first
+    plan, so re-statting the repository overlaps research; the one index
+    is then passed to every prompt and plan validation of the run.
+    """
+
+    def __init__(self, state: WorkflowState) -> None:
+        self._index: SymbolIndex | None = None
+        self._thread: threading.Thread | None = None
+        if state.enable_code_search:
+            self._thread = threading.Thread(target=self._build, name="ingot-symbols", daemon=True)
+            self._thread.start()
+
+    def _build(self) -> None:
+        try:
+            self._index = get_symbol_index()
+        except Exception as e:
+            log_message(f"Symbol index unavailable: {e}")
+
+    def join(self) -> SymbolIndex | None:
+        """Wait for the build; None if code search is off or the index is unavailable."""
+        if self._thread is not None:
+            self._thread.join()
+        return self._index
+
+
+def _build_symbol_definitions(index: SymbolIndex | None, text: str) -> str:
+    """Cite where the symbols quoted in text are defined, from the symbol index.
+
+    Returns a markdown list, or "" if there is no index or no quoted name
+    is a known symbol.
+    """
+    if index is None:
+        return ""
+    names = [name for name in _SYMBOL_SPAN_RE.findall(text) if len(name) > 3]
+    if not names:
+        return ""
+    return format_symbol_definitions(index, names, limit=_SYMBOL_DEFINITIONS_LIMIT)
+
+
+def _open_research_cache(
+    state: WorkflowState, researcher_name: str
+) -> tuple[ResearchCache | None, ResearchKey | None]:
+    """Return the research cache and this run's key, or Nones if caching is off."""
+    if state.research_cache_max_mb <= 0:
+        return None, None
+    key = ResearchKey.for_state(state, researcher_name)
+    if key is None:
+        return None, None
+    return ResearchCache(max_bytes=state.research_cache_max_mb * 1024 * 1024), key
+
+
+def _build_research_refresh_prompt(prompt: str, hit: ResearchCacheHit) -> str:
+    """Turn a research prompt into one that updates earlier research for a few changed files."""
+    changed = "\n".join(f"- {path}" for path in hit.changed_paths)
+    return f"""{prompt}
+
+[REFRESH EARLIER RESEARCH]
+The research below was produced for this ticket before the following files changed:
+{changed}
+
+Do not rediscover the codebase. Re-check only what these changes affect (moved or
+deleted files, changed signatures, new call sites) and return the complete updated
+research in the same format.
+
+[PREVIOUS RESEARCH]
+{hit.output}"""
+
+
+def _truncate_researcher_context(
+    context: str,
+    budget: int | None = None,
+    estimator: TokenEstimator | None = None,
+) -> str:
+    """Truncate researcher context to fit within a token budget.
 
     Preserves sections in priority order. When budget is exceeded, drops
     lowest-priority sections entirely, then truncates within the last
     kept section.
 
+    Args:
+        context: Researcher output.
+        budget: Token budget (default: the research allowance of a default
+            TokenBudget).
+        estimator: Token estimator of the target backend.
+
     Returns truncated context. Prepends a note header if truncation occurred.
     """
+    if budget is None:
+        budget = TokenBudget(estimator=estimator).allowance("research")
+    estimator = estimator or TokenEstimator()
+    estimate = estimator.estimate
+
     # Header prepended when truncation occurs — account for its length in the budget.
     _TRUNCATION_HEADER = (
         "[NOTE: Research context truncated to fit budget. Full output saved to research file.]\n\n"
     )
 
-    if len(context) <= budget:
+    if estimate(context) <= budget:
         return context
 
     # Reserve space for the header so the final output stays within budget.
-    effective_budget = budget - len(_TRUNCATION_HEADER)
+    effective_budget = budget - estimate(_TRUNCATION_HEADER)
 
     # Split context into sections by ### headings
     sections: list[tuple[str, str]] = []  # (heading, content)
@@ -477,7 +943,7 @@ def _truncate_researcher_context(context: str, budget: int = _RESEARCHER_CONTEXT
 
     # Accumulate sections in priority order
     result_parts: list[str] = []
-    total_len = 0
+    total_tokens = 0
     truncated = False
 
     for priority_heading in _SECTION_PRIORITY:
@@ -485,29 +951,29 @@ def _truncate_researcher_context(context: str, budget: int = _RESEARCHER_CONTEXT
             continue
         heading, content = section_map[priority_heading]
         section_text = f"{heading}\n{content}"
-        # Account for "\n" separator between sections (first section has no separator)
-        separator_len = 1 if result_parts else 0
-        if total_len + separator_len + len(section_text) <= effective_budget:
+        section_tokens = estimate(section_text)
+        if total_tokens + section_tokens <= effective_budget:
             result_parts.append(section_text)
-            total_len += separator_len + len(section_text)
+            total_tokens += section_tokens
         else:
-            # Truncate within this section
-            remaining = effective_budget - total_len
-            if remaining > len(heading) + 20:  # Only include if meaningful content fits
-                truncated_content = content[: remaining - len(heading) - 5]
-                # Cut at last newline to avoid mid-line truncation
-                last_nl = truncated_content.rfind("\n")
-                if last_nl > 0:
-                    truncated_content = truncated_content[:last_nl]
+            # Truncate within this section, at a line boundary
+            remaining = effective_budget - total_tokens - estimate(f"{heading}\n\n...")
+            if remaining > 5:  # Only include if meaningful content fits
+                truncated_content = estimator.truncate(content, remaining, keep="head")
                 result_parts.append(f"{heading}\n{truncated_content}\n...")
             truncated = True
             break
 
     result = "\n".join(result_parts)
-
     if truncated or len(result) < len(context):
         result = _TRUNCATION_HEADER + result
 
+    # Section estimates do not add up exactly; drop lines before the
+    # trailing "..." marker while still over
+    marker = "\n..." if result.endswith("\n...") else ""
+    while result and estimate(result) > budget:
+        body = result[: len(result) - len(marker)]
+        result = body[: max(body.rfind("\n"), 0)] + marker
     return result
 
 
@@ -563,14 +1029,27 @@ def _validate_plan(
     plan_content: str,
     state: WorkflowState,
     researcher_output: str = "",
+    section_cache: SectionFindingCache | None = None,
+    symbol_index: SymbolIndex | None = None,
 ) -> ValidationReport:
-    """Run all registered plan validators."""
+    """Run all registered plan validators.
+
+    Pass the same section_cache to every validation of one plan so that
+    section-scoped validators skip sections unchanged since the last pass.
+    Symbol references are only checked when symbol_index is given.
+    """
     registry = create_plan_validator_registry(researcher_output=researcher_output)
     context = ValidationContext(
         repo_root=find_repo_root(),
         ticket_id=state.ticket.id,
+        symbol_index=symbol_index,
+    )
+    return registry.validate_all(
+        plan_content,
+        context,
+        max_workers=_PLAN_VALIDATION_WORKERS,
+        section_cache=section_cache,
     )
-    return registry.validate_all(plan_content, context)
 
 
 def _display_validation_report(report: ValidationReport) -> None:
@@ -676,12 +1155,17 @@ def step_1_create_plan(state: WorkflowState, backend: AIBackend) -> bool:
 
     plan_path = state.get_plan_path()
     researcher_output = ""
+    symbols = _SymbolIndexBuild(state)
 
     # Phase 1: Discovery (runs once — not repeated on retry)
     researcher_name = state.subagent_names.get("researcher")
+    pending, state.pending_research = state.pending_research, None
     if researcher_name:
         print_step("Researching codebase...")
-        researcher_success, researcher_output = _run_researcher(state, backend)
+        joined = pending.join() if pending is not None else None
+        if joined is None:
+            joined = _run_researcher(state, backend)
+        researcher_success, researcher_output = joined
         if researcher_success and researcher_output.strip():
             # Persist researcher output for audit/debug
             research_path = plan_path.with_suffix(".research.md")
@@ -709,8 +1193,26 @@ def step_1_create_plan(state: WorkflowState, backend: AIBackend) -> bool:
     # Attempts 2+: targeted fix via _fix_plan_with_ai (sends existing plan + errors)
     plan_content = ""
     validation_feedback = ""
+    symbol_index = symbols.join()
+    fixer = PlanFixer(get_repo_index()) if state.enable_plan_validation else None
+    section_cache = SectionFindingCache()
+    plan_passed = True
     for attempt in range(1, MAX_GENERATION_RETRIES + 1):
-        if attempt == 1 or not plan_content:
+        if attempt == 1 and _use_plan_candidates(state, backend):
+            # Phase 2: Full synthesis of several candidates; the best is kept and
+            # only fixed below if every candidate failed validation
+            print_step(f"Generating {state.plan_candidates} implementation plan candidates...")
+            if not _generate_plan_candidates(
+                state,
+                plan_path,
+                backend,
+                researcher_context=researcher_output,
+                section_cache=section_cache,
+                symbol_index=symbol_index,
+            ):
+                print_error("Failed to generate implementation plan")
+                return False
+        elif attempt == 1 or not plan_content:
             # Phase 2: Full synthesis
             print_step("Generating implementation plan...")
             success, output = _generate_plan_with_tui(
@@ -718,6 +1220,7 @@ def step_1_create_plan(state: WorkflowState, backend: AIBackend) -> bool:
                 plan_path,
                 backend,
                 researcher_context=researcher_output,
+                symbol_index=symbol_index,
             )
 
             if not success:
@@ -769,11 +1272,16 @@ def step_1_create_plan(state: WorkflowState, backend: AIBackend) -> bool:
         # Phase 3: Inspection + Self-Healing
         if state.enable_plan_validation:
             plan_content = plan_path.read_text()
-            report = _validate_plan(plan_content, state, researcher_output=researcher_output)
+            report = _validate_plan(
+                plan_content,
+                state,
+                researcher_output=researcher_output,
+                section_cache=section_cache,
+                symbol_index=symbol_index,
+            )
 
             # Stage A: Deterministic auto-fix
-            if report.has_errors:
-                fixer = PlanFixer()
+            if report.has_errors and fixer is not None:
                 fixed_content, fix_summary = fixer.fix(plan_content, report)
                 if fix_summary:
                     plan_path.write_text(fixed_content)
@@ -782,9 +1290,20 @@ def step_1_create_plan(state: WorkflowState, backend: AIBackend) -> bool:
                     print_info(f"Auto-fixed {len(fix_summary)} validation issue(s)")
                     # Revalidate after fix
                     report = _validate_plan(
-                        plan_content, state, researcher_output=researcher_output
+                        plan_content,
+                        state,
+                        researcher_output=researcher_output,
+                        section_cache=section_cache,
+                        symbol_index=symbol_index,
                     )
+                    if not report.has_errors:
+                        state.plan_ai_fixes_avoided += 1
+                        log_message(
+                            f"PlanFixer resolved all validation errors ({fixer.stats}); "
+                            f"AI fix attempts avoided: {state.plan_ai_fixes_avoided}"
+                        )
 
+            plan_passed = not report.has_errors
             if report.findings:
                 _display_validation_report(report)
 
@@ -816,6 +1335,16 @@ def step_1_create_plan(state: WorkflowState, backend: AIBackend) -> bool:
 
         break  # Success or exhausted retries — proceed to review
 
+    if section_cache.hits:
+        log_message(
+            f"Plan validation reused {section_cache.hits} cached section result(s), "
+            f"validated {section_cache.misses} section(s)"
+        )
+
+    # Generate the task list while the user reads the plan
+    if plan_passed:
+        _prefetch_tasklist(state, backend, plan_path)
+
     # Display and user review loop (unchanged from before)
     print_success(f"Implementation plan saved to: {plan_path}")
     _display_plan_summary(plan_path)
@@ -834,7 +1363,9 @@ def step_1_create_plan(state: WorkflowState, backend: AIBackend) -> bool:
                 continue
 
             state.plan_revision_count += 1
+            _cancel_tasklist_prefetch(state)
             if replan_with_feedback(state, backend, feedback):
+                _prefetch_tasklist(state, backend, plan_path)
                 _display_plan_summary(plan_path)
                 continue
             else:
@@ -843,6 +1374,7 @@ def step_1_create_plan(state: WorkflowState, backend: AIBackend) -> bool:
 
         elif choice == ReviewChoice.EDIT:
             _edit_plan(plan_path)
+            _prefetch_tasklist(state, backend, plan_path)
             _display_plan_summary(plan_path)
             continue
 
@@ -857,6 +1389,23 @@ def step_1_create_plan(state: WorkflowState, backend: AIBackend) -> bool:
         return False
 
 
+def _prefetch_tasklist(state: WorkflowState, backend: AIBackend, plan_path: Path) -> None:
+    """Start generating the Step 2 task list for the plan, unless already under way."""
+    pending = state.pending_tasklist
+    if pending is not None:
+        if pending.matches(plan_path):
+            return
+        pending.cancel()
+    state.pending_tasklist = TasklistPrefetch.start(state, backend, plan_path)
+
+
+def _cancel_tasklist_prefetch(state: WorkflowState) -> None:
+    """Stop the task list prefetch before the plan is replaced."""
+    if state.pending_tasklist is not None:
+        state.pending_tasklist.cancel()
+        state.pending_tasklist = None
+
+
 def _save_plan_from_output(plan_path: Path, state: WorkflowState, *, output: str = "") -> None:
     """Save plan from backend output if file wasn't created.
 
@@ -959,13 +1508,9 @@ def _build_replan_prompt(
         review_feedback: Reviewer output explaining why replan is needed.
     """
     # Truncate to keep prompt reasonable
-    plan_excerpt = existing_plan[:_REPLAN_PLAN_EXCERPT_LIMIT]
-    if len(existing_plan) > _REPLAN_PLAN_EXCERPT_LIMIT:
-        plan_excerpt += "\n\n... [truncated] ..."
-
-    feedback_excerpt = review_feedback[:_REPLAN_FEEDBACK_EXCERPT_LIMIT]
-    if len(review_feedback) > _REPLAN_FEEDBACK_EXCERPT_LIMIT:
-        feedback_excerpt += "\n\n... [truncated] ..."
+    budget = TokenBudget.for_platform(state.backend_platform)
+    plan_excerpt = budget.fit("plan", existing_plan, marker="\n\n... [truncated] ...")
+    feedback_excerpt = budget.fit("errors", review_feedback, marker="\n\n... [truncated] ...")
 
     ticket_source_label = _SOURCE_VERIFIED if state.spec_verified else _SOURCE_UNVERIFIED
 
@@ -1085,6 +1630,7 @@ Do not attempt to create or write any files."""
 
 
 __all__ = [
+    "SpeculativeResearch",
     "replan_with_feedback",
     "step_1_create_plan",
     "_build_fix_prompt",
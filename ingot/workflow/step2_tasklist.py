@@ -4,7 +4,11 @@ This module implements the second step of the workflow - creating
 a task list from the implementation plan with user approval.
 """
 
+import copy
+import hashlib
+import os
 import re
+from collections.abc import Callable
 from pathlib import Path
 
 from ingot.integrations.backends.base import AIBackend
@@ -20,8 +24,10 @@ from ingot.utils.console import (
     print_warning,
 )
 from ingot.utils.logging import log_message
+from ingot.workflow.background_run import BackgroundRun
 from ingot.workflow.constants import MAX_REVIEW_ITERATIONS, noop_output_callback
 from ingot.workflow.state import WorkflowState
+from ingot.workflow.tasklist_store import reset_tasklist_state
 from ingot.workflow.tasks import parse_task_list
 
 
@@ -50,6 +56,16 @@ def step_2_create_tasklist(state: WorkflowState, backend: AIBackend) -> bool:
     # Only generate on first entry or after REGENERATE
     needs_generation = True
 
+    # Use the task list generated while the user reviewed the plan, if the
+    # plan has not changed since
+    pending, state.pending_tasklist = state.pending_tasklist, None
+    if pending is not None:
+        if not pending.done and pending.matches(plan_path):
+            print_step("Finishing the task list started during plan review...")
+        if pending.join(plan_path, tasklist_path):
+            print_info("Using the task list prepared during plan review")
+            needs_generation = False
+
     # Task list approval loop
     for _iteration in range(MAX_REVIEW_ITERATIONS):
         if needs_generation:
@@ -99,6 +115,109 @@ def step_2_create_tasklist(state: WorkflowState, backend: AIBackend) -> bool:
         return False
 
 
+def _plan_digest(plan_text: str) -> str:
+    return hashlib.blake2b(plan_text.encode(), digest_size=16).hexdigest()
+
+
+class TasklistPrefetch(BackgroundRun):
+    """Task list generated in the background while the user reviews the plan.
+
+    The result is keyed on the hash of the plan content it was generated
+    from and written to a scratch file next to the task list; Step 2
+    adopts it only if the plan is unchanged. Cancelling it, when the plan
+    is edited or regenerated, also discards the scratch file.
+    """
+
+    thread_name = "ingot-tasklist"
+    label = "Task list prefetch"
+
+    def __init__(self, state: WorkflowState, backend: AIBackend, plan_path: Path) -> None:
+        super().__init__()
+        self.plan_path = plan_path
+        self.plan_digest = _plan_digest(plan_path.read_text())
+        tasklist_path = state.get_tasklist_path()
+        self._scratch_path = tasklist_path.with_name(
+            f"{tasklist_path.stem}.prefetch{tasklist_path.suffix}"
+        )
+        self._state = copy.copy(state)
+        self._backend = backend
+        self._success = False
+        self._warnings: list[str] = []
+
+    @classmethod
+    def start(
+        cls, state: WorkflowState, backend: AIBackend, plan_path: Path
+    ) -> "TasklistPrefetch | None":
+        """Start generating the task list for plan_path, or return None if disabled.
+
+        Needs a backend that supports concurrent invocations, since the
+        plan review may call it meanwhile.
+        """
+        if not state.prefetch_tasklist or not backend.supports_parallel:
+            return None
+        if not plan_path.exists():
+            return None
+        prefetch = cls(state, backend, plan_path)
+        prefetch._start()
+        log_message(f"Prefetching task list for plan {prefetch.plan_digest[:12]}")
+        return prefetch
+
+    def matches(self, plan_path: Path) -> bool:
+        """Whether plan_path still holds the plan this task list is generated from."""
+        try:
+            return plan_path == self.plan_path and (
+                _plan_digest(plan_path.read_text()) == self.plan_digest
+            )
+        except OSError:
+            return False
+
+    def _work(self) -> None:
+        self._scratch_path.unlink(missing_ok=True)
+        self._success = _generate_tasklist(
+            self._state,
+            self.plan_path,
+            self._scratch_path,
+            self._backend,
+            output_callback=self._handle_output_line,
+            warnings=self._warnings,
+        )
+
+    def _finished(self) -> None:
+        if self.cancelled:
+            self._scratch_path.unlink(missing_ok=True)
+
+    def cancel(self) -> None:
+        """Stop the run and discard its result."""
+        super().cancel()
+        if self.done:
+            self._scratch_path.unlink(missing_ok=True)
+
+    def join(self, plan_path: Path, tasklist_path: Path) -> bool:
+        """Wait for the prefetch and move its task list to tasklist_path.
+
+        Returns False (and discards the prefetch) if the plan changed since
+        it started or the generation failed; the caller then generates the
+        task list itself.
+        """
+        if not self.matches(plan_path):
+            log_message("Plan changed since the task list prefetch started; discarding it")
+            self.cancel()
+            return False
+        self._done.wait()
+        if self.cancelled or not self._success or not self._scratch_path.exists():
+            self.cancel()
+            return False
+        # The plan may have been edited while the task list was generated
+        if not self.matches(plan_path):
+            self.cancel()
+            return False
+        reset_tasklist_state(tasklist_path)
+        os.replace(self._scratch_path, tasklist_path)
+        for warning in self._warnings:
+            print_warning(warning)
+        return True
+
+
 # Strict regex for add_tasks tool output format:
 # UUID:<shortuuid> NAME:[CATEGORY: ]<task_name> DESCRIPTION:<description>
 #
@@ -265,11 +384,16 @@ def _generate_tasklist(
     plan_path: Path,
     tasklist_path: Path,
     backend: AIBackend,
+    *,
+    output_callback: Callable[[str], None] = noop_output_callback,
+    warnings: list[str] | None = None,
 ) -> bool:
     """Generate task list from implementation plan using subagent.
 
     Captures AI output and persists the task list to disk, even if the AI
-    does not create/write the file itself.
+    does not create/write the file itself. For runs in a background thread,
+    pass a warnings list: progress then goes to the log only and warnings
+    are appended to the list for the caller to show later.
     """
     # Minimal prompt - subagent has detailed instructions
     prompt = f"""Generate task list for: {state.ticket.id}
@@ -286,7 +410,7 @@ Create an executable task list with FUNDAMENTAL and INDEPENDENT categories."""
     success, output = backend.run_with_callback(
         prompt,
         subagent=state.subagent_names["tasklist"],
-        output_callback=noop_output_callback,
+        output_callback=output_callback,
         dont_save_session=True,
     )
 
@@ -294,6 +418,9 @@ Create an executable task list with FUNDAMENTAL and INDEPENDENT categories."""
         log_message("Task list generation failed")
         return False
 
+    # A freshly generated task list invalidates any recorded task state
+    reset_tasklist_state(tasklist_path)
+
     # Try to extract and persist the task list from AI output
     tasklist_content = _extract_tasklist_from_output(output, state.ticket.id)
 
@@ -326,14 +453,30 @@ Create an executable task list with FUNDAMENTAL and INDEPENDENT categories."""
         return False
 
     # Post-process: extract test-related work from FUNDAMENTAL to INDEPENDENT
-    print_step("Post-processing task list (extracting tests to independent)...")
-    if not _post_process_tasklist(state, tasklist_path, backend):
-        print_warning("Post-processing failed, using original task list")
+    (log_message if warnings is not None else print_step)(
+        "Post-processing task list (extracting tests to independent)..."
+    )
+    if not _post_process_tasklist(
+        state, tasklist_path, backend, output_callback=output_callback, warnings=warnings
+    ):
+        _warner(warnings)("Post-processing failed, using original task list")
         # Continue with original - post-processing is best-effort
 
     return True
 
 
+def _warner(warnings: list[str] | None) -> Callable[[str], None]:
+    """Return print_warning, or a function that logs and collects into warnings."""
+    if warnings is None:
+        return print_warning
+
+    def collect(message: str) -> None:
+        log_message(message)
+        warnings.append(message)
+
+    return collect
+
+
 # Test-related keywords for pre-check optimization (case-insensitive)
 # Language-agnostic list covering common test terminology
 _TEST_KEYWORDS = [
@@ -380,7 +523,14 @@ def _fundamental_section_has_test_keywords(content: str) -> bool:
     return False
 
 
-def _post_process_tasklist(state: WorkflowState, tasklist_path: Path, backend: AIBackend) -> bool:
+def _post_process_tasklist(
+    state: WorkflowState,
+    tasklist_path: Path,
+    backend: AIBackend,
+    *,
+    output_callback: Callable[[str], None] = noop_output_callback,
+    warnings: list[str] | None = None,
+) -> bool:
     """Post-process task list to extract test-related work from FUNDAMENTAL tasks.
 
     Uses the ingot-tasklist-refiner agent to:
@@ -414,9 +564,10 @@ Output ONLY the refined task list markdown."""
     success, output = backend.run_with_callback(
         prompt,
         subagent=state.subagent_names["tasklist_refiner"],
-        output_callback=noop_output_callback,
+        output_callback=output_callback,
         dont_save_session=True,
     )
+    warn = _warner(warnings)
 
     if not success:
         log_message("Post-processing agent failed")
@@ -429,7 +580,7 @@ Output ONLY the refined task list markdown."""
         # Safety check: warn if content is significantly shorter
         refined_length = len(refined_content)
         if refined_length < 0.8 * original_length:
-            print_warning(
+            warn(
                 "Post-processing resulted in significantly less content. "
                 "Please perform a manual double-check to ensure no implementation "
                 "tasks were accidentally dropped."
@@ -451,7 +602,7 @@ Output ONLY the refined task list markdown."""
         if new_content != tasklist_content:
             # Safety check for directly modified file
             if len(new_content) < 0.8 * original_length:
-                print_warning(
+                warn(
                     "Post-processing resulted in significantly less content. "
                     "Please perform a manual double-check to ensure no implementation "
                     "tasks were accidentally dropped."
@@ -523,6 +674,7 @@ def _edit_tasklist(tasklist_path: Path) -> None:
 
 
 __all__ = [
+    "TasklistPrefetch",
     "step_2_create_tasklist",
     "_generate_tasklist",
     "_extract_tasklist_from_output",
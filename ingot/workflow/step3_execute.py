@@ -27,6 +27,7 @@ Helper modules:
 
 import functools
 import os
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
@@ -34,7 +35,7 @@ from typing import Literal
 
 from ingot.integrations.backends.base import AIBackend
 from ingot.integrations.backends.errors import BackendRateLimitError
-from ingot.integrations.git import find_repo_root, get_current_branch
+from ingot.integrations.git import find_repo_root, get_current_branch, repo_snapshot_scope
 from ingot.ui.log_buffer import TaskLogBuffer
 from ingot.ui.prompts import prompt_confirm
 from ingot.utils.console import (
@@ -50,8 +51,10 @@ from ingot.utils.retry import (
     RateLimitExceededError,
     with_rate_limit_retry,
 )
+from ingot.utils.token_budget import TokenBudget
 from ingot.workflow.constants import SESSION_RESET_INTERVAL, noop_output_callback
 from ingot.workflow.events import (
+    TaskRunStatus,
     create_task_finished_event,
     create_task_output_event,
     create_task_started_event,
@@ -76,13 +79,12 @@ from ingot.workflow.prompts import (
 )
 from ingot.workflow.review import ReviewOutcome, run_phase_review
 from ingot.workflow.state import WorkflowState
+from ingot.workflow.tasklist_store import load_tasks, record_task_result, render_tasklist
 from ingot.workflow.tasks import (
     Task,
     get_pending_fundamental_tasks,
     get_pending_independent_tasks,
     get_pending_tasks,
-    mark_task_complete,
-    parse_task_list,
 )
 
 # Type alias for task status
@@ -155,31 +157,33 @@ def _capture_baseline_for_diffs(state: WorkflowState) -> bool:
     - WARN_AND_CONTINUE: Warn but continue (diffs may include unrelated changes)
 
     """
-    # Check for dirty working tree before capturing baseline
-    try:
-        is_clean = check_dirty_working_tree(policy=state.dirty_tree_policy)
-        if not is_clean:
-            # WARN_AND_CONTINUE policy - tree is dirty but we continue
-            print_warning(
-                "Continuing with dirty working tree. Review diffs may include pre-existing changes."
-            )
-    except DirtyWorkingTreeError as e:
-        # FAIL_FAST policy - abort on dirty tree
-        print_error(str(e))
-        return False
+    # The dirty check and untracked listing share one repository snapshot
+    with repo_snapshot_scope():
+        # Check for dirty working tree before capturing baseline
+        try:
+            is_clean = check_dirty_working_tree(policy=state.dirty_tree_policy)
+            if not is_clean:
+                # WARN_AND_CONTINUE policy - tree is dirty but we continue
+                print_warning(
+                    "Continuing with dirty working tree. Review diffs may include pre-existing changes."
+                )
+        except DirtyWorkingTreeError as e:
+            # FAIL_FAST policy - abort on dirty tree
+            print_error(str(e))
+            return False
 
-    # Capture baseline ref
-    try:
-        baseline_ref = capture_baseline()
-        state.diff_baseline_ref = baseline_ref
-        # Snapshot untracked files so restore_to_baseline can avoid deleting
-        # pre-existing untracked files during a replan restore.
-        state.pre_execution_untracked = frozenset(get_untracked_files())
-        print_info(f"Captured baseline for diff operations: {baseline_ref[:8]}")
-        return True
-    except Exception as e:
-        print_error(f"Failed to capture git baseline: {e}")
-        return False
+        # Capture baseline ref
+        try:
+            baseline_ref = capture_baseline()
+            state.diff_baseline_ref = baseline_ref
+            # Snapshot untracked files so restore_to_baseline can avoid deleting
+            # pre-existing untracked files during a replan restore.
+            state.pre_execution_untracked = frozenset(get_untracked_files())
+            print_info(f"Captured baseline for diff operations: {baseline_ref[:8]}")
+            return True
+        except Exception as e:
+            print_error(f"Failed to capture git baseline: {e}")
+            return False
 
 
 def step_3_execute(
@@ -218,8 +222,8 @@ def step_3_execute(
         print_error(f"Task list not found: {tasklist_path}")
         return Step3Result(success=False)
 
-    # Parse all tasks
-    tasks = parse_task_list(tasklist_path.read_text())
+    # Parse all tasks, applying completions recorded in the state journal
+    tasks = load_tasks(tasklist_path)
 
     # Disable parallel execution if backend doesn't support it
     if not backend.supports_parallel:
@@ -282,6 +286,7 @@ def step_3_execute(
         # If fail_fast and we had failures, stop here
         if failed_tasks and state.fail_fast:
             print_error("Phase 1 failures with fail_fast enabled. Stopping.")
+            render_tasklist(tasklist_path)
             return Step3Result(success=False)
 
     # PHASE 2: Execute independent tasks in parallel
@@ -324,6 +329,10 @@ def step_3_execute(
             )
         failed_tasks.extend(phase2_failed)
 
+    # The markdown is a rendered view of the state journal; regenerate it
+    # once per run instead of rewriting it on every task completion.
+    render_tasklist(tasklist_path)
+
     # Handle failures
     if failed_tasks:
         if not prompt_confirm(
@@ -367,6 +376,17 @@ def step_3_execute(
     return Step3Result(success=len(failed_tasks) == 0)
 
 
+def _record_result(tasklist_path: Path, task_name: str, success: bool, duration: float) -> None:
+    """Record a sequential task result in the task list state journal."""
+    record_task_result(
+        tasklist_path,
+        task_name,
+        TaskRunStatus.SUCCESS if success else TaskRunStatus.FAILED,
+        duration=duration,
+        error=None if success else "Task returned failure",
+    )
+
+
 def _execute_with_tui(
     state: WorkflowState,
     pending: list[Task],
@@ -448,8 +468,8 @@ def _execute_with_tui(
                     error=None if success else "Task returned failure",
                 )
                 tui.handle_event(finish_event)
+                _record_result(tasklist_path, task.name, success, duration)
                 if success:
-                    mark_task_complete(tasklist_path, task.name)
                     state.mark_task_complete(task.name)
                 else:
                     _failed.append(task.name)
@@ -467,9 +487,9 @@ def _execute_with_tui(
                 error=None if success else "Task returned failure",
             )
             tui.handle_event(finish_event)
+            _record_result(tasklist_path, task.name, success, duration)
 
             if success:
-                mark_task_complete(tasklist_path, task.name)
                 state.mark_task_complete(task.name)
                 tier.advance()
             else:
@@ -512,6 +532,7 @@ def _execute_fallback(
         log_filename = format_log_filename(i, task.name)
         log_path = log_dir / log_filename
 
+        started = time.monotonic()
         with TaskLogBuffer(log_path) as log_buffer:
             # Callback that writes to log and prints to stdout
             def output_callback(line: str) -> None:
@@ -529,9 +550,9 @@ def _execute_fallback(
                 save_session=not tier.is_last_before_reset,
                 use_continuation_prompt=not tier.is_cold_start,
             )
+        _record_result(tasklist_path, task.name, success, time.monotonic() - started)
 
         if success:
-            mark_task_complete(tasklist_path, task.name)
             state.mark_task_complete(task.name)
             print_success(f"Task completed: {task.name}")
             tier.advance()
@@ -746,6 +767,7 @@ def _execute_task_with_self_correction(
             repo_root=repo_root,
             ticket_title=state.ticket.title,
             ticket_description=state.ticket.description,
+            budget=TokenBudget.for_platform(state.backend_platform),
         )
 
         success, output = _run_backend_capturing_output(
@@ -11,6 +11,7 @@ It snapshots non-doc files before the agent runs and reverts any non-doc
 changes introduced by the agent.
 """
 
+import stat
 import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -19,7 +20,9 @@ from ingot.integrations.backends.base import AIBackend
 from ingot.integrations.git import (
     DiffResult,
     get_diff_from_baseline,
+    get_object_reader,
     has_any_changes,
+    repo_snapshot_scope,
 )
 from ingot.utils.console import (
     print_error,
@@ -166,44 +169,106 @@ def is_doc_file(filepath: str) -> bool:
     return False
 
 
+# (size, mtime_ns, ctime_ns, inode) - any write changes at least one of these
+StatKey = tuple[int, int, int, int]
+
+
+def _stat_key(path: Path) -> StatKey | None:
+    """Return the stat fingerprint of a regular file, or None if it is missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return (st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino)
+
+
+def _hash_files(paths: list[str], *, write: bool = False) -> dict[str, str]:
+    """Hash file contents with one batched ``git hash-object --stdin-paths`` call.
+
+    Contents are hashed as-is (--no-filters) so that the blob read back
+    from the object database is byte-identical to the file. With
+    write=True the blobs are stored in the object database.
+
+    Returns:
+        Mapping of path to blob hash. Paths that could not be hashed
+        (unreadable, vanished, or containing a newline) are omitted.
+    """
+    hashable = [p for p in paths if "\n" not in p]
+    if not hashable:
+        return {}
+
+    cmd = ["git", "hash-object", "--no-filters", "--stdin-paths"]
+    if write:
+        cmd.append("-w")
+    result = subprocess.run(cmd, input="\n".join(hashable) + "\n", capture_output=True, text=True)
+    hashes = result.stdout.split()
+    if result.returncode == 0 and len(hashes) == len(hashable):
+        return dict(zip(hashable, hashes, strict=True))
+
+    # A single unreadable path fails the whole batch - hash the rest one by one
+    if len(hashable) == 1:
+        return {}
+    hashed: dict[str, str] = {}
+    for path in hashable:
+        hashed.update(_hash_files([path], write=write))
+    return hashed
+
+
 @dataclass
 class FileSnapshot:
-    """Snapshot of a file's state for restoration."""
+    """Snapshot of a file's state for restoration.
+
+    File contents are not held in memory: the pre-agent content is stored
+    in the git object database and referenced by its blob hash. The stat
+    fingerprint lets detect_changes() skip rehashing untouched files.
+    """
 
     path: str
     was_untracked: bool = False
     was_dirty: bool = False
     existed: bool = True
-    content: bytes | None = None
+    blob: str | None = None
+    stat: StatKey | None = None
 
     @classmethod
-    def capture(cls, filepath: str, status_code: str) -> "FileSnapshot":
-        """Capture the current state of a file based on git status code."""
+    def capture(cls, filepath: str, status_code: str, blob: str | None = None) -> "FileSnapshot":
+        """Capture the current state of a file based on git status code.
+
+        Args:
+            filepath: Path of the file.
+            status_code: Two-letter porcelain status code.
+            blob: Blob hash of the file's current content, already written
+                to the object database (see _hash_files).
+        """
         is_untracked = status_code == "??"
         # File is dirty if it has any tracked modification (not untracked)
         is_dirty = not is_untracked and status_code.strip() != ""
 
         path = Path(filepath)
-        file_exists = path.exists() and path.is_file()
-        content = None
-
-        # Capture content for files that exist (both dirty and untracked)
-        # so we can restore them to their pre-agent state
-        if file_exists:
-            try:
-                content = path.read_bytes()
-            except OSError:
-                pass
+        file_stat = _stat_key(path)
+        file_exists = file_stat is not None
 
         return cls(
             path=filepath,
             was_untracked=is_untracked,
             was_dirty=is_dirty,
             existed=file_exists,
-            content=content,
+            blob=blob if file_exists else None,
+            stat=file_stat,
         )
 
 
+def _read_blob(blob: str) -> bytes | None:
+    """Read a blob written by _hash_files() back from the object database."""
+    try:
+        result = get_object_reader().read(blob)
+    except (OSError, RuntimeError):
+        return None
+    return result[1] if result is not None else None
+
+
 def _git_restore_file(filepath: str) -> bool:
     """Restore a tracked file using git restore.
 
@@ -226,7 +291,8 @@ class NonDocSnapshot:
 
     Key behaviors:
     - For untracked files ('??'): No content captured; revert by deleting.
-    - For tracked dirty files: Content captured; revert by writing back content.
+    - For tracked dirty files: Content stored as a git blob; revert by writing
+      the blob back.
     - For tracked clean files that become dirty: Use git restore to revert.
     """
 
@@ -248,13 +314,25 @@ class NonDocSnapshot:
         if result.returncode != 0:
             return snapshot
 
-        # Parse the null-delimited output
-        for status_code, filepath in parse_porcelain_z_output(result.stdout):
-            # Skip doc files - we only want to track non-doc files
-            if is_doc_file(filepath):
-                continue
+        # Parse the null-delimited output, skipping doc files - we only
+        # want to track non-doc files
+        entries = [
+            (status_code, filepath)
+            for status_code, filepath in parse_porcelain_z_output(result.stdout)
+            if not is_doc_file(filepath)
+        ]
+
+        # Store the content of every existing file (both dirty and untracked)
+        # in the object database with one git call, so we can restore them
+        # to their pre-agent state without holding the bytes in memory
+        blobs = _hash_files(
+            [filepath for _, filepath in entries if Path(filepath).is_file()], write=True
+        )
 
-            snapshot.snapshots[filepath] = FileSnapshot.capture(filepath, status_code)
+        for status_code, filepath in entries:
+            snapshot.snapshots[filepath] = FileSnapshot.capture(
+                filepath, status_code, blobs.get(filepath)
+            )
 
         return snapshot
 
@@ -269,11 +347,14 @@ class NonDocSnapshot:
         5. New untracked files created by the agent.
         """
         changed = []
+        # Files whose stat data changed; their content is rehashed in one batch
+        stat_mismatch: list[str] = []
 
         # Check ALL existing snapshots for changes (not just was_dirty)
         for filepath, old_snapshot in self.snapshots.items():
             path = Path(filepath)
-            file_exists_now = path.exists() and path.is_file()
+            current_stat = _stat_key(path)
+            file_exists_now = current_stat is not None
 
             # Case 1: File didn't exist pre-Step4 but exists now (agent created it)
             # This handles tracked files that were deleted before Step 4 and recreated
@@ -287,17 +368,17 @@ class NonDocSnapshot:
                 continue
 
             # Case 3: File has captured content - compare to current content
-            # This works for both pre-dirty tracked files AND pre-existing untracked files
-            if old_snapshot.content is not None:
-                if file_exists_now:
-                    try:
-                        current_content = path.read_bytes()
-                        if current_content != old_snapshot.content:
-                            changed.append(filepath)
-                    except OSError:
-                        # Can't read file - assume changed
-                        changed.append(filepath)
-                # Note: file missing case already handled above
+            # This works for both pre-dirty tracked files AND pre-existing untracked files.
+            # Identical stat data means the file was not written; otherwise rehash.
+            if old_snapshot.blob is not None and current_stat != old_snapshot.stat:
+                stat_mismatch.append(filepath)
+
+        if stat_mismatch:
+            current_blobs = _hash_files(stat_mismatch)
+            for filepath in stat_mismatch:
+                # A file that cannot be hashed is assumed changed
+                if current_blobs.get(filepath) != self.snapshots[filepath].blob:
+                    changed.append(filepath)
 
         # Get current git status to detect NEW changes (files not in original snapshot)
         result = subprocess.run(
@@ -328,7 +409,7 @@ class NonDocSnapshot:
                         was_untracked=is_untracked,
                         was_dirty=False,  # It wasn't dirty before agent ran
                         existed=file_existed_pre_step4,
-                        content=None,
+                        blob=None,
                     )
                     changed.append(filepath)
 
@@ -363,11 +444,18 @@ class NonDocSnapshot:
                 continue
 
             # If we have saved content, always restore it (works for dirty, untracked, deleted)
-            if snapshot.content is not None:
+            if snapshot.blob is not None:
+                content = _read_blob(snapshot.blob)
+                if content is None:
+                    print_warning(
+                        f"Cannot revert {filepath}: its pre-Step 4 copy "
+                        f"(blob {snapshot.blob[:12]}) is no longer readable"
+                    )
+                    continue
                 try:
                     path = Path(filepath)
                     path.parent.mkdir(parents=True, exist_ok=True)
-                    path.write_bytes(snapshot.content)
+                    path.write_bytes(content)
                     reverted.append(filepath)
                 except OSError:
                     pass
@@ -433,15 +521,17 @@ def step_4_update_docs(
     print_header("Step 4: Update Documentation")
     result = Step4Result()
 
-    # Check if there are any changes to analyze (including untracked files)
-    if not has_any_changes() and not state.base_commit:
-        print_info("No changes detected. Skipping documentation update.")
-        return result
+    # Pre-agent checks share one repository snapshot
+    with repo_snapshot_scope():
+        # Check if there are any changes to analyze (including untracked files)
+        if not has_any_changes() and not state.base_commit:
+            print_info("No changes detected. Skipping documentation update.")
+            return result
 
-    # Get diff from baseline (now returns DiffResult)
-    # Note: get_diff_from_baseline handles missing base_commit gracefully
-    # by falling back to staged + unstaged + untracked changes
-    diff_result = get_diff_from_baseline(state.base_commit)
+        # Get diff from baseline (now returns DiffResult)
+        # Note: get_diff_from_baseline handles missing base_commit gracefully
+        # by falling back to staged + unstaged + untracked changes
+        diff_result = get_diff_from_baseline(state.base_commit)
 
     if diff_result.has_error:
         print_warning(
@@ -0,0 +1,509 @@
+"""Persistent index of class, function and method definitions.
+
+SymbolIndex answers "does X exist, and where?" without an agent: plan
+validators use it to flag references to symbols that are not in the
+repository, and prompt builders use it to cite exact definitions.
+
+Python files are parsed with ``ast``. TypeScript/JavaScript, Go and Java
+files use line-based regexes (ctags style), which find top-level and
+class-level definitions but not every nested construct.
+
+The index is persisted as JSON under ``.ingot/cache/symbols/``. Each file
+entry records the mtime, size and content hash it was built from, so an
+update re-stats every indexed file but only re-reads files whose stat
+changed, and only re-parses those whose content hash changed.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+
+from ingot.integrations.git import find_repo_root, get_repo_index
+from ingot.utils.logging import log_message
+from ingot.workflow.research_cache import get_cache_base_dir
+
+# Bump when extraction or the file format changes; older indexes are rebuilt
+INDEX_VERSION = 1
+
+# Files larger than this are not parsed (generated code, bundles)
+MAX_SYMBOL_FILE_BYTES = 512 * 1024
+
+
+@dataclass(frozen=True)
+class Symbol:
+    """A definition found in the repository.
+
+    Attributes:
+        name: Simple name, e.g. ``render``.
+        qualname: Name qualified by enclosing classes, e.g. ``Invoice.render``.
+        kind: ``class``, ``function``, ``method``, ``interface``, ``type`` or ``enum``.
+        path: File path relative to the repository root.
+        line: 1-based line of the definition.
+    """
+
+    name: str
+    qualname: str
+    kind: str
+    path: str
+    line: int
+
+    @property
+    def location(self) -> str:
+        return f"{self.path}:{self.line}"
+
+
+# -- Extractors ---------------------------------------------------------------
+
+_Extracted = list[tuple[str, str, int]]  # (qualname, kind, line)
+
+
+def _extract_python(source: str) -> _Extracted:
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return _extract_with_patterns(source, _PYTHON_PATTERNS)
+
+    found: _Extracted = []
+
+    def visit(nodes: Iterable[ast.stmt], scope: str, in_class: bool) -> None:
+        for node in nodes:
+            if isinstance(node, ast.ClassDef):
+                qualname = f"{scope}{node.name}"
+                found.append((qualname, "class", node.lineno))
+                visit(node.body, f"{qualname}.", True)
+            elif isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+                qualname = f"{scope}{node.name}"
+                found.append((qualname, "method" if in_class else "function", node.lineno))
+                # Nested functions are implementation details; skip their bodies
+            elif isinstance(node, ast.If | ast.Try | ast.With):
+                # Definitions under "if TYPE_CHECKING:", try/except imports, etc.
+                for body in (
+                    getattr(node, "body", []),
+                    getattr(node, "orelse", []),
+                    getattr(node, "finalbody", []),
+                    *(handler.body for handler in getattr(node, "handlers", [])),
+                ):
+                    visit(body, scope, in_class)
+
+    visit(tree.body, "", False)
+    return found
+
+
+# (pattern, kind, class-opening) triples applied line by line
+_PatternTable = list[tuple[re.Pattern[str], str, bool]]
+
+_PYTHON_PATTERNS: _PatternTable = [
+    (re.compile(r"^\s*class\s+([A-Za-z_]\w*)"), "class", True),
+    (re.compile(r"^\s*(?:async\s+)?def\s+([A-Za-z_]\w*)"), "function", False),
+]
+
+_TS_PATTERNS: _PatternTable = [
+    (
+        re.compile(r"^\s*(?:export\s+)?(?:default\s+)?(?:abstract\s+)?class\s+([A-Za-z_$][\w$]*)"),
+        "class",
+        True,
+    ),
+    (re.compile(r"^\s*(?:export\s+)?interface\s+([A-Za-z_$][\w$]*)"), "interface", True),
+    (re.compile(r"^\s*(?:export\s+)?type\s+([A-Za-z_$][\w$]*)\s*(?:<[^=]*>)?\s*="), "type", False),
+    (re.compile(r"^\s*(?:export\s+)?(?:const\s+)?enum\s+([A-Za-z_$][\w$]*)"), "enum", False),
+    (
+        re.compile(
+            r"^\s*(?:export\s+)?(?:default\s+)?(?:async\s+)?function\s*\*?\s*([A-Za-z_$][\w$]*)"
+        ),
+        "function",
+        False,
+    ),
+    (
+        re.compile(
+            r"^\s*(?:export\s+)?(?:const|let|var)\s+([A-Za-z_$][\w$]*)\s*(?::[^=]+)?=\s*"
+            r"(?:async\s+)?(?:function\b|\([^)]*\)\s*(?::[^=]+)?=>|[A-Za-z_$][\w$]*\s*=>)"
+        ),
+        "function",
+        False,
+    ),
+    (
+        re.compile(
+            r"^\s+(?:(?:public|private|protected|static|async|readonly|override|abstract|get|set)\s+)*"
+            r"([A-Za-z_$][\w$]*)\s*(?:<[^>]*>)?\s*\((?:[^;]*\)\s*(?::[^;={]+)?\{|[^;)]*)\s*$"
+        ),
+        "method",
+        False,
+    ),
+]
+
+_GO_FUNC_RE = re.compile(r"^func\s+(?:\(\s*\w*\s*\*?\s*(\w+)(?:\[[^\]]*\])?\s*\)\s*)?(\w+)")
+_GO_TYPE_RE = re.compile(r"^type\s+(\w+)(?:\[[^\]]*\])?\s+(struct|interface)\b")
+
+_JAVA_PATTERNS: _PatternTable = [
+    (
+        re.compile(
+            r"^\s*(?:(?:public|private|protected|static|final|abstract|sealed|non-sealed)\s+)*"
+            r"(?:class|record)\s+(\w+)"
+        ),
+        "class",
+        True,
+    ),
+    (
+        re.compile(r"^\s*(?:(?:public|private|protected|static|sealed)\s+)*@?interface\s+(\w+)"),
+        "interface",
+        True,
+    ),
+    (
+        re.compile(r"^\s*(?:(?:public|private|protected|static)\s+)*enum\s+(\w+)"),
+        "enum",
+        True,
+    ),
+    (
+        re.compile(
+            r"^\s+(?:(?:public|private|protected|static|final|abstract|synchronized|native|default)\s+)*"
+            r"(?:<[^>]+>\s+)?[\w<>\[\],.?]+(?:\s*<[^>]*>)?\s+(\w+)\s*"
+            r"\((?:[^;]*\)\s*(?:throws\s+[\w.,\s]+)?\{|[^;)]*)\s*$"
+        ),
+        "method",
+        False,
+    ),
+]
+
+# Words that the method patterns would otherwise take for method names
+_CONTROL_KEYWORDS = frozenset(
+    "if for while switch catch return new else do try function throw await typeof".split()
+)
+
+
+def _extract_with_patterns(source: str, patterns: _PatternTable) -> _Extracted:
+    """Apply a pattern table line by line, qualifying members by the last class seen."""
+    found: _Extracted = []
+    current_class: str | None = None
+    for number, line in enumerate(source.splitlines(), 1):
+        if line and not line[0].isspace() and current_class and not line.startswith("}"):
+            current_class = None  # Back at top level
+        for pattern, kind, opens_class in patterns:
+            m = pattern.match(line)
+            if not m or m.group(1) in _CONTROL_KEYWORDS:
+                continue
+            name = m.group(1)
+            if kind == "method":
+                if current_class is None:
+                    break
+                found.append((f"{current_class}.{name}", kind, number))
+            elif kind == "function" and current_class and line[0].isspace():
+                found.append((f"{current_class}.{name}", "method", number))
+            else:
+                found.append((name, kind, number))
+                if opens_class:
+                    current_class = name
+            break
+    return found
+
+
+def _extract_typescript(source: str) -> _Extracted:
+    return _extract_with_patterns(source, _TS_PATTERNS)
+
+
+def _extract_java(source: str) -> _Extracted:
+    return _extract_with_patterns(source, _JAVA_PATTERNS)
+
+
+def _extract_go(source: str) -> _Extracted:
+    found: _Extracted = []
+    for number, line in enumerate(source.splitlines(), 1):
+        if m := _GO_FUNC_RE.match(line):
+            receiver, name = m.groups()
+            if receiver:
+                found.append((f"{receiver}.{name}", "method", number))
+            else:
+                found.append((name, "function", number))
+        elif m := _GO_TYPE_RE.match(line):
+            kind = "interface" if m.group(2) == "interface" else "class"
+            found.append((m.group(1), kind, number))
+    return found
+
+
+_EXTRACTORS: dict[str, Callable[[str], _Extracted]] = {
+    ".py": _extract_python,
+    ".pyi": _extract_python,
+    ".ts": _extract_typescript,
+    ".tsx": _extract_typescript,
+    ".js": _extract_typescript,
+    ".jsx": _extract_typescript,
+    ".mjs": _extract_typescript,
+    ".cjs": _extract_typescript,
+    ".go": _extract_go,
+    ".java": _extract_java,
+}
+
+
+def extract_symbols(path: str, source: str) -> list[Symbol]:
+    """Return the definitions in source, which was read from path."""
+    extractor = _EXTRACTORS.get(PurePosixPath(path).suffix.lower())
+    if extractor is None:
+        return []
+    return [
+        Symbol(qualname.rpartition(".")[2], qualname, kind, path, line)
+        for qualname, kind, line in extractor(source)
+    ]
+
+
+def is_indexable(path: str) -> bool:
+    """True if path has a language the symbol index understands."""
+    return PurePosixPath(path).suffix.lower() in _EXTRACTORS
+
+
+# -- Index --------------------------------------------------------------------
+
+
+@dataclass
+class _FileEntry:
+    mtime_ns: int
+    size: int
+    digest: str
+    symbols: list[Symbol]
+
+
+class SymbolIndex:
+    """Definitions of every indexable file in a repository."""
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        self._files: dict[str, _FileEntry] = {}
+        self._by_name: dict[str, list[Symbol]] | None = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(len(entry.symbols) for entry in self._files.values())
+
+    @property
+    def file_count(self) -> int:
+        return len(self._files)
+
+    def update(self, paths: Iterable[str]) -> int:
+        """Re-index paths (repo-relative) whose stat or content changed.
+
+        Files no longer in paths are dropped. Returns the number of files
+        that were re-parsed or dropped.
+        """
+        wanted = {path for path in paths if is_indexable(path)}
+        changed = 0
+        with self._lock:
+            for path in set(self._files) - wanted:
+                del self._files[path]
+                changed += 1
+            for path in wanted:
+                full_path = self.repo_root / path
+                try:
+                    st = full_path.stat()
+                except OSError:
+                    if self._files.pop(path, None) is not None:
+                        changed += 1
+                    continue
+                entry = self._files.get(path)
+                if entry is not None and (entry.mtime_ns, entry.size) == (
+                    st.st_mtime_ns,
+                    st.st_size,
+                ):
+                    continue
+                if st.st_size > MAX_SYMBOL_FILE_BYTES:
+                    if self._files.pop(path, None) is not None:
+                        changed += 1
+                    continue
+                try:
+                    data = full_path.read_bytes()
+                except OSError:
+                    continue
+                digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+                if entry is not None and entry.digest == digest:
+                    entry.mtime_ns, entry.size = st.st_mtime_ns, st.st_size
+                    continue
+                symbols = extract_symbols(path, data.decode("utf-8", errors="replace"))
+                self._files[path] = _FileEntry(st.st_mtime_ns, st.st_size, digest, symbols)
+                changed += 1
+            if changed:
+                self._by_name = None
+        return changed
+
+    def lookup(self, name: str) -> list[Symbol]:
+        """Definitions matching name, best first.
+
+        name may be simple (``render``) or dotted (``Invoice.render``); a
+        dotted name matches qualified names ending with it.
+        """
+        simple = name.rpartition(".")[2]
+        candidates = self._name_table().get(simple, [])
+        if "." in name:
+            suffix = f".{name}"
+            candidates = [
+                s for s in candidates if s.qualname == name or s.qualname.endswith(suffix)
+            ]
+        return sorted(candidates, key=lambda s: (s.qualname != name, s.path, s.line))
+
+    def has_symbol(self, name: str) -> bool:
+        """True if a definition matching name exists."""
+        return bool(self.lookup(name))
+
+    def names(self) -> list[str]:
+        """Simple names of all indexed definitions."""
+        return list(self._name_table())
+
+    def _name_table(self) -> dict[str, list[Symbol]]:
+        table = self._by_name
+        if table is None:
+            with self._lock:
+                table = {}
+                for entry in self._files.values():
+                    for symbol in entry.symbols:
+                        table.setdefault(symbol.name, []).append(symbol)
+                self._by_name = table
+        return table
+
+    # -- Persistence ---------------------------------------------------------
+
+    @classmethod
+    def load(cls, repo_root: Path, path: Path) -> SymbolIndex:
+        """Load an index from path; an empty index if missing, outdated or for another repo."""
+        index = cls(repo_root)
+        try:
+            data = json.loads(path.read_text())
+        except FileNotFoundError:
+            return index
+        except (OSError, json.JSONDecodeError) as e:
+            log_message(f"Discarding unreadable symbol index {path}: {e}")
+            return index
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != INDEX_VERSION
+            or data.get("repo_root") != str(repo_root)
+        ):
+            return index
+        for file_path, (mtime_ns, size, digest, symbols) in data.get("files", {}).items():
+            index._files[file_path] = _FileEntry(
+                mtime_ns,
+                size,
+                digest,
+                [
+                    Symbol(qualname.rpartition(".")[2], qualname, kind, file_path, line)
+                    for qualname, kind, line in symbols
+                ],
+            )
+        return index
+
+    def save(self, path: Path) -> None:
+        """Write the index to path atomically."""
+        with self._lock:
+            data = {
+                "version": INDEX_VERSION,
+                "repo_root": str(self.repo_root),
+                "files": {
+                    file_path: [
+                        entry.mtime_ns,
+                        entry.size,
+                        entry.digest,
+                        [[s.qualname, s.kind, s.line] for s in entry.symbols],
+                    ]
+                    for file_path, entry in self._files.items()
+                },
+            }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", prefix=".symbols_", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+
+def get_symbol_index_path() -> Path:
+    """Get the path of the persisted symbol index."""
+    return get_cache_base_dir() / "symbols" / "index.json"
+
+
+# One index per repository root, kept for the life of the process
+_symbol_indexes: dict[Path, SymbolIndex] = {}
+_symbol_indexes_lock = threading.Lock()
+
+
+def get_symbol_index(repo_root: Path | None = None) -> SymbolIndex | None:
+    """Return the symbol index of the repository, brought up to date.
+
+    The first call in a process loads the persisted index; every call
+    re-stats the repository's files and re-parses the changed ones.
+    Returns None outside a git repository.
+    """
+    root = repo_root or find_repo_root()
+    if root is None:
+        return None
+    repo_index = get_repo_index(root)
+    if repo_index is None:
+        return None
+    root = root.resolve()
+    path = get_symbol_index_path()
+    if not path.is_absolute():
+        path = root / path
+
+    with _symbol_indexes_lock:
+        index = _symbol_indexes.get(root)
+        if index is None:
+            index = SymbolIndex.load(root, path)
+            _symbol_indexes[root] = index
+
+    files = [f for f in repo_index.files if f not in repo_index.symlinks]
+    changed = index.update(files)
+    if changed:
+        log_message(
+            f"Symbol index updated: {changed} file(s) re-indexed, "
+            f"{len(index)} symbols in {index.file_count} files"
+        )
+        try:
+            index.save(path)
+        except OSError as e:
+            log_message(f"Failed to save symbol index: {e}")
+    return index
+
+
+def clear_symbol_indexes() -> None:
+    """Drop all in-process symbol indexes (the persisted files are kept)."""
+    with _symbol_indexes_lock:
+        _symbol_indexes.clear()
+
+
+def format_symbol_definitions(index: SymbolIndex, names: Iterable[str], limit: int = 30) -> str:
+    """Markdown list citing where each known name is defined.
+
+    Names without a definition are skipped; names with several are listed
+    with up to three locations.
+    """
+    lines = []
+    for name in dict.fromkeys(names):
+        symbols = index.lookup(name)
+        if not symbols:
+            continue
+        locations = ", ".join(f"`{s.location}`" for s in symbols[:3])
+        more = f" (+{len(symbols) - 3} more)" if len(symbols) > 3 else ""
+        lines.append(f"- `{name}` ({symbols[0].kind}): {locations}{more}")
+        if len(lines) == limit:
+            break
+    return "\n".join(lines)
+
+
+__all__ = [
+    "INDEX_VERSION",
+    "MAX_SYMBOL_FILE_BYTES",
+    "Symbol",
+    "SymbolIndex",
+    "clear_symbol_indexes",
+    "extract_symbols",
+    "format_symbol_definitions",
+    "get_symbol_index",
+    "get_symbol_index_path",
+    "is_indexable",
+]
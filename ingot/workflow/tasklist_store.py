@@ -0,0 +1,267 @@
+"""Structured task state journal for INGOT task lists.
+
+The markdown task list stays the human-facing view of Step 3 progress, but
+rewriting it on every completion means re-reading, re-scanning and
+re-writing the whole file under a global lock. This module keeps an
+append-only JSON Lines journal next to the task list instead:
+
+    specs/TICKET-tasklist.md            <- rendered view
+    specs/TICKET-tasklist.state.jsonl   <- source of truth for task state
+
+Each task result is a single appended line, so recording a completion is
+O(1) and parallel workers only contend for one short write. The journal is
+replayed when tasks are loaded (resume) and the markdown checkboxes are
+regenerated lazily via render_tasklist().
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from ingot.utils.logging import log_message
+from ingot.workflow.events import TaskRunStatus
+from ingot.workflow.tasks import Task, TaskStatus, parse_task_list
+
+# Suffix appended to the task list stem for the journal file
+JOURNAL_SUFFIX = ".state.jsonl"
+
+# Matches an unchecked task line, capturing prefix, spacing and task name
+_UNCHECKED_TASK_PATTERN = re.compile(r"^(\s*[-*]?\s*)\[ \](\s*)(.+?)(\s*)$")
+
+
+@dataclass
+class TaskStateRecord:
+    """Replayed state of a single task from the journal.
+
+    Attributes:
+        name: Task name (the task identity, as in the markdown task list).
+        status: Latest recorded execution status.
+        attempts: Number of recorded execution results for this task.
+        started_at: Unix timestamp when the latest attempt started, if known.
+        finished_at: Unix timestamp when the latest attempt finished.
+        error: Error message of the latest attempt, if it failed.
+    """
+
+    name: str
+    status: TaskRunStatus = TaskRunStatus.PENDING
+    attempts: int = 0
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str | None = None
+
+    @property
+    def duration(self) -> float | None:
+        """Duration of the latest attempt in seconds, if known."""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+
+class TaskListStore:
+    """Append-only task state journal bound to one task list file.
+
+    Thread-safe: appends are serialized by a per-instance lock that is only
+    held for a single line write. Use get_tasklist_store() to share one
+    instance per task list across workers.
+    """
+
+    def __init__(self, tasklist_path: Path) -> None:
+        self.tasklist_path = tasklist_path
+        self._lock = threading.Lock()
+
+    @property
+    def journal_path(self) -> Path:
+        """Path of the journal file next to the task list."""
+        return self.tasklist_path.with_name(self.tasklist_path.stem + JOURNAL_SUFFIX)
+
+    def record(
+        self,
+        task_name: str,
+        status: TaskRunStatus,
+        *,
+        duration: float | None = None,
+        error: str | None = None,
+    ) -> bool:
+        """Append one task result to the journal.
+
+        Returns False (and writes nothing) if the task list does not exist.
+        """
+        if not self.tasklist_path.exists():
+            log_message(f"Task list file not found: {self.tasklist_path}")
+            return False
+
+        entry: dict[str, object] = {
+            "task": task_name,
+            "status": status.value,
+            "finished_at": time.time(),
+        }
+        if duration is not None:
+            entry["duration"] = round(duration, 3)
+        if error:
+            entry["error"] = error
+
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            with self.journal_path.open("a", encoding="utf-8") as f:
+                f.write(line)
+        log_message(f"Recorded task {status.value}: {task_name}")
+        return True
+
+    def load(self) -> dict[str, TaskStateRecord]:
+        """Replay the journal into per-task records keyed by task name.
+
+        Malformed lines (e.g. a write interrupted by a crash) are skipped.
+        """
+        records: dict[str, TaskStateRecord] = {}
+        if not self.journal_path.exists():
+            return records
+
+        with self.journal_path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    name = entry["task"]
+                    status = TaskRunStatus(entry["status"])
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+                record = records.setdefault(name, TaskStateRecord(name=name))
+                record.status = status
+                record.attempts += 1
+                record.finished_at = entry.get("finished_at")
+                duration = entry.get("duration")
+                record.started_at = (
+                    record.finished_at - duration
+                    if record.finished_at is not None and duration is not None
+                    else None
+                )
+                record.error = entry.get("error")
+        return records
+
+    def completed_names(self) -> set[str]:
+        """Names of tasks whose latest recorded status is SUCCESS."""
+        return {
+            name for name, record in self.load().items() if record.status == TaskRunStatus.SUCCESS
+        }
+
+    def reset(self) -> None:
+        """Discard the journal (e.g. when a new task list is generated)."""
+        with self._lock:
+            self.journal_path.unlink(missing_ok=True)
+
+    def render(self) -> bool:
+        """Regenerate the markdown checkboxes from the journal.
+
+        Performs a single pass over the task list and rewrites it atomically,
+        only if at least one unchecked task is now complete.
+
+        Returns:
+            True if the markdown file was updated.
+        """
+        pending = self.completed_names()
+        if not pending or not self.tasklist_path.exists():
+            return False
+
+        lines = self.tasklist_path.read_text().splitlines()
+        modified = False
+        for i, line in enumerate(lines):
+            match = _UNCHECKED_TASK_PATTERN.match(line)
+            if match and match.group(3) in pending:
+                prefix, spacing, name, trailing = match.groups()
+                lines[i] = f"{prefix}[x]{spacing}{name}{trailing}"
+                # Only the first unchecked occurrence is marked, as before
+                pending.discard(name)
+                modified = True
+
+        if modified:
+            _atomic_write_text(self.tasklist_path, "\n".join(lines) + "\n")
+            log_message(f"Rendered task list from journal: {self.tasklist_path}")
+        return modified
+
+
+def _atomic_write_text(target_path: Path, content: str) -> None:
+    """Atomically replace target_path with content."""
+    fd, temp_path = tempfile.mkstemp(dir=target_path.parent, prefix=".ingot-tasklist-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        Path(temp_path).replace(target_path)
+    except Exception:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+# One shared store per task list so parallel workers share the append lock
+_stores: dict[Path, TaskListStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_tasklist_store(tasklist_path: Path) -> TaskListStore:
+    """Get the shared TaskListStore for a task list path."""
+    key = tasklist_path.absolute()
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = TaskListStore(tasklist_path)
+            _stores[key] = store
+        return store
+
+
+def record_task_result(
+    tasklist_path: Path,
+    task_name: str,
+    status: TaskRunStatus,
+    *,
+    duration: float | None = None,
+    error: str | None = None,
+) -> bool:
+    """Record a task execution result in the task list journal (O(1))."""
+    return get_tasklist_store(tasklist_path).record(
+        task_name, status, duration=duration, error=error
+    )
+
+
+def load_tasks(tasklist_path: Path) -> list[Task]:
+    """Parse the task list and overlay completions recorded in the journal.
+
+    The journal wins over the markdown, so tasks completed by a run that
+    was interrupted before render_tasklist() are not executed again.
+    """
+    tasks = parse_task_list(tasklist_path.read_text())
+    completed = get_tasklist_store(tasklist_path).completed_names()
+    for task in tasks:
+        if task.name in completed:
+            task.status = TaskStatus.COMPLETE
+    return tasks
+
+
+def render_tasklist(tasklist_path: Path) -> bool:
+    """Regenerate the markdown task list view from the journal."""
+    return get_tasklist_store(tasklist_path).render()
+
+
+def reset_tasklist_state(tasklist_path: Path) -> None:
+    """Discard recorded task state for a task list."""
+    get_tasklist_store(tasklist_path).reset()
+
+
+__all__ = [
+    "JOURNAL_SUFFIX",
+    "TaskStateRecord",
+    "TaskListStore",
+    "get_tasklist_store",
+    "record_task_result",
+    "load_tasks",
+    "render_tasklist",
+    "reset_tasklist_state",
+]
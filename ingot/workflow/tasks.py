@@ -133,6 +133,96 @@ class Task:
     target_files: list[str] = field(default_factory=list)
 
 
+# Compiled once at import: parse_task_list runs on every Step 2/3 entry
+_TASK_LINE_PATTERN = re.compile(r"^(\s*)[-*]?\s*\[([xX ])\]\s*(.+)$")
+_ORDER_PATTERN = re.compile(r"order:\s*(\d+)")
+_GROUP_PATTERN = re.compile(r"group:\s*(\w+)")
+_FILES_PATTERN = re.compile(r"files:\s*([^>]+)", re.DOTALL)
+_FILES_TRAILING_DASHES_PATTERN = re.compile(r"\s*-+\s*$")
+_COMMENT_OPEN_PATTERN = re.compile(r"<!--\s*")
+_FILES_SEPARATOR_PATTERN = re.compile(r"[,\n]+|\s{2,}")
+
+
+@dataclass
+class _MetadataBlock:
+    """Metadata parsed from a single HTML comment block."""
+
+    category: TaskCategory | None = None
+    order: int | None = None
+    group_id: str | None = None
+    target_files: list[str] = field(default_factory=list)
+
+
+def _parse_metadata_block(metadata_content: str) -> _MetadataBlock:
+    """Parse category and files metadata from one comment block."""
+    block = _MetadataBlock()
+    lowered = metadata_content.lower()
+
+    # Parse category metadata
+    if "category:" in lowered:
+        if "fundamental" in lowered:
+            block.category = TaskCategory.FUNDAMENTAL
+            order_match = _ORDER_PATTERN.search(metadata_content)
+            if order_match:
+                block.order = int(order_match.group(1))
+        elif "independent" in lowered:
+            block.category = TaskCategory.INDEPENDENT
+            group_match = _GROUP_PATTERN.search(metadata_content)
+            if group_match:
+                block.group_id = group_match.group(1)
+
+    # Parse files metadata
+    # Handles both:
+    # <!-- files: path/to/file1.py, path/to/file2.py -->
+    # And multiline with newlines within the file list
+    files_match = _FILES_PATTERN.search(metadata_content)
+    if files_match:
+        files_str = files_match.group(1).strip()
+        # Handle trailing -- (from -->) if present (the > is excluded by [^>]+)
+        files_str = _FILES_TRAILING_DASHES_PATTERN.sub("", files_str)
+        # Also remove leading <!-- if present
+        files_str = _COMMENT_OPEN_PATTERN.sub("", files_str)
+        # Split by comma, newline, or multiple spaces (2+) and clean up each file path
+        # Multiple spaces occur when multiline comments are joined with single spaces
+        # Handle mixed separators: comma, newline, multiple spaces, or combinations
+        parsed_files = _FILES_SEPARATOR_PATTERN.split(files_str)
+        block.target_files = [f.strip() for f in parsed_files if f.strip()]
+
+    return block
+
+
+def _merge_metadata_blocks(
+    blocks: list[_MetadataBlock],
+) -> tuple[TaskCategory, int, str | None, list[str]]:
+    """Fold metadata blocks ordered from nearest to farthest from the task.
+
+    Later (farther) blocks override category, order and group; files accumulate.
+    """
+    category = TaskCategory.FUNDAMENTAL
+    order = 0
+    group_id = None
+    target_files: list[str] = []
+
+    for block in blocks:
+        if block.category is not None:
+            category = block.category
+        if block.order is not None:
+            order = block.order
+        if block.group_id is not None:
+            group_id = block.group_id
+        target_files.extend(block.target_files)
+
+    return category, order, group_id, target_files
+
+
+def _is_multiline_comment_end(line_content: str) -> bool:
+    return line_content.endswith("-->") and "<!--" not in line_content
+
+
+def _is_single_line_comment(line_content: str) -> bool:
+    return line_content.startswith("<!--") and "-->" in line_content
+
+
 def _parse_task_metadata(
     lines: list[str], task_line_num: int
 ) -> tuple[TaskCategory, int, str | None, list[str]]:
@@ -157,13 +247,10 @@ def _parse_task_metadata(
     Metadata Bleed Prevention:
     - If a non-empty line that is NOT metadata and NOT a blank line appears
       before metadata, the metadata is NOT attached to the task.
-    """
-    # Default values
-    category = TaskCategory.FUNDAMENTAL
-    order = 0
-    group_id = None
-    target_files: list[str] = []
 
+    This is the single-task reference implementation; parse_task_list uses
+    an equivalent forward pass so whole lists are parsed in linear time.
+    """
     # Collect all metadata content from comments above the task
     metadata_blocks: list[str] = []
 
@@ -176,7 +263,7 @@ def _parse_task_metadata(
         line_content = lines[search_line].strip()
 
         # Handle multi-line comment end (when searching backwards, this is the start)
-        if not in_multiline_comment and line_content.endswith("-->") and "<!--" not in line_content:
+        if not in_multiline_comment and _is_multiline_comment_end(line_content):
             # This is the end of a multi-line comment (searching backwards)
             in_multiline_comment = True
             multiline_buffer = [line_content]
@@ -202,7 +289,7 @@ def _parse_task_metadata(
             continue
 
         # Check if it's a single-line metadata comment
-        if line_content.startswith("<!--") and "-->" in line_content:
+        if _is_single_line_comment(line_content):
             metadata_blocks.append(line_content)
             search_line -= 1
             continue
@@ -212,40 +299,7 @@ def _parse_task_metadata(
         # to tasks that have other content between them
         break
 
-    # Parse all collected metadata
-    for metadata_content in metadata_blocks:
-        # Parse category metadata
-        if "category:" in metadata_content.lower():
-            if "fundamental" in metadata_content.lower():
-                category = TaskCategory.FUNDAMENTAL
-                order_match = re.search(r"order:\s*(\d+)", metadata_content)
-                if order_match:
-                    order = int(order_match.group(1))
-            elif "independent" in metadata_content.lower():
-                category = TaskCategory.INDEPENDENT
-                group_match = re.search(r"group:\s*(\w+)", metadata_content)
-                if group_match:
-                    group_id = group_match.group(1)
-
-        # Parse files metadata
-        # Handles both:
-        # <!-- files: path/to/file1.py, path/to/file2.py -->
-        # And multiline with newlines within the file list
-        files_match = re.search(r"files:\s*([^>]+)", metadata_content, re.DOTALL)
-        if files_match:
-            files_str = files_match.group(1).strip()
-            # Handle trailing -- (from -->) if present (the > is excluded by [^>]+)
-            files_str = re.sub(r"\s*-+\s*$", "", files_str)
-            # Also remove leading <!-- if present
-            files_str = re.sub(r"<!--\s*", "", files_str)
-            # Split by comma, newline, or multiple spaces (2+) and clean up each file path
-            # Multiple spaces occur when multiline comments are joined with single spaces
-            # Handle mixed separators: comma, newline, multiple spaces, or combinations
-            parsed_files = re.split(r"[,\n]+|\s{2,}", files_str)
-            parsed_files = [f.strip() for f in parsed_files if f.strip()]
-            target_files.extend(parsed_files)
-
-    return category, order, group_id, target_files
+    return _merge_metadata_blocks([_parse_metadata_block(b) for b in metadata_blocks])
 
 
 def parse_task_list(content: str) -> list[Task]:
@@ -262,27 +316,45 @@ def parse_task_list(content: str) -> list[Task]:
     - <!-- category: fundamental, order: N -->
     - <!-- category: independent, group: GROUP_NAME -->
     - <!-- files: path/to/file1.py, path/to/file2.py -->
+
+    Single forward pass, linear in the number of lines. For every line it
+    records where a backward metadata scan starting there would continue
+    (``chain_head``), so each task only walks its own metadata blocks. The
+    result is identical to calling _parse_task_metadata for every task,
+    including metadata bleed prevention.
     """
     tasks: list[Task] = []
     lines = content.splitlines()
 
-    # Pattern for task items: optional bullet, checkbox, task name
-    # Captures: indent, checkbox state, task name
-    pattern = re.compile(
-        r"^(\s*)[-*]?\s*\[([xX ])\]\s*(.+)$",
-        re.MULTILINE,
-    )
+    # chain_head[i]: nearest metadata block line reached by a backward scan
+    # starting at line i, or -1 if the scan stops without collecting more.
+    # For a block line h, block_start[h] is its first line and chain_head of
+    # the line above block_start[h] continues the chain.
+    chain_head: list[int] = [-1] * len(lines)
+    block_start: dict[int, int] = {}
+    last_comment_open = -1  # Last line (so far) starting with "<!--"
+    # Stack of (indent_level, task) with strictly increasing indent levels
+    parent_stack: list[tuple[int, Task]] = []
 
     for line_num, line in enumerate(lines):
-        match = pattern.match(line)
+        line_content = line.strip()
+        previous_head = chain_head[line_num - 1] if line_num > 0 else -1
+
+        match = _TASK_LINE_PATTERN.match(line)
         if match:
             indent, checkbox, name = match.groups()
             indent_level = len(indent) // 2  # Assume 2-space indentation
 
             status = TaskStatus.COMPLETE if checkbox.lower() == "x" else TaskStatus.PENDING
 
-            # Parse metadata from previous lines (category, order, group_id, target_files)
-            category, order, group_id, target_files = _parse_task_metadata(lines, line_num)
+            # Walk this task's metadata chain from nearest to farthest block
+            blocks: list[_MetadataBlock] = []
+            head = previous_head
+            while head != -1:
+                start = block_start[head]
+                blocks.append(_parse_metadata_block(" ".join(_strip_lines(lines, start, head))))
+                head = chain_head[start - 1] if start > 0 else -1
+            category, order, group_id, target_files = _merge_metadata_blocks(blocks)
 
             task = Task(
                 name=name.strip(),
@@ -295,20 +367,41 @@ def parse_task_list(content: str) -> list[Task]:
                 target_files=target_files,
             )
 
-            # Set parent for nested tasks
-            if indent_level > 0 and tasks:
-                for prev_task in reversed(tasks):
-                    if prev_task.indent_level < indent_level:
-                        task.parent = prev_task.name
-                        break
+            # Set parent for nested tasks (nearest previous task with a smaller indent)
+            while parent_stack and parent_stack[-1][0] >= indent_level:
+                parent_stack.pop()
+            if indent_level > 0 and parent_stack:
+                task.parent = parent_stack[-1][1].name
+            parent_stack.append((indent_level, task))
 
             tasks.append(task)
-            log_message(f"Parsed task: {task.name} ({task.status.value}, {task.category.value})")
+
+        # Classify the line for the backward-scan chain (same rules and
+        # precedence as _parse_task_metadata)
+        if _is_multiline_comment_end(line_content):
+            if last_comment_open != -1:
+                block_start[line_num] = last_comment_open
+                chain_head[line_num] = line_num
+            # else: an unmatched "-->" swallows everything above it
+        elif not line_content:
+            chain_head[line_num] = previous_head
+        elif _is_single_line_comment(line_content):
+            block_start[line_num] = line_num
+            chain_head[line_num] = line_num
+        # else: any other line stops the scan (metadata bleed prevention)
+
+        if line_content.startswith("<!--"):
+            last_comment_open = line_num
 
     log_message(f"Total tasks parsed: {len(tasks)}")
     return tasks
 
 
+def _strip_lines(lines: list[str], start: int, end: int) -> list[str]:
+    """Return stripped lines[start..end] (inclusive)."""
+    return [line.strip() for line in lines[start : end + 1]]
+
+
 def get_pending_tasks(tasks: list[Task]) -> list[Task]:
     """Get list of pending (incomplete) tasks."""
     return [t for t in tasks if t.status == TaskStatus.PENDING]
@@ -10,6 +10,14 @@ import pytest
 pytest_plugins = ("pytest_asyncio", "tests.fixtures.cli_integration")
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path: Path, monkeypatch) -> Path:
+    """Keep local artifact caches (.ingot/cache) out of the working directory."""
+    cache_dir = tmp_path / ".ingot-cache"
+    monkeypatch.setenv("INGOT_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
 @pytest.fixture
 def temp_config_file(tmp_path: Path) -> Path:
     """Create a temporary config file with sample values."""
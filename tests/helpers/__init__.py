@@ -4,4 +4,5 @@ Import helpers directly from their concrete modules:
   from tests.helpers.async_cm import make_async_context_manager
   from tests.helpers.workflow import get_ticket_from_workflow_call
   from tests.helpers.ui import make_records, make_record_with_log_buffer
+  from tests.helpers.benchmark import report_timings, skip_timing_under_xdist
 """
@@ -51,22 +51,28 @@ class TestGitignorePatternsConfiguration:
     """Tests for INGOT_GITIGNORE_PATTERNS configuration.
 
     These tests verify the patterns list is correctly configured to:
-    - Ignore runtime artifacts (.ingot/runs/, *.log)
+    - Ignore runtime artifacts (.ingot/runs/, .ingot/cache/, *.log, *.state.jsonl)
     - NOT ignore user-visible files (specs/ directory with plan/tasklist .md files)
     """
 
     def test_patterns_include_ingot_runs_directory(self):
         assert ".ingot/runs/" in INGOT_GITIGNORE_PATTERNS
 
+    def test_patterns_include_ingot_cache_directory(self):
+        assert ".ingot/cache/" in INGOT_GITIGNORE_PATTERNS
+
     def test_patterns_include_log_files(self):
         assert "*.log" in INGOT_GITIGNORE_PATTERNS
 
+    def test_patterns_include_task_state_journal(self):
+        assert "*.state.jsonl" in INGOT_GITIGNORE_PATTERNS
+
     def test_patterns_do_not_include_specs_directory(self):
         assert "specs/" not in INGOT_GITIGNORE_PATTERNS
         assert "specs" not in INGOT_GITIGNORE_PATTERNS
 
     def test_patterns_only_contain_expected_entries(self):
-        expected_patterns = [".ingot/runs/", "*.log"]
+        expected_patterns = [".ingot/runs/", ".ingot/cache/", "*.log", "*.state.jsonl"]
         assert INGOT_GITIGNORE_PATTERNS == expected_patterns
 
 
@@ -155,7 +161,7 @@ __pycache__/
         gitignore_path = tmp_path / ".gitignore"
 
         # Create .gitignore with INGOT patterns already present
-        existing_content = "*.pyc\n.ingot/runs/\n*.log\n"
+        existing_content = "*.pyc\n.ingot/runs/\n.ingot/cache/\n*.log\n*.state.jsonl\n"
         gitignore_path.write_text(existing_content)
 
         result = ensure_gitignore_configured(quiet=True)
@@ -0,0 +1,106 @@
+"""Tests for ingot.workflow.background_run module."""
+
+import subprocess
+import sys
+import threading
+from unittest.mock import patch
+
+from ingot.utils.processes import process_started
+from ingot.workflow.background_run import BackgroundRun
+
+
+class _LineRun(BackgroundRun):
+    """Emits output lines until cancelled, or raises if given an error."""
+
+    label = "Test run"
+
+    def __init__(self, error: Exception | None = None) -> None:
+        super().__init__()
+        self.error = error
+        self.started = threading.Event()
+        self.lines_sent = 0
+        self.finished_calls = 0
+
+    def _work(self) -> None:
+        if self.error is not None:
+            raise self.error
+        self.started.set()
+        for i in range(500):
+            self._handle_output_line(f"line {i}")
+            self.lines_sent += 1
+            threading.Event().wait(0.01)
+
+    def _finished(self) -> None:
+        self.finished_calls += 1
+
+
+class _QuietRun(BackgroundRun):
+    """Waits on a subprocess that produces no output."""
+
+    label = "Quiet run"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.started = threading.Event()
+        self.returncode: int | None = None
+
+    def _work(self) -> None:
+        process = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(60)"],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        process_started(process)
+        self.started.set()
+        self.returncode = process.wait()
+
+
+class TestBackgroundRun:
+    def test_cancel_raises_at_next_output_line(self):
+        run = _LineRun()
+        run._start()
+        run.started.wait(timeout=5)
+
+        run.cancel()
+        run._thread.join(timeout=5)
+
+        assert run.done
+        assert run.cancelled
+        assert run.lines_sent < 500
+        assert run.finished_calls == 1
+
+    def test_cancel_terminates_quiet_backend_process(self):
+        run = _QuietRun()
+        run._start()
+        run.started.wait(timeout=5)
+
+        run.cancel()
+        run._thread.join(timeout=10)
+
+        assert run.done
+        assert run.returncode is not None and run.returncode != 0
+
+    def test_forwards_lines_to_listener(self):
+        run = _LineRun()
+        seen: list[str] = []
+        run._listener = seen.append
+        run._start()
+        run.started.wait(timeout=5)
+        while len(seen) < 3:
+            threading.Event().wait(0.01)
+
+        run.cancel()
+        run._thread.join(timeout=5)
+
+        assert seen[:3] == ["line 0", "line 1", "line 2"]
+
+    @patch("ingot.workflow.background_run.log_message")
+    def test_failure_is_logged_and_marks_done(self, mock_log):
+        run = _LineRun(error=RuntimeError("boom"))
+        run._start()
+        run._thread.join(timeout=5)
+
+        assert run.done
+        assert not run.cancelled
+        assert run.finished_calls == 1
+        mock_log.assert_called_once_with("Test run failed: boom")
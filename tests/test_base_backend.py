@@ -12,6 +12,7 @@ from ingot.integrations.backends.base import (
     SubagentMetadata,
 )
 from ingot.integrations.backends.errors import BackendTimeoutError
+from ingot.utils.processes import watch_processes
 
 
 class ConcreteTestBackend(BaseBackend):
@@ -315,6 +316,23 @@ class TestRunStreamingWithTimeout:
         assert return_code == 0
         assert output == "output\n"
 
+    def test_run_streaming_with_timeout_reports_process_to_watcher(self, mocker):
+        mock_process = mocker.MagicMock()
+        mock_process.stdout = iter([])
+        mock_process.returncode = 0
+        mock_process.poll.return_value = 0
+
+        mocker.patch("subprocess.Popen", return_value=mock_process)
+
+        backend = ConcreteTestBackend()
+        started = []
+        with watch_processes(started.append):
+            backend._run_streaming_with_timeout(
+                ["echo", "test"], output_callback=lambda x: None, timeout_seconds=None
+            )
+
+        assert started == [mock_process]
+
     def test_run_streaming_with_timeout_callback_receives_stripped_lines(self, mocker):
         mock_process = mocker.MagicMock()
         mock_process.stdout = iter(["  line with spaces  \n", "another line\n"])
@@ -349,6 +349,51 @@ class TestInMemoryTicketCache:
         assert cache.size() == num_threads * iterations
 
 
+class TestExpiredEntries:
+    def test_include_expired_keeps_entry_for_revalidation(self, sample_ticket):
+        cache = InMemoryTicketCache()
+        cache.set(sample_ticket, ttl=timedelta(seconds=-1), etag='"v1"', last_modified="Mon")
+        key = CacheKey.from_ticket(sample_ticket)
+
+        entry = cache.get_cached_ticket(key, include_expired=True)
+
+        assert entry is not None and entry.is_expired
+        assert (entry.etag, entry.last_modified) == ('"v1"', "Mon")
+        assert cache.size() == 1
+        assert cache.get(key) is None
+        assert cache.size() == 0
+
+    def test_file_cache_round_trips_validators(self, sample_ticket, tmp_path):
+        cache = FileBasedTicketCache(cache_dir=tmp_path)
+        cache.set(sample_ticket, ttl=timedelta(seconds=-1), etag='"v1"', last_modified="Mon")
+
+        entry = cache.get_cached_ticket(CacheKey.from_ticket(sample_ticket), include_expired=True)
+
+        assert entry is not None
+        assert (entry.etag, entry.last_modified) == ('"v1"', "Mon")
+
+
+class TestSetMany:
+    def test_in_memory_stores_all_and_evicts_lru(self, sample_ticket, linear_ticket):
+        cache = InMemoryTicketCache(max_size=1)
+
+        cache.set_many([sample_ticket, linear_ticket], ttl=timedelta(minutes=5))
+
+        assert cache.size() == 1
+        entry = cache.get_cached_ticket(CacheKey.from_ticket(linear_ticket))
+        assert entry is not None
+        assert entry.ttl_remaining <= timedelta(minutes=5)
+        assert entry.etag is None
+
+    def test_file_cache_stores_all(self, sample_ticket, linear_ticket, tmp_path):
+        cache = FileBasedTicketCache(cache_dir=tmp_path)
+
+        cache.set_many([sample_ticket, linear_ticket])
+
+        assert cache.get(CacheKey.from_ticket(sample_ticket)) is not None
+        assert cache.get(CacheKey.from_ticket(linear_ticket)) is not None
+
+
 class TestFileBasedTicketCache:
     @pytest.fixture
     def cache(self, tmp_path):
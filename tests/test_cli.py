@@ -506,6 +506,8 @@ class TestDirtyTreePolicy:
         mock_config.settings.auto_update_docs = True
         mock_config.settings.max_self_corrections = 3
         mock_config.settings.max_review_fix_attempts = 3
+        mock_config.settings.clarification_batch_size = 1
+        mock_config.settings.plan_candidates = 1
 
         _run_workflow(
             ticket="TEST-123",
@@ -536,6 +538,8 @@ class TestDirtyTreePolicy:
         mock_config.settings.auto_update_docs = True
         mock_config.settings.max_self_corrections = 3
         mock_config.settings.max_review_fix_attempts = 3
+        mock_config.settings.clarification_batch_size = 1
+        mock_config.settings.plan_candidates = 1
 
         _run_workflow(
             ticket="TEST-123",
@@ -566,6 +570,8 @@ class TestDirtyTreePolicy:
         mock_config.settings.auto_update_docs = True
         mock_config.settings.max_self_corrections = 3
         mock_config.settings.max_review_fix_attempts = 3
+        mock_config.settings.clarification_batch_size = 1
+        mock_config.settings.plan_candidates = 1
 
         with pytest.raises(click.exceptions.Exit) as exc_info:
             _run_workflow(
@@ -619,6 +625,8 @@ class TestEffectiveValueOverrides:
         mock_config.settings.auto_update_docs = True
         mock_config.settings.max_self_corrections = 3
         mock_config.settings.max_review_fix_attempts = 3
+        mock_config.settings.clarification_batch_size = 1
+        mock_config.settings.plan_candidates = 1
 
         _run_workflow(
             ticket="TEST-123",
@@ -650,6 +658,8 @@ class TestEffectiveValueOverrides:
         mock_config.settings.auto_update_docs = True
         mock_config.settings.max_self_corrections = 3
         mock_config.settings.max_review_fix_attempts = 3
+        mock_config.settings.clarification_batch_size = 1
+        mock_config.settings.plan_candidates = 1
 
         _run_workflow(
             ticket="TEST-123",
@@ -681,6 +691,8 @@ class TestEffectiveValueOverrides:
         mock_config.settings.auto_update_docs = True
         mock_config.settings.max_self_corrections = 3
         mock_config.settings.max_review_fix_attempts = 3
+        mock_config.settings.clarification_batch_size = 1
+        mock_config.settings.plan_candidates = 1
 
         _run_workflow(
             ticket="TEST-123",
@@ -710,6 +722,8 @@ class TestEffectiveValueOverrides:
         mock_config.settings.auto_update_docs = True
         mock_config.settings.max_self_corrections = 3
         mock_config.settings.max_review_fix_attempts = 3
+        mock_config.settings.clarification_batch_size = 1
+        mock_config.settings.plan_candidates = 1
 
         _run_workflow(
             ticket="TEST-123",
@@ -741,6 +755,8 @@ class TestEffectiveValueOverrides:
         mock_config.settings.auto_update_docs = True
         mock_config.settings.max_self_corrections = 3
         mock_config.settings.max_review_fix_attempts = 3
+        mock_config.settings.clarification_batch_size = 1
+        mock_config.settings.plan_candidates = 1
 
         with pytest.raises(click.exceptions.Exit) as exc_info:
             _run_workflow(
@@ -750,6 +766,64 @@ class TestEffectiveValueOverrides:
             )
         assert exc_info.value.exit_code == ExitCode.GENERAL_ERROR
 
+    @patch("ingot.cli.workflow._is_ambiguous_ticket_id", return_value=False)
+    @patch("ingot.cli.ticket.run_async")
+    def test_invalid_config_plan_candidates_rejected(self, mock_run_async, mock_is_ambiguous):
+        import click
+
+        from ingot.cli import _run_workflow
+        from ingot.utils.errors import ExitCode
+
+        mock_run_async.return_value = (MagicMock(), MagicMock())
+        mock_config = MagicMock()
+        mock_config.settings.max_parallel_tasks = 3
+        mock_config.settings.parallel_execution_enabled = True
+        mock_config.settings.fail_fast = False
+        mock_config.settings.default_model = "test-model"
+        mock_config.settings.planning_model = ""
+        mock_config.settings.implementation_model = ""
+        mock_config.settings.skip_clarification = False
+        mock_config.settings.squash_at_end = True
+        mock_config.settings.auto_update_docs = True
+        mock_config.settings.max_self_corrections = 3
+        mock_config.settings.max_review_fix_attempts = 3
+        mock_config.settings.clarification_batch_size = 1
+        mock_config.settings.plan_candidates = 6  # Invalid config value
+
+        with pytest.raises(click.exceptions.Exit) as exc_info:
+            _run_workflow(ticket="TEST-123", config=mock_config)
+        assert exc_info.value.exit_code == ExitCode.GENERAL_ERROR
+
+    @patch("ingot.cli.workflow._is_ambiguous_ticket_id", return_value=False)
+    @patch("ingot.cli.ticket.run_async")
+    def test_invalid_config_clarification_batch_size_rejected(
+        self, mock_run_async, mock_is_ambiguous
+    ):
+        import click
+
+        from ingot.cli import _run_workflow
+        from ingot.utils.errors import ExitCode
+
+        mock_run_async.return_value = (MagicMock(), MagicMock())
+        mock_config = MagicMock()
+        mock_config.settings.max_parallel_tasks = 3
+        mock_config.settings.parallel_execution_enabled = True
+        mock_config.settings.fail_fast = False
+        mock_config.settings.default_model = "test-model"
+        mock_config.settings.planning_model = ""
+        mock_config.settings.implementation_model = ""
+        mock_config.settings.skip_clarification = False
+        mock_config.settings.squash_at_end = True
+        mock_config.settings.auto_update_docs = True
+        mock_config.settings.max_self_corrections = 3
+        mock_config.settings.max_review_fix_attempts = 3
+        mock_config.settings.clarification_batch_size = 11  # Invalid config value
+        mock_config.settings.plan_candidates = 1
+
+        with pytest.raises(click.exceptions.Exit) as exc_info:
+            _run_workflow(ticket="TEST-123", config=mock_config)
+        assert exc_info.value.exit_code == ExitCode.GENERAL_ERROR
+
     @patch("ingot.cli.workflow._is_ambiguous_ticket_id", return_value=False)
     @patch("ingot.workflow.runner.run_ingot_workflow")
     @patch("ingot.cli.ticket.run_async")
@@ -771,6 +845,8 @@ class TestEffectiveValueOverrides:
         mock_config.settings.auto_update_docs = True  # Config says True
         mock_config.settings.max_self_corrections = 3
         mock_config.settings.max_review_fix_attempts = 3
+        mock_config.settings.clarification_batch_size = 1
+        mock_config.settings.plan_candidates = 1
 
         _run_workflow(
             ticket="TEST-123",
@@ -802,6 +878,8 @@ class TestEffectiveValueOverrides:
         mock_config.settings.auto_update_docs = False  # Config says False
         mock_config.settings.max_self_corrections = 3
         mock_config.settings.max_review_fix_attempts = 3
+        mock_config.settings.clarification_batch_size = 1
+        mock_config.settings.plan_candidates = 1
 
         _run_workflow(
             ticket="TEST-123",
@@ -833,6 +911,8 @@ class TestEffectiveValueOverrides:
         mock_config.settings.auto_update_docs = True
         mock_config.settings.max_self_corrections = 3
         mock_config.settings.max_review_fix_attempts = 3
+        mock_config.settings.clarification_batch_size = 1
+        mock_config.settings.plan_candidates = 1
         mock_config.settings.auto_commit = True
         mock_config.settings.enable_plan_validation = True
         mock_config.settings.plan_validation_strict = True  # Config says strict
@@ -867,6 +947,8 @@ class TestEffectiveValueOverrides:
         mock_config.settings.auto_update_docs = True
         mock_config.settings.max_self_corrections = 3
         mock_config.settings.max_review_fix_attempts = 3
+        mock_config.settings.clarification_batch_size = 1
+        mock_config.settings.plan_candidates = 1
         mock_config.settings.auto_commit = True
         mock_config.settings.enable_plan_validation = True
         mock_config.settings.plan_validation_strict = False  # Config says lenient
@@ -901,6 +983,8 @@ class TestEffectiveValueOverrides:
         mock_config.settings.auto_update_docs = True
         mock_config.settings.max_self_corrections = 3
         mock_config.settings.max_review_fix_attempts = 3
+        mock_config.settings.clarification_batch_size = 1
+        mock_config.settings.plan_candidates = 1
         mock_config.settings.auto_commit = True
         mock_config.settings.enable_plan_validation = True  # Config says enabled
         mock_config.settings.plan_validation_strict = True
@@ -1696,6 +1780,8 @@ class TestMaxReviewFixAttemptsFlags:
         mock_config.settings.auto_update_docs = True
         mock_config.settings.max_self_corrections = 3
         mock_config.settings.max_review_fix_attempts = 3  # Config default
+        mock_config.settings.clarification_batch_size = 1
+        mock_config.settings.plan_candidates = 1
 
         _run_workflow(
             ticket="TEST-123",
@@ -1726,6 +1812,8 @@ class TestMaxReviewFixAttemptsFlags:
         mock_config.settings.auto_update_docs = True
         mock_config.settings.max_self_corrections = 3
         mock_config.settings.max_review_fix_attempts = 3
+        mock_config.settings.clarification_batch_size = 1
+        mock_config.settings.plan_candidates = 1
 
         with pytest.raises(click.exceptions.Exit) as exc_info:
             _run_workflow(
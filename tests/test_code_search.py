@@ -0,0 +1,178 @@
+"""Tests for ingot.workflow.code_search."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ingot.integrations.git import GitObjectReader, get_head_tree
+from ingot.workflow.code_search import (
+    CodeSearchIndex,
+    get_index_path,
+    load_code_search_index,
+    query_terms_for,
+    tokenize,
+)
+from ingot.workflow.state import WorkflowState
+from ingot.workflow.step1_plan import _run_researcher
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+def _commit(repo: Path, files: dict[str, str | None]) -> None:
+    for name, content in files.items():
+        if content is None:
+            (repo / name).unlink()
+            continue
+        (repo / name).parent.mkdir(parents=True, exist_ok=True)
+        (repo / name).write_text(content)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-m", "change")
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    monkeypatch.chdir(repo)
+    _git(repo, "init")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test User")
+    _commit(
+        repo,
+        {
+            "src/billing/invoice.py": "class InvoiceRenderer:\n    def render_pdf(self):\n"
+            "        return build_invoice_pdf()\n",
+            "src/auth/login.py": "def login_user(token):\n    return validate_token(token)\n",
+            "src/util.py": "def helper():\n    pass\n",
+            "docs/guide.md": "# Guide\nHow to log in.\n",
+        },
+    )
+    return repo
+
+
+@pytest.fixture
+def reader(repo):
+    with GitObjectReader(repo) as reader:
+        yield reader
+
+
+class TestTokenize:
+    def test_splits_identifiers(self):
+        assert tokenize("RepoFileIndex.build_index") == [
+            "repofileindex",
+            "repo",
+            "file",
+            "index",
+            "build_index",
+            "build",
+            "index",
+        ]
+
+    def test_drops_stopwords_and_short_words(self):
+        assert tokenize("The user should be able to do it") == ["user", "able"]
+
+
+class TestCodeSearchIndex:
+    def test_ranks_matching_file_first(self, repo, reader):
+        index = CodeSearchIndex()
+        index.update(get_head_tree(), reader)
+
+        hits = index.search(["invoice", "pdf"])
+
+        assert hits[0].path == "src/billing/invoice.py"
+        assert set(hits[0].terms) == {"invoice", "pdf"}
+
+    def test_snippets_show_best_lines(self, repo, reader):
+        index = CodeSearchIndex()
+        index.update(get_head_tree(), reader)
+
+        (hit,) = index.with_snippets(index.search(["token"], limit=1), reader)
+
+        assert hit.path == "src/auth/login.py"
+        assert hit.snippets == (
+            (1, "def login_user(token):"),
+            (2, "return validate_token(token)"),
+        )
+
+    def test_incremental_update_reads_only_changed_files(self, repo, reader):
+        index = CodeSearchIndex()
+        index.update(get_head_tree(), reader)
+        _commit(repo, {"src/util.py": "def refund_invoice():\n    pass\n", "docs/guide.md": None})
+
+        with patch(
+            "ingot.workflow.code_search._read_text_blob",
+            return_value="def refund_invoice():\n    pass\n",
+        ) as read:
+            changed = index.update(get_head_tree(), reader)
+
+        assert changed == 2
+        assert read.call_count == 1
+        assert len(index) == 3
+        assert index.search(["refund"])[0].path == "src/util.py"
+
+    def test_round_trips_through_disk(self, repo, reader, tmp_path):
+        index = CodeSearchIndex()
+        index.update(get_head_tree(), reader)
+        path = tmp_path / "index.json"
+
+        index.save(path)
+        loaded = CodeSearchIndex.load(path)
+
+        assert loaded.tree == index.tree
+        assert loaded.search(["login"]) == index.search(["login"])
+
+    def test_skips_binary_files(self, repo, reader):
+        (repo / "logo.png").write_bytes(b"\x89PNG\0invoice")
+        _git(repo, "add", "logo.png")
+        _git(repo, "commit", "-m", "logo")
+        index = CodeSearchIndex()
+
+        index.update(get_head_tree(), reader)
+
+        assert "logo.png" not in {hit.path for hit in index.search(["invoice", "png"])}
+
+
+class TestLoadCodeSearchIndex:
+    def test_persists_and_follows_head(self, repo):
+        first = load_code_search_index()
+        _commit(repo, {"src/export.py": "def export_csv():\n    pass\n"})
+
+        second = load_code_search_index()
+
+        assert get_index_path().exists()
+        assert second.tree != first.tree
+        assert second.search(["csv"])[0].path == "src/export.py"
+
+    def test_query_terms_skip_unknown_and_common_words(self, repo):
+        index = load_code_search_index()
+
+        assert query_terms_for("Render invoice PDF after login, unknownword", index) == [
+            "render",
+            "invoice",
+            "pdf",
+            "login",
+        ]
+
+
+class TestResearcherSeed:
+    @patch("ingot.ui.inline_runner.InlineRunner")
+    def test_prompt_lists_matching_files(self, tui_class, repo, generic_ticket, mock_backend):
+        tui = MagicMock()
+        tui.check_quit_requested.return_value = False
+        tui.run_with_work.side_effect = lambda fn: fn()
+        tui_class.return_value = tui
+        generic_ticket.title = "Fix invoice PDF rendering"
+        state = WorkflowState(ticket=generic_ticket, research_cache_max_mb=0)
+        mock_backend.run_with_callback.return_value = (True, "research")
+
+        _run_researcher(state, mock_backend)
+
+        prompt = mock_backend.run_with_callback.call_args.args[0]
+        assert "[SOURCE: LOCAL CODE SEARCH" in prompt
+        assert "- `src/billing/invoice.py`" in prompt
+        assert "3: return build_invoice_pdf()" in prompt
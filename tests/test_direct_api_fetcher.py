@@ -27,6 +27,7 @@ from ingot.integrations.fetchers import (
     DirectAPIFetcher,
 )
 from ingot.integrations.fetchers.exceptions import PlatformApiError
+from ingot.integrations.fetchers.handlers import CacheValidators, ConditionalFetchResult
 from ingot.integrations.providers.base import Platform
 
 
@@ -274,6 +275,37 @@ class TestDirectAPIFetcherFetchRaw:
             assert call_args[1]["timeout_seconds"] == 10.0
 
 
+class TestDirectAPIFetcherFetchBatch:
+    @pytest.mark.asyncio
+    async def test_chunks_by_batch_size_and_drops_failed_chunks(self, fetcher):
+        async def fetch_batch(ticket_ids, credentials, timeout_seconds, http_client):
+            if "PROJ-5" in ticket_ids:
+                raise PlatformApiError(platform_name="Jira", error_details="bad request")
+            return {ticket_id: {"key": ticket_id} for ticket_id in ticket_ids}
+
+        handler = MagicMock(batch_size=2, platform_name="Jira")
+        handler.fetch_batch = AsyncMock(side_effect=fetch_batch)
+        ticket_ids = [f"PROJ-{n}" for n in range(1, 6)]
+
+        with patch.object(fetcher, "_get_platform_handler", AsyncMock(return_value=handler)):
+            result = await fetcher.fetch_batch(ticket_ids, "jira")
+
+        assert list(result) == ["PROJ-1", "PROJ-2", "PROJ-3", "PROJ-4"]
+        chunks = [call.args[0] for call in handler.fetch_batch.await_args_list]
+        assert chunks == [["PROJ-1", "PROJ-2"], ["PROJ-3", "PROJ-4"], ["PROJ-5"]]
+
+    @pytest.mark.asyncio
+    async def test_no_request_without_batch_endpoint(self, fetcher):
+        handler = MagicMock(batch_size=0)
+        handler.fetch_batch = AsyncMock()
+
+        with patch.object(fetcher, "_get_platform_handler", AsyncMock(return_value=handler)):
+            result = await fetcher.fetch_batch(["abc", "def"], "trello")
+
+        assert result == {}
+        handler.fetch_batch.assert_not_called()
+
+
 class TestDirectAPIFetcherRetry:
     @pytest.mark.asyncio
     async def test_retry_on_timeout(self, mock_auth_manager):
@@ -298,6 +330,30 @@ class TestDirectAPIFetcherRetry:
         assert result == {"key": "PROJ-123"}
         assert mock_handler.fetch.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_validators_use_conditional_fetch(self, mock_auth_manager):
+        fetcher = DirectAPIFetcher(mock_auth_manager)
+        fetcher._performance = FetchPerformanceConfig(max_retries=2, retry_delay_seconds=0.01)
+        validators = CacheValidators(etag='"v1"')
+        not_modified = ConditionalFetchResult(data=None, validators=validators)
+
+        mock_handler = MagicMock()
+        mock_handler.fetch_conditional = AsyncMock(
+            side_effect=[httpx.TimeoutException("timeout"), not_modified]
+        )
+
+        result = await fetcher._fetch_with_retry(
+            handler=mock_handler,
+            ticket_id="PROJ-123",
+            credentials={"token": "test"},
+            timeout_seconds=5.0,
+            validators=validators,
+        )
+
+        assert result is not_modified
+        assert mock_handler.fetch_conditional.call_count == 2
+        mock_handler.fetch.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_no_retry_on_4xx_error(self, mock_auth_manager):
         fetcher = DirectAPIFetcher(mock_auth_manager)
@@ -25,6 +25,7 @@ from ingot.integrations.fetchers.exceptions import (
 )
 from ingot.integrations.fetchers.handlers import (
     AzureDevOpsHandler,
+    CacheValidators,
     GitHubHandler,
     GraphQLPlatformHandler,
     JiraHandler,
@@ -435,6 +436,170 @@ class TestGitHubHandler:
         assert headers["Authorization"] == "Bearer ghp_token123"
 
 
+class TestConditionalRequests:
+    @pytest.mark.asyncio
+    async def test_github_sends_validators_and_handles_304(
+        self, mock_http_client, github_credentials
+    ):
+        response = mock_http_client.get.return_value
+        response.status_code = 304
+        response.headers = httpx.Headers()
+        validators = CacheValidators(etag='W/"abc"', last_modified="Mon, 01 Jun 2026 10:00:00 GMT")
+
+        result = await GitHubHandler().fetch_conditional(
+            "owner/repo#1", github_credentials, validators, http_client=mock_http_client
+        )
+
+        headers = mock_http_client.get.call_args[1]["headers"]
+        assert headers["If-None-Match"] == 'W/"abc"'
+        assert headers["If-Modified-Since"] == "Mon, 01 Jun 2026 10:00:00 GMT"
+        assert result.not_modified
+        assert result.validators == validators
+        response.raise_for_status.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_jira_returns_data_and_new_validators(self, mock_http_client, jira_credentials):
+        response = mock_http_client.get.return_value
+        response.json.return_value = {"key": "PROJ-123"}
+        response.headers = httpx.Headers({"ETag": '"v2"'})
+
+        result = await JiraHandler().fetch_conditional(
+            "PROJ-123", jira_credentials, CacheValidators(etag='"v1"'), http_client=mock_http_client
+        )
+
+        assert result.data == {"key": "PROJ-123"}
+        assert result.validators == CacheValidators(etag='"v2"')
+
+    @pytest.mark.asyncio
+    async def test_default_is_unconditional(self, mock_http_client, trello_credentials):
+        result = await TrelloHandler().fetch_conditional(
+            "abc123", trello_credentials, CacheValidators(etag='"v1"'), http_client=mock_http_client
+        )
+
+        assert "If-None-Match" not in (mock_http_client.get.call_args[1].get("headers") or {})
+        assert result.data == {"id": "test"}
+        assert not result.validators
+
+
+class TestBatchRequests:
+    @pytest.mark.asyncio
+    async def test_jira_jql_search_skips_invalid_keys(self, mock_http_client, jira_credentials):
+        mock_http_client.post.return_value.json.return_value = {
+            "issues": [{"key": "PROJ-1", "fields": {}}, {"key": "PROJ-2", "fields": {}}]
+        }
+
+        result = await JiraHandler().fetch_batch(
+            ["PROJ-1", "PROJ-2", "x) OR project = SECRET"],
+            jira_credentials,
+            http_client=mock_http_client,
+        )
+
+        assert set(result) == {"PROJ-1", "PROJ-2"}
+        url = mock_http_client.post.call_args[0][0]
+        payload = mock_http_client.post.call_args[1]["json"]
+        assert url == "https://company.atlassian.net/rest/api/3/search/jql"
+        assert payload["jql"] == "key in (PROJ-1, PROJ-2)"
+        assert payload["maxResults"] == 2
+
+    @pytest.mark.asyncio
+    async def test_linear_aliases_keep_found_issues(self, mock_http_client, linear_credentials):
+        mock_http_client.post.return_value.json.return_value = {
+            "data": {"i0": {"identifier": "ENG-1"}, "i1": None},
+            "errors": [{"message": "Entity not found", "path": ["i1"]}],
+        }
+
+        result = await LinearHandler().fetch_batch(
+            ["ENG-1", "ENG-2"], linear_credentials, http_client=mock_http_client
+        )
+
+        assert result == {"ENG-1": {"identifier": "ENG-1"}}
+        payload = mock_http_client.post.call_args[1]["json"]
+        assert payload["variables"] == {"id0": "ENG-1", "id1": "ENG-2"}
+        assert "i1: issueByIdentifier(identifier: $id1)" in payload["query"]
+
+    @pytest.mark.asyncio
+    async def test_linear_errors_without_data_raise(self, mock_http_client, linear_credentials):
+        mock_http_client.post.return_value.json.return_value = {
+            "errors": [{"message": "Authentication required"}]
+        }
+
+        with pytest.raises(PlatformApiError, match="GraphQL errors"):
+            await LinearHandler().fetch_batch(
+                ["ENG-1"], linear_credentials, http_client=mock_http_client
+            )
+
+    @pytest.mark.asyncio
+    async def test_monday_items_by_ids(self, mock_http_client, monday_credentials):
+        mock_http_client.post.return_value.json.return_value = {
+            "data": {"items": [{"id": "2", "name": "Second"}, {"id": "1", "name": "First"}]}
+        }
+
+        result = await MondayHandler().fetch_batch(
+            ["1", "2", "3"], monday_credentials, http_client=mock_http_client
+        )
+
+        assert result == {"1": {"id": "1", "name": "First"}, "2": {"id": "2", "name": "Second"}}
+        payload = mock_http_client.post.call_args[1]["json"]
+        assert payload["variables"] == {"itemIds": ["1", "2", "3"], "limit": 3}
+
+    @pytest.mark.asyncio
+    async def test_github_graphql_converted_to_rest_shape(
+        self, mock_http_client, github_credentials
+    ):
+        mock_http_client.post.return_value.json.return_value = {
+            "data": {
+                "i0": {
+                    "issueOrPullRequest": {
+                        "__typename": "PullRequest",
+                        "number": 7,
+                        "title": "Fix it",
+                        "body": None,
+                        "state": "MERGED",
+                        "url": "https://github.com/owner/repo/pull/7",
+                        "author": {"login": "octocat"},
+                        "assignees": {"nodes": [{"login": "hubot"}]},
+                        "labels": {"nodes": [{"name": "bug"}]},
+                        "milestone": None,
+                        "repository": {"nameWithOwner": "owner/repo"},
+                        "mergedAt": "2026-06-01T10:00:00Z",
+                    }
+                },
+                "i1": None,
+            },
+            "errors": [{"type": "NOT_FOUND", "path": ["i1"]}],
+        }
+
+        result = await GitHubHandler().fetch_batch(
+            ["owner/repo#7", "owner/gone#1"], github_credentials, http_client=mock_http_client
+        )
+
+        assert list(result) == ["owner/repo#7"]
+        issue = result["owner/repo#7"]
+        assert issue["state"] == "closed"
+        assert issue["html_url"] == "https://github.com/owner/repo/pull/7"
+        assert issue["labels"] == [{"name": "bug"}]
+        assert issue["assignee"] == {"login": "hubot"}
+        assert issue["user"] == {"login": "octocat"}
+        assert issue["repository"] == {"full_name": "owner/repo"}
+        assert issue["pull_request"]["merged_at"] == "2026-06-01T10:00:00Z"
+        variables = mock_http_client.post.call_args[1]["json"]["variables"]
+        assert variables == {
+            "o0": "owner",
+            "r0": "repo",
+            "n0": 7,
+            "o1": "owner",
+            "r1": "gone",
+            "n1": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_default_has_no_batch_endpoint(self, trello_credentials):
+        handler = TrelloHandler()
+
+        assert handler.batch_size == 0
+        assert await handler.fetch_batch(["abc123"], trello_credentials) == {}
+
+
 class TestAzureDevOpsHandler:
     def test_platform_name(self):
         handler = AzureDevOpsHandler()
@@ -20,6 +20,46 @@ from ingot.integrations.git import (
     squash_commits,
 )
 
+# Zeroed object names for porcelain v2 fixture lines
+_ZERO_OID = "0" * 40
+
+
+def _ordinary(xy: str, path: str) -> str:
+    """A porcelain v2 ordinary changed entry."""
+    return f"1 {xy} N... 100644 100644 100644 {_ZERO_OID} {_ZERO_OID} {path}"
+
+
+def _status_output(*entries: str) -> str:
+    """NUL-terminated ``git status --porcelain=v2 -z --branch`` output."""
+    header = ["# branch.oid abc123", "# branch.head main"]
+    return "".join(f"{token}\0" for token in [*header, *entries])
+
+
+def _fake_git(
+    *,
+    status: str = "",
+    committed: str = "",
+    committed_numstat: str = "",
+    staged: str = "",
+    staged_numstat: str = "",
+    unstaged: str = "",
+    unstaged_numstat: str = "",
+):
+    """Build a subprocess.run side_effect that answers git commands by shape."""
+
+    def run(cmd, *args, **kwargs):
+        if "status" in cmd:
+            stdout = _status_output(*status.split("\0")) if status else _status_output()
+        elif any(".." in arg for arg in cmd):
+            stdout = committed_numstat if "--numstat" in cmd else committed
+        elif "--cached" in cmd:
+            stdout = staged_numstat if "--numstat" in cmd else staged
+        else:
+            stdout = unstaged_numstat if "--numstat" in cmd else unstaged
+        return MagicMock(returncode=0, stdout=stdout, stderr="")
+
+    return run
+
 
 class TestIsGitRepo:
     def test_returns_true_in_git_repo(self, mock_subprocess):
@@ -39,39 +79,51 @@ class TestIsGitRepo:
 
 class TestIsDirty:
     def test_returns_false_when_clean(self, mock_subprocess):
-        mock_subprocess.return_value = MagicMock(returncode=0)
+        mock_subprocess.return_value = MagicMock(returncode=0, stdout=_status_output())
 
         result = is_dirty()
 
         assert result is False
 
     def test_returns_true_with_unstaged_changes(self, mock_subprocess):
-        # First call (unstaged) returns 1, second call (staged) returns 0
-        mock_subprocess.side_effect = [
-            MagicMock(returncode=1),
-            MagicMock(returncode=0),
-        ]
+        mock_subprocess.return_value = MagicMock(
+            returncode=0, stdout=_status_output(_ordinary(".M", "file.py"))
+        )
 
         result = is_dirty()
 
         assert result is True
 
     def test_returns_true_with_staged_changes(self, mock_subprocess):
-        # First call (unstaged) returns 0, second call (staged) returns 1
-        mock_subprocess.side_effect = [
-            MagicMock(returncode=0),
-            MagicMock(returncode=1),
-        ]
+        mock_subprocess.return_value = MagicMock(
+            returncode=0, stdout=_status_output(_ordinary("M.", "file.py"))
+        )
 
         result = is_dirty()
 
         assert result is True
 
+    def test_untracked_files_do_not_make_tree_dirty(self, mock_subprocess):
+        mock_subprocess.return_value = MagicMock(returncode=0, stdout=_status_output("? new.py"))
+
+        result = is_dirty()
+
+        assert result is False
+
+    def test_returns_false_on_git_error(self, mock_subprocess):
+        mock_subprocess.return_value = MagicMock(returncode=128, stdout="", stderr="fatal")
+
+        result = is_dirty()
+
+        assert result is False
+
 
 class TestHasUntrackedFiles:
     @patch("ingot.integrations.git.subprocess.run")
     def test_returns_true_when_untracked_files_exist(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=0, stdout="new_file.txt\nanother.py")
+        mock_run.return_value = MagicMock(
+            returncode=0, stdout=_status_output("? new_file.txt", "? another.py")
+        )
 
         result = has_untracked_files()
 
@@ -80,7 +132,7 @@ class TestHasUntrackedFiles:
 
     @patch("ingot.integrations.git.subprocess.run")
     def test_returns_false_when_no_untracked_files(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=0, stdout="")
+        mock_run.return_value = MagicMock(returncode=0, stdout=_status_output())
 
         result = has_untracked_files()
 
@@ -88,7 +140,7 @@ class TestHasUntrackedFiles:
 
     @patch("ingot.integrations.git.subprocess.run")
     def test_returns_false_on_git_error(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=128, stdout="")
+        mock_run.return_value = MagicMock(returncode=128, stdout="", stderr="")
 
         result = has_untracked_files()
 
@@ -243,33 +295,10 @@ class TestAddToGitignore:
 class TestGetDiffFromBaseline:
     @patch("ingot.integrations.git.subprocess.run")
     def test_returns_diff_result_with_content(self, mock_run):
-        # Mock all the subprocess calls that get_diff_from_baseline makes
-        # Order: committed diff, staged diff, unstaged diff, staged files, unstaged files,
-        #        committed files, staged stat, unstaged stat, committed stat, untracked
-        mock_run.side_effect = [
-            # 1. git diff --no-color --no-ext-diff base..HEAD (committed)
-            MagicMock(returncode=0, stdout="diff --git a/file.py b/file.py\n+new line", stderr=""),
-            # 2. git diff --no-color --no-ext-diff --cached (staged)
-            MagicMock(returncode=0, stdout="", stderr=""),
-            # 3. git diff --no-color --no-ext-diff (unstaged)
-            MagicMock(returncode=0, stdout="", stderr=""),
-            # 4. git diff --name-only --cached (staged files)
-            MagicMock(returncode=0, stdout="", stderr=""),
-            # 5. git diff --name-only (unstaged files)
-            MagicMock(returncode=0, stdout="", stderr=""),
-            # 6. git diff --name-status base..HEAD (committed files)
-            MagicMock(returncode=0, stdout="M\tfile.py", stderr=""),
-            # 7. git diff --stat --cached (staged stat)
-            MagicMock(returncode=0, stdout="", stderr=""),
-            # 8. git diff --stat (unstaged stat)
-            MagicMock(returncode=0, stdout="", stderr=""),
-            # 9. git diff --stat base..HEAD (committed stat)
-            MagicMock(
-                returncode=0, stdout=" file.py | 1 +\n 1 file changed, 1 insertion(+)", stderr=""
-            ),
-            # 10. git ls-files --others --exclude-standard
-            MagicMock(returncode=0, stdout="", stderr=""),
-        ]
+        mock_run.side_effect = _fake_git(
+            committed="diff --git a/file.py b/file.py\n+new line",
+            committed_numstat="1\t0\tfile.py\0",
+        )
 
         result = get_diff_from_baseline("abc123")
 
@@ -281,18 +310,7 @@ class TestGetDiffFromBaseline:
 
     @patch("ingot.integrations.git.subprocess.run")
     def test_returns_no_changes_on_empty_diff(self, mock_run):
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="", stderr=""),  # committed
-            MagicMock(returncode=0, stdout="", stderr=""),  # staged
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged
-            MagicMock(returncode=0, stdout="", stderr=""),  # staged files
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged files
-            MagicMock(returncode=0, stdout="", stderr=""),  # committed files
-            MagicMock(returncode=0, stdout="", stderr=""),  # staged stat
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged stat
-            MagicMock(returncode=0, stdout="", stderr=""),  # committed stat
-            MagicMock(returncode=0, stdout="", stderr=""),  # untracked
-        ]
+        mock_run.side_effect = _fake_git()
 
         result = get_diff_from_baseline("abc123")
 
@@ -303,7 +321,7 @@ class TestGetDiffFromBaseline:
     @patch("ingot.integrations.git.print_warning")
     @patch("ingot.integrations.git.subprocess.run")
     def test_returns_error_on_git_failure(self, mock_run, mock_warning):
-        # First call fails with non-zero returncode
+        # Every git call fails with non-zero returncode
         mock_run.return_value = MagicMock(
             returncode=128, stdout="", stderr="fatal: bad revision 'abc123'"
         )
@@ -315,26 +333,37 @@ class TestGetDiffFromBaseline:
         assert "failed" in result.error_message.lower()
         mock_warning.assert_called()
 
+    @patch("ingot.integrations.git.print_warning")
+    @patch("ingot.integrations.git.subprocess.run")
+    def test_returns_error_on_committed_diff_failure(self, mock_run, mock_warning):
+        def run(cmd, *args, **kwargs):
+            if "status" in cmd:
+                return MagicMock(returncode=0, stdout=_status_output(), stderr="")
+            return MagicMock(returncode=128, stdout="", stderr="fatal: bad revision 'abc123'")
+
+        mock_run.side_effect = run
+
+        result = get_diff_from_baseline("abc123")
+
+        assert result.has_error
+        assert "abc123..HEAD failed" in result.error_message
+        mock_warning.assert_called()
+
     @patch("ingot.integrations.git.subprocess.run")
     def test_empty_commit_falls_back_to_staged_unstaged_untracked(self, mock_run):
-        # When no base commit: staged diff, unstaged diff, staged files, unstaged files,
-        #                      staged stat, unstaged stat, untracked
-        mock_run.side_effect = [
-            # 1. git diff --cached (staged)
-            MagicMock(returncode=0, stdout="staged diff content", stderr=""),
-            # 2. git diff (unstaged)
-            MagicMock(returncode=0, stdout="unstaged diff content", stderr=""),
-            # 3. git diff --name-only --cached (staged files)
-            MagicMock(returncode=0, stdout="staged_file.py", stderr=""),
-            # 4. git diff --name-only (unstaged files)
-            MagicMock(returncode=0, stdout="unstaged_file.py", stderr=""),
-            # 5. git diff --stat --cached (staged stat)
-            MagicMock(returncode=0, stdout=" 1 file changed", stderr=""),
-            # 6. git diff --stat (unstaged stat)
-            MagicMock(returncode=0, stdout=" 1 file changed", stderr=""),
-            # 7. git ls-files --others --exclude-standard
-            MagicMock(returncode=0, stdout="new_file.txt", stderr=""),
-        ]
+        mock_run.side_effect = _fake_git(
+            status="\0".join(
+                [
+                    _ordinary("M.", "staged_file.py"),
+                    _ordinary(".M", "unstaged_file.py"),
+                    "? new_file.txt",
+                ]
+            ),
+            staged="staged diff content",
+            staged_numstat="1\t0\tstaged_file.py\0",
+            unstaged="unstaged diff content",
+            unstaged_numstat="1\t0\tunstaged_file.py\0",
+        )
 
         with patch("ingot.integrations.git._generate_untracked_file_diff") as mock_gen:
             mock_gen.return_value = "diff --git a/new_file.txt\n+content"
@@ -348,17 +377,16 @@ class TestGetDiffFromBaseline:
             assert "Unstaged Changes" in result.diff
             assert "new_file.txt" in result.untracked_files
 
+        # No commit-to-commit diff without a base commit
+        assert not any(".." in arg for call in mock_run.call_args_list for arg in call[0][0])
+
     @patch("ingot.integrations.git.subprocess.run")
     def test_empty_commit_none_value_also_falls_back(self, mock_run):
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="staged content", stderr=""),  # staged diff
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged diff
-            MagicMock(returncode=0, stdout="file.py", stderr=""),  # staged files
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged files
-            MagicMock(returncode=0, stdout="1 file changed", stderr=""),  # staged stat
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged stat
-            MagicMock(returncode=0, stdout="", stderr=""),  # untracked
-        ]
+        mock_run.side_effect = _fake_git(
+            status=_ordinary("M.", "file.py"),
+            staged="staged content",
+            staged_numstat="1\t0\tfile.py\0",
+        )
 
         result = get_diff_from_baseline(None)
 
@@ -367,18 +395,13 @@ class TestGetDiffFromBaseline:
 
     @patch("ingot.integrations.git.subprocess.run")
     def test_includes_all_change_types(self, mock_run):
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="committed changes", stderr=""),  # committed diff
-            MagicMock(returncode=0, stdout="staged changes", stderr=""),  # staged diff
-            MagicMock(returncode=0, stdout="unstaged changes", stderr=""),  # unstaged diff
-            MagicMock(returncode=0, stdout="", stderr=""),  # staged files
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged files
-            MagicMock(returncode=0, stdout="M\tfile.py", stderr=""),  # committed files
-            MagicMock(returncode=0, stdout="", stderr=""),  # staged stat
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged stat
-            MagicMock(returncode=0, stdout=" file.py | 1 +", stderr=""),  # committed stat
-            MagicMock(returncode=0, stdout="", stderr=""),  # untracked
-        ]
+        mock_run.side_effect = _fake_git(
+            status="\0".join([_ordinary("M.", "staged.py"), _ordinary(".M", "unstaged.py")]),
+            committed="committed changes",
+            committed_numstat="1\t0\tfile.py\0",
+            staged="staged changes",
+            unstaged="unstaged changes",
+        )
 
         result = get_diff_from_baseline("abc123")
 
@@ -389,21 +412,21 @@ class TestGetDiffFromBaseline:
         assert "committed changes" in result.diff
         assert "staged changes" in result.diff
         assert "unstaged changes" in result.diff
+        assert set(result.changed_files) == {"file.py", "staged.py", "unstaged.py"}
+
+    @patch("ingot.integrations.git.subprocess.run")
+    def test_skips_staged_and_unstaged_diffs_when_clean(self, mock_run):
+        mock_run.side_effect = _fake_git(committed="diff", committed_numstat="1\t0\tfile.py\0")
+
+        get_diff_from_baseline("abc123")
+
+        commands = [call[0][0] for call in mock_run.call_args_list]
+        assert len(commands) == 3  # status, committed patch, committed numstat
+        assert not any("--cached" in cmd for cmd in commands)
 
     @patch("ingot.integrations.git.subprocess.run")
     def test_includes_untracked_files(self, mock_run):
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="", stderr=""),  # committed diff
-            MagicMock(returncode=0, stdout="", stderr=""),  # staged diff
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged diff
-            MagicMock(returncode=0, stdout="", stderr=""),  # staged files
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged files
-            MagicMock(returncode=0, stdout="", stderr=""),  # committed files
-            MagicMock(returncode=0, stdout="", stderr=""),  # staged stat
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged stat
-            MagicMock(returncode=0, stdout="", stderr=""),  # committed stat
-            MagicMock(returncode=0, stdout="new_file.txt", stderr=""),  # untracked
-        ]
+        mock_run.side_effect = _fake_git(status="? new_file.txt")
 
         # We need to mock _generate_untracked_file_diff or create the file
         with patch("ingot.integrations.git._generate_untracked_file_diff") as mock_gen:
@@ -428,26 +451,15 @@ class TestGetDiffFromBaseline:
 
     @patch("ingot.integrations.git.subprocess.run")
     def test_populates_diffstat(self, mock_run):
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="diff content", stderr=""),  # committed diff
-            MagicMock(returncode=0, stdout="", stderr=""),  # staged diff
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged diff
-            MagicMock(returncode=0, stdout="", stderr=""),  # staged files
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged files
-            MagicMock(returncode=0, stdout="M\tfile.py", stderr=""),  # committed files
-            MagicMock(returncode=0, stdout="", stderr=""),  # staged stat
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged stat
-            MagicMock(
-                returncode=0,
-                stdout=" file.py | 10 +++++++---\n 1 file changed, 7 insertions(+), 3 deletions(-)",
-                stderr="",
-            ),  # committed stat
-            MagicMock(returncode=0, stdout="", stderr=""),  # untracked
-        ]
+        mock_run.side_effect = _fake_git(
+            committed="diff content",
+            committed_numstat="7\t3\tfile.py\0",
+        )
 
         result = get_diff_from_baseline("abc123")
 
         assert result.is_success
+        assert "Committed:" in result.diffstat
         assert "7 insertions" in result.diffstat
         assert "3 deletions" in result.diffstat
 
@@ -500,63 +512,33 @@ class TestGetDiffFromBaselineCommandSyntax:
 
     @patch("ingot.integrations.git.subprocess.run")
     def test_committed_diff_uses_double_dot_syntax(self, mock_run):
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="diff content", stderr=""),  # committed diff
-            MagicMock(returncode=0, stdout="", stderr=""),  # staged diff
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged diff
-            MagicMock(returncode=0, stdout="", stderr=""),  # staged files
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged files
-            MagicMock(returncode=0, stdout="M\tfile.py", stderr=""),  # committed files
-            MagicMock(returncode=0, stdout="", stderr=""),  # staged stat
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged stat
-            MagicMock(returncode=0, stdout="", stderr=""),  # committed stat
-            MagicMock(returncode=0, stdout="", stderr=""),  # untracked
-        ]
+        mock_run.side_effect = _fake_git(
+            committed="diff content", committed_numstat="1\t0\tfile.py\0"
+        )
 
         get_diff_from_baseline("abc123")
 
-        # Find the committed diff call (first call with base_commit reference)
-        calls = mock_run.call_args_list
-        committed_diff_call = calls[0]  # First call is committed diff
-        committed_files_call = calls[5]  # 6th call is committed files (name-status)
-        committed_stat_call = calls[8]  # 9th call is committed stat
-
-        # Verify committed diff uses ..HEAD (double dot)
-        diff_cmd = committed_diff_call[0][0]  # args[0] is the command list
-        assert "abc123..HEAD" in diff_cmd, f"Expected 'abc123..HEAD' in {diff_cmd}"
-        assert "abc123.HEAD" not in diff_cmd, f"Found invalid 'abc123.HEAD' in {diff_cmd}"
-
-        # Verify committed name-status uses ..HEAD (double dot)
-        name_status_cmd = committed_files_call[0][0]
-        assert "abc123..HEAD" in name_status_cmd, f"Expected 'abc123..HEAD' in {name_status_cmd}"
-        assert (
-            "abc123.HEAD" not in name_status_cmd
-        ), f"Found invalid 'abc123.HEAD' in {name_status_cmd}"
-
-        # Verify committed stat uses ..HEAD (double dot)
-        stat_cmd = committed_stat_call[0][0]
-        assert "abc123..HEAD" in stat_cmd, f"Expected 'abc123..HEAD' in {stat_cmd}"
-        assert "abc123.HEAD" not in stat_cmd, f"Found invalid 'abc123.HEAD' in {stat_cmd}"
+        # Every command referencing the base commit must use base..HEAD
+        base_cmds = [
+            call[0][0]
+            for call in mock_run.call_args_list
+            if any("abc123" in arg for arg in call[0][0])
+        ]
+        assert len(base_cmds) == 2  # committed patch and committed numstat
+        for cmd in base_cmds:
+            assert "abc123..HEAD" in cmd, f"Expected 'abc123..HEAD' in {cmd}"
+            assert "abc123.HEAD" not in cmd, f"Found invalid 'abc123.HEAD' in {cmd}"
 
 
 class TestGetDiffFromBaselineRenameHandling:
     @patch("ingot.integrations.git.subprocess.run")
     def test_changed_files_contains_only_new_path_for_renames(self, mock_run):
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="", stderr=""),  # committed diff
-            MagicMock(returncode=0, stdout="", stderr=""),  # staged diff
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged diff
-            MagicMock(returncode=0, stdout="", stderr=""),  # staged files
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged files
-            # Committed files with rename
-            MagicMock(
-                returncode=0, stdout="R100\told_name.py\tnew_name.py\nM\tother.py", stderr=""
+        mock_run.side_effect = _fake_git(
+            # Committed files with rename (numstat -z: empty path, then old and new)
+            committed_numstat="\0".join(
+                ["0\t0\t", "old_name.py", "new_name.py", "1\t1\tother.py", ""]
             ),
-            MagicMock(returncode=0, stdout="", stderr=""),  # staged stat
-            MagicMock(returncode=0, stdout="", stderr=""),  # unstaged stat
-            MagicMock(returncode=0, stdout="", stderr=""),  # committed stat
-            MagicMock(returncode=0, stdout="", stderr=""),  # untracked
-        ]
+        )
 
         result = get_diff_from_baseline("abc123")
 
@@ -569,6 +551,15 @@ class TestGetDiffFromBaselineRenameHandling:
         # The buggy substring should NOT appear
         assert "old_name.py\tnew_name.py" not in result.changed_files
 
+    @patch("ingot.integrations.git.subprocess.run")
+    def test_staged_rename_reports_new_path(self, mock_run):
+        rename = f"2 R. N... 100644 100644 100644 {_ZERO_OID} {_ZERO_OID} R100 new.py\0old.py"
+        mock_run.side_effect = _fake_git(status=rename, staged="diff")
+
+        result = get_diff_from_baseline(None)
+
+        assert result.changed_files == ["new.py"]
+
 
 class TestGetStatusShort:
     @patch("ingot.integrations.git.subprocess.run")
@@ -0,0 +1,124 @@
+"""Tests for GitObjectReader in ingot.integrations.git."""
+
+import subprocess
+import threading
+from pathlib import Path
+
+import pytest
+
+from ingot.integrations.git import (
+    GitObjectReader,
+    close_object_readers,
+    get_object_reader,
+    read_file_at_revision,
+)
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    _git(tmp_path, "init")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test User")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("print('v1')\n")
+    (tmp_path / "my file.txt").write_text("spaces\n")
+    (tmp_path / "data.bin").write_bytes(b"\x00\x01\n\x02" * 100)
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-m", "v1")
+    (tmp_path / "src" / "app.py").write_text("print('v2')\n")
+    _git(tmp_path, "commit", "-am", "v2")
+    yield tmp_path
+    close_object_readers()
+
+
+@pytest.fixture
+def reader(repo):
+    with GitObjectReader(repo) as reader:
+        yield reader
+
+
+class TestGitObjectReader:
+    def test_reads_blob_at_revisions(self, reader):
+        assert reader.read_text("HEAD", "src/app.py") == "print('v2')\n"
+        assert reader.read_text("HEAD~1", "src/app.py") == "print('v1')\n"
+
+    def test_reads_binary_and_paths_with_spaces(self, reader, repo):
+        assert reader.read_blob("HEAD", "data.bin") == (repo / "data.bin").read_bytes()
+        assert reader.read_text("HEAD", "my file.txt") == "spaces\n"
+
+    def test_missing_objects_return_none(self, reader):
+        assert reader.read_blob("HEAD", "nope.py") is None
+        assert reader.read("no-such-branch") is None
+        assert reader.info("HEAD:my missing file") is None
+        assert not reader.exists("HEAD:nope.py")
+        # The co-process stays usable after a miss
+        assert reader.exists("HEAD:src/app.py")
+
+    def test_info_reports_type_and_size(self, reader, repo):
+        info = reader.info("HEAD:src/app.py")
+
+        assert info is not None
+        assert info.type == "blob"
+        assert info.size == len("print('v2')\n")
+        assert info.oid == _git(repo, "rev-parse", "HEAD:src/app.py")
+
+    def test_tree_is_not_returned_as_blob(self, reader):
+        assert reader.info("HEAD:src").type == "tree"
+        assert reader.read_blob("HEAD", "src") is None
+
+    def test_rejects_newlines_in_spec(self, reader):
+        with pytest.raises(ValueError):
+            reader.read("HEAD:a\nb")
+
+    def test_restarts_dead_coprocess(self, reader):
+        assert reader.exists("HEAD:src/app.py")
+        reader._processes["--batch-check"].kill()
+        reader._processes["--batch-check"].wait()
+
+        assert reader.exists("HEAD:src/app.py")
+
+    def test_closed_reader_raises(self, repo):
+        reader = GitObjectReader(repo)
+        reader.close()
+
+        with pytest.raises(RuntimeError):
+            reader.read("HEAD")
+
+    def test_concurrent_reads_are_consistent(self, reader):
+        errors: list[str] = []
+
+        def worker() -> None:
+            for _ in range(50):
+                if reader.read_text("HEAD~1", "src/app.py") != "print('v1')\n":
+                    errors.append("content")
+                if reader.info("HEAD:data.bin").size != 400:
+                    errors.append("info")
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+
+
+class TestSharedReader:
+    def test_shared_per_repository(self, repo):
+        assert get_object_reader() is get_object_reader()
+
+    def test_read_file_at_revision(self, repo):
+        assert read_file_at_revision("HEAD", "src/app.py") == "print('v2')\n"
+        assert read_file_at_revision("HEAD", "missing.py") is None
+
+    def test_close_object_readers_resets_shared_instance(self, repo):
+        first = get_object_reader()
+        close_object_readers()
+
+        assert get_object_reader() is not first
@@ -0,0 +1,69 @@
+"""Benchmark: GitObjectReader versus one ``git show`` process per read.
+
+Set INGOT_BENCH=1 to print timings, and INGOT_BENCH_FILES to benchmark
+against a larger repository.
+"""
+
+import os
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from ingot.integrations.git import GitObjectReader
+from tests.helpers.benchmark import report_timings, skip_timing_under_xdist
+
+NUM_FILES = int(os.environ.get("INGOT_BENCH_FILES", "300"))
+
+
+@pytest.fixture(scope="module")
+def large_repo(tmp_path_factory) -> Path:
+    repo = tmp_path_factory.mktemp("bench_repo")
+    subprocess.run(["git", "init"], cwd=repo, check=True, capture_output=True)
+    for i in range(NUM_FILES):
+        package = repo / f"pkg{i % 20}"
+        package.mkdir(exist_ok=True)
+        (package / f"module_{i}.py").write_text(f"VALUE = {i}\n" * 50)
+    subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "-c", "user.email=b@example.com", "-c", "user.name=Bench", "commit", "-m", "x"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+    return repo
+
+
+def _paths() -> list[str]:
+    return [f"pkg{i % 20}/module_{i}.py" for i in range(NUM_FILES)]
+
+
+def test_batch_reader_beats_per_call_subprocess(large_repo, capsys):
+    paths = _paths()
+
+    start = time.perf_counter()
+    per_call = [
+        subprocess.run(
+            ["git", "show", f"HEAD:{path}"], cwd=large_repo, capture_output=True, check=True
+        ).stdout
+        for path in paths
+    ]
+    subprocess_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with GitObjectReader(large_repo) as reader:
+        batched = [reader.read_blob("HEAD", path) for path in paths]
+    reader_time = time.perf_counter() - start
+
+    assert batched == per_call
+
+    report_timings(
+        capsys,
+        f"{NUM_FILES} blob reads: subprocess.run {subprocess_time * 1000:.0f}ms, "
+        f"cat-file --batch {reader_time * 1000:.0f}ms "
+        f"({subprocess_time / reader_time:.1f}x)",
+    )
+
+    skip_timing_under_xdist()
+    assert reader_time < subprocess_time / 3
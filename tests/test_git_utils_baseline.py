@@ -6,24 +6,37 @@ These tests use a temporary git repository fixture to validate:
 - Dirty working tree policy
 - Smart diff fallback with baseline
 - Binary file handling in diffs
+- Streaming diff pipeline with output budgets
+- Parallel untracked-file diffs and directory collapsing
 """
 
 import subprocess
+import time
 from pathlib import Path
 
 import pytest
 
+from ingot.integrations.git import (
+    UNTRACKED_DIR_COLLAPSE_THRESHOLD,
+    UntrackedDirSummary,
+    collapse_untracked_dirs,
+    read_text_if_not_binary,
+    render_untracked_files,
+)
 from ingot.workflow.git_utils import (
     DirtyTreePolicy,
     DirtyWorkingTreeError,
     capture_baseline,
     check_dirty_working_tree,
+    collect_diff_within_budget,
     filter_binary_files_from_diff,
+    filter_diff_lines,
     get_diff_from_baseline,
     get_smart_diff_from_baseline,
     get_working_tree_diff_from_baseline,
     parse_stat_file_count,
     parse_stat_total_lines,
+    stream_git_diff,
 )
 
 
@@ -594,3 +607,149 @@ class TestUntrackedFiles:
 
         assert not git_error
         assert "smart_untracked.txt" not in diff_output
+
+
+class TestStreamingDiffPipeline:
+    def test_filter_replaces_binary_lines(self):
+        lines = [
+            "diff --git a/image.png b/image.png\n",
+            "Binary files a/image.png and b/image.png differ\n",
+        ]
+
+        assert list(filter_diff_lines(lines))[1] == "[BINARY FILE CHANGED: image.png]\n"
+
+    def test_filter_caps_lines_per_file(self):
+        lines = ["diff --git a/big.py b/big.py\n"] + [f"+{i}\n" for i in range(100)]
+        lines += ["diff --git a/small.py b/small.py\n", "+x\n"]
+
+        output = list(filter_diff_lines(lines, max_file_lines=10))
+
+        assert output[10] == "[LARGE FILE DIFF: big.py - remaining lines omitted]\n"
+        assert output[11:] == ["diff --git a/small.py b/small.py\n", "+x\n"]
+
+    def test_collect_stops_pulling_at_budget(self):
+        pulled = []
+
+        def source():
+            for i in range(1_000):
+                pulled.append(i)
+                yield f"line {i}\n"
+
+        text, truncated = collect_diff_within_budget(source(), max_lines=5)
+
+        assert truncated
+        assert text.count("\n") == 5
+        assert len(pulled) == 6
+
+    def test_collect_respects_char_budget(self):
+        text, truncated = collect_diff_within_budget(["abcd\n"] * 10, max_chars=12)
+
+        assert truncated
+        assert text == "abcd\nabcd\n"
+
+    def test_stream_yields_diff_lines(self, temp_git_repo):
+        baseline = capture_baseline()
+        temp_git_repo.create_file("README.md", "# Changed\n")
+
+        lines = list(stream_git_diff(baseline))
+
+        assert lines[0].startswith("diff --git a/README.md b/README.md")
+        assert "+# Changed\n" in lines
+
+    def test_stream_raises_on_git_error(self, temp_git_repo):
+        with pytest.raises(subprocess.CalledProcessError) as excinfo:
+            list(stream_git_diff("no-such-ref"))
+
+        assert "no-such-ref" in excinfo.value.stderr
+
+    def test_smart_diff_stops_at_output_budget(self, temp_git_repo):
+        baseline = capture_baseline()
+        temp_git_repo.create_file("huge.txt", "".join(f"line {i}\n" for i in range(100_000)))
+        subprocess.run(["git", "add", "huge.txt"], check=True, capture_output=True)
+
+        diff_output, is_truncated, git_error = get_smart_diff_from_baseline(
+            baseline, max_lines=1_000_000, max_files=100, max_output_lines=200
+        )
+
+        assert not git_error
+        assert is_truncated
+        assert "diff truncated at output budget" in diff_output
+        assert len(diff_output.splitlines()) < 300
+
+
+class TestParallelUntrackedDiffs:
+    def test_collapse_keeps_small_directories(self):
+        paths = ["a.txt", "src/b.py", "src/c.py"]
+
+        assert collapse_untracked_dirs(paths, threshold=5) == paths
+
+    def test_collapse_summarizes_crowded_directory(self):
+        paths = ["a.txt"] + [f"node_modules/pkg{i}/index.js" for i in range(10)]
+
+        entries = collapse_untracked_dirs(paths, threshold=5)
+
+        assert entries == ["a.txt", UntrackedDirSummary("node_modules/", 10)]
+
+    def test_collapse_prefers_shallowest_crowded_directory(self):
+        paths = [f"build/out/{i}.o" for i in range(6)] + [f"build/{i}.log" for i in range(6)]
+
+        entries = collapse_untracked_dirs(paths, threshold=5)
+
+        assert entries == [UntrackedDirSummary("build/", 12)]
+
+    def test_parallel_diffs_preserve_input_order(self):
+        paths = [f"f{i}" for i in range(50)]
+
+        def render(path: str) -> str:
+            # Later paths finish first
+            time.sleep((50 - int(path[1:])) / 10_000)
+            return path
+
+        assert list(render_untracked_files(paths, render, max_workers=8)) == paths
+
+    def test_closing_parallel_diffs_stops_scheduling(self):
+        rendered: list[str] = []
+        paths = [f"f{i}" for i in range(1_000)]
+
+        def render(path: str) -> str:
+            rendered.append(path)
+            return path
+
+        diffs = render_untracked_files(paths, render, max_workers=2)
+        assert next(diffs) == "f0"
+        diffs.close()
+
+        assert len(rendered) < 10
+
+    def test_read_text_skips_binary_and_large_files(self, tmp_path):
+        (tmp_path / "bin").write_bytes(b"abc\x00def")
+        (tmp_path / "big").write_text("x" * 100)
+        (tmp_path / "empty").write_text("")
+
+        assert read_text_if_not_binary(str(tmp_path / "bin"), 1_000) == (7, None)
+        assert read_text_if_not_binary(str(tmp_path / "big"), 10) == (100, None)
+        assert read_text_if_not_binary(str(tmp_path / "empty"), 1_000) == (0, "")
+
+    def test_stat_only_collapses_crowded_directory(self, temp_git_repo):
+        from ingot.workflow.git_utils import get_untracked_files_diff
+
+        temp_git_repo.create_file("keep.txt", "content")
+        for i in range(UNTRACKED_DIR_COLLAPSE_THRESHOLD + 1):
+            temp_git_repo.create_file(f"vendor/lib{i}.js", "x")
+
+        diff = get_untracked_files_diff(stat_only=True)
+
+        assert " keep.txt | [NEW FILE]" in diff
+        assert f"vendor/ | [NEW DIRECTORY: {UNTRACKED_DIR_COLLAPSE_THRESHOLD + 1} files]" in diff
+        assert "lib0.js" not in diff
+        assert f"{UNTRACKED_DIR_COLLAPSE_THRESHOLD + 2} untracked file(s)" in diff
+
+    def test_full_diff_lists_files_in_order(self, temp_git_repo):
+        from ingot.workflow.git_utils import get_untracked_files_diff
+
+        for name in ("a.py", "b.py", "c.py"):
+            temp_git_repo.create_file(name, f"{name}\n")
+
+        diff = get_untracked_files_diff()
+
+        assert diff.index("+a.py") < diff.index("+b.py") < diff.index("+c.py")
@@ -0,0 +1,112 @@
+"""Import-time budget tests for the CLI entry point.
+
+The `ingot` console script resolves `ingot.cli:app`, so everything imported
+by `from ingot.cli import app` is paid by every invocation, including
+`ingot --version` and the interactive menu. These tests guard the lazy
+package `__init__`s (PEP 562 `__getattr__`) against regressions.
+"""
+
+import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative import time budget for `from ingot.cli import app`, in milliseconds.
+# Override with INGOT_IMPORT_BUDGET_MS on unusually slow machines.
+STARTUP_BUDGET_MS = float(os.environ.get("INGOT_IMPORT_BUDGET_MS", "300"))
+
+# Modules that must only be loaded once a workflow actually runs.
+HEAVY_MODULES = [
+    "httpx",
+    "textual",
+    "questionary",
+    "ingot.integrations.agents",
+    "ingot.integrations.auggie",
+    "ingot.integrations.ticket_service",
+    "ingot.workflow.runner",
+]
+
+LAZY_PACKAGES = [
+    "ingot.cli",
+    "ingot.config",
+    "ingot.integrations",
+    "ingot.integrations.fetchers",
+    "ingot.ui",
+    "ingot.utils",
+    "ingot.validation",
+    "ingot.workflow",
+]
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        env=env,
+        check=True,
+    )
+
+
+def _ingot_import_time_us(statement: str) -> int:
+    """Return the cumulative `-X importtime` cost of ingot's top-level imports."""
+    result = _run_python("-X", "importtime", "-c", statement)
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line.split("|")
+        # Nested imports are indented and already counted in their parent's
+        # cumulative time, so only top-level ingot entries are summed.
+        if not cumulative_us.strip().isdigit() or name.startswith("  "):
+            continue
+        if name.strip().startswith("ingot"):
+            total += int(cumulative_us)
+    return total
+
+
+class TestCliStartup:
+    @pytest.mark.skipif(
+        "PYTEST_XDIST_WORKER" in os.environ,
+        reason="wall-clock budget is unreliable under parallel test load",
+    )
+    def test_entry_point_within_budget(self):
+        # Best of three runs to smooth out filesystem cache noise
+        best_us = min(_ingot_import_time_us("from ingot.cli import app") for _ in range(3))
+
+        assert best_us / 1000 <= STARTUP_BUDGET_MS, (
+            f"`from ingot.cli import app` took {best_us / 1000:.1f}ms, "
+            f"budget is {STARTUP_BUDGET_MS:.0f}ms"
+        )
+
+    @pytest.mark.parametrize("module", HEAVY_MODULES)
+    def test_entry_point_does_not_import_heavy_module(self, module):
+        result = _run_python(
+            "-c",
+            f"import sys\nfrom ingot.cli import app\nprint({module!r} in sys.modules)",
+        )
+
+        assert result.stdout.strip() == "False", f"{module} is imported at CLI startup"
+
+
+class TestLazyPackageExports:
+    @pytest.mark.parametrize("package", LAZY_PACKAGES)
+    def test_all_exports_resolve(self, package):
+        module = importlib.import_module(package)
+
+        for name in module.__all__:
+            assert getattr(module, name) is not None, f"{package}.{name} did not resolve"
+
+    @pytest.mark.parametrize("package", LAZY_PACKAGES)
+    def test_unknown_attribute_raises(self, package):
+        module = importlib.import_module(package)
+
+        with pytest.raises(AttributeError, match="no_such_attribute"):
+            module.no_such_attribute  # noqa: B018
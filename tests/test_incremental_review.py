@@ -0,0 +1,297 @@
+"""Tests for incremental re-review in the review-fix loop.
+
+These tests use a temporary git repository to validate:
+- Working tree tree hashes (write_worktree_tree, diff_tree_blobs)
+- Per-file verdict caching keyed by content
+- Delta-only verify passes in _run_review_fix_loop
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ingot.integrations.git import diff_tree_blobs, write_worktree_tree
+from ingot.workflow.incremental_review import IncrementalReviewTracker, flagged_paths
+from ingot.workflow.review import ExitReason, _run_review_fix_loop
+from ingot.workflow.review_shards import FileDiff, ReviewShard, ShardVerdict
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch):
+    """Temporary git repository with one commit; yields (path, baseline SHA)."""
+    monkeypatch.chdir(tmp_path)
+    for cmd in (
+        ["git", "init"],
+        ["git", "config", "user.email", "test@example.com"],
+        ["git", "config", "user.name", "Test User"],
+    ):
+        subprocess.run(cmd, check=True, capture_output=True)
+    (tmp_path / "README.md").write_text("# Test\n")
+    subprocess.run(["git", "add", "README.md"], check=True, capture_output=True)
+    subprocess.run(["git", "commit", "-m", "init"], check=True, capture_output=True)
+    head = subprocess.run(
+        ["git", "rev-parse", "HEAD"], check=True, capture_output=True, text=True
+    ).stdout.strip()
+    return tmp_path, head
+
+
+def _state(baseline: str) -> MagicMock:
+    state = MagicMock()
+    state.diff_baseline_ref = baseline
+    state.max_review_fix_attempts = 3
+    state.enable_sharded_review = False
+    state.user_constraints = ""
+    state.subagent_names = {"reviewer": "ingot-reviewer"}
+    return state
+
+
+class TestWorktreeTree:
+    def test_hash_tracks_content_including_untracked(self, repo):
+        path, _ = repo
+        first = write_worktree_tree()
+
+        assert write_worktree_tree() == first
+
+        (path / "new.py").write_text("x = 1\n")
+        second = write_worktree_tree()
+
+        assert second != first
+
+    def test_real_index_is_untouched(self, repo):
+        path, _ = repo
+        (path / "new.py").write_text("x = 1\n")
+
+        write_worktree_tree()
+
+        staged = subprocess.run(
+            ["git", "diff", "--cached", "--name-only"], capture_output=True, text=True
+        ).stdout
+        assert staged == ""
+
+    def test_returns_none_outside_repo(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+
+        assert write_worktree_tree() is None
+
+    def test_diff_tree_blobs_reports_changes_and_deletions(self, repo):
+        path, baseline = repo
+        (path / "a.py").write_text("a\n")
+        (path / "README.md").unlink()
+
+        blobs = diff_tree_blobs(baseline, write_worktree_tree())
+
+        assert set(blobs) == {"a.py", "README.md"}
+        assert blobs["README.md"] == "0" * 40
+        assert blobs["a.py"] != "0" * 40
+
+
+class TestFlaggedPaths:
+    def test_matches_full_paths_and_unique_names(self):
+        output = "**Issues**:\n1. [BUG] src/a.py crashes\n2. [TEST] b.py lacks tests\n"
+
+        assert flagged_paths(output, ["src/a.py", "lib/b.py", "c.py"]) == {"src/a.py", "lib/b.py"}
+
+    def test_ambiguous_names_are_not_matched(self):
+        output = "**Issues**:\n1. __init__.py exports are wrong\n"
+
+        assert flagged_paths(output, ["a/__init__.py", "b/__init__.py"]) == set()
+
+    def test_ignores_text_outside_issues_section(self):
+        output = "Reviewed a.py and b.py.\n\n**Issues**:\n1. b.py is broken\n\n**Status**: X"
+
+        assert flagged_paths(output, ["a.py", "b.py"]) == {"b.py"}
+
+
+class TestIncrementalReviewTracker:
+    def test_pass_caches_reviewed_files_by_content(self, repo):
+        path, baseline = repo
+        (path / "a.py").write_text("a\n")
+        (path / "b.py").write_text("b\n")
+        tracker = IncrementalReviewTracker.start(baseline)
+        tree_state = tracker.capture()
+
+        tracker.record(tree_state, ["a.py", "b.py"], "**Status**: PASS")
+
+        assert tracker.pending_files(tracker.capture()) == []
+        (path / "a.py").write_text("a2\n")
+        assert tracker.pending_files(tracker.capture()) == ["a.py"]
+
+    def test_needs_attention_keeps_flagged_files_pending(self, repo):
+        path, baseline = repo
+        (path / "a.py").write_text("a\n")
+        (path / "b.py").write_text("b\n")
+        tracker = IncrementalReviewTracker.start(baseline)
+        tree_state = tracker.capture()
+
+        tracker.record(
+            tree_state,
+            ["a.py", "b.py"],
+            "**Issues**:\n1. a.py is wrong\n\n**Status**: NEEDS_ATTENTION",
+        )
+
+        assert tracker.pending_files(tree_state) == ["a.py"]
+
+    def test_unattributed_issues_cache_nothing(self, repo):
+        path, baseline = repo
+        (path / "a.py").write_text("a\n")
+        tracker = IncrementalReviewTracker.start(baseline)
+        tree_state = tracker.capture()
+
+        tracker.record(tree_state, ["a.py"], "**Status**: NEEDS_ATTENTION\nSomething is off")
+
+        assert tracker.pending_files(tree_state) == ["a.py"]
+
+    def test_seed_from_complete_review_caches_unflagged_files(self, repo):
+        path, baseline = repo
+        (path / "a.py").write_text("a\n")
+        (path / "b.py").write_text("b\n")
+        tracker = IncrementalReviewTracker.start(baseline)
+
+        tracker.seed("**Issues**:\n1. a.py is wrong\n\n**Status**: NEEDS_ATTENTION", complete=True)
+
+        assert tracker.is_seeded
+        assert tracker.pending_files(tracker.capture()) == ["a.py"]
+
+    def test_seed_from_truncated_review_caches_nothing(self, repo):
+        path, baseline = repo
+        (path / "a.py").write_text("a\n")
+        tracker = IncrementalReviewTracker.start(baseline)
+
+        tracker.seed("**Status**: PASS", complete=False)
+
+        assert not tracker.is_seeded
+
+    def test_seed_from_shards_skips_failed_and_truncated_shards(self, repo):
+        path, baseline = repo
+        for name in ("a.py", "b.py", "c.py"):
+            (path / name).write_text(f"{name}\n")
+        tracker = IncrementalReviewTracker.start(baseline)
+
+        def shard(index: int, name: str, *, truncated: bool = False) -> ReviewShard:
+            return ReviewShard(index, [FileDiff(name, "")], truncated=truncated)
+
+        tracker.seed(
+            "merged",
+            complete=False,
+            shard_verdicts=[
+                ShardVerdict(shard(1, "a.py"), True, "**Status**: PASS"),
+                ShardVerdict(shard(2, "b.py", truncated=True), True, "**Status**: PASS"),
+                ShardVerdict(shard(3, "c.py"), False, "boom"),
+            ],
+        )
+
+        assert tracker.is_seeded
+        assert tracker.pending_files(tracker.capture()) == ["b.py", "c.py"]
+
+    def test_changed_by_fix_compares_with_previous_capture(self, repo):
+        path, baseline = repo
+        (path / "a.py").write_text("a\n")
+        (path / "b.py").write_text("b\n")
+        tracker = IncrementalReviewTracker.start(baseline)
+
+        (path / "b.py").write_text("b2\n")
+
+        assert tracker.changed_by_fix(tracker.capture()) == ["b.py"]
+
+
+class TestIncrementalFixLoop:
+    @patch("ingot.workflow.review.print_info")
+    @patch("ingot.workflow.review.print_success")
+    @patch("ingot.workflow.review.print_warning")
+    @patch("ingot.workflow.review.print_step")
+    @patch("ingot.workflow.autofix.run_auto_fix")
+    def test_later_verify_sends_only_pending_files(
+        self, mock_autofix, _step, _warn, _success, _info, repo
+    ):
+        path, baseline = repo
+        (path / "good.py").write_text("ok = True\n")
+        (path / "bad.py").write_text("bug = 1\n")
+        fixes = iter(["bug = 2\n", "bug = 3\n"])
+
+        def fix(*args, **kwargs):
+            (path / "bad.py").write_text(next(fixes))
+            return True
+
+        mock_autofix.side_effect = fix
+        backend = MagicMock()
+        backend.run_with_callback.side_effect = [
+            (True, "**Issues**:\n1. [BUG] bad.py still wrong\n\n**Status**: NEEDS_ATTENTION"),
+            (True, "**Status**: PASS"),
+        ]
+
+        result = _run_review_fix_loop(_state(baseline), "initial", MagicMock(), "final", backend)
+
+        assert result.exit_reason == ExitReason.PASSED
+        first_prompt = backend.run_with_callback.call_args_list[0].args[0]
+        second_prompt = backend.run_with_callback.call_args_list[1].args[0]
+        assert "good.py" in first_prompt
+        assert "diff --git a/bad.py b/bad.py" in second_prompt
+        assert "diff --git a/good.py" not in second_prompt
+        assert "bad.py still wrong" in second_prompt
+        assert "1 other changed file(s) already passed review" in second_prompt
+
+    @patch("ingot.workflow.review.print_success")
+    @patch("ingot.workflow.review.print_warning")
+    @patch("ingot.workflow.review.print_step")
+    @patch("ingot.workflow.autofix.run_auto_fix")
+    def test_reverting_flagged_file_passes_without_review(
+        self, mock_autofix, _step, _warn, _success, repo
+    ):
+        path, baseline = repo
+        (path / "good.py").write_text("ok = True\n")
+        (path / "bad.py").write_text("bug = 1\n")
+        calls = iter([lambda: (path / "bad.py").write_text("bug = 2\n"), (path / "bad.py").unlink])
+
+        def fix(*args, **kwargs):
+            next(calls)()
+            return True
+
+        mock_autofix.side_effect = fix
+        backend = MagicMock()
+        backend.run_with_callback.return_value = (
+            True,
+            "**Issues**:\n1. bad.py should not exist\n\n**Status**: NEEDS_ATTENTION",
+        )
+
+        result = _run_review_fix_loop(_state(baseline), "initial", MagicMock(), "final", backend)
+
+        assert result.passed is True
+        assert result.fix_attempts == 2
+        assert backend.run_with_callback.call_count == 1
+
+    @patch("ingot.workflow.review.print_info")
+    @patch("ingot.workflow.review.print_success")
+    @patch("ingot.workflow.review.print_warning")
+    @patch("ingot.workflow.review.print_step")
+    @patch("ingot.workflow.autofix.run_auto_fix")
+    def test_first_verify_is_incremental_after_complete_initial_review(
+        self, mock_autofix, _step, _warn, _success, _info, repo
+    ):
+        path, baseline = repo
+        (path / "good.py").write_text("ok = True\n")
+        (path / "bad.py").write_text("bug = 1\n")
+
+        def fix(*args, **kwargs):
+            (path / "bad.py").write_text("bug = 2\n")
+            return True
+
+        mock_autofix.side_effect = fix
+        backend = MagicMock()
+        backend.run_with_callback.return_value = (True, "**Status**: PASS")
+
+        result = _run_review_fix_loop(
+            _state(baseline),
+            "**Issues**:\n1. bad.py is wrong\n\n**Status**: NEEDS_ATTENTION",
+            MagicMock(),
+            "final",
+            backend,
+            initial_review_complete=True,
+        )
+
+        assert result.exit_reason == ExitReason.PASSED
+        prompt = backend.run_with_callback.call_args.args[0]
+        assert "diff --git a/bad.py b/bad.py" in prompt
+        assert "diff --git a/good.py" not in prompt
@@ -0,0 +1,112 @@
+"""Tests for ingot.validation.line_index module."""
+
+import os
+import time
+
+import pytest
+
+from ingot.validation.base import ValidationContext, ValidationSeverity
+from ingot.validation.line_index import (
+    FileLineIndex,
+    clear_line_index_cache,
+    get_file_line_index,
+)
+from ingot.validation.plan_validators import PatternSourceValidator
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_line_index_cache()
+    yield
+    clear_line_index_cache()
+
+
+class TestFileLineIndex:
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [(b"", 0), (b"a", 1), (b"a\n", 1), (b"a\nb", 2), (b"a\nb\n", 2), (b"\n\n", 2)],
+    )
+    def test_line_count(self, tmp_path, data, expected):
+        path = tmp_path / "f.txt"
+        path.write_bytes(data)
+
+        assert FileLineIndex.build(path).line_count == expected
+
+
+class TestGetFileLineIndex:
+    def test_memoized_until_file_changes(self, tmp_path):
+        path = tmp_path / "f.py"
+        path.write_text("a\nb\n")
+
+        first = get_file_line_index(path)
+        assert get_file_line_index(path) is first
+
+        path.write_text("a\nb\nc\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = get_file_line_index(path)
+
+        assert second is not first
+        assert second.line_count == 3
+
+    def test_missing_file_and_directory(self, tmp_path):
+        assert get_file_line_index(tmp_path / "missing.py") is None
+        assert get_file_line_index(tmp_path) is None
+
+
+def _plan(citation: str) -> str:
+    return f"Pattern source: `{citation}`\n```python\na = 1\nb = 2\nc = 3\n```\n"
+
+
+class TestPatternSourceCitations:
+    @pytest.fixture
+    def repo(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "main.py").write_text("".join(f"line {i}\n" for i in range(50)))
+        return tmp_path
+
+    def _validate(self, plan, repo):
+        return PatternSourceValidator().validate(plan, ValidationContext(repo_root=repo))
+
+    def test_valid_range_passes(self, repo):
+        assert self._validate(_plan("src/main.py:10-50"), repo) == []
+
+    def test_range_past_end_of_file(self, repo):
+        (finding,) = self._validate(_plan("src/main.py:40-60"), repo)
+
+        assert finding.severity == ValidationSeverity.WARNING
+        assert finding.line_number == 1
+        assert "has 50 line(s)" in finding.message
+
+    def test_missing_file(self, repo):
+        (finding,) = self._validate(_plan("src/ghost.py:1-5"), repo)
+
+        assert "does not exist" in finding.message
+
+    def test_inverted_range(self, repo):
+        (finding,) = self._validate(_plan("src/main.py:20-10"), repo)
+
+        assert "invalid line range" in finding.message
+
+    def test_paths_outside_repo_ignored(self, repo):
+        assert self._validate(_plan("../outside.py:1-2"), repo) == []
+
+    def test_citations_skipped_without_repo_root(self):
+        plan = _plan("src/ghost.py:1-5")
+
+        assert PatternSourceValidator().validate(plan, ValidationContext()) == []
+
+    def test_hundreds_of_citations_are_fast(self, repo):
+        plan = "\n".join(
+            f"Pattern source: `src/main.py:{i}-{i + 5}`" for i in range(1, 45)
+        ) + "".join(f"\nPattern source: `src/mod{i}.py:1-2`" for i in range(300))
+        for i in range(300):
+            (repo / "src" / f"mod{i}.py").write_text("x\ny\n")
+        self._validate(plan, repo)  # warm the cache
+
+        start = time.perf_counter()
+        findings = self._validate(plan, repo)
+        elapsed = time.perf_counter() - start
+
+        assert findings == []
+        assert elapsed < 1.0
@@ -0,0 +1,100 @@
+"""Tests for ingot.validation.plan_document module."""
+
+from ingot.validation.plan_document import PlanDocument, strip_code_blocks
+
+PLAN = """\
+# Plan
+
+## Implementation Steps
+1. Modify `src/a.py` <!-- UNVERIFIED: not checked -->
+
+```python
+x = "`not/a/span.py`"
+```
+
+### Details
+See `docs/b.md`.
+
+## Testing Strategy
+<!-- NO_TEST_NEEDED: trivial
+across lines -->
+"""
+
+
+class TestPlanDocument:
+    def test_line_numbers(self):
+        document = PlanDocument(PLAN)
+
+        assert document.line_number_at(0) == 1
+        assert document.line_number_at(PLAN.index("src/a.py")) == 4
+        assert len(document.line_index) == PLAN.count("\n")
+
+    def test_code_blocks(self):
+        document = PlanDocument(PLAN)
+
+        assert len(document.code_blocks) == 1
+        assert document.in_code_block(PLAN.index("x = "))
+        assert not document.in_code_block(PLAN.index("src/a.py"))
+        assert "x = " not in document.stripped_content
+        assert document.stripped_content == strip_code_blocks(PLAN)
+
+    def test_fences_and_unclosed_fence(self):
+        assert [(f.open_line, f.close_line) for f in PlanDocument(PLAN).fences] == [(5, 7)]
+        assert PlanDocument("text\n```\ncode\n").unclosed_fence_line == 1
+
+    def test_outline_nests_headings(self):
+        document = PlanDocument(PLAN)
+
+        (root,) = document.outline
+        assert root.title == "Plan"
+        assert [h.title for h in root.children] == ["Implementation Steps", "Testing Strategy"]
+        assert [h.title for h in root.children[0].children] == ["Details"]
+
+    def test_section_text_runs_to_next_heading(self):
+        document = PlanDocument(PLAN)
+
+        text = document.section_text(["implementation"])
+
+        assert text.startswith("## Implementation Steps")
+        assert "src/a.py" in text
+        assert "docs/b.md" not in text
+        assert document.section_text(["implementation"]) is text
+
+    def test_sections_split_before_each_heading(self):
+        sections = PlanDocument("intro\n" + PLAN).sections
+
+        assert [s.text.split("\n", 1)[0] for s in sections] == [
+            "intro",
+            "# Plan",
+            "## Implementation Steps",
+            "### Details",
+            "## Testing Strategy",
+        ]
+        assert "".join(s.text for s in sections) == "intro\n" + PLAN
+
+    def test_sections_ignore_headings_in_code_blocks(self):
+        content = "## A\n```\n# not a heading\n```\n## B\n"
+
+        sections = PlanDocument(content).sections
+
+        assert [s.text for s in sections] == ["## A\n```\n# not a heading\n```\n", "## B\n"]
+
+    def test_inline_code_spans_skip_code_blocks(self):
+        spans = [span.text for span in PlanDocument(PLAN).inline_code_spans]
+
+        assert spans == ["src/a.py", "docs/b.md"]
+
+    def test_html_comments_include_multiline(self):
+        comments = [c.text for c in PlanDocument(PLAN).html_comments]
+
+        assert comments == [
+            "<!-- UNVERIFIED: not checked -->",
+            "<!-- NO_TEST_NEEDED: trivial\nacross lines -->",
+        ]
+
+    def test_parse_all_matches_lazy_parse(self):
+        eager = PlanDocument.parse_all(PLAN)
+        lazy = PlanDocument(PLAN)
+
+        assert eager.headings == lazy.headings
+        assert eager.html_comments == lazy.html_comments
@@ -1,5 +1,6 @@
 """Tests for ingot.validation.plan_fixer module."""
 
+from ingot.integrations.git import RepoFileIndex
 from ingot.validation.base import (
     ValidationContext,
     ValidationFinding,
@@ -261,3 +262,91 @@ class TestPlanFixerEdgeCases:
 
         assert fixes == []
         assert fixed == content
+
+
+def _not_found(path: str, line_number: int) -> ValidationFinding:
+    return ValidationFinding(
+        validator_name="File Exists",
+        severity=ValidationSeverity.ERROR,
+        message=f"File not found: `{path}`",
+        line_number=line_number,
+    )
+
+
+REPO_FILES = [
+    "README.md",
+    "ingot/workflow/step1_plan.py",
+    "ingot/workflow/tasks.py",
+    "ingot/validation/plan_fixer.py",
+    "tests/test_tasks.py",
+    "docs/a/config.py",
+    "docs/b/config.py",
+]
+
+
+class TestPlanFixerPathCorrection:
+    """Not-found paths resolved against the repository file index."""
+
+    def _fixer(self) -> PlanFixer:
+        return PlanFixer(RepoFileIndex(REPO_FILES))
+
+    def test_missing_leading_directories(self):
+        assert self._fixer().resolve_path("workflow/tasks.py") == "ingot/workflow/tasks.py"
+
+    def test_extra_leading_directories(self):
+        assert self._fixer().resolve_path("package/ingot/workflow/tasks.py") == (
+            "ingot/workflow/tasks.py"
+        )
+
+    def test_unique_basename(self):
+        assert self._fixer().resolve_path("src/plan_fixer.py") == "ingot/validation/plan_fixer.py"
+
+    def test_typo_in_directory_and_file(self):
+        assert self._fixer().resolve_path("ingot/workfow/step1_plam.py") == (
+            "ingot/workflow/step1_plan.py"
+        )
+
+    def test_ambiguous_match_is_not_resolved(self):
+        assert self._fixer().resolve_path("config.py") is None
+        assert self._fixer().resolve_path("docs/c/config.py") is None
+
+    def test_no_index_resolves_nothing(self):
+        assert PlanFixer().resolve_path("workflow/tasks.py") is None
+
+    def test_fix_rewrites_every_quoted_occurrence(self):
+        content = (
+            "Modify `workflow/tasks.py` first.\n"
+            "Then test `workflow/tasks.py:10-20`.\n"
+            "Unrelated `README.md`."
+        )
+        report = ValidationReport(findings=[_not_found("workflow/tasks.py", 1)])
+        fixer = self._fixer()
+
+        fixed, fixes = fixer.fix(content, report)
+
+        assert fixed == (
+            "Modify `ingot/workflow/tasks.py` first.\n"
+            "Then test `ingot/workflow/tasks.py:10-20`.\n"
+            "Unrelated `README.md`."
+        )
+        assert fixes == ["Corrected `workflow/tasks.py` to `ingot/workflow/tasks.py` (line 1)"]
+        assert fixer.stats.paths_corrected == 1
+        assert fixer.fix(fixed, report) == (fixed, [])
+
+    def test_unresolved_path_still_flagged(self):
+        content = "Modify `config.py` here."
+        fixer = self._fixer()
+
+        fixed, _ = fixer.fix(content, ValidationReport(findings=[_not_found("config.py", 1)]))
+
+        assert "<!-- UNVERIFIED: auto-flagged, file not in repo -->" in fixed
+        assert fixer.stats.paths_flagged == 1
+
+    def test_new_file_is_not_rewritten(self):
+        content = "Create `workflow/tasks.py` for the task model.\nUse `workflow/tasks.py` later."
+        report = ValidationReport(findings=[_not_found("workflow/tasks.py", 2)])
+
+        fixed, fixes = self._fixer().fix(content, report)
+
+        assert "Create `workflow/tasks.py`" in fixed
+        assert "UNVERIFIED" in fixes[0]
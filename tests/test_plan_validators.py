@@ -3,6 +3,7 @@
 from unittest.mock import patch
 
 from ingot.validation.base import (
+    SectionFindingCache,
     ValidationContext,
     ValidationFinding,
     ValidationReport,
@@ -438,9 +439,41 @@ class TestValidatorRegistry:
         assert report.has_errors
         assert report.error_count > 0
 
+    def test_concurrent_run_matches_sequential_order(self, tmp_path):
+        plan = COMPLETE_PLAN + "\nModify `src/missing.py`. <!-- NEW_FILE: later -->\n"
+        registry = create_plan_validator_registry()
+        ctx = ValidationContext(repo_root=tmp_path)
+
+        sequential = registry.validate_all(plan, ctx)
+        concurrent = registry.validate_all(plan, ctx, max_workers=4)
+
+        assert concurrent.findings == sequential.findings
+
+    def test_parses_content_once_for_all_validators(self):
+        seen = []
+
+        class Recorder(Validator):
+            @property
+            def name(self):
+                return "Recorder"
+
+            def validate(self, content, context):
+                seen.append(context.document)
+                return []
+
+        registry = ValidatorRegistry()
+        registry.register(Recorder())
+        registry.register(Recorder())
+
+        registry.validate_all(COMPLETE_PLAN, ValidationContext())
+
+        assert seen[0] is not None
+        assert seen[0] is seen[1]
+        assert seen[0].content == COMPLETE_PLAN
+
     def test_factory_returns_all_validators(self):
         registry = create_plan_validator_registry()
-        assert len(registry.validators) == 8
+        assert len(registry.validators) == 9
 
     def test_factory_passes_researcher_output(self):
         researcher = "### Interface & Class Hierarchy\n#### `Foo`\n"
@@ -479,6 +512,94 @@ class TestValidatorRegistry:
         assert report.warning_count == 1
 
 
+class _SectionRecorder(Validator):
+    """Section-scoped validator flagging every line that mentions TODO."""
+
+    section_scoped = True
+
+    def __init__(self):
+        self.seen = []
+
+    @property
+    def name(self):
+        return "Section Recorder"
+
+    def validate(self, content, context):
+        self.seen.append(content)
+        return [
+            ValidationFinding(
+                validator_name=self.name,
+                severity=ValidationSeverity.WARNING,
+                message="TODO left in plan",
+                line_number=i,
+            )
+            for i, line in enumerate(content.splitlines(), 1)
+            if "TODO" in line
+        ]
+
+
+class TestSectionFindingCache:
+    def test_only_changed_sections_are_revalidated(self):
+        recorder = _SectionRecorder()
+        registry = ValidatorRegistry()
+        registry.register(recorder)
+        cache = SectionFindingCache()
+
+        registry.validate_all(COMPLETE_PLAN, ValidationContext(), section_cache=cache)
+        first_pass = len(recorder.seen)
+        recorder.seen.clear()
+        edited = COMPLETE_PLAN.replace("- Risk one", "- Risk one, revised")
+        registry.validate_all(edited, ValidationContext(), section_cache=cache)
+
+        assert first_pass == 7
+        assert len(recorder.seen) == 1
+        assert recorder.seen[0].startswith("## Potential Risks")
+        assert cache.hits == 6
+
+    def test_line_numbers_are_relative_to_the_whole_plan(self):
+        registry = ValidatorRegistry()
+        registry.register(_SectionRecorder())
+        plan = COMPLETE_PLAN.replace("2. Step two", "2. Step two TODO")
+        expected = plan.splitlines().index("2. Step two TODO") + 1
+        cache = SectionFindingCache()
+
+        registry.validate_all(plan, ValidationContext(), section_cache=cache)
+        report = registry.validate_all(plan, ValidationContext(), section_cache=cache)
+
+        assert [f.line_number for f in report.findings] == [expected]
+        assert cache.misses == 7
+
+    def test_document_scoped_validators_see_whole_plan(self):
+        registry = ValidatorRegistry()
+        registry.register(RequiredSectionsValidator())
+        cache = SectionFindingCache()
+
+        report = registry.validate_all(COMPLETE_PLAN, ValidationContext(), section_cache=cache)
+
+        assert report.findings == []
+        assert len(cache) == 0
+
+    def test_file_exists_matches_uncached_run(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "real.py").write_text("x = 1\n")
+        plan = COMPLETE_PLAN.replace(
+            "1. Step one",
+            "1. Edit `src/real.py` and `src/gone.py`",
+        ).replace("- Risk one", "- `src/gone.py` again, and `src/other.py`")
+        registry = ValidatorRegistry()
+        registry.register(FileExistsValidator())
+        ctx = ValidationContext(repo_root=tmp_path)
+
+        uncached = registry.validate_all(plan, ctx)
+        cached = registry.validate_all(plan, ctx, section_cache=SectionFindingCache())
+
+        assert cached.findings == uncached.findings
+        assert [f.message for f in cached.findings] == [
+            "File not found: `src/gone.py`",
+            "File not found: `src/other.py`",
+        ]
+
+
 # =============================================================================
 # TestValidatorRegistryCrashIsolation
 # =============================================================================
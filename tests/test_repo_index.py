@@ -0,0 +1,152 @@
+"""Tests for RepoFileIndex in ingot.integrations.git."""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from ingot.integrations.git import RepoFileIndex, clear_repo_indexes, get_repo_index
+from ingot.validation.base import ValidationContext
+from ingot.validation.plan_validators import FileExistsValidator
+from ingot.workflow.tasks import PathSecurityError, deduplicate_paths, normalize_path
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    _git(tmp_path, "init")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test User")
+    (tmp_path / "src" / "ingot" / "workflow").mkdir(parents=True)
+    (tmp_path / "src" / "ingot" / "workflow" / "step1_plan.py").write_text("x = 1\n")
+    (tmp_path / "src" / "ingot" / "workflow" / "tasks.py").write_text("x = 2\n")
+    (tmp_path / "README.md").write_text("# Test\n")
+    (tmp_path / ".gitignore").write_text("build/\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-m", "init")
+    yield tmp_path
+    clear_repo_indexes()
+
+
+class TestRepoFileIndex:
+    def test_lists_tracked_and_untracked_files(self, repo):
+        (repo / "notes.txt").write_text("untracked\n")
+        (repo / "build").mkdir()
+        (repo / "build" / "out.o").write_text("ignored\n")
+
+        index = RepoFileIndex.build(repo)
+
+        assert index.is_file("src/ingot/workflow/tasks.py")
+        assert index.is_file("notes.txt")
+        assert not index.exists("build/out.o")
+
+    def test_directory_trie(self, repo):
+        index = RepoFileIndex.build(repo)
+
+        assert index.is_dir("src/ingot")
+        assert index.exists("src/ingot/")
+        assert not index.is_file("src/ingot")
+        assert index.list_dir("src/ingot/workflow") == ["step1_plan.py", "tasks.py"]
+        assert index.list_dir() == [".gitignore", "README.md", "src"]
+
+    def test_excludes_files_deleted_from_worktree(self, repo):
+        (repo / "README.md").unlink()
+
+        index = RepoFileIndex.build(repo)
+
+        assert not index.exists("README.md")
+
+    def test_records_symlinks(self, repo):
+        try:
+            os.symlink("README.md", repo / "tracked_link")
+            _git(repo, "add", "tracked_link")
+            os.symlink("/etc", repo / "untracked_link")
+        except OSError:
+            pytest.skip("Cannot create symlinks on this system")
+
+        index = RepoFileIndex.build(repo)
+
+        assert index.symlinks == {"tracked_link", "untracked_link"}
+
+    def test_suggests_same_name_in_other_directory(self, repo):
+        index = RepoFileIndex.build(repo)
+
+        assert index.suggest("ingot/workflow/step1_plan.py", limit=1) == [
+            "src/ingot/workflow/step1_plan.py"
+        ]
+
+    def test_suggests_similar_name(self, repo):
+        index = RepoFileIndex.build(repo)
+
+        assert index.suggest("src/ingot/workflow/step_1_plan.py", limit=1) == [
+            "src/ingot/workflow/step1_plan.py"
+        ]
+
+    def test_no_suggestion_for_unrelated_path(self, repo):
+        index = RepoFileIndex.build(repo)
+
+        assert index.suggest("docs/architecture/overview.rst") == []
+
+
+class TestGetRepoIndex:
+    def test_shared_until_index_changes(self, repo):
+        first = get_repo_index(repo)
+
+        assert get_repo_index(repo) is first
+
+        (repo / "new.py").write_text("y = 1\n")
+        _git(repo, "add", "new.py")
+        second = get_repo_index(repo)
+
+        assert second is not first
+        assert second.is_file("new.py")
+
+    def test_rebuilt_when_head_moves(self, repo):
+        first = get_repo_index(repo)
+        _git(repo, "checkout", "-b", "feature")
+
+        assert get_repo_index(repo) is not first
+
+    def test_none_outside_repository(self, tmp_path):
+        assert get_repo_index(tmp_path) is None
+
+
+class TestIndexedCallers:
+    def test_file_exists_validator_suggests_nearest_path(self, repo):
+        plan = "Modify `ingot/workflow/tasks.py` and `README.md`."
+
+        findings = FileExistsValidator().validate(plan, ValidationContext(repo_root=repo))
+
+        assert [f.message for f in findings] == ["File not found: `ingot/workflow/tasks.py`"]
+        assert findings[0].suggestion.startswith("Did you mean `src/ingot/workflow/tasks.py`?")
+
+    def test_file_exists_validator_falls_back_to_filesystem(self, repo):
+        (repo / "build").mkdir()
+        (repo / "build" / "out.txt").write_text("ignored\n")
+        plan = "Read `build/out.txt`."
+
+        findings = FileExistsValidator().validate(plan, ValidationContext(repo_root=repo))
+
+        assert findings == []
+
+    def test_directory_swapped_for_symlink_after_indexing_is_rejected(self, repo, tmp_path_factory):
+        outside = tmp_path_factory.mktemp("outside")
+        (outside / "workflow").mkdir(parents=True)
+        (outside / "workflow" / "tasks.py").write_text("x = 1\n")
+        assert get_repo_index(repo).is_file("src/ingot/workflow/tasks.py")
+
+        shutil.rmtree(repo / "src" / "ingot" / "workflow")
+        try:
+            os.symlink(outside / "workflow", repo / "src" / "ingot" / "workflow")
+        except OSError:
+            pytest.skip("Cannot create symlinks on this system")
+
+        with pytest.raises(PathSecurityError):
+            normalize_path("src/ingot/workflow/tasks.py", repo)
+        assert deduplicate_paths(["README.md"], repo) == ["README.md"]
@@ -0,0 +1,185 @@
+"""Tests for the RepoSnapshot layer in ingot.integrations.git."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ingot.integrations.git import (
+    NumstatEntry,
+    RepoSnapshot,
+    format_diffstat,
+    get_repo_snapshot,
+    parse_numstat_z,
+    parse_status_v2_z,
+    repo_snapshot_scope,
+)
+from ingot.workflow.git_utils import parse_stat_file_count, parse_stat_total_lines
+
+_OID = "0" * 40
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch) -> Path:
+    """A git repository with one commit, used as the working directory."""
+    monkeypatch.chdir(tmp_path)
+    _git(tmp_path, "init")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test User")
+    (tmp_path / "tracked.py").write_text("one\ntwo\n")
+    (tmp_path / "old.py").write_text("content\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-m", "Initial commit")
+    return tmp_path
+
+
+class TestParseStatusV2:
+    def test_parses_branch_headers_and_entries(self):
+        output = "\0".join(
+            [
+                "# branch.oid abc123",
+                "# branch.head main",
+                f"1 .M N... 100644 100644 100644 {_OID} {_OID} path with spaces.py",
+                f"2 R. N... 100644 100644 100644 {_OID} {_OID} R100 new.py",
+                "old.py",
+                f"u UU N... 100644 100644 100644 100644 {_OID} {_OID} {_OID} conflict.py",
+                "? untracked.txt",
+                "",
+            ]
+        )
+
+        head, branch, entries = parse_status_v2_z(output)
+
+        assert (head, branch) == ("abc123", "main")
+        assert [e.path for e in entries] == [
+            "path with spaces.py",
+            "new.py",
+            "conflict.py",
+            "untracked.txt",
+        ]
+        assert entries[0].short_status == " M"
+        assert entries[1].orig_path == "old.py"
+        assert entries[1].is_staged and not entries[1].is_unstaged
+        assert entries[2].is_staged and entries[2].is_unstaged
+        assert entries[3].is_untracked and entries[3].short_status == "??"
+
+    def test_unborn_and_detached_head(self):
+        head, branch, _ = parse_status_v2_z("# branch.oid (initial)\0# branch.head (detached)\0")
+
+        assert head is None
+        assert branch is None
+
+
+class TestParseNumstat:
+    def test_parses_regular_binary_and_renamed_entries(self):
+        output = "\0".join(["3\t1\ta.py", "-\t-\timage.png", "0\t0\t", "old.py", "new.py", ""])
+
+        entries = parse_numstat_z(output)
+
+        assert entries == [
+            NumstatEntry("a.py", 3, 1),
+            NumstatEntry("image.png", None, None),
+            NumstatEntry("new.py", 0, 0, orig_path="old.py"),
+        ]
+        assert entries[1].is_binary
+
+
+class TestFormatDiffstat:
+    def test_summary_is_parseable_by_stat_helpers(self):
+        stat = format_diffstat(
+            [
+                NumstatEntry("a.py", 7, 3),
+                NumstatEntry("b.py", 1, 0),
+                NumstatEntry("c.png", None, None),
+            ]
+        )
+
+        assert parse_stat_file_count(stat) == 3
+        assert parse_stat_total_lines(stat) == 11
+        assert " c.png | Bin" in stat
+
+    def test_empty(self):
+        assert format_diffstat([]) == ""
+
+
+class TestRepoSnapshot:
+    def test_capture_reports_staged_unstaged_and_untracked(self, repo):
+        (repo / "tracked.py").write_text("one\nchanged\n")
+        _git(repo, "mv", "old.py", "renamed.py")
+        (repo / "nested").mkdir()
+        (repo / "nested" / "new.txt").write_text("new\n")
+
+        snapshot = RepoSnapshot.capture()
+
+        assert snapshot.unstaged_files == ["tracked.py"]
+        assert snapshot.staged_files == ["renamed.py"]
+        # Untracked directories are listed file by file, like ls-files --others
+        assert snapshot.untracked_files == ["nested/new.txt"]
+        assert snapshot.is_dirty and snapshot.has_untracked
+        assert snapshot.unstaged_numstat() == [NumstatEntry("tracked.py", 1, 1)]
+
+    def test_clean_repo_needs_no_numstat_call(self, repo):
+        snapshot = RepoSnapshot.capture()
+
+        with patch("ingot.integrations.git.subprocess.run") as mock_run:
+            assert snapshot.staged_numstat() == []
+            assert snapshot.unstaged_numstat() == []
+
+        mock_run.assert_not_called()
+        assert not snapshot.has_changes
+
+    def test_capture_raises_outside_repository(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+
+        with pytest.raises(subprocess.CalledProcessError):
+            RepoSnapshot.capture()
+
+
+class TestRepoSnapshotScope:
+    def test_outside_scope_always_captures(self, repo):
+        assert get_repo_snapshot() is not get_repo_snapshot()
+
+    def test_scope_reuses_snapshot_while_head_and_index_unchanged(self, repo):
+        with repo_snapshot_scope():
+            first = get_repo_snapshot()
+            assert get_repo_snapshot() is first
+
+    def test_scope_recaptures_after_index_change(self, repo):
+        with repo_snapshot_scope():
+            first = get_repo_snapshot()
+            (repo / "staged.py").write_text("x\n")
+            _git(repo, "add", "staged.py")
+
+            second = get_repo_snapshot()
+
+        assert second is not first
+        assert second.staged_files == ["staged.py"]
+
+    def test_scope_recaptures_after_commit(self, repo):
+        with repo_snapshot_scope():
+            first = get_repo_snapshot()
+            _git(repo, "commit", "--allow-empty", "-m", "empty")
+
+            second = get_repo_snapshot()
+
+        assert second is not first
+        assert second.head != first.head
+
+    def test_scopes_do_not_leak(self, repo):
+        with repo_snapshot_scope():
+            inside = get_repo_snapshot()
+
+        assert get_repo_snapshot() is not inside
+
+    def test_nested_scope_shares_outer_snapshot(self, repo):
+        with repo_snapshot_scope():
+            outer = get_repo_snapshot()
+            with repo_snapshot_scope():
+                assert get_repo_snapshot() is outer
+            assert get_repo_snapshot() is outer
@@ -0,0 +1,196 @@
+"""Tests for ingot.workflow.research_cache and its use by the researcher."""
+
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ingot.workflow.research_cache import ResearchCache, ResearchKey
+from ingot.workflow.state import WorkflowState
+from ingot.workflow.step1_plan import _run_researcher
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+def _commit(repo: Path, files: dict[str, str], message: str = "change") -> None:
+    for name, content in files.items():
+        (repo / name).parent.mkdir(parents=True, exist_ok=True)
+        (repo / name).write_text(content)
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-m", message)
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    monkeypatch.chdir(repo)
+    _git(repo, "init")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test User")
+    _commit(repo, {"src/app.py": "x = 1\n", "README.md": "# Test\n"}, "init")
+    return repo
+
+
+@pytest.fixture
+def state(generic_ticket) -> WorkflowState:
+    return WorkflowState(ticket=generic_ticket, enable_code_search=False)
+
+
+def _key(state: WorkflowState) -> ResearchKey:
+    key = ResearchKey.for_state(state, "ingot-researcher")
+    assert key is not None
+    return key
+
+
+class TestResearchKey:
+    def test_depends_on_ticket_constraints_and_agent(self, repo, state):
+        first = _key(state)
+
+        state.user_constraints = "Use the existing cache module"
+        with_constraints = _key(state)
+        (repo / ".ingot" / "agents").mkdir(parents=True)
+        (repo / ".ingot" / "agents" / "ingot-researcher.md").write_text("Custom agent\n")
+        with_agent = _key(state)
+
+        assert first.tree == with_constraints.tree == with_agent.tree
+        assert len({first.ticket_hash, with_constraints.ticket_hash}) == 2
+        assert len({with_constraints.agent_hash, with_agent.agent_hash}) == 2
+
+    def test_none_with_uncommitted_changes(self, repo, state):
+        (repo / "src" / "app.py").write_text("x = 2\n")
+
+        assert ResearchKey.for_state(state, "ingot-researcher") is None
+
+    def test_workflow_artifacts_do_not_count_as_changes(self, repo, state):
+        (repo / "specs").mkdir()
+        (repo / "specs" / "plan.md").write_text("# Plan\n")
+
+        assert ResearchKey.for_state(state, "ingot-researcher") is not None
+
+
+class TestResearchCache:
+    def test_exact_hit(self, repo, state, tmp_path):
+        cache = ResearchCache(tmp_path / "cache")
+        key = _key(state)
+
+        assert cache.lookup(key) is None
+        cache.store(key, "### Verified Files\n- `src/app.py`")
+        hit = cache.lookup(key)
+
+        assert hit.is_exact
+        assert hit.output == "### Verified Files\n- `src/app.py`"
+
+    def test_small_tree_delta_returns_refresh_hit(self, repo, state, tmp_path):
+        cache = ResearchCache(tmp_path / "cache")
+        old_key = _key(state)
+        cache.store(old_key, "old research")
+
+        _commit(repo, {"src/app.py": "x = 2\n", "src/new.py": "y = 1\n"})
+        hit = cache.lookup(_key(state))
+
+        assert not hit.is_exact
+        assert hit.tree == old_key.tree
+        assert hit.changed_paths == ("src/app.py", "src/new.py")
+        assert hit.output == "old research"
+
+    def test_large_tree_delta_misses(self, repo, state, tmp_path):
+        cache = ResearchCache(tmp_path / "cache", refresh_max_changed_files=2)
+        cache.store(_key(state), "old research")
+
+        _commit(repo, {f"src/m{i}.py": "z = 1\n" for i in range(3)})
+
+        assert cache.lookup(_key(state)) is None
+
+    def test_other_ticket_never_refreshes(self, repo, state, tmp_path):
+        cache = ResearchCache(tmp_path / "cache")
+        cache.store(_key(state), "old research")
+
+        _commit(repo, {"src/app.py": "x = 2\n"})
+        state.user_constraints = "Different request"
+
+        assert cache.lookup(_key(state)) is None
+
+    def test_evicts_least_recently_used_over_size_bound(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        cache = ResearchCache(cache_dir)
+        keys = [
+            ResearchKey(tree=f"{i:040x}", ticket_hash="t" * 64, agent_hash="a") for i in range(3)
+        ]
+        for i, key in enumerate(keys):
+            cache.store(key, "x" * 500)
+            os.utime(cache_dir / key.filename, (1000 + i, 1000 + i))
+        cache.lookup(keys[0])  # Refreshes the oldest entry
+
+        cache.max_bytes = 2 * (cache_dir / keys[0].filename).stat().st_size
+        cache.evict()
+
+        remaining = {path.name for path in cache_dir.glob("*.json")}
+        assert remaining == {keys[0].filename, keys[2].filename}
+
+    def test_corrupt_entry_is_dropped(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        cache = ResearchCache(cache_dir)
+        key = ResearchKey(tree="f" * 40, ticket_hash="t" * 64, agent_hash="a")
+        cache_dir.mkdir()
+        (cache_dir / key.filename).write_text("{not json")
+
+        assert cache.lookup(key) is None
+        assert not (cache_dir / key.filename).exists()
+
+
+class TestRunResearcherCache:
+    @pytest.fixture
+    def tui(self):
+        with patch("ingot.ui.inline_runner.InlineRunner") as tui_class:
+            tui = MagicMock()
+            tui.check_quit_requested.return_value = False
+            tui.run_with_work.side_effect = lambda fn: fn()
+            tui_class.return_value = tui
+            yield tui_class
+
+    @patch("ingot.workflow.step1_plan.print_info")
+    def test_second_run_skips_researcher(self, _info, repo, state, mock_backend, tui):
+        mock_backend.run_with_callback.return_value = (True, "### Verified Files\n- `a.py`")
+
+        first = _run_researcher(state, mock_backend)
+        second = _run_researcher(state, mock_backend)
+
+        assert first == second == (True, "### Verified Files\n- `a.py`")
+        assert mock_backend.run_with_callback.call_count == 1
+
+    def test_small_change_sends_refresh_prompt(self, repo, state, mock_backend, tui):
+        mock_backend.run_with_callback.side_effect = [(True, "research v1"), (True, "research v2")]
+        _run_researcher(state, mock_backend)
+        _commit(repo, {"src/app.py": "x = 2\n"})
+
+        success, output = _run_researcher(state, mock_backend)
+
+        prompt = mock_backend.run_with_callback.call_args_list[1].args[0]
+        assert (success, output) == (True, "research v2")
+        assert "[REFRESH EARLIER RESEARCH]" in prompt
+        assert "- src/app.py" in prompt
+        assert prompt.endswith("[PREVIOUS RESEARCH]\nresearch v1")
+        assert tui.call_args.kwargs["status_message"] == "Refreshing cached codebase research..."
+
+    def test_failed_run_is_not_cached(self, repo, state, mock_backend, tui):
+        mock_backend.run_with_callback.side_effect = [(False, "partial"), (True, "research")]
+
+        _run_researcher(state, mock_backend)
+        _run_researcher(state, mock_backend)
+
+        assert mock_backend.run_with_callback.call_count == 2
+
+    def test_disabled_by_zero_size(self, repo, state, mock_backend, tui):
+        state.research_cache_max_mb = 0
+        mock_backend.run_with_callback.return_value = (True, "research")
+
+        _run_researcher(state, mock_backend)
+        _run_researcher(state, mock_backend)
+
+        assert mock_backend.run_with_callback.call_count == 2
@@ -373,16 +373,22 @@ class TestGetDiffForReview:
     def test_uses_baseline_when_available(self):
         from unittest.mock import MagicMock, patch
 
+        from ingot.utils.token_budget import TokenBudget
         from ingot.workflow.review import _get_diff_for_review
 
         state = MagicMock()
         state.diff_baseline_ref = "abc123"
+        state.backend_platform = None
 
         with patch("ingot.workflow.review.get_smart_diff_from_baseline") as mock_baseline:
             mock_baseline.return_value = ("diff output", False, False)
             result = _get_diff_for_review(state)
 
-            mock_baseline.assert_called_once_with("abc123", include_working_tree=True)
+            mock_baseline.assert_called_once_with(
+                "abc123",
+                include_working_tree=True,
+                max_output_chars=TokenBudget().char_allowance("diff", code=True),
+            )
             assert result == ("diff output", False, False)
 
     def test_falls_back_to_smart_diff_when_no_baseline(self):
@@ -0,0 +1,283 @@
+"""Tests for ingot.workflow.review_shards module."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ingot.workflow.review import ReviewStatus, _run_reviewer, parse_review_status
+from ingot.workflow.review_shards import (
+    FileDiff,
+    ReviewShard,
+    ShardVerdict,
+    build_shard_review_prompt,
+    merge_shard_verdicts,
+    partition_diff,
+    run_sharded_review,
+    split_diff_by_file,
+)
+
+
+def _file_diff(path: str, lines: int = 3) -> str:
+    body = "".join(f"+line {i}\n" for i in range(lines - 2))
+    return f"diff --git a/{path} b/{path}\n@@ -0,0 +1 @@\n{body}"
+
+
+def _verdict(index: int, output: str, *, success: bool = True, paths=("a.py",)) -> ShardVerdict:
+    shard = ReviewShard(index=index, files=[FileDiff(p, _file_diff(p)) for p in paths])
+    return ShardVerdict(shard, success, output)
+
+
+@pytest.fixture
+def state():
+    state = MagicMock()
+    state.diff_baseline_ref = "abc123"
+    state.enable_sharded_review = True
+    state.max_parallel_tasks = 3
+    state.user_constraints = ""
+    state.subagent_names = {"reviewer": "ingot-reviewer"}
+    return state
+
+
+class TestSplitDiffByFile:
+    def test_splits_on_diff_headers(self):
+        diff = _file_diff("a.py") + _file_diff("src/b.py")
+
+        files = split_diff_by_file(diff)
+
+        assert [f.path for f in files] == ["a.py", "src/b.py"]
+        assert "".join(f.text for f in files) == diff
+
+    def test_attaches_trailing_marker_to_last_file(self):
+        diff = _file_diff("a.py") + "... [diff truncated at output budget]"
+
+        files = split_diff_by_file(diff)
+
+        assert files[-1].text.endswith("[diff truncated at output budget]\n")
+
+    def test_returns_empty_for_stat_output(self):
+        assert split_diff_by_file(" a.py | 3 +++\n 1 file changed\n") == []
+
+
+class TestPartitionDiff:
+    def test_keeps_small_changes_in_one_shard(self):
+        files = split_diff_by_file(_file_diff("a.py") + _file_diff("b.py"))
+
+        shards = partition_diff(files, max_lines=100, max_files=10)
+
+        assert len(shards) == 1
+        assert shards[0].paths == ["a.py", "b.py"]
+
+    def test_respects_line_and_file_budgets(self):
+        files = [FileDiff(f"f{i}.py", _file_diff(f"f{i}.py", 10)) for i in range(6)]
+
+        by_lines = partition_diff(files, max_lines=25, max_files=10)
+        by_files = partition_diff(files, max_lines=1_000, max_files=4)
+
+        assert [len(s.files) for s in by_lines] == [2, 2, 2]
+        assert [len(s.files) for s in by_files] == [4, 2]
+        assert [s.index for s in by_lines] == [1, 2, 3]
+
+    def test_groups_files_by_directory(self):
+        files = [
+            FileDiff("web/a.ts", _file_diff("web/a.ts", 10)),
+            FileDiff("api/a.py", _file_diff("api/a.py", 10)),
+            FileDiff("web/b.ts", _file_diff("web/b.ts", 10)),
+            FileDiff("api/b.py", _file_diff("api/b.py", 10)),
+        ]
+
+        shards = partition_diff(files, max_lines=20, max_files=10)
+
+        assert [s.paths for s in shards] == [["api/a.py", "api/b.py"], ["web/a.ts", "web/b.ts"]]
+
+    def test_truncates_oversized_file(self):
+        files = [
+            FileDiff("big.py", _file_diff("big.py", 500)),
+            FileDiff("c.py", _file_diff("c.py")),
+        ]
+
+        shards = partition_diff(files, max_lines=100, max_files=10)
+
+        assert shards[0].paths == ["big.py"]
+        assert shards[0].truncated
+        assert "[LARGE FILE DIFF: big.py - remaining lines omitted]" in shards[0].diff
+        assert not shards[1].truncated
+
+
+class TestBuildShardReviewPrompt:
+    def test_scopes_prompt_to_shard_files(self, state):
+        shard = ReviewShard(index=2, files=[FileDiff("a.py", _file_diff("a.py"))])
+
+        prompt = build_shard_review_prompt(state, "final", shard, 3)
+
+        assert "part 2 of 3" in prompt
+        assert "- a.py" in prompt
+        assert "**Status**: PASS" in prompt
+
+
+class TestMergeShardVerdicts:
+    def test_all_pass(self):
+        merged = merge_shard_verdicts([_verdict(1, "**Status**: PASS")] * 2)
+
+        assert parse_review_status(merged) == ReviewStatus.PASS
+        assert "**Issues**" not in merged
+
+    def test_needs_attention_collects_labelled_issues(self):
+        merged = merge_shard_verdicts(
+            [
+                _verdict(1, "**Status**: PASS"),
+                _verdict(
+                    2,
+                    "**Issues**:\n1. [BUG] Off by one\n2. [TEST] Missing test\n\n"
+                    "**Status**: NEEDS_ATTENTION",
+                ),
+            ]
+        )
+
+        assert parse_review_status(merged) == ReviewStatus.NEEDS_ATTENTION
+        assert "1. [Shard 2/2] [BUG] Off by one" in merged
+        assert "2. [Shard 2/2] [TEST] Missing test" in merged
+
+    def test_needs_replan_wins(self):
+        merged = merge_shard_verdicts(
+            [
+                _verdict(1, "**Issues**:\n1. x\n\n**Status**: NEEDS_ATTENTION"),
+                _verdict(2, "**Replan Reason**: Wrong layer\n\n**Status**: NEEDS_REPLAN"),
+            ]
+        )
+
+        assert parse_review_status(merged) == ReviewStatus.NEEDS_REPLAN
+        assert "**Replan Reason**: [Shard 2/2] Wrong layer" in merged
+
+    def test_failed_shard_never_passes(self):
+        merged = merge_shard_verdicts(
+            [_verdict(1, "**Status**: PASS"), _verdict(2, "boom", success=False)]
+        )
+
+        assert parse_review_status(merged) == ReviewStatus.NEEDS_ATTENTION
+        assert "[REVIEW FAILED]" in merged
+
+    def test_truncated_diff_is_reported(self):
+        merged = merge_shard_verdicts([_verdict(1, "**Status**: PASS")], diff_truncated=True)
+
+        assert parse_review_status(merged) == ReviewStatus.NEEDS_ATTENTION
+        assert "not reviewed" in merged
+
+
+class TestRunShardedReview:
+    @patch("ingot.workflow.review_shards.print_info")
+    @patch("ingot.workflow.review_shards.BackendFactory")
+    @patch("ingot.workflow.review_shards.get_smart_diff_from_baseline")
+    def test_reviews_each_shard_with_fresh_backend(self, mock_diff, mock_factory, _info, state):
+        mock_diff.return_value = (
+            "".join(_file_diff(f"f{i}.py", 10) for i in range(4)),
+            False,
+            False,
+        )
+        workers = []
+
+        def create(platform, model=None):
+            worker = MagicMock()
+            worker.run_with_callback.return_value = (True, "**Status**: PASS")
+            workers.append(worker)
+            return worker
+
+        mock_factory.create.side_effect = create
+        backend = MagicMock()
+
+        success, output = run_sharded_review(
+            state, "final", backend=backend, max_lines=20, max_files=10
+        )
+
+        assert success
+        assert parse_review_status(output) == ReviewStatus.PASS
+        assert len(workers) == 2
+        assert all(w.close.called for w in workers)
+        backend.run_with_callback.assert_not_called()
+
+    @patch("ingot.workflow.review_shards.print_info")
+    @patch("ingot.workflow.review_shards.BackendFactory")
+    @patch("ingot.workflow.review_shards.get_smart_diff_from_baseline")
+    def test_passes_shard_verdicts_to_callback(self, mock_diff, mock_factory, _info, state):
+        mock_diff.return_value = (_file_diff("a.py") + _file_diff("b.py"), False, False)
+        mock_factory.create.return_value.run_with_callback.return_value = (True, "**Status**: PASS")
+        verdicts: list[ShardVerdict] = []
+
+        run_sharded_review(
+            state, "final", backend=MagicMock(), max_files=1, verdicts_callback=verdicts.extend
+        )
+
+        assert [v.shard.paths for v in verdicts] == [["a.py"], ["b.py"]]
+
+    @patch("ingot.workflow.review_shards.print_info")
+    @patch("ingot.workflow.review_shards.print_warning")
+    @patch("ingot.workflow.review_shards.BackendFactory")
+    @patch("ingot.workflow.review_shards.get_smart_diff_from_baseline")
+    def test_shard_crash_reports_failure(self, mock_diff, mock_factory, _warn, _info, state):
+        mock_diff.return_value = (_file_diff("a.py"), False, False)
+        mock_factory.create.return_value.run_with_callback.side_effect = RuntimeError("boom")
+
+        success, output = run_sharded_review(state, "final", backend=MagicMock())
+
+        assert not success
+        assert "[REVIEW FAILED]" in output
+
+    @patch("ingot.workflow.review_shards.get_smart_diff_from_baseline")
+    def test_returns_none_on_git_error(self, mock_diff, state):
+        mock_diff.return_value = ("", False, True)
+
+        assert run_sharded_review(state, "final", backend=MagicMock()) is None
+
+    @patch("ingot.workflow.review_shards.print_info")
+    @patch("ingot.workflow.review_shards.BackendFactory")
+    @patch("ingot.workflow.review_shards.get_smart_diff_from_baseline")
+    def test_caps_shard_count(self, mock_diff, mock_factory, _info, state):
+        mock_diff.return_value = ("".join(_file_diff(f"f{i}.py") for i in range(5)), False, False)
+        mock_factory.create.return_value.run_with_callback.return_value = (True, "**Status**: PASS")
+
+        success, output = run_sharded_review(
+            state, "final", backend=MagicMock(), max_files=1, max_shards=2
+        )
+
+        assert mock_factory.create.call_count == 2
+        assert parse_review_status(output) == ReviewStatus.NEEDS_ATTENTION
+
+
+class TestRunReviewer:
+    @patch("ingot.workflow.review_shards.run_sharded_review")
+    def test_uses_sharded_review_for_truncated_diff(self, mock_sharded, state):
+        mock_sharded.return_value = (True, "**Status**: PASS")
+        backend = MagicMock()
+
+        result = _run_reviewer(state, "final", "stat", True, backend)
+
+        assert result == (True, "**Status**: PASS")
+        backend.run_with_callback.assert_not_called()
+
+    @patch("ingot.workflow.review_shards.run_sharded_review")
+    def test_single_review_when_diff_fits(self, mock_sharded, state):
+        backend = MagicMock()
+        backend.run_with_callback.return_value = (True, "**Status**: PASS")
+
+        _run_reviewer(state, "final", "diff", False, backend)
+
+        mock_sharded.assert_not_called()
+        backend.run_with_callback.assert_called_once()
+
+    @patch("ingot.workflow.review_shards.run_sharded_review")
+    def test_single_review_when_disabled(self, mock_sharded, state):
+        state.enable_sharded_review = False
+        backend = MagicMock()
+        backend.run_with_callback.return_value = (True, "**Status**: PASS")
+
+        _run_reviewer(state, "final", "stat", True, backend)
+
+        mock_sharded.assert_not_called()
+
+    @patch("ingot.workflow.review_shards.run_sharded_review")
+    def test_falls_back_when_sharding_unavailable(self, mock_sharded, state):
+        mock_sharded.return_value = None
+        backend = MagicMock()
+        backend.run_with_callback.return_value = (True, "**Status**: PASS")
+
+        assert _run_reviewer(state, "final", "stat", True, backend) == (True, "**Status**: PASS")
+        backend.run_with_callback.assert_called_once()
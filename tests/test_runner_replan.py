@@ -35,6 +35,17 @@ def ticket():
     )
 
 
+@pytest.fixture(autouse=True)
+def no_speculative_research():
+    """Keep the runner from starting a real researcher run in the background.
+
+    It would call the mock backend from another thread and index the
+    repository the tests run in.
+    """
+    with patch("ingot.workflow.runner.SpeculativeResearch.start", return_value=None):
+        yield
+
+
 @pytest.fixture
 def mock_config():
     """Create a mock ConfigManager."""
@@ -1,5 +1,6 @@
 """Tests for ingot.workflow.step1_5_clarification module."""
 
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -10,10 +11,13 @@ from ingot.workflow.state import WorkflowState
 from ingot.workflow.step1_5_clarification import (
     ClarificationQA,
     _append_clarifications_log,
+    _build_question_batch_prompt,
     _build_rewrite_prompt,
     _build_single_question_prompt,
     _extract_question,
+    _extract_questions,
     _rewrite_plan_with_clarifications,
+    _run_batched_qa_loop,
     _run_interactive_qa_loop,
     step_1_5_clarification,
 )
@@ -71,6 +75,21 @@ class TestStep15ClarificationEntryPoint:
         assert result is True
         mock_confirm.assert_not_called()
 
+    @patch("ingot.workflow.step1_5_clarification._run_interactive_qa_loop")
+    @patch("ingot.workflow.step1_5_clarification._run_batched_qa_loop")
+    @patch("ingot.workflow.step1_5_clarification.prompt_confirm")
+    def test_uses_batched_loop_when_batch_size_above_one(
+        self, mock_confirm, mock_batched, mock_single, workflow_state, mock_backend
+    ):
+        mock_confirm.return_value = True
+        mock_batched.return_value = []
+        workflow_state.clarification_batch_size = 5
+
+        step_1_5_clarification(workflow_state, mock_backend)
+
+        mock_batched.assert_called_once()
+        mock_single.assert_not_called()
+
     @patch("ingot.workflow.step1_5_clarification._display_plan_summary")
     @patch("ingot.workflow.step1_5_clarification._rewrite_plan_with_clarifications")
     @patch("ingot.workflow.step1_5_clarification._run_interactive_qa_loop")
@@ -296,6 +315,145 @@ class TestInteractiveQALoop:
         assert call_kwargs["dont_save_session"] is True
 
 
+# =============================================================================
+# Batched Q&A Loop Tests
+# =============================================================================
+
+
+@pytest.fixture
+def batched_state(workflow_state):
+    workflow_state.clarification_batch_size = 3
+    return workflow_state
+
+
+class TestBatchedQALoop:
+    @patch("ingot.workflow.step1_5_clarification.prompt_confirm")
+    @patch("ingot.workflow.step1_5_clarification.prompt_input")
+    def test_one_call_for_whole_batch(self, mock_input, mock_confirm, batched_state, mock_backend):
+        mock_backend.supports_parallel = False
+        mock_backend.run_with_callback.return_value = (True, "1. What DB?\n2. What auth?")
+        mock_input.side_effect = ["PostgreSQL", "JWT"]
+
+        result = _run_batched_qa_loop(batched_state, mock_backend, batched_state.get_plan_path())
+
+        assert [(qa.question, qa.answer) for qa in result] == [
+            ("What DB?", "PostgreSQL"),
+            ("What auth?", "JWT"),
+        ]
+        mock_backend.run_with_callback.assert_called_once()
+        # Short batch: the AI has nothing more, so no follow-up is offered
+        mock_confirm.assert_not_called()
+
+    @patch("ingot.workflow.step1_5_clarification.console")
+    @patch("ingot.workflow.step1_5_clarification.prompt_input")
+    def test_lists_each_question_once(self, mock_input, mock_console, batched_state, mock_backend):
+        mock_backend.supports_parallel = False
+        mock_backend.run_with_callback.return_value = (True, "1. What DB?\n2. What auth?")
+        mock_input.side_effect = ["PostgreSQL", "JWT"]
+
+        _run_batched_qa_loop(batched_state, mock_backend, batched_state.get_plan_path())
+
+        printed = [c.args[0] for c in mock_console.print.call_args_list if c.args]
+        assert sum("What DB?" in line for line in printed) == 1
+        assert sum("What auth?" in line for line in printed) == 1
+        assert [c.args[0] for c in mock_input.call_args_list] == [
+            "Your answer to question 1:",
+            "Your answer to question 2:",
+        ]
+
+    @patch("ingot.workflow.step1_5_clarification.prompt_confirm")
+    @patch("ingot.workflow.step1_5_clarification.prompt_input")
+    def test_next_batch_generated_while_user_answers(
+        self, mock_input, mock_confirm, batched_state, mock_backend
+    ):
+        background_call = threading.Event()
+
+        def run(prompt, **kwargs):
+            if "already been asked" in prompt:
+                assert "- Q1?" in prompt and "- Q3?" in prompt
+                background_call.set()
+                return True, "1. Q4?"
+            return True, "1. Q1?\n2. Q2?\n3. Q3?"
+
+        def answer(_prompt):
+            # The next batch is requested before the current one is answered
+            assert background_call.wait(timeout=5)
+            return "yes"
+
+        mock_backend.run_with_callback.side_effect = run
+        mock_input.side_effect = answer
+        mock_confirm.return_value = True
+
+        result = _run_batched_qa_loop(batched_state, mock_backend, batched_state.get_plan_path())
+
+        assert [qa.question for qa in result] == ["Q1?", "Q2?", "Q3?", "Q4?"]
+        assert mock_backend.run_with_callback.call_count == 2
+
+    @patch("ingot.workflow.step1_5_clarification.prompt_input")
+    def test_stopping_cancels_next_batch(self, mock_input, batched_state, mock_backend):
+        release = threading.Event()
+        stopped = threading.Event()
+
+        def run(prompt, output_callback, **kwargs):
+            if "already been asked" in prompt:
+                release.wait(timeout=5)
+                try:
+                    output_callback("1. Q4?")
+                except Exception:
+                    stopped.set()
+                    raise
+                return True, "1. Q4?"
+            return True, "1. Q1?\n2. Q2?\n3. Q3?"
+
+        mock_backend.run_with_callback.side_effect = run
+        mock_input.side_effect = ["yes", "done"]
+
+        result = _run_batched_qa_loop(batched_state, mock_backend, batched_state.get_plan_path())
+        release.set()
+
+        assert [qa.question for qa in result] == ["Q1?"]
+        assert stopped.wait(timeout=5)
+
+    @patch("ingot.workflow.step1_5_clarification.prompt_confirm")
+    @patch("ingot.workflow.step1_5_clarification.prompt_input")
+    def test_total_questions_capped(self, mock_input, mock_confirm, batched_state, mock_backend):
+        mock_backend.supports_parallel = False
+        counter = iter(range(100))
+
+        def run(prompt, **kwargs):
+            return True, "\n".join(f"{i}. Question {next(counter)}?" for i in range(1, 4))
+
+        mock_backend.run_with_callback.side_effect = run
+        mock_input.return_value = "yes"
+        mock_confirm.return_value = True
+
+        result = _run_batched_qa_loop(batched_state, mock_backend, batched_state.get_plan_path())
+
+        assert len(result) == 10
+
+    def test_backend_failure_stops_loop(self, batched_state, mock_backend):
+        mock_backend.run_with_callback.return_value = (False, "Error")
+
+        assert (
+            _run_batched_qa_loop(batched_state, mock_backend, batched_state.get_plan_path()) == []
+        )
+
+    def test_batch_size_validated(self, generic_ticket):
+        with pytest.raises(ValueError, match="clarification_batch_size must be 1-10"):
+            WorkflowState(ticket=generic_ticket, clarification_batch_size=0)
+
+    def test_conflict_context_in_first_batch(self, batched_state, mock_backend):
+        batched_state.conflict_detected = True
+        batched_state.conflict_summary = "Ticket says X, user says Y."
+        mock_backend.run_with_callback.return_value = (True, "NO_MORE_QUESTIONS")
+
+        _run_batched_qa_loop(batched_state, mock_backend, batched_state.get_plan_path())
+
+        prompt = mock_backend.run_with_callback.call_args[0][0]
+        assert "Ticket says X, user says Y." in prompt
+        assert "Ask up to 3 clarification questions" in prompt
+
+
 # =============================================================================
 # Plan Rewrite Tests
 # =============================================================================
@@ -512,6 +670,41 @@ class TestExtractQuestion:
         assert result == "What DB? Should we use PostgreSQL?"
 
 
+class TestExtractQuestions:
+    def test_numbered_list(self):
+        output = "Here are my questions:\n1. What DB?\n2) Which auth\n   provider?\n- Rate limits?"
+
+        assert _extract_questions(output) == ["What DB?", "Which auth provider?", "Rate limits?"]
+
+    def test_sentinel_and_empty_output(self):
+        assert _extract_questions("NO_MORE_QUESTIONS") == []
+        assert _extract_questions("") == []
+        assert _extract_questions(None) == []
+
+    def test_unnumbered_output_is_one_question(self):
+        assert _extract_questions("What database\nshould we use?") == [
+            "What database should we use?"
+        ]
+
+
+class TestBuildQuestionBatchPrompt:
+    def test_lists_pending_questions_without_conflict(self, workflow_state):
+        workflow_state.conflict_detected = True
+        workflow_state.conflict_summary = "Some conflict"
+
+        prompt = _build_question_batch_prompt(
+            plan_path=Path("specs/plan.md"),
+            state=workflow_state,
+            previous_qa=[],
+            pending=["What DB?"],
+            batch_size=2,
+        )
+
+        assert "- What DB?" in prompt
+        assert "Some conflict" not in prompt
+        assert "NO_MORE_QUESTIONS" in prompt
+
+
 # =============================================================================
 # Append Clarifications Log Tests
 # =============================================================================
@@ -1,15 +1,19 @@
 """Tests for ingot.workflow.step1_plan module."""
 
 import subprocess
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from ingot.config.fetch_config import AgentPlatform
 from ingot.ui.menus import ReviewChoice
+from ingot.utils.token_budget import TokenEstimator, get_token_estimator
 from ingot.validation.base import ValidationFinding, ValidationReport, ValidationSeverity
 from ingot.workflow.state import WorkflowState
 from ingot.workflow.step1_plan import (
+    SpeculativeResearch,
     _build_fix_prompt,
     _build_minimal_prompt,
     _build_replan_prompt,
@@ -20,11 +24,14 @@ from ingot.workflow.step1_plan import (
     _extract_plan_markdown,
     _fix_plan_with_ai,
     _format_validation_feedback,
+    _generate_plan_candidates,
     _generate_plan_with_tui,
     _get_log_base_dir,
+    _prefetch_tasklist,
     _run_researcher,
     _save_plan_from_output,
     _truncate_researcher_context,
+    _use_plan_candidates,
     _validate_plan,
     step_1_create_plan,
 )
@@ -1241,6 +1248,131 @@ class TestRunResearcher:
         assert output == ""
 
 
+class TestSpeculativeResearch:
+    @pytest.fixture(autouse=True)
+    def head_tree(self):
+        with patch("ingot.workflow.step1_plan.get_head_tree", return_value="tree-1") as tree:
+            yield tree
+
+    @pytest.fixture(autouse=True)
+    def no_code_search(self, workflow_state):
+        # Seeding the prompt would index the repository the tests run in
+        workflow_state.enable_code_search = False
+
+    def _wait(self, research: SpeculativeResearch) -> None:
+        research._thread.join(timeout=5)
+        assert research.done
+
+    def test_finished_research_is_reused(self, workflow_state, mock_backend):
+        workflow_state.research_cache_max_mb = 0
+        mock_backend.run_with_callback.return_value = (True, "### Verified Files\n")
+
+        research = SpeculativeResearch.start(workflow_state, mock_backend)
+        self._wait(research)
+        workflow_state.user_constraints = "use Redis"
+
+        assert research.join() == (True, "### Verified Files\n")
+        prompt = mock_backend.run_with_callback.call_args[0][0]
+        assert "use Redis" not in prompt
+        assert mock_backend.run_with_callback.call_args[1]["subagent"] == "ingot-researcher"
+
+    @patch("ingot.ui.inline_runner.InlineRunner")
+    def test_join_shows_progress_of_running_research(
+        self, mock_tui_class, workflow_state, mock_backend
+    ):
+        workflow_state.research_cache_max_mb = 0
+        release = threading.Event()
+
+        def run(prompt, *, output_callback, **kwargs):
+            release.wait(timeout=5)
+            output_callback("Reading src/main.py")
+            return True, "### Verified Files\n"
+
+        mock_backend.run_with_callback.side_effect = run
+        mock_tui = MagicMock()
+        mock_tui.check_quit_requested.return_value = False
+        mock_tui.run_with_work.side_effect = lambda fn: (release.set(), fn())[1]
+        mock_tui_class.return_value = mock_tui
+
+        research = SpeculativeResearch.start(workflow_state, mock_backend)
+
+        assert research.join() == (True, "### Verified Files\n")
+        mock_tui.handle_output_line.assert_called_once_with("Reading src/main.py")
+        mock_tui.print_summary.assert_called_once_with(True)
+
+    def test_discarded_when_head_tree_changes(self, workflow_state, mock_backend, head_tree):
+        workflow_state.research_cache_max_mb = 0
+        research = SpeculativeResearch.start(workflow_state, mock_backend)
+        self._wait(research)
+        head_tree.return_value = "tree-2"
+
+        assert research.join() is None
+
+    def test_cancel_stops_backend_at_next_output_line(self, workflow_state, mock_backend):
+        workflow_state.research_cache_max_mb = 0
+        started = threading.Event()
+        lines = []
+
+        def run(prompt, *, output_callback, **kwargs):
+            started.set()
+            for i in range(500):
+                output_callback(f"line {i}")
+                lines.append(i)
+                threading.Event().wait(0.01)
+            return True, "never used"
+
+        mock_backend.run_with_callback.side_effect = run
+        research = SpeculativeResearch.start(workflow_state, mock_backend)
+        started.wait(timeout=5)
+
+        research.cancel()
+        self._wait(research)
+
+        assert len(lines) < 500
+        assert research.join() is None
+
+    def test_not_started_for_sequential_backends(self, workflow_state, mock_backend):
+        mock_backend.supports_parallel = False
+
+        assert SpeculativeResearch.start(workflow_state, mock_backend) is None
+        mock_backend.run_with_callback.assert_not_called()
+
+    @patch("ingot.workflow.step1_plan.show_plan_review_menu")
+    @patch("ingot.workflow.step1_plan._display_plan_summary")
+    @patch("ingot.workflow.step1_plan._run_researcher")
+    @patch("ingot.workflow.step1_plan._generate_plan_with_tui")
+    def test_step_1_joins_pending_research(
+        self,
+        mock_generate,
+        mock_researcher,
+        mock_display_summary,
+        mock_review_menu,
+        workflow_state,
+        tmp_path,
+        monkeypatch,
+    ):
+        monkeypatch.chdir(tmp_path)
+        mock_review_menu.return_value = ReviewChoice.APPROVE
+        workflow_state.enable_plan_validation = False
+        pending = MagicMock()
+        pending.join.return_value = (True, "### Verified Files\n")
+        workflow_state.pending_research = pending
+
+        def create_plan(*args, **kwargs):
+            plan_path = workflow_state.get_plan_path()
+            plan_path.parent.mkdir(parents=True, exist_ok=True)
+            plan_path.write_text("# Plan")
+            return True, "# Plan"
+
+        mock_generate.side_effect = create_plan
+
+        assert step_1_create_plan(workflow_state, MagicMock()) is True
+
+        mock_researcher.assert_not_called()
+        assert mock_generate.call_args[1]["researcher_context"] == "### Verified Files\n"
+        assert workflow_state.pending_research is None
+
+
 # =============================================================================
 # Truncation Tests
 # =============================================================================
@@ -1257,7 +1389,7 @@ class TestTruncateResearcherContext:
         # Create context that exceeds the budget
         context = "### Verified Files\n" + "- `src/file.py:1` — Description\n" * 500
         result = _truncate_researcher_context(context, budget=500)
-        assert len(result) <= 600  # Budget + header overhead
+        assert TokenEstimator().estimate(result) <= 500
         assert "[NOTE: Research context truncated" in result
 
     def test_empty_context_returned(self):
@@ -1270,9 +1402,21 @@ class TestTruncateResearcherContext:
             "### Existing Code Patterns\nPatterns\n"
             "### Unresolved\nUnresolved items long text " + "x" * 500
         )
-        result = _truncate_researcher_context(context, budget=200)
+        result = _truncate_researcher_context(context, budget=60)
         # Should keep Verified Files (highest priority) and drop Unresolved (lowest)
         assert "Verified Files" in result
+        assert "Unresolved items" not in result
+
+    def test_budget_follows_backend_calibration(self):
+        context = "### Verified Files\n" + "- `src/file.py:1` — Description\n" * 100
+        claude = get_token_estimator(AgentPlatform.CLAUDE)
+        codex = get_token_estimator(AgentPlatform.CODEX)
+
+        # The same token budget holds more text for a tokenizer with more chars per token
+        dense = _truncate_researcher_context(context, budget=400, estimator=claude)
+        sparse = _truncate_researcher_context(context, budget=400, estimator=codex)
+
+        assert len(dense) < len(sparse)
 
 
 # =============================================================================
@@ -1415,6 +1559,46 @@ class TestStep1WithValidation:
 
         mock_validate.assert_called_once()
 
+    @patch("ingot.workflow.step1_plan.get_symbol_index")
+    @patch("ingot.workflow.step1_plan.show_plan_review_menu")
+    @patch("ingot.workflow.step1_plan._display_plan_summary")
+    @patch("ingot.workflow.step1_plan._validate_plan")
+    @patch("ingot.workflow.step1_plan._run_researcher")
+    @patch("ingot.workflow.step1_plan._generate_plan_with_tui")
+    def test_symbol_index_built_once_and_shared(
+        self,
+        mock_generate,
+        mock_researcher,
+        mock_validate,
+        mock_display,
+        mock_review_menu,
+        mock_get_index,
+        workflow_state,
+        tmp_path,
+        monkeypatch,
+    ):
+        monkeypatch.chdir(tmp_path)
+        mock_review_menu.return_value = ReviewChoice.APPROVE
+        mock_researcher.return_value = (True, "### Verified Files\n")
+        plan_path = tmp_path / "specs" / "TEST-123-plan.md"
+
+        def create_plan(*args, **kwargs):
+            plan_path.parent.mkdir(parents=True, exist_ok=True)
+            plan_path.write_text("# Plan")
+            return True, "# Plan"
+
+        mock_generate.side_effect = create_plan
+        mock_validate.side_effect = [_report(1), ValidationReport()]
+        workflow_state.enable_plan_validation = True
+
+        step_1_create_plan(workflow_state, MagicMock())
+
+        index = mock_get_index.return_value
+        mock_get_index.assert_called_once_with()
+        assert mock_generate.call_args.kwargs["symbol_index"] is index
+        assert mock_validate.call_count == 2
+        assert all(c.kwargs["symbol_index"] is index for c in mock_validate.call_args_list)
+
     @patch("ingot.workflow.step1_plan.show_plan_review_menu")
     @patch("ingot.workflow.step1_plan._display_plan_summary")
     @patch("ingot.workflow.step1_plan._validate_plan")
@@ -1629,13 +1813,13 @@ class TestTruncationBudgetRespected:
         budget = 500
         context = "### Verified Files\n" + "- `src/file.py:1` — Description\n" * 200
         result = _truncate_researcher_context(context, budget=budget)
-        assert len(result) <= budget
+        assert TokenEstimator().estimate(result) <= budget
 
     def test_small_budget_still_within_limit(self):
-        budget = 200
+        budget = 60
         context = "### Verified Files\n" + "- `src/file.py:1` — Desc\n" * 100
         result = _truncate_researcher_context(context, budget=budget)
-        assert len(result) <= budget
+        assert TokenEstimator().estimate(result) <= budget
 
 
 class TestBuildMinimalPromptFallback:
@@ -1717,6 +1901,222 @@ class TestResearcherNotRerunOnRetry:
         assert mock_fix_ai.call_count == 1
 
 
+def _report(errors: int, warnings: int = 0) -> ValidationReport:
+    findings = [
+        ValidationFinding(validator_name="Test", severity=severity, message="Bad")
+        for severity in [ValidationSeverity.ERROR] * errors
+        + [ValidationSeverity.WARNING] * warnings
+    ]
+    return ValidationReport(findings=findings)
+
+
+class TestPlanCandidates:
+    @pytest.fixture
+    def inline_runner(self):
+        with patch("ingot.ui.inline_runner.InlineRunner") as runner_class:
+            runner = runner_class.return_value
+            runner.check_quit_requested.return_value = False
+            runner.run_with_work.side_effect = lambda fn: fn()
+            yield runner
+
+    @pytest.fixture
+    def candidate_state(self, workflow_state, tmp_path, monkeypatch):
+        monkeypatch.setenv("INGOT_LOG_DIR", str(tmp_path / "logs"))
+        workflow_state.plan_candidates = 3
+        workflow_state.plan_candidate_models = ["model-a", "model-b"]
+        return workflow_state
+
+    def _worker_backends(self, outputs: dict[str, tuple[bool, str]]):
+        def create(platform, model=""):
+            worker = MagicMock()
+            worker.run_with_callback.side_effect = lambda prompt, **kwargs: outputs[kwargs["model"]]
+            return worker
+
+        return patch("ingot.workflow.step1_plan.BackendFactory.create", side_effect=create)
+
+    def test_keeps_candidate_with_fewest_errors(
+        self, candidate_state, mock_backend, inline_runner, tmp_path
+    ):
+        mock_backend.supports_plan_mode = True
+        plan_path = tmp_path / "specs" / "TEST-123-plan.md"
+        outputs = {"model-a": (True, "# Plan A"), "model-b": (True, "# Plan B")}
+        reports = {"# Plan A": _report(2), "# Plan B": _report(0, warnings=1)}
+
+        with (
+            self._worker_backends(outputs) as create,
+            patch(
+                "ingot.workflow.step1_plan._validate_plan",
+                side_effect=lambda content, *args, **kwargs: reports[content],
+            ),
+        ):
+            assert _generate_plan_candidates(candidate_state, plan_path, mock_backend) is True
+
+        assert plan_path.read_text() == "# Plan B"
+        assert [c.kwargs["model"] for c in create.call_args_list] == [
+            "model-a",
+            "model-b",
+            "model-a",
+        ]
+        assert not list(plan_path.parent.glob("*.candidate-*"))
+
+    def test_ties_go_to_the_earliest_candidate(
+        self, candidate_state, mock_backend, inline_runner, tmp_path
+    ):
+        mock_backend.supports_plan_mode = True
+        candidate_state.plan_candidate_models = []
+        plan_path = tmp_path / "specs" / "TEST-123-plan.md"
+        calls = iter(["# First", "# Second", "# Third"])
+
+        def create(platform, model=""):
+            worker = MagicMock()
+            worker.run_with_callback.return_value = (True, next(calls))
+            return worker
+
+        with (
+            patch("ingot.workflow.step1_plan.BackendFactory.create", side_effect=create),
+            patch("ingot.workflow.step1_plan._validate_plan", return_value=_report(1)),
+        ):
+            assert _generate_plan_candidates(candidate_state, plan_path, mock_backend) is True
+
+        assert plan_path.read_text() == "# First"
+
+    def test_fails_when_no_candidate_produces_a_plan(
+        self, candidate_state, mock_backend, inline_runner, tmp_path
+    ):
+        plan_path = tmp_path / "specs" / "TEST-123-plan.md"
+        outputs = {"model-a": (False, ""), "model-b": (True, "")}
+
+        with self._worker_backends(outputs):
+            assert _generate_plan_candidates(candidate_state, plan_path, mock_backend) is False
+
+        assert not plan_path.exists()
+
+    def test_only_with_validation_and_parallel_backends(self, candidate_state, mock_backend):
+        assert _use_plan_candidates(candidate_state, mock_backend) is True
+
+        mock_backend.supports_parallel = False
+        assert _use_plan_candidates(candidate_state, mock_backend) is False
+
+        mock_backend.supports_parallel = True
+        candidate_state.enable_plan_validation = False
+        assert _use_plan_candidates(candidate_state, mock_backend) is False
+
+    def test_range_is_validated(self, generic_ticket):
+        with pytest.raises(ValueError, match="plan_candidates must be 1-5"):
+            WorkflowState(ticket=generic_ticket, plan_candidates=0)
+
+    @patch("ingot.workflow.step1_plan.show_plan_review_menu")
+    @patch("ingot.workflow.step1_plan._display_plan_summary")
+    @patch("ingot.workflow.step1_plan._validate_plan")
+    @patch("ingot.workflow.step1_plan._fix_plan_with_ai")
+    @patch("ingot.workflow.step1_plan._generate_plan_with_tui")
+    @patch("ingot.workflow.step1_plan._generate_plan_candidates")
+    def test_step_1_fixes_only_when_best_candidate_fails(
+        self,
+        mock_candidates,
+        mock_generate,
+        mock_fix_ai,
+        mock_validate,
+        mock_display_summary,
+        mock_review_menu,
+        candidate_state,
+        mock_backend,
+        tmp_path,
+        monkeypatch,
+    ):
+        monkeypatch.chdir(tmp_path)
+        mock_review_menu.return_value = ReviewChoice.APPROVE
+        mock_validate.return_value = ValidationReport()
+        candidate_state.subagent_names.pop("researcher")
+
+        def write_best(state, plan_path, backend, **kwargs):
+            plan_path.parent.mkdir(parents=True, exist_ok=True)
+            plan_path.write_text("# Best plan")
+            return True
+
+        mock_candidates.side_effect = write_best
+
+        assert step_1_create_plan(candidate_state, mock_backend) is True
+
+        mock_candidates.assert_called_once()
+        mock_generate.assert_not_called()
+        mock_fix_ai.assert_not_called()
+
+
+class TestPrefetchTasklist:
+    @patch("ingot.workflow.step1_plan.TasklistPrefetch.start")
+    def test_keeps_prefetch_of_unchanged_plan(self, mock_start, workflow_state, mock_backend):
+        pending = MagicMock()
+        pending.matches.return_value = True
+        workflow_state.pending_tasklist = pending
+
+        _prefetch_tasklist(workflow_state, mock_backend, Path("plan.md"))
+
+        mock_start.assert_not_called()
+        pending.cancel.assert_not_called()
+        assert workflow_state.pending_tasklist is pending
+
+    @patch("ingot.workflow.step1_plan.TasklistPrefetch.start")
+    def test_restarts_prefetch_of_edited_plan(self, mock_start, workflow_state, mock_backend):
+        pending = MagicMock()
+        pending.matches.return_value = False
+        workflow_state.pending_tasklist = pending
+
+        _prefetch_tasklist(workflow_state, mock_backend, Path("plan.md"))
+
+        pending.cancel.assert_called_once()
+        mock_start.assert_called_once_with(workflow_state, mock_backend, Path("plan.md"))
+        assert workflow_state.pending_tasklist is mock_start.return_value
+
+    @patch("ingot.workflow.step1_plan.TasklistPrefetch.start")
+    @patch("ingot.workflow.step1_plan.show_plan_review_menu")
+    @patch("ingot.workflow.step1_plan._display_plan_summary")
+    @patch("ingot.workflow.step1_plan._display_validation_report")
+    @patch("ingot.workflow.step1_plan._validate_plan")
+    @patch("ingot.workflow.step1_plan._generate_plan_with_tui")
+    def test_started_only_for_plans_that_pass_validation(
+        self,
+        mock_generate,
+        mock_validate,
+        mock_display_report,
+        mock_display_summary,
+        mock_review_menu,
+        mock_start,
+        workflow_state,
+        tmp_path,
+        monkeypatch,
+    ):
+        monkeypatch.chdir(tmp_path)
+        mock_review_menu.return_value = ReviewChoice.APPROVE
+        workflow_state.subagent_names.pop("researcher")
+        workflow_state.validation_strict = False
+
+        def create_plan(*args, **kwargs):
+            plan_path = workflow_state.get_plan_path()
+            plan_path.parent.mkdir(parents=True, exist_ok=True)
+            plan_path.write_text("# Plan")
+            return True, "# Plan"
+
+        mock_generate.side_effect = create_plan
+        failing = ValidationReport(
+            findings=[
+                ValidationFinding(
+                    validator_name="Test", severity=ValidationSeverity.ERROR, message="Bad"
+                )
+            ]
+        )
+
+        mock_validate.return_value = ValidationReport()
+        assert step_1_create_plan(workflow_state, MagicMock()) is True
+        assert mock_start.call_count == 1
+
+        workflow_state.pending_tasklist = None
+        mock_validate.return_value = failing
+        with patch("ingot.workflow.step1_plan._fix_plan_with_ai", return_value=(False, "")):
+            assert step_1_create_plan(workflow_state, MagicMock()) is True
+        assert mock_start.call_count == 1
+
+
 class TestSectionsNotInPriority:
     """Unknown sections are dropped during truncation."""
 
@@ -1730,7 +2130,7 @@ class TestSectionsNotInPriority:
         )
         # Use a budget that is smaller than the full context but large enough
         # to fit at least the Verified Files section
-        budget = len(context) - 10
+        budget = TokenEstimator().estimate(context) - 3
         result = _truncate_researcher_context(context, budget=budget)
         # Known sections should be present
         assert "Verified Files" in result
@@ -1746,7 +2146,7 @@ class TestTruncationAtLineBoundary:
         lines = [f"- `src/file_{i}.py:1` — Description line {i}" for i in range(200)]
         context = "### Verified Files\n" + "\n".join(lines)
         # Budget small enough to truncate within the section
-        budget = 400
+        budget = 120
         result = _truncate_researcher_context(context, budget=budget)
         assert "[NOTE: Research context truncated" in result
         # The truncated section should end with "..." on its own line
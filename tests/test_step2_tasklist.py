@@ -1,5 +1,6 @@
 """Tests for ingot.workflow.step2_tasklist module."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -8,6 +9,7 @@ from ingot.integrations.providers import GenericTicket, Platform
 from ingot.ui.menus import ReviewChoice
 from ingot.workflow.state import WorkflowState
 from ingot.workflow.step2_tasklist import (
+    TasklistPrefetch,
     _create_default_tasklist,
     _display_tasklist,
     _edit_tasklist,
@@ -279,12 +281,12 @@ Task list updated successfully. Created: 13, Updated: 1, Deleted: 0.
 
         # Verify task names don't have the prefix anymore (it's in metadata)
         for task in tasks:
-            assert not task.name.startswith(
-                "FUNDAMENTAL:"
-            ), f"Task name should not start with 'FUNDAMENTAL:': {task.name}"
-            assert not task.name.startswith(
-                "INDEPENDENT:"
-            ), f"Task name should not start with 'INDEPENDENT:': {task.name}"
+            assert not task.name.startswith("FUNDAMENTAL:"), (
+                f"Task name should not start with 'FUNDAMENTAL:': {task.name}"
+            )
+            assert not task.name.startswith("INDEPENDENT:"), (
+                f"Task name should not start with 'INDEPENDENT:': {task.name}"
+            )
 
     def test_extracts_category_from_add_tasks_format(self):
         output = """Here is the task list:
@@ -747,7 +749,7 @@ class TestStep2CreateTasklist:
         plan_path.write_text("# Plan")
         state.plan_file = plan_path
 
-        mock_generate.side_effect = lambda s, pp, tp, b: (tp.write_text("- [ ] Task\n") or True)
+        mock_generate.side_effect = lambda s, pp, tp, b: tp.write_text("- [ ] Task\n") or True
         mock_menu.return_value = ReviewChoice.ABORT
 
         result = step_2_create_tasklist(state, MagicMock())
@@ -785,6 +787,114 @@ class TestStep2CreateTasklist:
         mock_generate.assert_not_called()
 
 
+class TestTasklistPrefetch:
+    TASKS = "- [ ] Create user module\n- [ ] Add authentication\n"
+
+    @pytest.fixture
+    def prefetch_state(self, generic_ticket, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        state = WorkflowState(ticket=generic_ticket, prefetch_tasklist=True)
+        plan_path = state.get_plan_path()
+        plan_path.parent.mkdir(parents=True)
+        plan_path.write_text("# Plan\n\n1. Create user module\n")
+        return state
+
+    def _finished(self, state, backend) -> TasklistPrefetch:
+        prefetch = TasklistPrefetch.start(state, backend, state.get_plan_path())
+        prefetch._thread.join(timeout=5)
+        assert prefetch.done
+        return prefetch
+
+    @patch("ingot.workflow.step2_tasklist.show_task_review_menu")
+    def test_step_2_adopts_prefetched_tasklist(self, mock_menu, prefetch_state, mock_backend):
+        mock_backend.run_with_callback.return_value = (True, self.TASKS)
+        prefetch_state.pending_tasklist = self._finished(prefetch_state, mock_backend)
+        mock_menu.return_value = ReviewChoice.APPROVE
+
+        with patch("ingot.workflow.step2_tasklist._generate_tasklist") as mock_generate:
+            assert step_2_create_tasklist(prefetch_state, mock_backend) is True
+
+        mock_generate.assert_not_called()
+        tasklist_path = prefetch_state.get_tasklist_path()
+        assert [t.name for t in parse_task_list(tasklist_path.read_text())] == [
+            "Create user module",
+            "Add authentication",
+        ]
+        assert list(tasklist_path.parent.glob("*.prefetch.md")) == []
+        assert prefetch_state.pending_tasklist is None
+
+    def test_discarded_when_plan_changes(self, prefetch_state, mock_backend):
+        mock_backend.run_with_callback.return_value = (True, self.TASKS)
+        prefetch = self._finished(prefetch_state, mock_backend)
+        plan_path = prefetch_state.get_plan_path()
+        tasklist_path = prefetch_state.get_tasklist_path()
+
+        plan_path.write_text("# Plan\n\n1. Something else\n")
+
+        assert prefetch.matches(plan_path) is False
+        assert prefetch.join(plan_path, tasklist_path) is False
+        assert not tasklist_path.exists()
+        assert list(tasklist_path.parent.glob("*.prefetch.md")) == []
+
+    @patch("ingot.workflow.step2_tasklist.print_warning")
+    def test_join_prints_warnings_from_background_run(
+        self, mock_warning, prefetch_state, mock_backend
+    ):
+        tasks = (
+            "## Fundamental Tasks\n"
+            "- [ ] Create user module with unit tests for every public function\n"
+            "- [ ] Add authentication with integration tests for the login flow\n"
+        )
+        mock_backend.run_with_callback.side_effect = [
+            (True, tasks),
+            (True, "- [ ] Create user module\n"),
+        ]
+        prefetch = self._finished(prefetch_state, mock_backend)
+        mock_warning.assert_not_called()
+
+        assert prefetch.join(prefetch_state.get_plan_path(), prefetch_state.get_tasklist_path())
+
+        mock_warning.assert_called_once()
+        assert "significantly less content" in mock_warning.call_args[0][0]
+
+    def test_cancel_stops_backend_at_next_output_line(self, prefetch_state, mock_backend):
+        started = threading.Event()
+        lines = []
+
+        def run(prompt, *, output_callback, **kwargs):
+            started.set()
+            for i in range(500):
+                output_callback(f"line {i}")
+                lines.append(i)
+                threading.Event().wait(0.01)
+            return True, self.TASKS
+
+        mock_backend.run_with_callback.side_effect = run
+        prefetch = TasklistPrefetch.start(
+            prefetch_state, mock_backend, prefetch_state.get_plan_path()
+        )
+        started.wait(timeout=5)
+
+        prefetch.cancel()
+        prefetch._thread.join(timeout=5)
+
+        assert prefetch.done
+        assert len(lines) < 500
+        tasklist_path = prefetch_state.get_tasklist_path()
+        assert prefetch.join(prefetch_state.get_plan_path(), tasklist_path) is False
+        assert list(tasklist_path.parent.glob("*.prefetch.md")) == []
+
+    def test_not_started_when_disabled_or_sequential(self, prefetch_state, mock_backend):
+        plan_path = prefetch_state.get_plan_path()
+        mock_backend.supports_parallel = False
+        assert TasklistPrefetch.start(prefetch_state, mock_backend, plan_path) is None
+
+        mock_backend.supports_parallel = True
+        prefetch_state.prefetch_tasklist = False
+        assert TasklistPrefetch.start(prefetch_state, mock_backend, plan_path) is None
+        mock_backend.run_with_callback.assert_not_called()
+
+
 class TestDisplayTasklist:
     def test_displays_task_list(self, tmp_path, capsys):
         tasklist_path = tmp_path / "tasklist.md"
@@ -428,7 +428,7 @@ class TestRunPostImplementationTests:
 
 
 class TestExecuteFallback:
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     @patch("ingot.workflow.step3_execute._run_backend_capturing_output")
     def test_executes_tasks_sequentially(
         self, mock_run, mock_mark, mock_backend, workflow_state, tmp_path
@@ -453,7 +453,7 @@ class TestExecuteFallback:
 
         assert mock_run.call_count == 2
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     @patch("ingot.workflow.step3_execute._run_backend_capturing_output")
     def test_marks_tasks_complete_on_success(
         self, mock_run, mock_mark, mock_backend, workflow_state, tmp_path
@@ -476,7 +476,7 @@ class TestExecuteFallback:
         mock_mark.assert_called_once()
         assert "Task 1" in workflow_state.completed_tasks
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     @patch("ingot.workflow.step3_execute._run_backend_capturing_output")
     def test_tracks_failed_tasks(self, mock_run, mock_mark, mock_backend, workflow_state, tmp_path):
         mock_run.side_effect = [(True, "ok"), (False, "error"), (True, "ok")]
@@ -500,7 +500,7 @@ class TestExecuteFallback:
 
         assert failed == ["Task 2"]
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     @patch("ingot.workflow.step3_execute._run_backend_capturing_output")
     def test_respects_fail_fast_option(
         self, mock_run, mock_mark, mock_backend, workflow_state, tmp_path
@@ -529,7 +529,7 @@ class TestExecuteFallback:
         assert mock_run.call_count == 2
         assert failed == ["Task 2"]
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     @patch("ingot.workflow.step3_execute._run_backend_capturing_output")
     def test_returns_list_of_failed_task_names(
         self, mock_run, mock_mark, mock_backend, workflow_state, tmp_path
@@ -557,7 +557,7 @@ class TestExecuteFallback:
 
 
 class TestExecuteWithTui:
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     @patch("ingot.workflow.step3_execute._run_backend_capturing_output")
     @patch("ingot.ui.textual_runner.TextualTaskRunner")
     def test_initializes_tui_correctly(
@@ -592,7 +592,7 @@ class TestExecuteWithTui:
         mock_tui_class.assert_called_once_with(ticket_id="TEST-123", verbose_mode=False)
         mock_tui.initialize_records.assert_called_once_with(["Task 1"])
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     @patch("ingot.workflow.step3_execute._run_backend_capturing_output")
     @patch("ingot.ui.textual_runner.TextualTaskRunner")
     def test_marks_tasks_complete_on_success(
@@ -627,7 +627,7 @@ class TestExecuteWithTui:
         mock_mark.assert_called_once()
         assert "Task 1" in workflow_state.completed_tasks
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     @patch("ingot.workflow.step3_execute._run_backend_capturing_output")
     @patch("ingot.ui.textual_runner.TextualTaskRunner")
     def test_tracks_failed_tasks(
@@ -664,7 +664,7 @@ class TestExecuteWithTui:
 
         assert failed == ["Task 2"]
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     @patch("ingot.workflow.step3_execute._run_backend_capturing_output")
     @patch("ingot.ui.textual_runner.TextualTaskRunner")
     def test_respects_fail_fast_option(
@@ -952,7 +952,7 @@ class TestStep3Execute:
 
         mock_tests.assert_called_once()
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     @patch("ingot.workflow.step3_execute._run_backend_capturing_output")
     @patch("ingot.ui.textual_runner.TextualTaskRunner")
     def test_stops_execution_when_quit_requested(
@@ -1196,7 +1196,7 @@ class TestTwoPhaseExecution:
 
 
 class TestParallelExecution:
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     @patch("ingot.workflow.step3_execute._execute_task_with_retry")
     def test_uses_thread_pool_executor(
         self, mock_execute_retry, mock_mark, mock_backend, workflow_state, tmp_path
@@ -1226,7 +1226,7 @@ class TestParallelExecution:
         # Both tasks should be executed
         assert mock_execute_retry.call_count == 2
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     @patch("ingot.workflow.step3_execute._execute_task_with_retry")
     def test_respects_max_parallel_tasks(
         self, mock_execute_retry, mock_mark, mock_backend, workflow_state, tmp_path
@@ -1253,7 +1253,7 @@ class TestParallelExecution:
         assert failed == []
         assert mock_execute_retry.call_count == 5
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     @patch("ingot.workflow.step3_execute._execute_task_with_retry")
     def test_collects_failed_tasks(
         self, mock_execute_retry, mock_mark, mock_backend, workflow_state, tmp_path
@@ -1283,7 +1283,7 @@ class TestParallelExecution:
         assert len(failed) == 1
         assert "Failed Task" in failed
 
-    @patch("ingot.workflow.parallel_executor.mark_task_complete")
+    @patch("ingot.workflow.parallel_executor.record_task_result")
     @patch("ingot.workflow.step3_execute._execute_task_with_retry")
     def test_marks_successful_tasks_complete(
         self, mock_execute_retry, mock_mark, mock_backend, workflow_state, tmp_path
@@ -1409,7 +1409,7 @@ class TestTaskRetry:
 
 
 class TestParallelFailFast:
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     @patch("ingot.workflow.step3_execute._execute_task_with_retry")
     def test_fail_fast_stops_pending_tasks(
         self, mock_execute, mock_mark, mock_backend, workflow_state, tmp_path
@@ -1441,7 +1441,7 @@ class TestParallelFailFast:
         # Task 1 should fail, others should be skipped
         assert "Task 1" in failed
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     @patch("ingot.workflow.step3_execute._execute_task_with_retry")
     def test_no_fail_fast_continues_after_failure(
         self, mock_execute, mock_mark, mock_backend, workflow_state, tmp_path
@@ -1473,7 +1473,7 @@ class TestParallelFailFast:
         assert mock_execute.call_count == 3
         assert failed == ["Task 1"]
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     @patch("ingot.workflow.step3_execute._execute_task_with_retry")
     def test_stop_flag_prevents_new_task_execution(
         self, mock_execute, mock_mark, mock_backend, workflow_state, tmp_path
@@ -2314,7 +2314,7 @@ class TestBuildContinuationPrompt:
 class TestSessionTiering:
     """Test session tiering in sequential execution loops."""
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     def test_save_pattern_five_tasks(self, mock_mark, mock_backend, workflow_state, tmp_path):
         """5 tasks -> save_session inverts to dont_save_session = [F, F, F, T, F]."""
         mock_backend.run_with_callback.return_value = (True, "Output")
@@ -2340,7 +2340,7 @@ class TestSessionTiering:
 
         assert dont_save_values == [False, False, False, True, False]
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     def test_failure_resets_session(self, mock_mark, mock_backend, workflow_state, tmp_path):
         """After failure, next task gets a cold start with full prompt."""
         mock_backend.run_with_callback.side_effect = [
@@ -2380,7 +2380,7 @@ class TestSessionTiering:
         task3_prompt = calls[3][0][0]
         assert "Implementation plan:" in task3_prompt or "codebase-retrieval" in task3_prompt
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     def test_cold_start_uses_full_prompt(self, mock_mark, mock_backend, workflow_state, tmp_path):
         """Cold-start tasks contain 'Implementation plan:', warm tasks do not."""
         mock_backend.run_with_callback.return_value = (True, "Output")
@@ -2411,7 +2411,7 @@ class TestSessionTiering:
         # Second task (warm): continuation prompt, no plan reference
         assert "Implementation plan:" not in prompts[1]
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     def test_session_reset_at_boundary(self, mock_mark, mock_backend, workflow_state, tmp_path):
         """After SESSION_RESET_INTERVAL tasks, the next task is a cold start."""
         from ingot.workflow.constants import SESSION_RESET_INTERVAL
@@ -2443,7 +2443,7 @@ class TestSessionTiering:
             "Implementation plan:" in cold_start_prompt or "codebase-retrieval" in cold_start_prompt
         )
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     def test_tiering_works_with_self_correction_disabled(
         self, mock_mark, mock_backend, workflow_state, tmp_path
     ):
@@ -2470,7 +2470,7 @@ class TestSessionTiering:
 
         assert dont_save_values == [False, False, False, True, False]
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     def test_continuation_prompt_with_correction_disabled(
         self, mock_mark, mock_backend, workflow_state, tmp_path
     ):
@@ -2507,7 +2507,7 @@ class TestSessionTiering:
 class TestSessionTieringTui:
     """Test session tiering through the TUI execution path."""
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     @patch("ingot.ui.textual_runner.TextualTaskRunner")
     def test_save_pattern_five_tasks_tui(
         self, mock_tui_class, mock_mark, mock_backend, workflow_state, tmp_path
@@ -2543,7 +2543,7 @@ class TestSessionTieringTui:
         # which inverts to dont_save_session: [False, False, False, True, False]
         assert dont_save_values == [False, False, False, True, False]
 
-    @patch("ingot.workflow.step3_execute.mark_task_complete")
+    @patch("ingot.workflow.step3_execute.record_task_result")
     @patch("ingot.ui.textual_runner.TextualTaskRunner")
     def test_cold_start_uses_full_prompt_tui(
         self, mock_tui_class, mock_mark, mock_backend, workflow_state, tmp_path
@@ -1,5 +1,6 @@
 """Tests for ingot.workflow.step4_update_docs module."""
 
+import subprocess
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -12,6 +13,7 @@ from ingot.workflow.step4_update_docs import (
     NonDocSnapshot,
     Step4Result,
     _build_doc_update_prompt,
+    _hash_files,
     is_doc_file,
     step_4_update_docs,
 )
@@ -25,6 +27,16 @@ def workflow_state(generic_ticket):
     return state
 
 
+def _git_blob(repo, path: str) -> str:
+    return subprocess.run(
+        ["git", "hash-object", "--no-filters", path],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
 @pytest.fixture
 def mock_backend():
     """Create a mock AIBackend."""
@@ -779,29 +791,24 @@ class TestNonDocSnapshotGuardrailFixes:
 
     def test_preexisting_untracked_file_modified_is_restored(self, tmp_path, monkeypatch):
         monkeypatch.chdir(tmp_path)
+        subprocess.run(["git", "init"], check=True, capture_output=True)
 
         # Create original file
         scratch_file = tmp_path / "scratch.py"
         scratch_file.write_text("ORIGINAL")
 
-        # Mock for capture_non_doc_state - file is untracked
-        with patch("ingot.workflow.step4_update_docs.subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0, stdout="?? scratch.py\0")
-            snapshot = NonDocSnapshot.capture_non_doc_state()
+        snapshot = NonDocSnapshot.capture_non_doc_state()
 
-        # Verify snapshot captured the content
+        # Verify snapshot stored the content as a blob in the object database
         assert "scratch.py" in snapshot.snapshots
-        assert snapshot.snapshots["scratch.py"].content == b"ORIGINAL"
+        assert snapshot.snapshots["scratch.py"].blob == _git_blob(tmp_path, "scratch.py")
         assert snapshot.snapshots["scratch.py"].was_untracked is True
         assert snapshot.snapshots["scratch.py"].existed is True
 
         # Modify the file (simulating agent modification)
         scratch_file.write_text("MODIFIED")
 
-        # Mock for detect_changes - file still shows as untracked
-        with patch("ingot.workflow.step4_update_docs.subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0, stdout="?? scratch.py\0")
-            changed = snapshot.detect_changes()
+        changed = snapshot.detect_changes()
 
         # Should detect the change (A2 fix)
         assert "scratch.py" in changed
@@ -827,11 +834,11 @@ class TestNonDocSnapshotGuardrailFixes:
             )
             snapshot = NonDocSnapshot.capture_non_doc_state()
 
-        # Verify snapshot: file was deleted so existed=False, content=None
+        # Verify snapshot: file was deleted so existed=False, blob=None
         assert "src/foo.py" in snapshot.snapshots
         file_snap = snapshot.snapshots["src/foo.py"]
         assert file_snap.existed is False
-        assert file_snap.content is None
+        assert file_snap.blob is None
 
         # Agent recreates the file
         src_dir = tmp_path / "src"
@@ -925,3 +932,64 @@ class TestNonDocSnapshotGuardrailFixes:
         file_snap = snapshot.snapshots["new_name.py"]
         assert file_snap.was_untracked is False  # Renames are tracked
         assert file_snap.existed is True  # Tracked files use git restore
+
+
+class TestNonDocSnapshotBlobs:
+    @pytest.fixture
+    def repo(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        subprocess.run(["git", "init"], check=True, capture_output=True)
+        (tmp_path / "a.py").write_bytes(b"a = 1\r\n")
+        (tmp_path / "b.py").write_text("b = 1\n")
+        return tmp_path
+
+    def test_capture_hashes_all_files_in_one_call(self, repo):
+        with patch("ingot.workflow.step4_update_docs._hash_files", wraps=_hash_files) as mock_hash:
+            snapshot = NonDocSnapshot.capture_non_doc_state()
+
+        mock_hash.assert_called_once()
+        assert snapshot.snapshots["a.py"].blob == _git_blob(repo, "a.py")
+        assert snapshot.snapshots["b.py"].blob == _git_blob(repo, "b.py")
+
+    def test_unchanged_stat_skips_rehash(self, repo):
+        snapshot = NonDocSnapshot.capture_non_doc_state()
+
+        with patch("ingot.workflow.step4_update_docs._hash_files") as mock_hash:
+            changed = snapshot.detect_changes()
+
+        mock_hash.assert_not_called()
+        assert changed == []
+
+    def test_rewrite_with_same_content_is_not_a_change(self, repo):
+        snapshot = NonDocSnapshot.capture_non_doc_state()
+
+        (repo / "b.py").unlink()
+        (repo / "b.py").write_text("b = 1\n")
+
+        assert snapshot.detect_changes() == []
+
+    def test_restore_is_byte_identical(self, repo):
+        snapshot = NonDocSnapshot.capture_non_doc_state()
+        (repo / "a.py").write_text("changed\n")
+
+        snapshot.revert_changes(snapshot.detect_changes())
+
+        assert (repo / "a.py").read_bytes() == b"a = 1\r\n"
+
+    @patch("ingot.workflow.step4_update_docs.print_warning")
+    def test_unreadable_blob_is_reported_not_reverted(self, mock_warning, repo):
+        snapshot = NonDocSnapshot.capture_non_doc_state()
+        (repo / "a.py").write_text("changed\n")
+
+        with patch("ingot.workflow.step4_update_docs._read_blob", return_value=None):
+            reverted = snapshot.revert_changes(snapshot.detect_changes())
+
+        assert reverted == []
+        assert (repo / "a.py").read_text() == "changed\n"
+        mock_warning.assert_called_once()
+        assert "a.py" in mock_warning.call_args[0][0]
+
+    def test_hash_files_skips_unreadable_paths(self, repo):
+        hashes = _hash_files(["a.py", "missing.py", "b.py"])
+
+        assert set(hashes) == {"a.py", "b.py"}
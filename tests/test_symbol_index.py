@@ -0,0 +1,294 @@
+"""Tests for ingot.workflow.symbol_index and the symbol reference validator."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ingot.validation.base import ValidationContext, ValidationSeverity
+from ingot.validation.plan_validators import SymbolReferenceValidator
+from ingot.workflow.state import WorkflowState
+from ingot.workflow.step1_plan import _build_minimal_prompt, _SymbolIndexBuild
+from ingot.workflow.symbol_index import (
+    SymbolIndex,
+    clear_symbol_indexes,
+    extract_symbols,
+    get_symbol_index,
+    get_symbol_index_path,
+)
+
+PYTHON_SOURCE = """\
+class InvoiceRenderer:
+    def render_pdf(self):
+        def inner():
+            pass
+
+    class Options:
+        async def load(self):
+            pass
+
+
+def build_invoice_pdf():
+    pass
+"""
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch) -> Path:
+    repo = tmp_path / "repo"
+    (repo / "src").mkdir(parents=True)
+    monkeypatch.chdir(repo)
+    _git(repo, "init")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test User")
+    (repo / "src" / "invoice.py").write_text(PYTHON_SOURCE)
+    (repo / "src" / "main.py").write_text(
+        "from concurrent.futures import ThreadPoolExecutor\n\ndef main():\n    pass\n"
+    )
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-m", "init")
+    clear_symbol_indexes()
+    yield repo
+    clear_symbol_indexes()
+
+
+def _locations(path: str, source: str) -> list[tuple[str, str, int]]:
+    return [(s.qualname, s.kind, s.line) for s in extract_symbols(path, source)]
+
+
+class TestExtractSymbols:
+    def test_python_classes_methods_and_functions(self):
+        assert _locations("src/invoice.py", PYTHON_SOURCE) == [
+            ("InvoiceRenderer", "class", 1),
+            ("InvoiceRenderer.render_pdf", "method", 2),
+            ("InvoiceRenderer.Options", "class", 6),
+            ("InvoiceRenderer.Options.load", "method", 7),
+            ("build_invoice_pdf", "function", 11),
+        ]
+
+    def test_python_syntax_error_falls_back_to_regex(self):
+        source = "class Broken:\n    def method(self):\n        x = (\ndef after():\n"
+
+        assert _locations("a.py", source) == [
+            ("Broken", "class", 1),
+            ("Broken.method", "method", 2),
+            ("after", "function", 4),
+        ]
+
+    def test_typescript(self):
+        source = (
+            "export class InvoiceService {\n"
+            "  async render(id: string): Promise<void> {\n"
+            "    doThing(id);\n"
+            "    if (id) {\n"
+            "    }\n"
+            "  }\n"
+            "}\n"
+            "export const makeInvoice = async (a: number) => {\n"
+            "};\n"
+            "export interface InvoiceProps {\n"
+            "}\n"
+            "export type InvoiceId = string;\n"
+        )
+
+        assert _locations("a.ts", source) == [
+            ("InvoiceService", "class", 1),
+            ("InvoiceService.render", "method", 2),
+            ("makeInvoice", "function", 8),
+            ("InvoiceProps", "interface", 10),
+            ("InvoiceId", "type", 12),
+        ]
+
+    def test_go_methods_are_qualified_by_receiver(self):
+        source = (
+            "type Server struct {\n}\n"
+            "func (s *Server) Start(ctx context.Context) error {\n}\n"
+            "func New() *Server {\n}\n"
+        )
+
+        assert _locations("a.go", source) == [
+            ("Server", "class", 1),
+            ("Server.Start", "method", 3),
+            ("New", "function", 5),
+        ]
+
+    def test_java(self):
+        source = (
+            "public class OrderService {\n"
+            "    public List<Order> findAll(int limit) throws IOException {\n"
+            "        if (ready) {\n"
+            "        }\n"
+            "        return repo.findAll();\n"
+            "    }\n"
+            "}\n"
+        )
+
+        assert _locations("A.java", source) == [
+            ("OrderService", "class", 1),
+            ("OrderService.findAll", "method", 2),
+        ]
+
+    def test_unknown_language(self):
+        assert extract_symbols("README.md", "# class Foo") == []
+
+
+class TestSymbolIndex:
+    def test_lookup_by_simple_and_dotted_name(self, repo):
+        index = SymbolIndex(repo)
+        index.update(["src/invoice.py", "src/main.py"])
+
+        assert [s.location for s in index.lookup("render_pdf")] == ["src/invoice.py:2"]
+        assert index.has_symbol("InvoiceRenderer.render_pdf")
+        assert index.has_symbol("Options.load")
+        assert not index.has_symbol("Options.render_pdf")
+        assert len(index) == 6
+
+    def test_update_reparses_only_changed_content(self, repo):
+        index = SymbolIndex(repo)
+        index.update(["src/invoice.py", "src/main.py"])
+        (repo / "src" / "main.py").write_text(
+            "def main():\n    pass\n\ndef shutdown():\n    pass\n"
+        )
+        (repo / "src" / "invoice.py").touch()  # New mtime, same content
+
+        with patch("ingot.workflow.symbol_index.extract_symbols", wraps=extract_symbols) as extract:
+            changed = index.update(["src/invoice.py", "src/main.py"])
+
+        assert changed == 1
+        assert [call.args[0] for call in extract.call_args_list] == ["src/main.py"]
+        assert index.has_symbol("shutdown")
+
+    def test_update_drops_removed_files(self, repo):
+        index = SymbolIndex(repo)
+        index.update(["src/invoice.py", "src/main.py"])
+
+        assert index.update(["src/main.py"]) == 1
+        assert not index.has_symbol("InvoiceRenderer")
+
+    def test_round_trips_through_disk(self, repo, tmp_path):
+        index = SymbolIndex(repo)
+        index.update(["src/invoice.py", "src/main.py"])
+        path = tmp_path / "symbols.json"
+
+        index.save(path)
+        loaded = SymbolIndex.load(repo, path)
+
+        assert loaded.lookup("load") == index.lookup("load")
+        assert loaded.update(["src/invoice.py", "src/main.py"]) == 0
+
+
+class TestGetSymbolIndex:
+    def test_persists_and_follows_working_tree(self, repo):
+        first = get_symbol_index()
+        (repo / "src" / "main.py").write_text("def export_csv():\n    pass\n")
+
+        second = get_symbol_index()
+
+        assert second is first
+        assert get_symbol_index_path().exists()
+        assert second.has_symbol("export_csv")
+
+    def test_reloads_persisted_index(self, repo):
+        get_symbol_index()
+        clear_symbol_indexes()
+
+        with patch("ingot.workflow.symbol_index.extract_symbols") as extract:
+            index = get_symbol_index()
+
+        extract.assert_not_called()
+        assert index.has_symbol("build_invoice_pdf")
+
+    def test_none_outside_repository(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+        assert get_symbol_index() is None
+
+
+class TestSymbolReferenceValidator:
+    def _validate(self, repo: Path, plan: str):
+        context = ValidationContext(repo_root=repo, symbol_index=get_symbol_index(repo))
+        return SymbolReferenceValidator().validate(plan, context)
+
+    def test_flags_unknown_symbol_with_suggestion(self, repo):
+        findings = self._validate(repo, "## Steps\n1. Call `build_invoice_pd()` from the API.\n")
+
+        (finding,) = findings
+        assert finding.severity == ValidationSeverity.WARNING
+        assert finding.message == "Symbol not found in repository: `build_invoice_pd()`"
+        assert finding.line_number == 2
+        assert "`build_invoice_pdf` (src/invoice.py:11)" in finding.suggestion
+
+    def test_accepts_known_symbols_and_repository_names(self, repo):
+        plan = (
+            "1. Update `InvoiceRenderer.render_pdf()` to use `ThreadPoolExecutor`.\n"
+            "2. Call `self.render_pdf()` and `json.dumps()`, then `print()`.\n"
+        )
+
+        assert self._validate(repo, plan) == []
+
+    def test_names_the_plan_introduces_are_not_references(self, repo):
+        plan = (
+            "1. Add `InvoiceArchiver` in `src/archive.py`.\n"
+            "2. Call `archive_invoice()` from `main()`.\n"
+            "<!-- NEW_FILE --> `PdfCompressor`\n"
+            "\n"
+            "```python\n"
+            "def archive_invoice(invoice):\n"
+            "    pass\n"
+            "```\n"
+            "3. Wire `InvoiceArchiver.store()` into the renderer.\n"
+        )
+
+        assert self._validate(repo, plan) == []
+
+    def test_skipped_without_index(self, repo):
+        plan = "1. Call `missing_function()`.\n"
+
+        findings = SymbolReferenceValidator().validate(plan, ValidationContext(repo_root=repo))
+
+        assert findings == []
+
+
+class TestPlannerPromptDefinitions:
+    def test_prompt_cites_definitions_of_researched_symbols(self, repo, generic_ticket):
+        state = WorkflowState(ticket=generic_ticket)
+        research = "### Verified Files\n- `InvoiceRenderer.render_pdf()` builds the PDF\n"
+
+        prompt = _build_minimal_prompt(
+            state,
+            repo / "plan.md",
+            researcher_context=research,
+            symbol_index=_SymbolIndexBuild(state).join(),
+        )
+
+        assert "[SOURCE: SYMBOL INDEX" in prompt
+        assert "- `InvoiceRenderer.render_pdf` (method): `src/invoice.py:2`" in prompt
+
+    def test_no_definitions_without_index(self, repo, generic_ticket):
+        state = WorkflowState(ticket=generic_ticket)
+        research = "- `InvoiceRenderer.render_pdf()`\n"
+
+        prompt = _build_minimal_prompt(state, repo / "plan.md", researcher_context=research)
+
+        assert "[SOURCE: SYMBOL INDEX" not in prompt
+
+
+class TestSymbolIndexBuild:
+    def test_returns_the_shared_index(self, repo, generic_ticket):
+        build = _SymbolIndexBuild(WorkflowState(ticket=generic_ticket))
+
+        assert build.join() is get_symbol_index()
+
+    def test_skipped_when_code_search_is_off(self, repo, generic_ticket):
+        state = WorkflowState(ticket=generic_ticket, enable_code_search=False)
+
+        with patch("ingot.workflow.step1_plan.get_symbol_index") as get_index:
+            assert _SymbolIndexBuild(state).join() is None
+
+        get_index.assert_not_called()
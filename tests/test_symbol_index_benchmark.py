@@ -0,0 +1,93 @@
+"""Benchmark: full symbol index build versus incremental updates.
+
+Set INGOT_BENCH=1 to print timings, and INGOT_BENCH_FILES to benchmark
+against a larger repository.
+"""
+
+import os
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from ingot.workflow.symbol_index import clear_symbol_indexes, get_symbol_index
+from tests.helpers.benchmark import report_timings, skip_timing_under_xdist
+
+NUM_FILES = int(os.environ.get("INGOT_BENCH_FILES", "300"))
+CHANGED_FILES = 10
+
+_SOURCES = {
+    ".py": "class Service{i}:\n    def handle_{i}(self, request):\n        return request\n\n"
+    "def helper_{i}():\n    return Service{i}()\n" + "# padding\n" * 40,
+    ".ts": "export class Widget{i} {{\n  render{i}(props: Props): void {{\n  }}\n}}\n"
+    "export const make{i} = (a: number) => a;\n" + "// padding\n" * 40,
+    ".go": "package pkg\n\ntype Store{i} struct {{\n}}\n\n"
+    "func (s *Store{i}) Get{i}(key string) string {{\n\treturn key\n}}\n" + "// padding\n" * 40,
+    ".java": "public class Repo{i} {{\n    public String find{i}(int id) {{\n"
+    "        return null;\n    }}\n}}\n" + "// padding\n" * 40,
+}
+
+
+def _path(i: int) -> str:
+    suffix = list(_SOURCES)[i % len(_SOURCES)]
+    return f"pkg{i % 50}/module_{i}{suffix}"
+
+
+@pytest.fixture(scope="module")
+def large_repo(tmp_path_factory) -> Path:
+    repo = tmp_path_factory.mktemp("bench_repo")
+    subprocess.run(["git", "init"], cwd=repo, check=True, capture_output=True)
+    for i in range(NUM_FILES):
+        path = repo / _path(i)
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(_SOURCES[path.suffix].format(i=i))
+    subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "-c", "user.email=b@example.com", "-c", "user.name=Bench", "commit", "-m", "x"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+    return repo
+
+
+def test_incremental_update_beats_full_build(large_repo, monkeypatch, capsys):
+    monkeypatch.chdir(large_repo)
+    clear_symbol_indexes()
+
+    start = time.perf_counter()
+    index = get_symbol_index(large_repo)
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert get_symbol_index(large_repo) is index
+    unchanged_time = time.perf_counter() - start
+
+    for i in range(CHANGED_FILES):
+        path = large_repo / _path(i)
+        path.write_text(path.read_text() + f"\ndef added_{i}():\n    pass\n")
+    start = time.perf_counter()
+    get_symbol_index(large_repo)
+    changed_time = time.perf_counter() - start
+
+    clear_symbol_indexes()
+    start = time.perf_counter()
+    reloaded = get_symbol_index(large_repo)
+    reload_time = time.perf_counter() - start
+
+    assert reloaded.has_symbol("Service0.handle_0")
+    assert reloaded.has_symbol("Store2.Get2")
+    assert reloaded.has_symbol("added_0")
+
+    report_timings(
+        capsys,
+        f"{NUM_FILES} files ({len(index)} symbols): full build {full_time * 1000:.0f}ms, "
+        f"no-change update {unchanged_time * 1000:.0f}ms, "
+        f"{CHANGED_FILES} changed files {changed_time * 1000:.0f}ms, "
+        f"reload from disk {reload_time * 1000:.0f}ms",
+    )
+
+    clear_symbol_indexes()
+    skip_timing_under_xdist()
+    assert changed_time < full_time / 2
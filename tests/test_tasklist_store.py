@@ -0,0 +1,159 @@
+"""Tests for ingot.workflow.tasklist_store module."""
+
+import threading
+
+import pytest
+
+from ingot.workflow.events import TaskRunStatus
+from ingot.workflow.tasklist_store import (
+    TaskListStore,
+    get_tasklist_store,
+    load_tasks,
+    record_task_result,
+    render_tasklist,
+    reset_tasklist_state,
+)
+from ingot.workflow.tasks import TaskStatus
+
+
+@pytest.fixture
+def tasklist(tmp_path):
+    path = tmp_path / "TEST-1-tasklist.md"
+    path.write_text(
+        "# Task List: TEST-1\n"
+        "\n"
+        "<!-- category: fundamental, order: 1 -->\n"
+        "- [ ] Task one\n"
+        "  - [ ] Sub task\n"
+        "<!-- category: independent, group: ui -->\n"
+        "* [ ] Task two\n"
+        "- [x] Already done\n"
+    )
+    return path
+
+
+class TestTaskListStore:
+    def test_journal_path_is_next_to_tasklist(self, tasklist):
+        store = TaskListStore(tasklist)
+
+        assert store.journal_path == tasklist.parent / "TEST-1-tasklist.state.jsonl"
+
+    def test_record_appends_one_line_without_touching_markdown(self, tasklist):
+        before = tasklist.read_text()
+        store = TaskListStore(tasklist)
+
+        assert store.record("Task one", TaskRunStatus.SUCCESS, duration=1.5) is True
+
+        assert len(store.journal_path.read_text().splitlines()) == 1
+        assert tasklist.read_text() == before
+
+    def test_record_returns_false_for_missing_tasklist(self, tmp_path):
+        store = TaskListStore(tmp_path / "missing.md")
+
+        assert store.record("Task one", TaskRunStatus.SUCCESS) is False
+        assert not store.journal_path.exists()
+
+    def test_load_replays_status_attempts_and_timings(self, tasklist):
+        store = TaskListStore(tasklist)
+        store.record("Task one", TaskRunStatus.FAILED, duration=2.0, error="boom")
+        store.record("Task one", TaskRunStatus.SUCCESS, duration=3.0)
+
+        record = store.load()["Task one"]
+
+        assert record.status == TaskRunStatus.SUCCESS
+        assert record.attempts == 2
+        assert record.error is None
+        assert record.duration == pytest.approx(3.0)
+
+    def test_load_skips_malformed_lines(self, tasklist):
+        store = TaskListStore(tasklist)
+        store.record("Task one", TaskRunStatus.SUCCESS)
+        with store.journal_path.open("a") as f:
+            f.write('{"task": "Task two", "sta')
+
+        records = store.load()
+
+        assert set(records) == {"Task one"}
+
+    def test_completed_names_uses_latest_status(self, tasklist):
+        store = TaskListStore(tasklist)
+        store.record("Task one", TaskRunStatus.SUCCESS)
+        store.record("Task two", TaskRunStatus.SUCCESS)
+        store.record("Task two", TaskRunStatus.FAILED)
+
+        assert store.completed_names() == {"Task one"}
+
+    def test_reset_removes_journal(self, tasklist):
+        store = TaskListStore(tasklist)
+        store.record("Task one", TaskRunStatus.SUCCESS)
+
+        store.reset()
+
+        assert not store.journal_path.exists()
+        assert store.load() == {}
+
+    def test_concurrent_records_are_not_lost(self, tasklist):
+        store = TaskListStore(tasklist)
+
+        def worker(n: int) -> None:
+            for i in range(50):
+                store.record(f"Task {n}-{i}", TaskRunStatus.SUCCESS)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(store.load()) == 200
+
+
+class TestRender:
+    def test_marks_completed_tasks_and_preserves_layout(self, tasklist):
+        record_task_result(tasklist, "Task two", TaskRunStatus.SUCCESS)
+        record_task_result(tasklist, "Sub task", TaskRunStatus.SUCCESS)
+
+        assert render_tasklist(tasklist) is True
+
+        content = tasklist.read_text()
+        assert "- [ ] Task one" in content
+        assert "  - [x] Sub task" in content
+        assert "* [x] Task two" in content
+        assert "<!-- category: independent, group: ui -->" in content
+
+    def test_no_rewrite_when_nothing_completed(self, tasklist):
+        record_task_result(tasklist, "Task one", TaskRunStatus.FAILED)
+        before = tasklist.stat().st_mtime_ns
+
+        assert render_tasklist(tasklist) is False
+        assert tasklist.stat().st_mtime_ns == before
+
+    def test_render_is_idempotent(self, tasklist):
+        record_task_result(tasklist, "Task one", TaskRunStatus.SUCCESS)
+        render_tasklist(tasklist)
+
+        assert render_tasklist(tasklist) is False
+
+
+class TestLoadTasks:
+    def test_journal_completions_override_markdown(self, tasklist):
+        record_task_result(tasklist, "Task one", TaskRunStatus.SUCCESS)
+
+        tasks = {t.name: t for t in load_tasks(tasklist)}
+
+        assert tasks["Task one"].status == TaskStatus.COMPLETE
+        assert tasks["Task two"].status == TaskStatus.PENDING
+        assert tasks["Already done"].status == TaskStatus.COMPLETE
+
+    def test_reset_discards_recorded_state(self, tasklist):
+        record_task_result(tasklist, "Task one", TaskRunStatus.SUCCESS)
+        reset_tasklist_state(tasklist)
+
+        tasks = {t.name: t for t in load_tasks(tasklist)}
+
+        assert tasks["Task one"].status == TaskStatus.PENDING
+
+
+class TestGetTasklistStore:
+    def test_returns_shared_instance_per_path(self, tasklist):
+        assert get_tasklist_store(tasklist) is get_tasklist_store(tasklist)
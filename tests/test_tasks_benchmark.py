@@ -0,0 +1,75 @@
+"""Benchmarks for parse_task_list on large task lists.
+
+Set INGOT_BENCH=1 to print timings. The scaling assertions guard against the parser becoming quadratic again (it
+used to re-scan metadata and previous tasks backwards for every task).
+"""
+
+import time
+
+import pytest
+
+from ingot.workflow.tasks import parse_task_list
+from tests.helpers.benchmark import report_timings, skip_timing_under_xdist
+
+SIZES = [100, 1_000, 10_000]
+
+# Generous: linear growth is a 10x ratio per step; quadratic would be ~100x.
+MAX_GROWTH_PER_10X = 30
+
+
+def _tasklist(num_tasks: int) -> str:
+    """Build a realistic task list with metadata comments and subtasks."""
+    lines = [f"# Task List: BENCH-{num_tasks}", ""]
+    for i in range(num_tasks):
+        if i % 10 == 0:
+            lines.append(f"## Section {i // 10}")
+            lines.append("")
+        if i % 3 == 0:
+            lines.append(f"<!-- category: fundamental, order: {i} -->")
+        else:
+            lines.append(f"<!-- category: independent, group: g{i % 7} -->")
+        lines.append("<!--")
+        lines.append(f"  files: src/module_{i}.py,")
+        lines.append(f"         tests/test_module_{i}.py")
+        lines.append("-->")
+        lines.append(f"- [ ] Task {i}: implement module {i}")
+        lines.append(f"  - [ ] Subtask {i}.1")
+    return "\n".join(lines) + "\n"
+
+
+def _flat_siblings(num_tasks: int) -> str:
+    """Pathological for backward parent lookup: many deep siblings, no root."""
+    return "\n".join(f"    - [ ] Task {i}" for i in range(num_tasks)) + "\n"
+
+
+def _unmatched_comment_ends(num_tasks: int) -> str:
+    """Pathological for backward metadata scans: unmatched '-->' before every task."""
+    return "\n".join(f"note {i} -->\n- [ ] Task {i}" for i in range(num_tasks)) + "\n"
+
+
+def _best_time(content: str, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_task_list(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize("builder", [_tasklist, _flat_siblings, _unmatched_comment_ends])
+def test_parse_task_list_scales_linearly(builder, capsys):
+    timings = {size: _best_time(builder(size)) for size in SIZES}
+
+    summary = ", ".join(f"{n}: {t * 1000:.1f}ms" for n, t in timings.items())
+    report_timings(capsys, f"parse_task_list[{builder.__name__}] {summary}")
+
+    skip_timing_under_xdist()
+    assert timings[10_000] / timings[1_000] < MAX_GROWTH_PER_10X
+
+
+def test_parse_task_list_counts():
+    tasks = parse_task_list(_tasklist(1_000))
+
+    assert len(tasks) == 2_000
+    assert sum(t.parent is not None for t in tasks) == 1_000
+    assert all(len(t.target_files) == 2 for t in tasks if t.parent is None)
@@ -1,5 +1,6 @@
 """Tests for TicketService orchestration layer."""
 
+import asyncio
 from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -7,12 +8,14 @@ import pytest
 
 from ingot.config.fetch_config import AgentPlatform
 from ingot.integrations.cache import CacheKey, InMemoryTicketCache
+from ingot.integrations.fetchers import DirectAPIFetcher
 from ingot.integrations.fetchers.exceptions import (
     AgentFetchError,
     AgentIntegrationError,
     AgentResponseParseError,
     PlatformNotSupportedError,
 )
+from ingot.integrations.fetchers.handlers import CacheValidators, ConditionalFetchResult
 from ingot.integrations.providers.base import (
     GenericTicket,
     Platform,
@@ -20,6 +23,7 @@ from ingot.integrations.providers.base import (
     TicketType,
 )
 from ingot.integrations.ticket_service import (
+    TicketBatch,
     TicketService,
     create_ticket_service,
 )
@@ -459,6 +463,253 @@ class TestResourceManagement:
         await service.close()
 
 
+class TestRevalidation:
+    @pytest.fixture
+    async def direct_fetcher(self):
+        auth = MagicMock()
+        auth.has_fallback_configured.return_value = True
+        fetcher = DirectAPIFetcher(auth)
+        fetcher.fetch_conditional = AsyncMock()
+        fetcher.fetch = AsyncMock()
+        yield fetcher
+        await fetcher.close()
+
+    @pytest.fixture
+    def cache(self):
+        return InMemoryTicketCache()
+
+    async def _get(self, service, mock_provider, **kwargs):
+        with patch(
+            "ingot.integrations.ticket_service.ProviderRegistry.get_provider_for_input",
+            return_value=mock_provider,
+        ):
+            return await service.get_ticket("PROJ-123", **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_not_modified_extends_ttl_without_normalizing(
+        self, direct_fetcher, cache, mock_provider, sample_ticket
+    ):
+        cache.set(sample_ticket, ttl=timedelta(seconds=-1), etag='"v1"', last_modified="Mon")
+        direct_fetcher.fetch_conditional.return_value = ConditionalFetchResult(
+            data=None, validators=CacheValidators(etag='"v1"', last_modified="Mon")
+        )
+        service = TicketService(primary_fetcher=direct_fetcher, cache=cache)
+
+        ticket = await self._get(service, mock_provider)
+
+        assert ticket.id == sample_ticket.id
+        direct_fetcher.fetch_conditional.assert_awaited_once_with(
+            "PROJ-123", "jira", CacheValidators(etag='"v1"', last_modified="Mon")
+        )
+        mock_provider.normalize.assert_not_called()
+        entry = cache.get_cached_ticket(CacheKey(Platform.JIRA, "PROJ-123"))
+        assert entry is not None and entry.etag == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_modified_ticket_is_normalized_with_new_validators(
+        self, direct_fetcher, cache, mock_provider, sample_ticket, sample_raw_data
+    ):
+        cache.set(sample_ticket, etag='"v1"')
+        direct_fetcher.fetch_conditional.return_value = ConditionalFetchResult(
+            data=sample_raw_data, validators=CacheValidators(etag='"v2"')
+        )
+        service = TicketService(primary_fetcher=direct_fetcher, cache=cache)
+
+        await self._get(service, mock_provider, skip_cache=True)
+
+        mock_provider.normalize.assert_called_once_with(sample_raw_data, "PROJ-123")
+        assert cache.get_etag(CacheKey(Platform.JIRA, "PROJ-123")) == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_served_without_request(
+        self, direct_fetcher, cache, mock_provider, sample_ticket
+    ):
+        cache.set(sample_ticket, etag='"v1"')
+        service = TicketService(primary_fetcher=direct_fetcher, cache=cache)
+
+        await self._get(service, mock_provider)
+
+        direct_fetcher.fetch_conditional.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_agent_fetcher_is_not_asked_for_conditional_requests(
+        self, mock_primary_fetcher, cache, mock_provider, sample_ticket
+    ):
+        cache.set(sample_ticket, ttl=timedelta(seconds=-1), etag='"v1"')
+        service = TicketService(primary_fetcher=mock_primary_fetcher, cache=cache)
+
+        await self._get(service, mock_provider)
+
+        mock_primary_fetcher.fetch.assert_awaited_once_with("PROJ-123", "jira")
+
+
+class TestGetTickets:
+    @pytest.fixture
+    async def direct_fetcher(self):
+        auth = MagicMock()
+        auth.has_fallback_configured.return_value = True
+        fetcher = DirectAPIFetcher(auth)
+        fetcher.fetch_batch = AsyncMock(return_value={})
+        fetcher.fetch_conditional = AsyncMock()
+        yield fetcher
+        await fetcher.close()
+
+    @pytest.fixture
+    def jira_provider(self):
+        def normalize(raw_data, ticket_id):
+            return GenericTicket(
+                id=ticket_id, platform=Platform.JIRA, url="", title=raw_data["key"]
+            )
+
+        provider = MagicMock()
+        provider.platform = Platform.JIRA
+        provider.parse_input.side_effect = lambda input_str: input_str.upper()
+        provider.normalize.side_effect = normalize
+        return provider
+
+    async def _get_many(self, service, provider, inputs, **kwargs):
+        with patch(
+            "ingot.integrations.ticket_service.ProviderRegistry.get_provider_for_input",
+            return_value=provider,
+        ):
+            return await service.get_tickets(inputs, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_batch_endpoint_with_single_fetch_for_missing(
+        self, direct_fetcher, jira_provider
+    ):
+        direct_fetcher.fetch_batch.return_value = {
+            "PROJ-1": {"key": "PROJ-1"},
+            "PROJ-2": {"key": "PROJ-2"},
+        }
+        direct_fetcher.fetch_conditional.return_value = ConditionalFetchResult(
+            data={"key": "PROJ-3"}, validators=CacheValidators(etag='"v1"')
+        )
+        cache = InMemoryTicketCache()
+        service = TicketService(primary_fetcher=direct_fetcher, cache=cache)
+
+        batch = await self._get_many(service, jira_provider, ["PROJ-3", "PROJ-1", "PROJ-2"])
+
+        assert isinstance(batch, TicketBatch)
+        assert list(batch.tickets) == ["PROJ-3", "PROJ-1", "PROJ-2"]
+        assert batch.errors == {}
+        assert set(batch.latency) == {Platform.JIRA}
+        direct_fetcher.fetch_batch.assert_awaited_once_with(["PROJ-3", "PROJ-1", "PROJ-2"], "jira")
+        direct_fetcher.fetch_conditional.assert_awaited_once_with(
+            "PROJ-3", "jira", CacheValidators()
+        )
+        assert cache.size() == 3
+        assert cache.get_etag(CacheKey(Platform.JIRA, "PROJ-3")) == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_falls_back_to_single_fetches(self, direct_fetcher, jira_provider):
+        direct_fetcher.fetch_batch.side_effect = AgentFetchError("batch rejected")
+        direct_fetcher.fetch_conditional.side_effect = lambda ticket_id, *args: (
+            ConditionalFetchResult(data={"key": ticket_id}, validators=CacheValidators())
+        )
+        service = TicketService(primary_fetcher=direct_fetcher)
+
+        batch = await self._get_many(service, jira_provider, ["PROJ-1", "PROJ-2"])
+
+        assert list(batch.tickets) == ["PROJ-1", "PROJ-2"]
+        assert direct_fetcher.fetch_conditional.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_normalize_error_is_reported_per_ticket(self, direct_fetcher, jira_provider):
+        direct_fetcher.fetch_batch.return_value = {
+            "PROJ-1": {"key": "PROJ-1"},
+            "PROJ-2": {},
+        }
+        service = TicketService(primary_fetcher=direct_fetcher)
+
+        batch = await self._get_many(service, jira_provider, ["PROJ-1", "PROJ-2"])
+
+        assert list(batch.tickets) == ["PROJ-1"]
+        assert isinstance(batch.errors["PROJ-2"], KeyError)
+        direct_fetcher.fetch_conditional.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cached_validators_are_revalidated_not_batched(
+        self, direct_fetcher, jira_provider
+    ):
+        cache = InMemoryTicketCache()
+        stale = GenericTicket(id="PROJ-1", platform=Platform.JIRA, url="", title="cached")
+        cache.set(stale, ttl=timedelta(seconds=-1), etag='"v1"')
+        direct_fetcher.fetch_batch.return_value = {
+            "PROJ-2": {"key": "PROJ-2"},
+            "PROJ-3": {"key": "PROJ-3"},
+        }
+        direct_fetcher.fetch_conditional.return_value = ConditionalFetchResult(
+            data=None, validators=CacheValidators(etag='"v1"')
+        )
+        service = TicketService(primary_fetcher=direct_fetcher, cache=cache)
+
+        batch = await self._get_many(service, jira_provider, ["PROJ-1", "PROJ-2", "PROJ-3"])
+
+        assert batch.tickets["PROJ-1"] == stale
+        direct_fetcher.fetch_batch.assert_awaited_once_with(["PROJ-2", "PROJ-3"], "jira")
+        direct_fetcher.fetch_conditional.assert_awaited_once_with(
+            "PROJ-1", "jira", CacheValidators(etag='"v1"')
+        )
+        assert cache.get_etag(CacheKey(Platform.JIRA, "PROJ-1")) == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_duplicates_and_errors(
+        self, mock_primary_fetcher, mock_cache, jira_provider
+    ):
+        cached = GenericTicket(id="PROJ-1", platform=Platform.JIRA, url="", title="cached")
+        mock_cache.get.side_effect = lambda key: cached if key.ticket_id == "PROJ-1" else None
+
+        async def fetch(ticket_id, platform):
+            if ticket_id == "PROJ-3":
+                raise AgentFetchError("Ticket not found")
+            return {"key": ticket_id}
+
+        mock_primary_fetcher.fetch = AsyncMock(side_effect=fetch)
+        service = TicketService(primary_fetcher=mock_primary_fetcher, cache=mock_cache)
+
+        batch = await self._get_many(
+            service, jira_provider, ["PROJ-1", "proj-2", "PROJ-2", "PROJ-3"]
+        )
+
+        assert batch.tickets["PROJ-1"] is cached
+        assert batch.tickets["proj-2"] is batch.tickets["PROJ-2"]
+        assert isinstance(batch.errors["PROJ-3"], AgentFetchError)
+        assert mock_primary_fetcher.fetch.await_count == 2  # PROJ-2 once, PROJ-3
+        mock_cache.set_many.assert_called_once()
+        assert [t.id for t in mock_cache.set_many.call_args[0][0]] == ["PROJ-2"]
+
+    @pytest.mark.asyncio
+    async def test_single_fetches_are_bounded(self, mock_primary_fetcher, jira_provider):
+        in_flight = 0
+        peak = 0
+
+        async def fetch(ticket_id, platform):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"key": ticket_id}
+
+        mock_primary_fetcher.fetch = AsyncMock(side_effect=fetch)
+        service = TicketService(primary_fetcher=mock_primary_fetcher)
+
+        batch = await self._get_many(
+            service, jira_provider, [f"PROJ-{n}" for n in range(10)], concurrency=3
+        )
+
+        assert len(batch.tickets) == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self, mock_primary_fetcher):
+        service = TicketService(primary_fetcher=mock_primary_fetcher)
+
+        with pytest.raises(ValueError, match="concurrency"):
+            await service.get_tickets(["PROJ-1"], concurrency=0)
+
+
 class TestCreateTicketService:
     @pytest.mark.asyncio
     async def test_create_with_auggie_backend(self):
@@ -0,0 +1,106 @@
+"""Tests for ingot.utils.token_budget."""
+
+from ingot.config.fetch_config import AgentPlatform
+from ingot.utils.token_budget import (
+    DEFAULT_CALIBRATION,
+    ComponentAllocation,
+    TokenBudget,
+    TokenEstimator,
+    get_calibration,
+    get_token_estimator,
+)
+
+PROSE = "The reviewer reads the plan and checks that every step is covered by a test. " * 20
+CODE = "def f(x):\n    return {'a': [x[0], x[1]], 'b': (x or {}).get('k')}\n" * 20
+
+
+class TestTokenEstimator:
+    def test_code_costs_more_tokens_per_char_than_prose(self):
+        estimator = TokenEstimator()
+
+        prose_ratio = len(PROSE) / estimator.estimate(PROSE)
+        code_ratio = len(CODE) / estimator.estimate(CODE)
+
+        assert code_ratio < prose_ratio
+        assert abs(prose_ratio - DEFAULT_CALIBRATION.prose_chars_per_token) < 0.1
+        assert abs(code_ratio - DEFAULT_CALIBRATION.code_chars_per_token) < 0.1
+
+    def test_calibrated_per_backend(self):
+        claude = get_token_estimator(AgentPlatform.CLAUDE)
+        codex = get_token_estimator(AgentPlatform.CODEX)
+
+        assert claude.estimate(CODE) > codex.estimate(CODE)
+        assert get_calibration("unknown") is DEFAULT_CALIBRATION
+        assert get_calibration(None) is DEFAULT_CALIBRATION
+
+    def test_empty_text(self):
+        assert TokenEstimator().estimate("") == 0
+
+    def test_truncate_keeps_whole_lines(self):
+        estimator = TokenEstimator()
+        text = "".join(f"line {i} of the output\n" for i in range(100))
+
+        head = estimator.truncate(text, 50, keep="head")
+        tail = estimator.truncate(text, 50, keep="tail")
+
+        assert estimator.estimate(head) <= 50
+        assert estimator.estimate(tail) <= 50
+        assert text.startswith(head) and head.endswith("of the output")
+        assert text.endswith(tail) and tail.startswith("line ")
+
+    def test_truncate_leaves_fitting_text_alone(self):
+        assert TokenEstimator().truncate("short", 10, keep="head") == "short"
+
+
+class TestTokenBudget:
+    def test_total_follows_backend_context_window(self):
+        assert (
+            TokenBudget.for_platform(AgentPlatform.GEMINI).total_tokens
+            > TokenBudget.for_platform(AgentPlatform.CLAUDE).total_tokens
+        )
+
+    def test_components_keep_their_allocation_until_used(self):
+        allocations = {
+            "instructions": ComponentAllocation(0.2),
+            "diff": ComponentAllocation(0.5),
+            "errors": ComponentAllocation(0.3, max_tokens=100),
+        }
+        budget = TokenBudget(1000, allocations=allocations)
+
+        # errors is capped, so the diff may take what errors will not use
+        assert budget.allowance("diff") == 1000 - 200 - 100
+        assert budget.allowance("errors") == 100
+
+    def test_unused_space_moves_to_later_components(self):
+        allocations = {"instructions": ComponentAllocation(0.5), "diff": ComponentAllocation(0.5)}
+        budget = TokenBudget(1000, allocations=allocations)
+
+        used = budget.reserve("instructions", "Review the changes.")
+
+        assert budget.allowance("diff") == 1000 - used
+
+    def test_fit_tail_with_marker(self):
+        budget = TokenBudget(1000, allocations={"errors": ComponentAllocation(1.0, 40)})
+        output = "".join(f"step {i} ok\n" for i in range(200)) + "ImportError: boom"
+
+        fitted = budget.fit("errors", output, keep="tail", marker="... [truncated]\n")
+
+        assert fitted.startswith("... [truncated]\n")
+        assert fitted.endswith("ImportError: boom")
+        assert budget.estimator.estimate(fitted) <= 40
+        assert budget.allowance("errors") == 40 - budget.used_tokens
+
+    def test_fit_ends_keeps_head_and_tail(self):
+        budget = TokenBudget(1000, allocations={"plan": ComponentAllocation(1.0, 60)})
+        plan = "# Plan\n" + "".join(f"- step {i}\n" for i in range(200)) + "## Risks\n- none"
+
+        fitted = budget.fit("plan", plan, keep="ends", marker="\n... [cut] ...\n")
+
+        assert fitted.startswith("# Plan\n")
+        assert "\n... [cut] ...\n" in fitted
+        assert fitted.endswith("## Risks\n- none")
+
+    def test_fit_returns_short_text_unchanged(self):
+        budget = TokenBudget()
+
+        assert budget.fit("errors", "TypeError: x", keep="tail", marker="...") == "TypeError: x"
@@ -48,6 +48,17 @@ def workflow_state(ticket, tmp_path):
     return state
 
 
+@pytest.fixture(autouse=True)
+def no_speculative_research():
+    """Keep the runner from starting a real researcher run in the background.
+
+    It would call the mock backend from another thread and index the
+    repository the tests run in.
+    """
+    with patch("ingot.workflow.runner.SpeculativeResearch.start", return_value=None):
+        yield
+
+
 @pytest.fixture
 def mock_config():
     """Create a mock ConfigManager."""
@@ -527,6 +538,7 @@ class TestRunIngotWorkflowInit:
         assert state.implementation_model == "custom-impl"
         assert state.skip_clarification is True
         assert state.squash_at_end is False
+        assert state.subagent_names["researcher"] == mock_config.settings.subagent_researcher
 
 
 class TestRunIngotWorkflowDirtyState:
@@ -673,6 +685,67 @@ class TestRunIngotWorkflowBranchSetup:
         assert result.success is False
 
 
+class TestRunIngotWorkflowSpeculativeResearch:
+    @patch("ingot.workflow.runner.SpeculativeResearch")
+    @patch("ingot.workflow.runner._setup_branch")
+    @patch("ingot.workflow.runner.prompt_confirm")
+    @patch("ingot.workflow.runner.is_dirty")
+    @patch("ingot.workflow.runner.get_current_branch")
+    def test_starts_before_prompts_and_cancels_on_failure(
+        self,
+        mock_get_branch,
+        mock_is_dirty,
+        mock_confirm,
+        mock_setup_branch,
+        mock_research_class,
+        mock_backend,
+        ticket,
+        mock_config,
+    ):
+        mock_get_branch.return_value = "main"
+        mock_is_dirty.return_value = False
+        mock_setup_branch.return_value = False
+        pending = mock_research_class.start.return_value
+        mock_confirm.side_effect = lambda *args, **kwargs: (
+            mock_research_class.start.assert_called_once() or False
+        )
+
+        result = run_ingot_workflow(ticket=ticket, config=mock_config, backend=mock_backend)
+
+        assert result.success is False
+        mock_confirm.assert_called_once()
+        state = mock_research_class.start.call_args[0][0]
+        pending.cancel.assert_called_once()
+        assert state.pending_research is None
+
+    @patch("ingot.workflow.runner.SpeculativeResearch")
+    @patch("ingot.workflow.runner._setup_branch")
+    @patch("ingot.workflow.runner.prompt_confirm")
+    @patch("ingot.workflow.runner.is_dirty")
+    @patch("ingot.workflow.runner.get_current_branch")
+    def test_not_started_when_disabled(
+        self,
+        mock_get_branch,
+        mock_is_dirty,
+        mock_confirm,
+        mock_setup_branch,
+        mock_research_class,
+        mock_backend,
+        ticket,
+        mock_config,
+    ):
+        mock_get_branch.return_value = "main"
+        mock_is_dirty.return_value = False
+        mock_confirm.return_value = False
+        mock_setup_branch.return_value = False
+
+        run_ingot_workflow(
+            ticket=ticket, config=mock_config, backend=mock_backend, speculative_research=False
+        )
+
+        mock_research_class.start.assert_not_called()
+
+
 class TestRunIngotWorkflowStepOrchestration:
     @patch("ingot.workflow.runner._show_completion")
     @patch("ingot.workflow.runner.step_5_commit")
@@ -1579,3 +1579,76 @@ class TestSecurityRegressions:
         assert (
             repo_root_param.default is inspect.Parameter.empty
         ), "repo_root must be required (no default) for security"
+
+
+class TestSinglePassParserEquivalence:
+    """parse_task_list must attach exactly what _parse_task_metadata would."""
+
+    @staticmethod
+    def _assert_matches_reference(content: str) -> None:
+        from ingot.workflow.tasks import _parse_task_metadata
+
+        lines = content.splitlines()
+        for task in parse_task_list(content):
+            category, order, group_id, files = _parse_task_metadata(lines, task.line_number - 1)
+            assert (task.category, task.dependency_order, task.group_id, task.target_files) == (
+                category,
+                order,
+                group_id,
+                files,
+            ), f"metadata mismatch for {task.name!r}"
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            # Stacked single-line and multi-line blocks with blank lines
+            "<!-- files: a.py -->\n\n<!--\n  category: independent, group: ui\n-->\n"
+            "\n- [ ] Task A\n",
+            # Non-metadata line between comment and task (bleed prevention)
+            "<!-- category: independent, group: x -->\nSome text\n- [ ] Task A\n",
+            # Task directly after another task inherits nothing
+            "<!-- category: independent -->\n- [ ] Task A\n- [ ] Task B\n",
+            # Unmatched --> swallows everything above it
+            "<!-- category: independent, group: g -->\nstray -->\n- [ ] Task A\n",
+            # Task-looking line inside a multi-line comment
+            "<!--\n- [ ] Hidden\n  files: b.py\n-->\n- [ ] Task A\n",
+            # Nested opener lines inside a multi-line comment
+            "<!-- files: c.py -->\n<!--\n<!-- inner\nfiles: d.py\n-->\n- [ ] Task A\n",
+            # Later (farther) block overrides category and order
+            "<!-- category: fundamental, order: 3 -->\n<!-- category: independent -->\n"
+            "- [ ] Task A\n",
+        ],
+    )
+    def test_matches_reference_on_edge_cases(self, content):
+        self._assert_matches_reference(content)
+
+    def test_matches_reference_on_random_documents(self):
+        import random
+
+        rng = random.Random(1234)
+        fragments = [
+            "",
+            "   ",
+            "# Heading",
+            "Some prose",
+            "<!-- category: fundamental, order: 2 -->",
+            "<!-- category: independent, group: api -->",
+            "<!-- files: src/a.py, src/b.py -->",
+            "<!--",
+            "  files: src/c.py,",
+            "-->",
+            "stray -->",
+            "- [ ] Pending task",
+            "  - [x] Done subtask",
+            "* [ ] Star task",
+        ]
+        for _ in range(300):
+            content = "\n".join(rng.choice(fragments) for _ in range(rng.randint(1, 25)))
+            self._assert_matches_reference(content)
+
+    def test_parent_is_nearest_shallower_task(self):
+        content = "- [ ] A\n  - [ ] A1\n    - [ ] A1a\n  - [ ] A2\n- [ ] B\n    - [ ] B1\n"
+
+        parents = {t.name: t.parent for t in parse_task_list(content)}
+
+        assert parents == {"A": None, "A1": "A", "A1a": "A1", "A2": "A", "B": None, "B1": "B"}